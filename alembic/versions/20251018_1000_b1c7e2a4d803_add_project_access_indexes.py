@@ -0,0 +1,36 @@
+"""add_project_access_indexes
+
+Revision ID: b1c7e2a4d803
+Revises: 6fad1d675ea3
+Create Date: 2025-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b1c7e2a4d803'
+down_revision = '6fad1d675ea3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the collaborator-first index for project access checks."""
+    # (project_id, user_id) probes use uq_project_user_collaboration;
+    # shared-project listings start from the collaborator
+    op.create_index(
+        'idx_project_collaborations_user_project',
+        'project_collaborations',
+        ['user_id', 'project_id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove project access indexes."""
+    op.drop_index(
+        'idx_project_collaborations_user_project',
+        table_name='project_collaborations'
+    )
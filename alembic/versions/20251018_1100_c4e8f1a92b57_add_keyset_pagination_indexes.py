@@ -0,0 +1,75 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: c4e8f1a92b57
+Revises: b1c7e2a4d803
+Create Date: 2025-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8f1a92b57'
+down_revision = 'b1c7e2a4d803'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, key columns) - each index ends in (sort DESC, id DESC)
+# so keyset pages seek directly to the cursor position
+KEYSET_INDEXES = [
+    (
+        'idx_activity_logs_project_feed',
+        'activity_logs',
+        ['project_id', 'created_at', 'id']
+    ),
+    (
+        'idx_comments_project_feed',
+        'comments',
+        ['project_id', 'created_at', 'id']
+    ),
+    (
+        'idx_notifications_user_feed',
+        'notifications',
+        ['user_id', 'created_at', 'id']
+    ),
+]
+
+
+def _has_columns(table: str, columns) -> bool:
+    """Check the live schema, which may lag behind the ORM models."""
+    inspector = sa.inspect(op.get_bind())
+    existing = {column['name'] for column in inspector.get_columns(table)}
+    return set(columns) <= existing
+
+
+def upgrade() -> None:
+    """Add composite indexes for keyset-paginated feeds."""
+    for name, table, (scope, sort, tiebreak) in KEYSET_INDEXES:
+        if not _has_columns(table, [scope, sort, tiebreak]):
+            print(f"Warning: Skipping {name}, {table} is missing feed columns")
+            continue
+        op.create_index(
+            name,
+            table,
+            [scope, sa.text(f'{sort} DESC'), sa.text(f'{tiebreak} DESC')],
+            unique=False
+        )
+    
+    # User project listings sort by last activity, falling back to creation
+    if _has_columns('projects', ['owner_id', 'last_activity_at', 'created_at']):
+        op.execute(
+            'CREATE INDEX idx_projects_owner_activity ON projects '
+            '(owner_id, (COALESCE(last_activity_at, created_at)) DESC, id DESC)'
+        )
+    else:
+        print("Warning: Skipping idx_projects_owner_activity, "
+              "projects.last_activity_at is missing")
+
+
+def downgrade() -> None:
+    """Remove keyset pagination indexes."""
+    op.execute('DROP INDEX IF EXISTS idx_projects_owner_activity')
+    for name, _, _ in reversed(KEYSET_INDEXES):
+        op.execute(f'DROP INDEX IF EXISTS {name}')
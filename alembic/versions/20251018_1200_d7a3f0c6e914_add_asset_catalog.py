@@ -0,0 +1,65 @@
+"""add_asset_catalog
+
+Revision ID: d7a3f0c6e914
+Revises: c4e8f1a92b57
+Create Date: 2025-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7a3f0c6e914'
+down_revision = 'c4e8f1a92b57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the AI asset catalog replacing the JSON-file project storage."""
+    op.create_table('asset_catalog_projects',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('user_id', sa.String(length=255), nullable=False),
+    sa.Column('slug', sa.String(length=64), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.String(length=1000), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_asset_catalog_projects')),
+    sa.UniqueConstraint('user_id', 'slug', name='uq_asset_catalog_projects_user_slug')
+    )
+    op.create_table('asset_catalog',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('user_id', sa.String(length=255), nullable=False),
+    sa.Column('project_id', sa.String(length=32), nullable=True),
+    sa.Column('job_id', sa.String(length=64), nullable=True),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('type', sa.String(length=32), nullable=False),
+    sa.Column('category', sa.String(length=64), nullable=False),
+    sa.Column('style', sa.String(length=64), nullable=True),
+    sa.Column('file_path', sa.String(length=1000), nullable=False),
+    sa.Column('thumbnail_path', sa.String(length=1000), nullable=True),
+    sa.Column('asset_metadata', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['asset_catalog_projects.id'], name=op.f('fk_asset_catalog_project_id_asset_catalog_projects'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_asset_catalog'))
+    )
+    # Newest-first listing per user, optionally narrowed by category or style
+    op.create_index('idx_asset_catalog_user_created', 'asset_catalog', ['user_id', 'created_at', 'id'], unique=False)
+    # Categories are stored as submitted and filtered on lower(category)
+    op.create_index('idx_asset_catalog_user_category_lower', 'asset_catalog', ['user_id', sa.text('lower(category)'), 'created_at'], unique=False)
+    op.create_index('idx_asset_catalog_user_style', 'asset_catalog', ['user_id', 'style', 'created_at'], unique=False)
+    op.create_index('idx_asset_catalog_project', 'asset_catalog', ['project_id'], unique=False)
+    op.create_index('idx_asset_catalog_job', 'asset_catalog', ['job_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the AI asset catalog."""
+    op.drop_index('idx_asset_catalog_job', table_name='asset_catalog')
+    op.drop_index('idx_asset_catalog_project', table_name='asset_catalog')
+    op.drop_index('idx_asset_catalog_user_style', table_name='asset_catalog')
+    op.drop_index('idx_asset_catalog_user_category_lower', table_name='asset_catalog')
+    op.drop_index('idx_asset_catalog_user_created', table_name='asset_catalog')
+    op.drop_table('asset_catalog')
+    op.drop_table('asset_catalog_projects')
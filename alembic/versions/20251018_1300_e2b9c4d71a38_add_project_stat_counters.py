@@ -0,0 +1,109 @@
+"""add_project_stat_counters
+
+Revision ID: e2b9c4d71a38
+Revises: d7a3f0c6e914
+Create Date: 2025-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b9c4d71a38'
+down_revision = 'd7a3f0c6e914'
+branch_labels = None
+depends_on = None
+
+
+# Adds `delta` to every facet bucket a project falls into. Buckets are always
+# touched in the same order (total first) so concurrent writers cannot deadlock.
+APPLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION project_stat_counters_apply(
+    p_status text, p_engine text, p_genre text, p_template boolean, p_delta integer
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO project_stat_counters (facet, value, count)
+    SELECT f.facet, f.value, p_delta
+    FROM (VALUES
+        (1, 'total', ''),
+        (2, 'template', CASE WHEN p_template THEN '' END),
+        (3, 'status', COALESCE(p_status, '')),
+        (4, 'engine', p_engine),
+        (5, 'genre', p_genre)
+    ) AS f(ord, facet, value)
+    WHERE f.value IS NOT NULL
+    ORDER BY f.ord
+    ON CONFLICT (facet, value)
+    DO UPDATE SET count = project_stat_counters.count + EXCLUDED.count;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION projects_stat_counters_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.visibility = 'PUBLIC' THEN
+        PERFORM project_stat_counters_apply(
+            OLD.status::text, OLD.engine::text, OLD.genre::text,
+            COALESCE(OLD.is_template, false), -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.visibility = 'PUBLIC' THEN
+        PERFORM project_stat_counters_apply(
+            NEW.status::text, NEW.engine::text, NEW.genre::text,
+            COALESCE(NEW.is_template, false), 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+BACKFILL = """
+INSERT INTO project_stat_counters (facet, value, count)
+SELECT 'total', '', count(*) FROM projects WHERE visibility = 'PUBLIC'
+UNION ALL
+SELECT 'template', '', count(*) FROM projects
+WHERE visibility = 'PUBLIC' AND is_template
+UNION ALL
+SELECT 'status', COALESCE(status::text, ''), count(*) FROM projects
+WHERE visibility = 'PUBLIC' GROUP BY 2
+UNION ALL
+SELECT 'engine', engine::text, count(*) FROM projects
+WHERE visibility = 'PUBLIC' AND engine IS NOT NULL GROUP BY 2
+UNION ALL
+SELECT 'genre', genre::text, count(*) FROM projects
+WHERE visibility = 'PUBLIC' AND genre IS NOT NULL GROUP BY 2
+"""
+
+
+def upgrade() -> None:
+    """Add trigger-maintained public project counters for the stats overview."""
+    op.create_table('project_stat_counters',
+    sa.Column('facet', sa.String(length=16), nullable=False),
+    sa.Column('value', sa.String(length=64), nullable=False),
+    sa.Column('count', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('facet', 'value', name=op.f('pk_project_stat_counters'))
+    )
+
+    op.execute(APPLY_FUNCTION)
+    op.execute(TRIGGER_FUNCTION)
+
+    # Block project writes until the trigger exists and the backfill is done,
+    # otherwise rows written in between would be counted twice or not at all
+    op.execute('LOCK TABLE projects IN SHARE ROW EXCLUSIVE MODE')
+    op.execute(
+        'CREATE TRIGGER projects_stat_counters '
+        'AFTER INSERT OR DELETE OR UPDATE OF visibility, status, engine, genre, is_template '
+        'ON projects FOR EACH ROW EXECUTE FUNCTION projects_stat_counters_trigger()'
+    )
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    """Remove the project statistics counters."""
+    op.execute('DROP TRIGGER IF EXISTS projects_stat_counters ON projects')
+    op.execute('DROP FUNCTION IF EXISTS projects_stat_counters_trigger()')
+    op.execute('DROP FUNCTION IF EXISTS project_stat_counters_apply(text, text, text, boolean, integer)')
+    op.drop_table('project_stat_counters')
@@ -0,0 +1,85 @@
+"""add_project_search_indexes
+
+Revision ID: f5c1a8e3b290
+Revises: e2b9c4d71a38
+Create Date: 2025-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5c1a8e3b290'
+down_revision = 'e2b9c4d71a38'
+branch_labels = None
+depends_on = None
+
+
+# Must match TEXT_SEARCH_CONFIG in gameforge.services.project_search
+SEARCH_DOCUMENT = """
+    setweight(to_tsvector('english', coalesce({row}name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce({row}summary, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(array_to_string({row}tags, ' '), '')), 'B') ||
+    setweight(to_tsvector('english', coalesce({row}description, '')), 'C')
+"""
+
+TRIGGER_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION projects_search_vector_trigger() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_DOCUMENT.format(row='NEW.')};
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# (index name, sort expression) - one per list_projects sort_by option that
+# is not backed by an existing index. view_count/like_count are left out on
+# purpose: indexing them would turn every counter bump into a non-HOT update.
+KEYSET_INDEXES = [
+    ('idx_projects_created_keyset', 'created_at, id'),
+    ('idx_projects_updated_keyset', '(COALESCE(updated_at, created_at)), id'),
+    ('idx_projects_name_keyset', 'name, id'),
+]
+
+
+def upgrade() -> None:
+    """Add full-text, trigram and keyset indexes for project listing."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # The initial schema created search_vector as text with a B-tree index,
+    # which no search can use; rebuild it as a trigger-maintained tsvector
+    op.execute('DROP INDEX IF EXISTS idx_projects_search')
+    op.execute(
+        'ALTER TABLE projects ALTER COLUMN search_vector TYPE tsvector USING NULL'
+    )
+    op.execute(TRIGGER_FUNCTION)
+    op.execute(
+        'CREATE TRIGGER projects_search_vector '
+        'BEFORE INSERT OR UPDATE OF name, summary, description, tags '
+        'ON projects FOR EACH ROW EXECUTE FUNCTION projects_search_vector_trigger()'
+    )
+    op.execute(f"UPDATE projects SET search_vector = {SEARCH_DOCUMENT.format(row='')}")
+
+    op.execute(
+        'CREATE INDEX idx_projects_search_vector ON projects USING gin (search_vector)'
+    )
+    # Prefix (ILIKE 'term%') and fuzzy (name % term) name matches
+    op.execute(
+        'CREATE INDEX idx_projects_name_trgm ON projects USING gin (name gin_trgm_ops)'
+    )
+
+    for name, columns in KEYSET_INDEXES:
+        op.execute(f'CREATE INDEX {name} ON projects ({columns})')
+
+
+def downgrade() -> None:
+    """Remove project search indexes and restore the text search_vector column."""
+    for name, _ in reversed(KEYSET_INDEXES):
+        op.execute(f'DROP INDEX IF EXISTS {name}')
+    op.execute('DROP INDEX IF EXISTS idx_projects_name_trgm')
+    op.execute('DROP INDEX IF EXISTS idx_projects_search_vector')
+    op.execute('DROP TRIGGER IF EXISTS projects_search_vector ON projects')
+    op.execute('DROP FUNCTION IF EXISTS projects_search_vector_trigger()')
+    op.execute('ALTER TABLE projects ALTER COLUMN search_vector TYPE text USING NULL')
+    op.create_index('idx_projects_search', 'projects', ['search_vector'], unique=False)
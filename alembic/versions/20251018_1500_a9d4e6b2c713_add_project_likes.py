@@ -0,0 +1,34 @@
+"""add_project_likes
+
+Revision ID: a9d4e6b2c713
+Revises: f5c1a8e3b290
+Create Date: 2025-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9d4e6b2c713'
+down_revision = 'f5c1a8e3b290'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Record individual project likes so each user's like counts once."""
+    op.create_table('project_likes',
+    sa.Column('project_id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], name=op.f('fk_project_likes_project_id_projects'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id', 'user_id', name=op.f('pk_project_likes'))
+    )
+    op.create_index('idx_project_likes_user_created', 'project_likes', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop project likes."""
+    op.drop_index('idx_project_likes_user_created', table_name='project_likes')
+    op.drop_table('project_likes')
@@ -0,0 +1,30 @@
+"""add_project_slug_pattern_index
+
+Revision ID: b3f7d2e8a451
+Revises: a9d4e6b2c713
+Create Date: 2025-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f7d2e8a451'
+down_revision = 'a9d4e6b2c713'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index slugs for the allocator's "<base>-%" prefix query."""
+    # The unique ix_projects_slug index uses the default collation and
+    # cannot serve LIKE 'prefix%' outside the C locale
+    op.execute(
+        'CREATE INDEX idx_projects_slug_pattern ON projects (slug text_pattern_ops)'
+    )
+
+
+def downgrade() -> None:
+    """Remove the slug prefix index."""
+    op.execute('DROP INDEX IF EXISTS idx_projects_slug_pattern')
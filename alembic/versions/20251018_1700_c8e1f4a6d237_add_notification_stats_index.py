@@ -0,0 +1,33 @@
+"""add_notification_stats_index
+
+Revision ID: c8e1f4a6d237
+Revises: b3f7d2e8a451
+Create Date: 2025-10-18 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8e1f4a6d237'
+down_revision = 'b3f7d2e8a451'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Cover the single-scan notification stats query."""
+    # (user_id, type) serves the GROUP BY; the INCLUDE columns feed the
+    # COUNT(*) FILTER clauses, so the scan is index-only
+    op.create_index(
+        'idx_notifications_user_stats',
+        'notifications',
+        ['user_id', 'type'],
+        postgresql_include=['read_at', 'archived_at', 'created_at']
+    )
+
+
+def downgrade() -> None:
+    """Remove the notification stats index."""
+    op.drop_index('idx_notifications_user_stats', table_name='notifications')
@@ -29,6 +29,7 @@ from gameforge.services.collaboration import (
 from gameforge.services.realtime import (
     connection_manager, RealTimeCollaborationService
 )
+from gameforge.services.pagination import InvalidCursorError
 from gameforge.core.logging_config import get_structured_logger
 
 logger = get_structured_logger(__name__)
@@ -142,6 +143,43 @@ class ProjectInviteResponse(BaseModel):
         from_attributes = True
 
 
+class ProjectSummaryResponse(BaseModel):
+    """Response model for projects in a user's project feed."""
+    id: str
+    name: str
+    description: Optional[str]
+    owner_id: str
+    last_activity_at: Optional[datetime]
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ActivityFeedPage(BaseModel):
+    """Cursor-paginated activity feed."""
+    items: List[ActivityLogResponse]
+    next_cursor: Optional[str] = None
+
+
+class CommentFeedPage(BaseModel):
+    """Cursor-paginated comments."""
+    items: List[CommentResponse]
+    next_cursor: Optional[str] = None
+
+
+class NotificationFeedPage(BaseModel):
+    """Cursor-paginated notifications."""
+    items: List[NotificationResponse]
+    next_cursor: Optional[str] = None
+
+
+class ProjectFeedPage(BaseModel):
+    """Cursor-paginated user projects."""
+    items: List[ProjectSummaryResponse]
+    next_cursor: Optional[str] = None
+
+
 # Helper function to get current user (placeholder - integrate with your auth system)
 async def get_current_user_id() -> str:
     """Get current authenticated user ID."""
@@ -393,6 +431,60 @@ async def get_project_activity(
     return [ActivityLogResponse.from_orm(activity) for activity in activities]
 
 
+@collaboration_router.get("/projects/{project_id}/activity/feed", response_model=ActivityFeedPage)
+async def get_project_activity_feed(
+    project_id: str = Path(..., description="Project ID"),
+    limit: int = Query(50, ge=1, le=100, description="Number of activities to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_session)
+):
+    """Get activity feed for a project with cursor pagination."""
+    service = CollaborationService(db)
+    
+    if not await service.can_user_access_project(project_id, current_user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this project"
+        )
+    
+    try:
+        page = await service.get_project_activity_page(
+            project_id, current_user_id, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return ActivityFeedPage(
+        items=[ActivityLogResponse.from_orm(activity) for activity in page.items],
+        next_cursor=page.next_cursor
+    )
+
+
+@collaboration_router.get("/my-projects", response_model=ProjectFeedPage)
+async def get_my_projects(
+    include_shared: bool = Query(True, description="Include projects shared with the user"),
+    limit: int = Query(50, ge=1, le=100, description="Number of projects to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_session)
+):
+    """Get projects owned by or shared with the current user, most recently active first."""
+    service = CollaborationService(db)
+    
+    try:
+        page = await service.get_user_projects_page(
+            current_user_id, include_shared=include_shared, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return ProjectFeedPage(
+        items=[ProjectSummaryResponse.from_orm(project) for project in page.items],
+        next_cursor=page.next_cursor
+    )
+
+
 # Comment Endpoints
 @collaboration_router.get("/projects/{project_id}/comments", response_model=List[CommentResponse])
 async def get_project_comments(
@@ -425,6 +517,43 @@ async def get_project_comments(
     return [CommentResponse.from_orm(comment) for comment in comments]
 
 
+@collaboration_router.get("/projects/{project_id}/comments/feed", response_model=CommentFeedPage)
+async def get_project_comments_feed(
+    project_id: str = Path(..., description="Project ID"),
+    entity_type: Optional[str] = Query(None, description="Filter by entity type"),
+    entity_id: Optional[str] = Query(None, description="Filter by entity ID"),
+    limit: int = Query(50, ge=1, le=100, description="Number of comments to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_session)
+):
+    """Get comments for a project or specific entity with cursor pagination."""
+    comment_service = CommentService(db)
+    
+    if not await comment_service.collaboration_service.can_user_access_project(project_id, current_user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this project"
+        )
+    
+    try:
+        page = await comment_service.get_comments_page(
+            project_id=project_id,
+            user_id=current_user_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            limit=limit,
+            cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return CommentFeedPage(
+        items=[CommentResponse.from_orm(comment) for comment in page.items],
+        next_cursor=page.next_cursor
+    )
+
+
 @collaboration_router.post("/projects/{project_id}/comments", response_model=CommentResponse)
 async def create_comment(
     project_id: str = Path(..., description="Project ID"),
@@ -533,6 +662,33 @@ async def get_notifications(
     return [NotificationResponse.from_orm(notification) for notification in notifications]
 
 
+@collaboration_router.get("/notifications/feed", response_model=NotificationFeedPage)
+async def get_notifications_feed(
+    limit: int = Query(50, ge=1, le=100, description="Number of notifications to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    unread_only: bool = Query(False, description="Show only unread notifications"),
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_session)
+):
+    """Get notifications for the current user with cursor pagination."""
+    service = NotificationService(db)
+    
+    try:
+        page = await service.get_user_notifications_page(
+            user_id=current_user_id,
+            unread_only=unread_only,
+            limit=limit,
+            cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return NotificationFeedPage(
+        items=[NotificationResponse.from_orm(notification) for notification in page.items],
+        next_cursor=page.next_cursor
+    )
+
+
 @collaboration_router.put("/notifications/{notification_id}", response_model=NotificationResponse)
 async def update_notification(
     notification_id: str = Path(..., description="Notification ID"),
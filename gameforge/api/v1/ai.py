@@ -16,7 +16,8 @@ from fastapi import (
 from pydantic import BaseModel, Field, validator, root_validator
 import logging
 
-from .project_storage_legacy import project_storage
+from gameforge.core.fast_json import RowSerializer, json_response
+from gameforge.services.asset_catalog import asset_catalog
 
 # Import metrics system, structured logging, and auth validation
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
@@ -64,6 +65,10 @@ class JobMetadata(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+# Stored job dict -> JobMetadata-shaped dict (fast path for list_jobs)
+_job_row = RowSerializer(JobMetadata)
+
+
 class AIGenerateRequest(BaseModel):
     """Request model for AI asset generation with payload size validation."""
     prompt: str = Field(
@@ -426,7 +431,7 @@ async def process_ai_generation(
         # Save asset to project storage
         try:
             if user_id:
-                asset_record = project_storage.save_asset_to_project(
+                asset_record = await asset_catalog.save_asset_to_project(
                     user_id=user_id,
                     asset_url=asset_url,
                     job_data=_job_storage[job_id]
@@ -516,7 +521,7 @@ async def process_super_resolution(
         try:
             user_id = _job_storage[job_id].get("user_id")
             if user_id:
-                asset_record = project_storage.save_asset_to_project(
+                asset_record = await asset_catalog.save_asset_to_project(
                     user_id=user_id,
                     asset_url=asset_url,
                     job_data=_job_storage[job_id]
@@ -863,8 +868,8 @@ async def list_jobs(
         # Apply pagination
         paginated_jobs = jobs[offset:offset + limit]
         
-        # Convert to JobMetadata models
-        return [JobMetadata(**job) for job in paginated_jobs]
+        # Job dicts already match JobMetadata; render without per-row models
+        return json_response(_job_row.many(paginated_jobs))
         
     except Exception as e:
         logger.error(f"Failed to list jobs: {str(e)}")
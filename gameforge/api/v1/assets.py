@@ -9,7 +9,9 @@ from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel, Field
 
 from .auth import get_current_user, UserData
-from .project_storage_legacy import project_storage
+from gameforge.core.fast_json import RowSerializer, json_response
+from gameforge.services.asset_catalog import AssetRecord, asset_catalog
+from gameforge.services.pagination import InvalidCursorError
 
 
 router = APIRouter()
@@ -64,6 +66,54 @@ class AssetResponse(BaseModel):
         }
 
 
+def _to_response(asset: AssetRecord) -> AssetResponse:
+    """Convert a catalog record to the API response format."""
+    return AssetResponse(
+        id=asset.id,
+        name=asset.name,
+        category=asset.category,
+        style=asset.metadata.get("style", ""),
+        status="approved",  # All AI assets are approved
+        asset_url=asset.file_path,
+        thumbnail_url=asset.thumbnail_path,
+        metadata=AssetMetadata(
+            id=asset.id,
+            name=asset.name,
+            category=asset.category,
+            style=asset.metadata.get("style", ""),
+            status="approved",
+            created_at=asset.created_at.isoformat(),
+            file_size=None,  # Not tracked yet
+            dimensions=asset.metadata.get("dimensions", ""),
+            tags=asset.metadata.get("tags", [])
+        )
+    )
+
+
+def _asset_meta(key: str, default=""):
+    return lambda row: (row["asset_metadata"] or {}).get(key, default)
+
+
+# List rows (asset_catalog.LIST_COLUMNS) -> AssetResponse dicts, same shape
+# as _to_response; checked against the models once, here
+_asset_metadata_row = RowSerializer(AssetMetadata, {
+    "style": _asset_meta("style"),
+    "status": lambda row: "approved",
+    "created_at": lambda row: row["created_at"].isoformat(),
+    "file_size": lambda row: None,
+    "dimensions": _asset_meta("dimensions"),
+    "tags": _asset_meta("tags", [])
+})
+
+_asset_row = RowSerializer(AssetResponse, {
+    "style": _asset_meta("style"),
+    "status": lambda row: "approved",
+    "asset_url": "file_path",
+    "thumbnail_url": "thumbnail_path",
+    "metadata": _asset_metadata_row
+})
+
+
 @router.get("/", response_model=List[AssetResponse])
 async def list_assets(
     category: Optional[str] = None,
@@ -71,75 +121,53 @@ async def list_assets(
     status: Optional[str] = None,
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
     current_user: UserData = Depends(get_current_user)
 ):
     """
     List user's assets with optional filtering.
     
+    Pass the X-Next-Cursor response header back as `cursor` to fetch the
+    next page without an OFFSET scan.
+    
     For generating new assets, use POST /api/ai/generate endpoint.
     """
     try:
-        # Get user's assets from project storage
-        user_assets = project_storage.get_user_assets(current_user.id)
-        
-        # Apply filters
-        filtered_assets = user_assets
-        if category:
-            filtered_assets = [
-                a for a in filtered_assets
-                if a.category.lower() == category.lower()
-            ]
-        if style:
-            filtered_assets = [
-                a for a in filtered_assets
-                if a.metadata.get("style", "").lower() == style.lower()
-            ]
-        
-        # Apply pagination
-        paginated_assets = filtered_assets[offset:offset + limit]
-        
-        # Convert to response format
-        response_assets = []
-        for asset in paginated_assets:
-            response_assets.append(AssetResponse(
-                id=asset.id,
-                name=asset.name,
-                category=asset.category,
-                style=asset.metadata.get("style", ""),
-                status="approved",  # All AI assets are approved
-                asset_url=asset.file_path,
-                thumbnail_url=asset.thumbnail_path,
-                metadata=AssetMetadata(
-                    id=asset.id,
-                    name=asset.name,
-                    category=asset.category,
-                    style=asset.metadata.get("style", ""),
-                    status="approved",
-                    created_at=asset.created_at.isoformat(),
-                    file_size=None,  # Not tracked yet
-                    dimensions=asset.metadata.get("dimensions", ""),
-                    tags=asset.metadata.get("tags", [])
-                )
-            ))
-        
-        return response_assets
-        
+        page = await asset_catalog.list_asset_rows(
+            current_user.id,
+            category=category,
+            style=style,
+            limit=limit,
+            offset=offset,
+            cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve assets: {str(e)}"
         )
+    
+    headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else None
+    return json_response(_asset_row.many(page.items), headers=headers)
 
 
 @router.get("/{asset_id}", response_model=AssetResponse)
-async def get_asset(asset_id: str):
+async def get_asset(
+    asset_id: str,
+    current_user: UserData = Depends(get_current_user)
+):
     """
     Get a specific asset by ID.
     
     For asset generation status, use GET /api/ai/job/{job_id} endpoint.
     """
-    # TODO: Implement actual asset retrieval from database
-    raise HTTPException(status_code=404, detail="Asset not found")
+    asset = await asset_catalog.get_asset(current_user.id, asset_id)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    
+    return _to_response(asset)
 
 
 @router.delete("/{asset_id}")
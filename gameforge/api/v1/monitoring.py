@@ -8,13 +8,22 @@ and Prometheus metrics exposition for GameForge frontend.
 import asyncio
 import json
 import aiohttp
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 import logging
 import os
 
+from gameforge.core.fast_json import json_response
+from gameforge.services.metrics_range import (
+    DOWNSAMPLE_LTTB, PrometheusQueryError, RangeQueryCache,
+    align_range, downsample, fetch_range, parse_step
+)
+from gameforge.services.monitoring_poller import (
+    SnapshotPoller, monitoring_pollers, query_prometheus_instant
+)
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -22,6 +31,20 @@ router = APIRouter()
 GRAFANA_URL = os.getenv("GRAFANA_URL", "http://localhost:3000")
 PROMETHEUS_URL = os.getenv("PROMETHEUS_URL", "http://localhost:9090")
 GRAFANA_API_KEY = os.getenv("GRAFANA_API_KEY", "")
+METRICS_POLL_INTERVAL = float(os.getenv("MONITORING_METRICS_POLL_INTERVAL", "5"))
+ALERTS_POLL_INTERVAL = float(os.getenv("MONITORING_ALERTS_POLL_INTERVAL", "10"))
+
+# Instant queries behind /metrics/instant, /dashboard-data and /ws/metrics
+INSTANT_METRIC_QUERIES = {
+    "models_total": "gameforge_models_total",
+    "models_production": "gameforge_models_production",
+    "experiments_active": "gameforge_experiments_active",
+    "requests_per_second": "rate(gameforge_ai_requests_total[1m])",
+    "error_rate": "rate(gameforge_ai_errors_total[1m])",
+    "latency_p95": "histogram_quantile(0.95, gameforge_ai_latency_seconds)",
+    "memory_usage": "gameforge_memory_usage_bytes",
+    "cpu_usage": "gameforge_cpu_usage_percent"
+}
 
 # WebSocket connection manager
 class ConnectionManager:
@@ -33,7 +56,8 @@ class ConnectionManager:
         self.active_connections.append(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        if websocket in self.active_connections:
+            self.active_connections.remove(websocket)
 
     async def broadcast(self, data: dict):
         for connection in self.active_connections:
@@ -64,6 +88,14 @@ class TimeSeriesMetric(BaseModel):
     values: List[MetricValue]
 
 
+class ColumnarSeries(BaseModel):
+    """Time series as parallel arrays (timestamps in unix seconds)"""
+    metric_name: str
+    labels: Dict[str, str]
+    timestamps: List[float]
+    values: List[float]
+
+
 class DashboardInfo(BaseModel):
     """Grafana dashboard information"""
     uid: str
@@ -98,125 +130,105 @@ class SystemStatus(BaseModel):
 # Prometheus Integration
 # ============================================================================
 
-@router.get("/metrics/prometheus", response_model=List[TimeSeriesMetric])
+async def _fetch_range(query: str, start: float, end: float, step: float):
+    return await fetch_range(
+        monitoring_pollers.http.get(), PROMETHEUS_URL, query, start, end, step
+    )
+
+
+range_cache = RangeQueryCache(
+    _fetch_range,
+    max_entries=int(os.getenv("MONITORING_RANGE_CACHE_ENTRIES", "256"))
+)
+
+
+@router.get("/metrics/prometheus", response_model=List[ColumnarSeries])
 async def get_prometheus_metrics(
     query: str,
     start: Optional[datetime] = None,
     end: Optional[datetime] = None,
-    step: str = "1m"
+    step: str = "1m",
+    max_points: int = Query(500, ge=10, le=11000),
+    downsample_method: str = Query(
+        DOWNSAMPLE_LTTB, alias="downsample", pattern="^(lttb|minmax|none)$"
+    )
 ):
-    """Query Prometheus metrics"""
+    """
+    Query Prometheus metrics as columnar series
+    
+    The range is aligned to the step and served from the range cache; each
+    series is downsampled to at most max_points.
+    """
     
-    if not start:
-        start = datetime.utcnow() - timedelta(hours=1)
     if not end:
         end = datetime.utcnow()
+    if not start:
+        start = end - timedelta(hours=1)
     
     try:
-        async with aiohttp.ClientSession() as session:
-            params = {
-                "query": query,
-                "start": start.isoformat() + "Z",
-                "end": end.isoformat() + "Z",
-                "step": step
-            }
-            
-            async with session.get(
-                f"{PROMETHEUS_URL}/api/v1/query_range",
-                params=params
-            ) as response:
-                
-                if response.status != 200:
-                    raise HTTPException(
-                        status_code=response.status,
-                        detail=f"Prometheus query failed: {await response.text()}"
-                    )
-                
-                data = await response.json()
-                
-                if data["status"] != "success":
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Prometheus query error: {data.get('error', 'Unknown error')}"
-                    )
-                
-                # Convert to our format
-                result = []
-                for series in data["data"]["result"]:
-                    metric_name = series["metric"].get("__name__", "unknown")
-                    labels = {k: v for k, v in series["metric"].items() if k != "__name__"}
-                    
-                    values = []
-                    for timestamp, value in series["values"]:
-                        values.append(MetricValue(
-                            timestamp=datetime.fromtimestamp(float(timestamp)),
-                            value=float(value)
-                        ))
-                    
-                    result.append(TimeSeriesMetric(
-                        metric_name=metric_name,
-                        labels=labels,
-                        values=values
-                    ))
-                
-                return result
-                
-    except aiohttp.ClientError as e:
-        logger.error(f"Failed to query Prometheus: {e}")
-        raise HTTPException(
-            status_code=503,
-            detail="Prometheus service unavailable"
-        )
+        step_seconds = parse_step(step)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    start_ts, end_ts, step_seconds = align_range(
+        _unix_seconds(start), _unix_seconds(end), step_seconds
+    )
+    if end_ts < start_ts:
+        raise HTTPException(status_code=400, detail="end must not be before start")
+    
+    try:
+        series = await range_cache.get(query, start_ts, end_ts, step_seconds)
+    except PrometheusQueryError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         logger.error(f"Error querying Prometheus: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    
+    result = []
+    for data in series:
+        data = downsample(data, max_points, downsample_method)
+        result.append({
+            "metric_name": data.metric.get("__name__", "unknown"),
+            "labels": {k: v for k, v in data.metric.items() if k != "__name__"},
+            "timestamps": data.timestamps,
+            "values": data.values
+        })
+    
+    return json_response(result, headers={"X-Query-Step": repr(step_seconds)})
+
+
+def _unix_seconds(value: datetime) -> float:
+    """Naive datetimes are UTC (as in the previous isoformat() + "Z" calls)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+async def _fetch_instant_metrics() -> Dict[str, Any]:
+    """Run the instant query set against Prometheus (one round, concurrently)."""
+    results = await query_prometheus_instant(
+        monitoring_pollers.http.get(), PROMETHEUS_URL, INSTANT_METRIC_QUERIES
+    )
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "metrics": results
+    }
+
+
+metrics_poller = monitoring_pollers.register(SnapshotPoller(
+    "instant_metrics",
+    _fetch_instant_metrics,
+    interval=METRICS_POLL_INTERVAL,
+    message_type="metrics_update"
+))
 
 
 @router.get("/metrics/instant")
 async def get_instant_metrics():
-    """Get instant metric values for dashboard"""
-    
-    metrics_queries = {
-        "models_total": "gameforge_models_total",
-        "models_production": "gameforge_models_production",
-        "experiments_active": "gameforge_experiments_active",
-        "requests_per_second": "rate(gameforge_ai_requests_total[1m])",
-        "error_rate": "rate(gameforge_ai_errors_total[1m])",
-        "latency_p95": "histogram_quantile(0.95, gameforge_ai_latency_seconds)",
-        "memory_usage": "gameforge_memory_usage_bytes",
-        "cpu_usage": "gameforge_cpu_usage_percent"
-    }
+    """Get instant metric values for dashboard (shared snapshot, refreshed per interval)"""
     
     try:
-        async with aiohttp.ClientSession() as session:
-            results = {}
-            
-            for metric_name, query in metrics_queries.items():
-                try:
-                    async with session.get(
-                        f"{PROMETHEUS_URL}/api/v1/query",
-                        params={"query": query}
-                    ) as response:
-                        
-                        if response.status == 200:
-                            data = await response.json()
-                            if data["status"] == "success" and data["data"]["result"]:
-                                value = float(data["data"]["result"][0]["value"][1])
-                                results[metric_name] = value
-                            else:
-                                results[metric_name] = 0.0
-                        else:
-                            results[metric_name] = 0.0
-                            
-                except Exception as e:
-                    logger.warning(f"Failed to get metric {metric_name}: {e}")
-                    results[metric_name] = 0.0
-            
-            return {
-                "timestamp": datetime.utcnow().isoformat(),
-                "metrics": results
-            }
-            
+        return await metrics_poller.get()
     except Exception as e:
         logger.error(f"Failed to get instant metrics: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -297,48 +309,61 @@ async def get_dashboard_embed_url(dashboard_uid: str):
 # Alerts Integration
 # ============================================================================
 
+async def _fetch_active_alerts() -> List[Dict[str, Any]]:
+    """Fetch alerting rules from Grafana as plain dicts (AlertInfo fields)."""
+    
+    if not GRAFANA_API_KEY:
+        return []
+    
+    headers = {
+        "Authorization": f"Bearer {GRAFANA_API_KEY}",
+        "Content-Type": "application/json"
+    }
+    
+    async with monitoring_pollers.http.get().get(
+        f"{GRAFANA_URL}/api/alerts",
+        headers=headers,
+        params={"state": "alerting"}
+    ) as response:
+        
+        # Raise so the poller keeps serving the last good snapshot
+        response.raise_for_status()
+        alerts_data = await response.json()
+    
+    alerts = []
+    for alert in alerts_data:
+        alerts.append(AlertInfo(
+            id=str(alert["id"]),
+            name=alert["name"],
+            state=alert["state"],
+            severity=alert.get("executionError", "medium"),
+            message=alert.get("message", ""),
+            started_at=datetime.fromisoformat(
+                alert["newStateDate"].replace("Z", "+00:00")
+            ),
+            labels=alert.get("evalData", {}).get("evalMatches", [{}])[0].get("tags", {})
+        ).dict())
+    
+    return alerts
+
+
+alerts_poller = monitoring_pollers.register(SnapshotPoller(
+    "active_alerts",
+    _fetch_active_alerts,
+    interval=ALERTS_POLL_INTERVAL,
+    message_type="alerts_update"
+))
+
+
 @router.get("/alerts", response_model=List[AlertInfo])
 async def get_active_alerts():
-    """Get active alerts from Grafana"""
+    """Get active alerts from Grafana (shared snapshot, refreshed per interval)"""
     
     if not GRAFANA_API_KEY:
         return []  # Return empty if not configured
     
     try:
-        headers = {
-            "Authorization": f"Bearer {GRAFANA_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{GRAFANA_URL}/api/alerts",
-                headers=headers,
-                params={"state": "alerting"}
-            ) as response:
-                
-                if response.status != 200:
-                    logger.warning(f"Failed to fetch alerts: {response.status}")
-                    return []
-                
-                alerts_data = await response.json()
-                
-                alerts = []
-                for alert in alerts_data:
-                    alerts.append(AlertInfo(
-                        id=str(alert["id"]),
-                        name=alert["name"],
-                        state=alert["state"],
-                        severity=alert.get("executionError", "medium"),
-                        message=alert.get("message", ""),
-                        started_at=datetime.fromisoformat(
-                            alert["newStateDate"].replace("Z", "+00:00")
-                        ),
-                        labels=alert.get("evalData", {}).get("evalMatches", [{}])[0].get("tags", {})
-                    ))
-                
-                return alerts
-                
+        return [AlertInfo(**alert) for alert in await alerts_poller.get()]
     except Exception as e:
         logger.warning(f"Failed to get alerts: {e}")
         return []
@@ -397,57 +422,38 @@ async def get_system_status():
 # Real-time WebSocket Endpoints
 # ============================================================================
 
-@router.websocket("/ws/metrics")
-async def metrics_websocket(websocket: WebSocket):
-    """WebSocket for real-time metrics updates"""
+async def _stream_snapshots(websocket: WebSocket, poller: SnapshotPoller):
+    """Forward every snapshot of a shared poller to one socket."""
     
     await manager.connect(websocket)
+    queue = poller.subscribe()
     
     try:
         while True:
-            # Send metrics every 5 seconds
-            try:
-                metrics = await get_instant_metrics()
-                await websocket.send_json({
-                    "type": "metrics_update",
-                    "data": metrics
-                })
-            except Exception as e:
-                logger.error(f"Failed to send metrics: {e}")
-            
-            await asyncio.sleep(5)
+            snapshot = await queue.get()
+            await websocket.send_text(snapshot.message)
             
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        pass
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
+    finally:
+        poller.unsubscribe(queue)
         manager.disconnect(websocket)
 
 
+@router.websocket("/ws/metrics")
+async def metrics_websocket(websocket: WebSocket):
+    """WebSocket for real-time metrics updates (every METRICS_POLL_INTERVAL seconds)"""
+    
+    await _stream_snapshots(websocket, metrics_poller)
+
+
 @router.websocket("/ws/alerts")
 async def alerts_websocket(websocket: WebSocket):
-    """WebSocket for real-time alert updates"""
-    
-    await manager.connect(websocket)
+    """WebSocket for real-time alert updates (every ALERTS_POLL_INTERVAL seconds)"""
     
-    try:
-        while True:
-            try:
-                alerts = await get_active_alerts()
-                await websocket.send_json({
-                    "type": "alerts_update",
-                    "data": [alert.dict() for alert in alerts]
-                })
-            except Exception as e:
-                logger.error(f"Failed to send alerts: {e}")
-            
-            await asyncio.sleep(10)  # Check alerts every 10 seconds
-            
-    except WebSocketDisconnect:
-        manager.disconnect(websocket)
-    except Exception as e:
-        logger.error(f"WebSocket error: {e}")
-        manager.disconnect(websocket)
+    await _stream_snapshots(websocket, alerts_poller)
 
 
 # ============================================================================
@@ -9,16 +9,19 @@ RESTful API endpoints for notification management:
 - Notification preferences and settings
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, WebSocket, WebSocketDisconnect, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, desc, func, update, delete
+from sqlalchemy import select, and_, desc
 from pydantic import BaseModel, Field, field_validator
 
 from gameforge.core.database import get_async_session
 from gameforge.models.collaboration import Notification, NotificationType
 from gameforge.core.logging_config import get_structured_logger
+from gameforge.services.collaboration import NotificationService
+from gameforge.services.notification_delivery import notification_delivery
+from gameforge.services.notification_stats import notification_stats
 
 logger = get_structured_logger(__name__)
 
@@ -26,52 +29,6 @@ logger = get_structured_logger(__name__)
 notifications_router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 
-# ============================================================================
-# WebSocket Connection Manager
-# ============================================================================
-
-class NotificationConnectionManager:
-    """Manages WebSocket connections for real-time notifications."""
-    
-    def __init__(self):
-        self.active_connections: Dict[str, List[WebSocket]] = {}
-    
-    async def connect(self, websocket: WebSocket, user_id: str):
-        """Connect a WebSocket for a user."""
-        await websocket.accept()
-        if user_id not in self.active_connections:
-            self.active_connections[user_id] = []
-        self.active_connections[user_id].append(websocket)
-        logger.info(f"WebSocket connected for user {user_id}")
-    
-    def disconnect(self, websocket: WebSocket, user_id: str):
-        """Disconnect a WebSocket for a user."""
-        if user_id in self.active_connections:
-            if websocket in self.active_connections[user_id]:
-                self.active_connections[user_id].remove(websocket)
-            if not self.active_connections[user_id]:
-                del self.active_connections[user_id]
-        logger.info(f"WebSocket disconnected for user {user_id}")
-    
-    async def send_notification(self, user_id: str, notification_data: dict):
-        """Send notification to all user's connected WebSockets."""
-        if user_id in self.active_connections:
-            disconnected_sockets = []
-            for websocket in self.active_connections[user_id]:
-                try:
-                    await websocket.send_json(notification_data)
-                except:
-                    disconnected_sockets.append(websocket)
-            
-            # Clean up disconnected sockets
-            for websocket in disconnected_sockets:
-                self.disconnect(websocket, user_id)
-
-
-# Global connection manager
-notification_manager = NotificationConnectionManager()
-
-
 # ============================================================================
 # Pydantic Models
 # ============================================================================
@@ -133,6 +90,11 @@ class NotificationStats(BaseModel):
     recent_count: int  # Last 24 hours
 
 
+class UnreadCount(BaseModel):
+    """Response model for the unread badge."""
+    unread_count: int
+
+
 class BulkNotificationUpdate(BaseModel):
     """Request model for bulk notification operations."""
     notification_ids: List[str] = Field(..., description="List of notification IDs")
@@ -217,32 +179,20 @@ async def create_notification(
 ):
     """Create a new notification for a specific user."""
     try:
-        # Create notification
-        notification = Notification(
+        # Stored, counted in the unread badge and pushed to the user's
+        # sockets on every worker by the service
+        notification = await NotificationService(db).create_notification(
             user_id=target_user_id,
-            type=notification_data.type,
+            notification_type=notification_data.type,
             title=notification_data.title,
             message=notification_data.message,
             entity_type=notification_data.entity_type,
             entity_id=notification_data.entity_id,
             action_url=notification_data.action_url,
             action_text=notification_data.action_text,
-            invite_metadata=notification_data.metadata or {}
+            metadata=notification_data.metadata
         )
-        
-        db.add(notification)
-        await db.commit()
-        await db.refresh(notification)
-        
-        # Send real-time notification via WebSocket
         notification_response = NotificationResponse.from_orm(notification)
-        await notification_manager.send_notification(
-            target_user_id, 
-            {
-                "type": "new_notification",
-                "notification": notification_response.dict()
-            }
-        )
         
         logger.info(f"Notification created: {notification.id} for user {target_user_id}")
         return notification_response
@@ -301,39 +251,19 @@ async def update_notification(
 ):
     """Update a notification (mark as read/unread, archive/unarchive)."""
     try:
-        # Get notification
-        result = await db.execute(
-            select(Notification).where(
-                and_(
-                    Notification.id == notification_id,
-                    Notification.user_id == current_user_id
-                )
+        try:
+            notification = await NotificationService(db).update_notification(
+                notification_id=notification_id,
+                user_id=current_user_id,
+                is_read=notification_data.read,
+                is_archived=notification_data.archived
             )
-        )
-        notification = result.scalar_one_or_none()
-        
-        if not notification:
+        except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Notification not found"
             )
         
-        # Update fields
-        if notification_data.read is not None:
-            if notification_data.read:
-                notification.read_at = datetime.utcnow()
-            else:
-                notification.read_at = None
-        
-        if notification_data.archived is not None:
-            if notification_data.archived:
-                notification.archived_at = datetime.utcnow()
-            else:
-                notification.archived_at = None
-        
-        await db.commit()
-        await db.refresh(notification)
-        
         logger.info(f"Notification updated: {notification_id}")
         return NotificationResponse.from_orm(notification)
         
@@ -356,27 +286,12 @@ async def delete_notification(
 ):
     """Delete a notification."""
     try:
-        # Get notification
-        result = await db.execute(
-            select(Notification).where(
-                and_(
-                    Notification.id == notification_id,
-                    Notification.user_id == current_user_id
-                )
-            )
-        )
-        notification = result.scalar_one_or_none()
-        
-        if not notification:
+        if not await NotificationService(db).delete_notification(notification_id, current_user_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Notification not found"
             )
         
-        # Delete notification
-        await db.delete(notification)
-        await db.commit()
-        
         logger.info(f"Notification deleted: {notification_id}")
         return {"message": "Notification deleted successfully"}
         
@@ -403,49 +318,10 @@ async def bulk_update_notifications(
 ):
     """Perform bulk operations on notifications."""
     try:
-        # Build base query for user's notifications
-        base_query = select(Notification).where(
-            and_(
-                Notification.user_id == current_user_id,
-                Notification.id.in_(bulk_data.notification_ids)
-            )
+        affected_count = await NotificationService(db).bulk_update(
+            current_user_id, bulk_data.notification_ids, bulk_data.action
         )
         
-        if bulk_data.action == "delete":
-            # Delete notifications
-            delete_query = delete(Notification).where(
-                and_(
-                    Notification.user_id == current_user_id,
-                    Notification.id.in_(bulk_data.notification_ids)
-                )
-            )
-            result = await db.execute(delete_query)
-            affected_count = result.rowcount
-        else:
-            # Update notifications
-            update_values = {}
-            
-            if bulk_data.action == "mark_read":
-                update_values = {Notification.read_at: datetime.utcnow()}
-            elif bulk_data.action == "mark_unread":
-                update_values = {Notification.read_at: None}
-            elif bulk_data.action == "archive":
-                update_values = {Notification.archived_at: datetime.utcnow()}
-            elif bulk_data.action == "unarchive":
-                update_values = {Notification.archived_at: None}
-            
-            update_query = update(Notification).where(
-                and_(
-                    Notification.user_id == current_user_id,
-                    Notification.id.in_(bulk_data.notification_ids)
-                )
-            ).values(**update_values)
-            
-            result = await db.execute(update_query)
-            affected_count = result.rowcount
-        
-        await db.commit()
-        
         logger.info(f"Bulk operation {bulk_data.action} performed on {affected_count} notifications")
         return {
             "message": f"Bulk operation completed",
@@ -469,17 +345,7 @@ async def mark_all_read(
 ):
     """Mark all notifications as read."""
     try:
-        update_query = update(Notification).where(
-            and_(
-                Notification.user_id == current_user_id,
-                Notification.read_at.is_(None)
-            )
-        ).values(read_at=datetime.utcnow())
-        
-        result = await db.execute(update_query)
-        affected_count = result.rowcount
-        
-        await db.commit()
+        affected_count = await NotificationService(db).mark_all_read(current_user_id)
         
         logger.info(f"Marked {affected_count} notifications as read for user {current_user_id}")
         return {
@@ -505,84 +371,67 @@ async def get_notification_stats(
     current_user_id: str = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_async_session)
 ):
-    """Get notification statistics for the current user."""
+    """Get notification statistics for the current user (one scan)."""
     try:
-        # Total count
-        total_query = select(func.count(Notification.id)).where(
-            Notification.user_id == current_user_id
-        )
-        total_result = await db.execute(total_query)
-        total_count = total_result.scalar() or 0
-        
-        # Unread count
-        unread_query = select(func.count(Notification.id)).where(
-            and_(
-                Notification.user_id == current_user_id,
-                Notification.read_at.is_(None)
-            )
-        )
-        unread_result = await db.execute(unread_query)
-        unread_count = unread_result.scalar() or 0
-        
-        # Archived count
-        archived_query = select(func.count(Notification.id)).where(
-            and_(
-                Notification.user_id == current_user_id,
-                Notification.archived_at.is_not(None)
-            )
-        )
-        archived_result = await db.execute(archived_query)
-        archived_count = archived_result.scalar() or 0
+        overview = await notification_stats.overview(db, current_user_id)
+        overview["by_type"] = {
+            _type_label(type_name): count
+            for type_name, count in overview["by_type"].items()
+        }
+        return NotificationStats(**overview)
         
-        # Recent count (last 24 hours)
-        twenty_four_hours_ago = datetime.utcnow() - timedelta(hours=24)
-        recent_query = select(func.count(Notification.id)).where(
-            and_(
-                Notification.user_id == current_user_id,
-                Notification.created_at >= twenty_four_hours_ago
-            )
+    except Exception as e:
+        logger.error(f"Error getting notification stats: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get notification statistics: {str(e)}"
         )
-        recent_result = await db.execute(recent_query)
-        recent_count = recent_result.scalar() or 0
-        
-        # By type
-        type_query = select(
-            Notification.type,
-            func.count(Notification.id)
-        ).where(
-            Notification.user_id == current_user_id
-        ).group_by(Notification.type)
-        
-        type_result = await db.execute(type_query)
-        by_type = {str(row[0]): row[1] for row in type_result.fetchall()}
-        
-        return NotificationStats(
-            total_count=total_count,
-            unread_count=unread_count,
-            archived_count=archived_count,
-            by_type=by_type,
-            recent_count=recent_count
+
+
+@notifications_router.get("/stats/unread", response_model=UnreadCount)
+async def get_unread_count(
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_session)
+):
+    """Get the unread notification count (badge) from the cached counter."""
+    try:
+        return UnreadCount(
+            unread_count=await notification_stats.unread_count(db, current_user_id)
         )
         
     except Exception as e:
-        logger.error(f"Error getting notification stats: {str(e)}")
+        logger.error(f"Error getting unread count: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get notification statistics: {str(e)}"
+            detail=f"Failed to get unread count: {str(e)}"
         )
 
 
+def _type_label(type_name: str) -> str:
+    """Stored enum name -> NotificationType value (as the API exposes it)."""
+    try:
+        return NotificationType[type_name].value
+    except KeyError:
+        return type_name
+
+
 # ============================================================================
 # WebSocket Endpoint for Real-time Notifications
 # ============================================================================
 
+@notifications_router.get("/stats/delivery")
+async def get_delivery_stats():
+    """Get real-time delivery counters and publish-to-socket latency for this worker."""
+    return notification_delivery.get_stats()
+
+
 @notifications_router.websocket("/ws")
 async def notification_websocket(
     websocket: WebSocket,
     current_user_id: str = Query(..., description="User ID")
 ):
     """WebSocket endpoint for real-time notifications."""
-    await notification_manager.connect(websocket, current_user_id)
+    connection_id = await notification_delivery.connect(websocket, current_user_id)
     
     try:
         while True:
@@ -591,10 +440,11 @@ async def notification_websocket(
             
             # Handle ping/pong for connection health
             if message == "ping":
-                await websocket.send_text("pong")
+                notification_delivery.reply(current_user_id, connection_id, "pong")
             
     except WebSocketDisconnect:
-        notification_manager.disconnect(websocket, current_user_id)
+        pass
     except Exception as e:
         logger.error(f"WebSocket error for user {current_user_id}: {str(e)}")
-        notification_manager.disconnect(websocket, current_user_id)
+    finally:
+        await notification_delivery.disconnect(current_user_id, connection_id)
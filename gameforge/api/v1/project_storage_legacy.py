@@ -1,26 +1,16 @@
 """
 Simple project and asset storage system for AI-generated assets.
+
+Superseded by gameforge.services.asset_catalog; kept so existing JSON
+data can be read by scripts/migrate-asset-catalog.py.
 """
 import json
 import uuid
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from pydantic import BaseModel
-
 
-class AssetRecord(BaseModel):
-    """Asset record for project storage."""
-    id: str
-    name: str
-    type: str
-    category: str
-    file_path: str
-    thumbnail_path: Optional[str] = None
-    created_at: datetime
-    user_id: str
-    job_id: str
-    metadata: Dict[str, Any] = {}
+from gameforge.services.asset_catalog import AssetRecord
 
 
 class ProjectStorage:
@@ -13,7 +13,7 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, desc, func
+from sqlalchemy import select, or_
 from sqlalchemy.orm import selectinload
 from pydantic import BaseModel, Field, validator
 
@@ -23,10 +23,17 @@ from gameforge.models.projects import (
 )
 from gameforge.models.collaboration import ProjectCollaboration, CollaborationRole
 from gameforge.services.collaboration import CollaborationService
+from gameforge.services.pagination import InvalidCursorError
+from gameforge.services.project_access import ProjectAccessResolver
+from gameforge.services.project_counters import project_counters
+from gameforge.services.project_search import search_projects
+from gameforge.services.project_slugs import assign_unique_slug
+from gameforge.services.project_stats import project_stats, render_breakdowns
 from gameforge.core.authorization import (
     get_current_user_auth, UserAuth, Permission, Role,
     RequirePermission, RequireRole, CurrentUser, CurrentUserId
 )
+from gameforge.core.fast_json import RowSerializer, json_response
 from gameforge.core.logging_config import get_structured_logger
 
 logger = get_structured_logger(__name__)
@@ -152,6 +159,13 @@ class ProjectListResponse(BaseModel):
         from_attributes = True
 
 
+# Columns and row serializer for the list_projects fast path
+PROJECT_LIST_COLUMNS = tuple(
+    getattr(Project, name) for name in ProjectListResponse.model_fields
+)
+_project_list_row = RowSerializer(ProjectListResponse)
+
+
 class ProjectStatsResponse(BaseModel):
     """Response model for project statistics."""
     total_projects: int
@@ -173,24 +187,6 @@ def get_current_user_id() -> str:
     return "550e8400-e29b-41d4-a716-446655440000"  # Placeholder UUID
 
 
-async def generate_unique_slug(name: str, db: AsyncSession) -> str:
-    """Generate a unique slug from project name."""
-    base_slug = name.lower().replace(' ', '-').replace('_', '-')
-    base_slug = ''.join(c for c in base_slug if c.isalnum() or c == '-')
-    
-    # Check if slug exists
-    counter = 0
-    slug = base_slug
-    while True:
-        result = await db.execute(
-            select(Project).where(Project.slug == slug)
-        )
-        if not result.scalar_one_or_none():
-            return slug
-        counter += 1
-        slug = f"{base_slug}-{counter}"
-
-
 # ============================================================================
 # Project CRUD Endpoints
 # ============================================================================
@@ -203,13 +199,9 @@ async def create_project(
 ):
     """Create a new project."""
     try:
-        # Generate unique slug
-        slug = await generate_unique_slug(project_data.name, db)
-        
         # Create project
         project = Project(
             name=project_data.name,
-            slug=slug,
             description=project_data.description,
             summary=project_data.summary,
             engine=project_data.engine,
@@ -223,9 +215,11 @@ async def create_project(
             repository_url=project_data.repository_url
         )
         
-        db.add(project)
+        # Claim a unique slug (adds and flushes the project)
+        await assign_unique_slug(db, project, project_data.name)
         await db.commit()
         await db.refresh(project)
+        project_stats.invalidate(current_user_id)
         
         logger.info(f"Project created: {project.id} by user {current_user_id}")
         return ProjectResponse.from_orm(project)
@@ -241,8 +235,9 @@ async def create_project(
 
 @projects_router.get("/", response_model=List[ProjectListResponse])
 async def list_projects(
-    skip: int = Query(0, ge=0, description="Number of projects to skip"),
+    skip: int = Query(0, ge=0, description="Number of projects to skip (prefer cursor)"),
     limit: int = Query(50, ge=1, le=100, description="Number of projects to return"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
     search: Optional[str] = Query(None, description="Search term"),
     status_filter: Optional[ProjectStatus] = Query(None, description="Filter by status"),
     engine_filter: Optional[GameEngine] = Query(None, description="Filter by engine"),
@@ -251,30 +246,25 @@ async def list_projects(
     owner_only: bool = Query(False, description="Show only projects owned by current user"),
     templates_only: bool = Query(False, description="Show only template projects"),
     featured_only: bool = Query(False, description="Show only featured projects"),
-    sort_by: str = Query("created_at", description="Sort field"),
+    sort_by: Optional[str] = Query(
+        None,
+        description="Sort field (created_at, updated_at, name, view_count, like_count, "
+                    "relevance); defaults to relevance when searching, else created_at"
+    ),
     sort_order: str = Query("desc", description="Sort order (asc/desc)"),
     current_user_id: str = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_async_session)
 ):
-    """List projects with filtering and pagination."""
+    """
+    List projects with filtering, full-text search and cursor pagination.
+    
+    Pass the X-Next-Cursor response header back as `cursor` to fetch the
+    next page; the header is absent on the last page.
+    """
     try:
-        # Build query
-        query = select(Project)
-        
         # Apply filters
         filters = []
         
-        if search:
-            search_term = f"%{search}%"
-            filters.append(
-                or_(
-                    Project.name.ilike(search_term),
-                    Project.description.ilike(search_term),
-                    Project.summary.ilike(search_term),
-                    Project.tags.op('&&')(func.array([search.lower()]))
-                )
-            )
-        
         if status_filter:
             filters.append(Project.status == status_filter)
             
@@ -304,42 +294,27 @@ async def list_projects(
         if featured_only:
             filters.append(Project.is_featured == True)
         
-        if filters:
-            query = query.where(and_(*filters))
-        
-        # Apply sorting
-        if sort_order.lower() == "desc":
-            if sort_by == "name":
-                query = query.order_by(desc(Project.name))
-            elif sort_by == "updated_at":
-                query = query.order_by(desc(Project.updated_at))
-            elif sort_by == "view_count":
-                query = query.order_by(desc(Project.view_count))
-            elif sort_by == "like_count":
-                query = query.order_by(desc(Project.like_count))
-            else:
-                query = query.order_by(desc(Project.created_at))
-        else:
-            if sort_by == "name":
-                query = query.order_by(Project.name)
-            elif sort_by == "updated_at":
-                query = query.order_by(Project.updated_at)
-            elif sort_by == "view_count":
-                query = query.order_by(Project.view_count)
-            elif sort_by == "like_count":
-                query = query.order_by(Project.like_count)
-            else:
-                query = query.order_by(Project.created_at)
-        
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-        
-        # Execute query
-        result = await db.execute(query)
-        projects = result.scalars().all()
+        page = await search_projects(
+            db,
+            Project,
+            filters,
+            search=search.strip() if search and search.strip() else None,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=limit,
+            cursor=cursor,
+            offset=skip,
+            columns=PROJECT_LIST_COLUMNS
+        )
         
-        return [ProjectListResponse.from_orm(project) for project in projects]
+        headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else None
+        return json_response(_project_list_row.many(page.items), headers=headers)
         
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error listing projects: {str(e)}")
         raise HTTPException(
@@ -379,12 +354,15 @@ async def get_project(
                     detail="Access denied to this project"
                 )
         
-        # Increment view count if not owner
+        # Count the view without locking the row; flushed in batches
         if project.owner_id != current_user_id:
-            project.view_count += 1
-            await db.commit()
+            await project_counters.record_view(project_id)
         
-        return ProjectResponse.from_orm(project)
+        response = ProjectResponse.from_orm(project)
+        response.view_count, response.like_count = await project_counters.live_counts(
+            project_id, project.view_count, project.like_count
+        )
+        return response
         
     except HTTPException:
         raise
@@ -429,6 +407,7 @@ async def update_project(
             )
         
         # Update fields
+        previous_owner_id = project.owner_id
         update_data = project_data.dict(exclude_unset=True)
         for field, value in update_data.items():
             if hasattr(project, field):
@@ -436,12 +415,16 @@ async def update_project(
         
         # Update slug if name changed
         if 'name' in update_data:
-            project.slug = await generate_unique_slug(project.name, db)
+            await assign_unique_slug(db, project, project.name)
         
         project.updated_at = datetime.utcnow()
         
         await db.commit()
         await db.refresh(project)
+        project_stats.invalidate(project.owner_id)
+        if project.owner_id != previous_owner_id:
+            project_stats.invalidate(previous_owner_id)
+            await ProjectAccessResolver(db).invalidate(project_id)
         
         logger.info(f"Project updated: {project_id} by user {current_user_id}")
         return ProjectResponse.from_orm(project)
@@ -487,6 +470,8 @@ async def delete_project(
         # Delete project (cascade will handle related records)
         await db.delete(project)
         await db.commit()
+        project_stats.invalidate(current_user_id)
+        await ProjectAccessResolver(db).invalidate(project_id)
         
         logger.info(f"Project deleted: {project_id} by user {current_user_id}")
         return {"message": "Project deleted successfully"}
@@ -513,103 +498,14 @@ async def get_project_stats(
 ):
     """Get project statistics overview."""
     try:
-        # Total projects (public + user's private)
-        total_query = select(func.count(Project.id)).where(
-            or_(
-                Project.visibility == ProjectVisibility.PUBLIC,
-                Project.owner_id == current_user_id
-            )
-        )
-        total_result = await db.execute(total_query)
-        total_projects = total_result.scalar()
-        
-        # Public projects
-        public_query = select(func.count(Project.id)).where(
-            Project.visibility == ProjectVisibility.PUBLIC
-        )
-        public_result = await db.execute(public_query)
-        public_projects = public_result.scalar()
-        
-        # Private projects for user
-        private_query = select(func.count(Project.id)).where(
-            and_(
-                Project.owner_id == current_user_id,
-                Project.visibility == ProjectVisibility.PRIVATE
-            )
-        )
-        private_result = await db.execute(private_query)
-        private_projects = private_result.scalar()
-        
-        # Template projects
-        template_query = select(func.count(Project.id)).where(
-            and_(
-                Project.is_template == True,
-                or_(
-                    Project.visibility == ProjectVisibility.PUBLIC,
-                    Project.owner_id == current_user_id
-                )
-            )
-        )
-        template_result = await db.execute(template_query)
-        template_projects = template_result.scalar()
-        
-        # Stats by status
-        status_query = select(
-            Project.status,
-            func.count(Project.id)
-        ).where(
-            or_(
-                Project.visibility == ProjectVisibility.PUBLIC,
-                Project.owner_id == current_user_id
-            )
-        ).group_by(Project.status)
-        
-        status_result = await db.execute(status_query)
-        by_status = {str(row[0]): row[1] for row in status_result.fetchall()}
-        
-        # Stats by engine
-        engine_query = select(
-            Project.engine,
-            func.count(Project.id)
-        ).where(
-            and_(
-                Project.engine.is_not(None),
-                or_(
-                    Project.visibility == ProjectVisibility.PUBLIC,
-                    Project.owner_id == current_user_id
-                )
-            )
-        ).group_by(Project.engine)
-        
-        engine_result = await db.execute(engine_query)
-        by_engine = {str(row[0]): row[1] for row in engine_result.fetchall()}
-        
-        # Stats by genre
-        genre_query = select(
-            Project.genre,
-            func.count(Project.id)
-        ).where(
-            and_(
-                Project.genre.is_not(None),
-                or_(
-                    Project.visibility == ProjectVisibility.PUBLIC,
-                    Project.owner_id == current_user_id
-                )
-            )
-        ).group_by(Project.genre)
-        
-        genre_result = await db.execute(genre_query)
-        by_genre = {str(row[0]): row[1] for row in genre_result.fetchall()}
-        
-        return ProjectStatsResponse(
-            total_projects=total_projects or 0,
-            public_projects=public_projects or 0,
-            private_projects=private_projects or 0,
-            template_projects=template_projects or 0,
-            by_status=by_status,
-            by_engine=by_engine,
-            by_genre=by_genre
-        )
+        # Public facets come from the shared counters; only the user's own
+        # non-public projects are aggregated per request (and cached briefly)
+        overview = await project_stats.get_overview(db, current_user_id)
+        return ProjectStatsResponse(**render_breakdowns(overview, {
+            "by_status": ProjectStatus,
+            "by_engine": GameEngine,
+            "by_genre": GameGenre
+        }))
         
     except Exception as e:
         logger.error(f"Error getting project stats: {str(e)}")
@@ -654,11 +550,8 @@ async def fork_project(
         
         # Create forked project
         fork_name = f"{original_project.name} (Fork)"
-        fork_slug = await generate_unique_slug(fork_name, db)
-        
         forked_project = Project(
             name=fork_name,
-            slug=fork_slug,
             description=original_project.description,
             summary=original_project.summary,
             engine=original_project.engine,
@@ -672,13 +565,15 @@ async def fork_project(
             ai_generated_content=original_project.ai_generated_content
         )
         
-        db.add(forked_project)
-        
         # Update fork count on original
         original_project.fork_count += 1
         
+        # Claim a unique slug (adds and flushes the fork)
+        await assign_unique_slug(db, forked_project, fork_name)
+        
         await db.commit()
         await db.refresh(forked_project)
+        project_stats.invalidate(current_user_id)
         
         logger.info(f"Project forked: {project_id} -> {forked_project.id} by user {current_user_id}")
         return ProjectResponse.from_orm(forked_project)
@@ -700,7 +595,7 @@ async def like_project(
     current_user_id: str = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_async_session)
 ):
-    """Like/unlike a project."""
+    """Like a project (each user's like counts once)."""
     try:
         # Get project
         result = await db.execute(
@@ -723,12 +618,20 @@ async def like_project(
                 detail="Cannot like this project - access denied"
             )
         
-        # Toggle like (in a real implementation, you'd track individual likes)
-        # For now, just increment the counter
-        project.like_count += 1
-        await db.commit()
+        # Buffer the like; project_likes deduplicates it when flushed
+        liked = (
+            not await project_counters.has_liked(db, project_id, current_user_id)
+            and await project_counters.record_like(project_id, current_user_id)
+        )
+        _, like_count = await project_counters.live_counts(
+            project_id, project.view_count, project.like_count
+        )
         
-        return {"message": "Project liked successfully", "like_count": project.like_count}
+        return {
+            "message": "Project liked successfully" if liked else "Project already liked",
+            "liked": liked,
+            "like_count": like_count
+        }
         
     except HTTPException:
         raise
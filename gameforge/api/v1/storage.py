@@ -432,6 +432,9 @@ async def rotate_encryption_keys(
         # result = await storage_security.rotate_encryption_keys(key_ids)
         result = {"rotated_keys": key_ids or ["all"], "status": "success"}
         
+        # Stop reusing data keys wrapped under the old master keys
+        storage_security.data_key_cache.clear()
+        
         # Log the operation
         log_security_event(
             event_type="encryption_keys_rotated",
@@ -454,6 +457,20 @@ async def rotate_encryption_keys(
         )
 
 
+@router.get("/admin/key-cache")
+async def get_key_cache_stats(
+    current_user: Dict[str, Any] = Depends(require_storage_admin)
+):
+    """
+    Get data-key cache statistics.
+    
+    Admin-only endpoint showing how many KMS/Vault calls the
+    data-key cache has saved and how many keys it holds.
+    """
+    storage_security = get_storage_security()
+    return storage_security.data_key_cache.get_stats()
+
+
 @router.get("/admin/security-posture")
 async def get_security_posture(
     current_user: Dict[str, Any] = Depends(require_storage_admin)
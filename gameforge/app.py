@@ -12,15 +12,32 @@ from contextlib import asynccontextmanager
 
 import redis.asyncio as redis
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST
 
 from gameforge.core.config import get_settings
+from gameforge.core.fast_json import DefaultJSONResponse
 from gameforge.core.health import HealthChecker
 from gameforge.core.database import db_manager, setup_database_event_listeners
+from gameforge.core.request_timing import RequestTimingMiddleware
+from src.metrics.gameforge_metrics import metrics, get_prometheus_metrics
 from gameforge.core.security_middleware import (
     setup_security_middleware, setup_exception_handlers
 )
 from gameforge.api.v1 import api_router
+from gameforge.services.membership_cache import membership_cache
+from gameforge.services.monitoring_poller import (
+    RedisSnapshotStore, monitoring_pollers
+)
+from gameforge.services.notification_delivery import notification_delivery
+from gameforge.services.notification_stats import (
+    RedisUnreadCounter, notification_stats
+)
+from gameforge.services.project_counters import RedisCounterBuffer, project_counters
+from gameforge.services.realtime import connection_manager
+from gameforge.services.realtime_bus import (
+    RedisRealtimeBus, RedisPresenceStore
+)
 
 
 # Configure structured logging for ELK compatibility
@@ -44,6 +61,9 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting GameForge application...")
     settings = get_settings()
     
+    # Runs in each worker after fork (gunicorn preloads the app in the master)
+    metrics.start_collection()
+    
     # Initialize SQLAlchemy database manager
     try:
         logger.info("📊 Connecting to database...")
@@ -70,8 +90,49 @@ async def lifespan(app: FastAPI):
         logger.warning(f"⚠️  Redis connection failed: {e}. Continuing without Redis.")
         redis_client = None
     
+    # Share project membership sets across workers when Redis is up
+    if redis_client:
+        membership_cache.configure(redis_client)
+    
+    # Buffer project view/like increments (shared across workers via Redis)
+    if redis_client:
+        project_counters.configure(RedisCounterBuffer(redis_client))
+    await project_counters.start()
+    
+    # Keep unread notification badges in Redis
+    if redis_client:
+        notification_stats.configure(RedisUnreadCounter(redis_client))
+    
+    # Route notifications to sockets on every worker
+    if redis_client:
+        await notification_delivery.start(bus=RedisRealtimeBus(redis_client))
+    else:
+        await notification_delivery.start()
+    
+    # Poll Prometheus/Grafana once per interval for the whole cluster
+    if redis_client:
+        monitoring_pollers.configure(RedisSnapshotStore(redis_client))
+    
+    # Start real-time collaboration fan-out (cross-node when Redis is up)
+    if redis_client:
+        realtime_bus = RedisRealtimeBus(redis_client)
+        await connection_manager.start(
+            bus=realtime_bus,
+            presence=RedisPresenceStore(
+                redis_client, settings.realtime_presence_ttl, node_id=realtime_bus.node_id
+            )
+        )
+    else:
+        await connection_manager.start()
+    
     # Initialize health checker with available services
-    health_checker = HealthChecker(db_manager, redis_client)
+    health_checker = HealthChecker(
+        db_manager,
+        redis_client,
+        cache_ttl=settings.health_cache_ttl,
+        check_timeout=settings.health_check_timeout
+    )
+    await health_checker.start()
     
     # Store in app state for dependency injection
     app.state.db_manager = db_manager
@@ -90,6 +151,13 @@ async def lifespan(app: FastAPI):
         # Cleanup
         logger.info("🛑 Shutting down GameForge application...")
         
+        if health_checker:
+            await health_checker.stop()
+        await connection_manager.stop()
+        await notification_delivery.stop()
+        await project_counters.stop()
+        await monitoring_pollers.stop()
+        
         if redis_client:
             await redis_client.close()
             logger.info("✅ Redis connection closed")
@@ -119,18 +187,30 @@ def create_app() -> FastAPI:
         openapi_url=(
             "/openapi.json" if settings.environment != "production" else None
         ),
+        default_response_class=DefaultJSONResponse,
         lifespan=lifespan
     )
     
     # Setup comprehensive security middleware
     setup_security_middleware(app, settings)
     
+    # Per-phase request timings (outermost, so every phase is inside it)
+    app.add_middleware(
+        RequestTimingMiddleware, server_timing=settings.server_timing_header
+    )
+    
     # Setup global exception handlers
     setup_exception_handlers(app)
     
     # Include API routes
     app.include_router(api_router, prefix="/api/v1")
     
+    # Prometheus scrape endpoint (aggregates every gunicorn worker)
+    @app.get("/metrics", include_in_schema=False)
+    async def prometheus_metrics():
+        content = await asyncio.to_thread(get_prometheus_metrics)
+        return Response(content, media_type=CONTENT_TYPE_LATEST)
+    
     # Root health check endpoint
     @app.get("/health")
     async def health_check():
@@ -11,6 +11,7 @@ from cachetools import TTLCache
 
 from gameforge.core.vault_client import VaultClient
 from gameforge.core.database import DatabaseManager
+from gameforge.core.request_timing import timed
 from gameforge.core.logging_config import (
     get_structured_logger, log_security_event
 )
@@ -71,6 +72,7 @@ class AuthValidator:
                 self._jwt_secret = os.getenv("JWT_SECRET_KEY", "dev-jwt-secret-key")
         return self._jwt_secret
     
+    @timed("auth.jwt")
     async def validate_token(
         self, credentials: Optional[HTTPAuthorizationCredentials]
     ) -> Optional[Dict[str, Any]]:
@@ -39,6 +39,29 @@ class Settings:
         # Redis
         self.redis_url = os.getenv("REDIS_URL", "redis://redis:6379/0")
         
+        # Real-time collaboration delivery
+        self.realtime_send_queue_size = int(
+            os.getenv("REALTIME_SEND_QUEUE_SIZE", "256")
+        )
+        self.realtime_overflow_policy = os.getenv(
+            "REALTIME_OVERFLOW_POLICY", "disconnect"
+        )
+        self.realtime_presence_ttl = int(
+            os.getenv("REALTIME_PRESENCE_TTL", "300")
+        )
+        
+        # Health checks (probes are served from the cached result)
+        self.health_cache_ttl = float(os.getenv("HEALTH_CACHE_TTL", "5"))
+        self.health_check_timeout = float(
+            os.getenv("HEALTH_CHECK_TIMEOUT", "2")
+        )
+        
+        # Per-request latency breakdown in a Server-Timing header
+        self.server_timing_header = os.getenv(
+            "SERVER_TIMING_HEADER",
+            "false" if self.environment == "production" else "true"
+        ).lower() == "true"
+        
         # CORS
         cors_origins_str = os.getenv("CORS_ORIGINS", "*")
         self.cors_origins = (
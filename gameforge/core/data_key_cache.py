@@ -0,0 +1,292 @@
+"""
+Data-key caching for envelope encryption.
+
+Wrapping a fresh data key for every asset costs one KMS/Vault round trip
+per upload, and unwrapping costs one per download. This cache keeps
+plaintext data keys in process memory for a bounded time so that:
+- uploads reuse one data key for many assets (bounded by age, number of
+  assets and bytes encrypted) and wrap it once
+- downloads unwrap each wrapped key once and reuse it for every asset
+  sharing that key
+- concurrent misses for the same key share one provider call
+
+Reused keys stay safe with the streaming format because every asset gets
+its own random nonce prefix; the per-key asset limit keeps nonce
+collisions negligible.
+"""
+import asyncio
+import hashlib
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from gameforge.core.envelope_encryption import generate_data_key
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+
+@dataclass
+class DataKey:
+    """A plaintext data key together with its provider-wrapped form."""
+    plaintext: bytes
+    wrapped: bytes
+    provider: str
+    metadata: str
+    created_at: float = field(default_factory=lambda: time.monotonic())
+    messages: int = 0
+    bytes_encrypted: int = 0
+
+
+class KeyProvider(ABC):
+    """Base class for services that generate and unwrap data keys."""
+
+    name = "base"
+
+    @abstractmethod
+    async def generate_data_key(self) -> DataKey:
+        """Create a new data key and wrap it under the provider's master key."""
+
+    @abstractmethod
+    async def decrypt_data_key(self, wrapped: bytes, metadata: str) -> bytes:
+        """Unwrap a data key previously produced by generate_data_key."""
+
+
+class LocalKeyProvider(KeyProvider):
+    """
+    In-process stand-in for KMS/Vault Transit.
+
+    Wraps data keys with a local AES-GCM master key and counts calls, so
+    tests and local development can observe how often a remote provider
+    would have been contacted.
+    """
+
+    name = "local"
+
+    def __init__(self, master_key: Optional[bytes] = None, latency_seconds: float = 0.0):
+        self._aead = AESGCM(master_key or AESGCM.generate_key(bit_length=256))
+        self.latency_seconds = latency_seconds
+        self.generate_calls = 0
+        self.decrypt_calls = 0
+
+    async def generate_data_key(self) -> DataKey:
+        self.generate_calls += 1
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+
+        plaintext = generate_data_key()
+        nonce = os.urandom(12)
+        return DataKey(
+            plaintext=plaintext,
+            wrapped=nonce + self._aead.encrypt(nonce, plaintext, None),
+            provider=self.name,
+            metadata="{}"
+        )
+
+    async def decrypt_data_key(self, wrapped: bytes, metadata: str) -> bytes:
+        self.decrypt_calls += 1
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+
+        return self._aead.decrypt(wrapped[:12], wrapped[12:], None)
+
+
+class DataKeyCache:
+    """Bounded, age-limited LRU cache of data keys for encryption and decryption."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_age_seconds: float = 300.0,
+        max_messages_per_key: int = 1000,
+        max_bytes_per_key: int = 16 * 1024 ** 3
+    ):
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self.max_messages_per_key = max_messages_per_key
+        self.max_bytes_per_key = max_bytes_per_key
+
+        self._encryption_keys: "OrderedDict[str, DataKey]" = OrderedDict()
+        self._decryption_keys: "OrderedDict[str, DataKey]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.stats: Dict[str, int] = {
+            "encrypt_hits": 0,
+            "encrypt_misses": 0,
+            "decrypt_hits": 0,
+            "decrypt_misses": 0,
+            "provider_calls": 0,
+            "provider_calls_saved": 0,
+            "retired_keys": 0,
+            "uncached_keys": 0,
+            "evictions": 0
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def _expired(self, key: DataKey) -> bool:
+        return time.monotonic() - key.created_at >= self.max_age_seconds
+
+    def _exhausted(self, key: DataKey) -> bool:
+        return (
+            key.messages >= self.max_messages_per_key
+            or key.bytes_encrypted >= self.max_bytes_per_key
+        )
+
+    def _store(self, entries: "OrderedDict[str, DataKey]", cache_key: str, key: DataKey) -> None:
+        entries[cache_key] = key
+        entries.move_to_end(cache_key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    async def _single_flight(self, flight_key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `load` once for concurrent callers asking for the same key."""
+        future = self._inflight.get(flight_key)
+        if future is not None:
+            self.stats["provider_calls_saved"] += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
+        try:
+            self.stats["provider_calls"] += 1
+            result = await load()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure does not log a warning
+            future.exception()
+            raise
+        finally:
+            del self._inflight[flight_key]
+
+    async def get_encryption_key(
+        self,
+        partition: str,
+        generate: Callable[[], Awaitable[DataKey]],
+        reusable: Optional[Callable[[DataKey], bool]] = None
+    ) -> DataKey:
+        """
+        Return a data key for encrypting one asset under `partition`.
+
+        Args:
+            partition: Cache partition, e.g. provider and master key id; keys
+                are never shared across partitions
+            generate: Coroutine function creating a wrapped key on a miss,
+                such as KeyProvider.generate_data_key
+            reusable: Whether a generated key belongs in `partition`; keys
+                failing the check are handed out without being cached
+
+        Returns:
+            DataKey whose usage has been reserved for one asset
+        """
+        if not self.enabled:
+            self.stats["provider_calls"] += 1
+            key = await generate()
+            key.messages += 1
+            return key
+
+        key = self._encryption_keys.get(partition)
+        if key is not None and (self._expired(key) or self._exhausted(key)):
+            del self._encryption_keys[partition]
+            self.stats["retired_keys"] += 1
+            key = None
+
+        if key is not None:
+            self.stats["encrypt_hits"] += 1
+            self.stats["provider_calls_saved"] += 1
+            self._encryption_keys.move_to_end(partition)
+        else:
+            self.stats["encrypt_misses"] += 1
+            key = await self._single_flight(f"encrypt:{partition}", generate)
+            if reusable is not None and not reusable(key):
+                self.stats["uncached_keys"] += 1
+            elif partition not in self._encryption_keys:
+                self._store(self._encryption_keys, partition, key)
+                # Reads of freshly written assets need no unwrap call
+                self._store(self._decryption_keys, self._wrapped_id(key.wrapped), key)
+
+        key.messages += 1
+        return key
+
+    def record_usage(self, key: DataKey, bytes_encrypted: int) -> None:
+        """Account for bytes encrypted with a cached key; exhausted keys retire on next use."""
+        key.bytes_encrypted += bytes_encrypted
+
+    async def get_decryption_key(
+        self,
+        wrapped: bytes,
+        unwrap: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """
+        Return the plaintext for a wrapped data key.
+
+        Args:
+            wrapped: Wrapped data key as stored with the asset
+            unwrap: Coroutine function calling the provider on a miss, such as
+                a partial of KeyProvider.decrypt_data_key
+        """
+        if not self.enabled:
+            self.stats["provider_calls"] += 1
+            return await unwrap()
+
+        cache_key = self._wrapped_id(wrapped)
+        key = self._decryption_keys.get(cache_key)
+        if key is not None and self._expired(key):
+            del self._decryption_keys[cache_key]
+            key = None
+
+        if key is not None:
+            self.stats["decrypt_hits"] += 1
+            self.stats["provider_calls_saved"] += 1
+            self._decryption_keys.move_to_end(cache_key)
+            return key.plaintext
+
+        self.stats["decrypt_misses"] += 1
+        plaintext = await self._single_flight(f"decrypt:{cache_key}", unwrap)
+        if cache_key not in self._decryption_keys:
+            self._store(
+                self._decryption_keys,
+                cache_key,
+                DataKey(plaintext=plaintext, wrapped=wrapped, provider="", metadata="")
+            )
+        return plaintext
+
+    def clear(self) -> None:
+        """Drop every cached key, e.g. after a master key rotation."""
+        self._encryption_keys.clear()
+        self._decryption_keys.clear()
+        logger.info("Data key cache cleared")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache counters plus current sizes."""
+        return {
+            **self.stats,
+            "encryption_keys_cached": len(self._encryption_keys),
+            "decryption_keys_cached": len(self._decryption_keys),
+            "max_entries": self.max_entries,
+            "max_age_seconds": self.max_age_seconds,
+            "max_messages_per_key": self.max_messages_per_key,
+            "max_bytes_per_key": self.max_bytes_per_key
+        }
+
+    @staticmethod
+    def _wrapped_id(wrapped: bytes) -> str:
+        return hashlib.sha256(wrapped).hexdigest()
+
+
+__all__ = [
+    'DataKey',
+    'KeyProvider',
+    'LocalKeyProvider',
+    'DataKeyCache'
+]
@@ -25,6 +25,7 @@ from sqlalchemy import (
 )
 from gameforge.core.config import get_settings
 from gameforge.core.logging_config import get_structured_logger
+from gameforge.core.request_timing import span
 from gameforge.core.base import Base  # Import Base from separate module
 
 # Import all models to ensure they're registered with SQLAlchemy
@@ -154,14 +155,17 @@ class DatabaseManager:
         if not self._initialized:
             await self.initialize()
         
-        async with self._async_session_factory() as session:
+        with span("db.session"):
+            session = self._async_session_factory()
+        async with session:
             try:
                 yield session
             except Exception:
                 await session.rollback()
                 raise
             finally:
-                await session.close()
+                with span("db.session"):
+                    await session.close()
     
     def get_sync_session(self):
         """Get sync database session for migrations and admin tasks."""
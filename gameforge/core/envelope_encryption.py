@@ -0,0 +1,315 @@
+"""
+Streaming envelope encryption for large GameForge assets.
+
+Assets are encrypted with a fresh per-asset AES-256 data key; only that
+32-byte key is sent to the configured KMS/Vault provider for wrapping.
+The object itself is a sequence of independently authenticated AES-GCM
+frames, so it can be encrypted while uploading and decrypted one frame at
+a time, including for byte-range reads.
+
+Object layout:
+
+    header  = magic "GFE1" | version (1 byte) | chunk size (uint32) | nonce prefix (7 bytes)
+    frame_i = AES-GCM(data key, nonce_i, plaintext chunk_i, aad=header)  -> chunk + 16-byte tag
+
+    nonce_i = nonce prefix (7 bytes) | frame index (uint32) | last-frame flag (1 byte)
+
+Every frame holds exactly `chunk size` plaintext bytes except the last one.
+Binding the frame index and the last-frame flag into the nonce rejects
+reordered, duplicated and truncated frame sequences.
+"""
+import hashlib
+import os
+import struct
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator, Optional, Tuple
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+STREAM_FORMAT = "gfe1-aes256gcm-stream"
+MAGIC = b"GFE1"
+VERSION = 1
+HEADER_STRUCT = struct.Struct(">4sBI7s")
+HEADER_SIZE = HEADER_STRUCT.size
+NONCE_PREFIX_SIZE = 7
+TAG_SIZE = 16
+DATA_KEY_SIZE = 32
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+MAX_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+class EnvelopeDecryptionError(ValueError):
+    """Raised when an encrypted stream is malformed or fails authentication."""
+
+
+@dataclass(frozen=True)
+class StreamHeader:
+    """Parsed stream header."""
+    chunk_size: int
+    nonce_prefix: bytes
+
+    def to_bytes(self) -> bytes:
+        return HEADER_STRUCT.pack(MAGIC, VERSION, self.chunk_size, self.nonce_prefix)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StreamHeader":
+        if len(data) < HEADER_SIZE:
+            raise EnvelopeDecryptionError("Encrypted stream header is truncated")
+
+        magic, version, chunk_size, nonce_prefix = HEADER_STRUCT.unpack(data[:HEADER_SIZE])
+        if magic != MAGIC or version != VERSION:
+            raise EnvelopeDecryptionError("Unsupported encrypted stream format")
+        if not 0 < chunk_size <= MAX_CHUNK_SIZE:
+            raise EnvelopeDecryptionError(f"Invalid stream chunk size: {chunk_size}")
+
+        return cls(chunk_size=chunk_size, nonce_prefix=nonce_prefix)
+
+    @property
+    def frame_size(self) -> int:
+        return self.chunk_size + TAG_SIZE
+
+
+def generate_data_key() -> bytes:
+    """Generate a fresh per-asset AES-256 data key."""
+    return AESGCM.generate_key(bit_length=DATA_KEY_SIZE * 8)
+
+
+def _frame_nonce(nonce_prefix: bytes, index: int, last: bool) -> bytes:
+    return nonce_prefix + struct.pack(">IB", index, 1 if last else 0)
+
+
+def frame_count(plaintext_size: int, chunk_size: int) -> int:
+    """Number of frames for a plaintext of the given size (empty input has one frame)."""
+    return max(1, -(-plaintext_size // chunk_size))
+
+
+def encrypted_size(plaintext_size: int, chunk_size: int) -> int:
+    """Size of the encrypted object for a plaintext of the given size."""
+    return HEADER_SIZE + plaintext_size + frame_count(plaintext_size, chunk_size) * TAG_SIZE
+
+
+def frame_range(
+    plaintext_size: int,
+    chunk_size: int,
+    start: int,
+    end: int
+) -> Tuple[int, int, int, int]:
+    """
+    Map an inclusive plaintext byte range onto whole frames.
+
+    Returns:
+        Tuple of (first frame, last frame, encrypted start offset, encrypted end offset),
+        offsets inclusive and relative to the start of the object
+    """
+    if start < 0 or end < start or end >= plaintext_size:
+        raise ValueError(f"Invalid byte range {start}-{end} for size {plaintext_size}")
+
+    first = start // chunk_size
+    last = end // chunk_size
+    frame_size = chunk_size + TAG_SIZE
+    enc_start = HEADER_SIZE + first * frame_size
+    enc_end = min(
+        HEADER_SIZE + (last + 1) * frame_size,
+        encrypted_size(plaintext_size, chunk_size)
+    ) - 1
+
+    return first, last, enc_start, enc_end
+
+
+class StreamEncryptor:
+    """
+    Incremental encryptor producing the framed object format.
+
+    Feed plaintext of any size with `update()` and finish with `finalize()`;
+    both return ready-to-upload bytes. The SHA-256 of the plaintext and its
+    size are tracked along the way.
+    """
+
+    def __init__(self, data_key: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if not 0 < chunk_size <= MAX_CHUNK_SIZE:
+            raise ValueError(f"Invalid stream chunk size: {chunk_size}")
+
+        self._aead = AESGCM(data_key)
+        self.header = StreamHeader(chunk_size=chunk_size, nonce_prefix=os.urandom(NONCE_PREFIX_SIZE))
+        self._buffer = bytearray()
+        self._index = 0
+        self._header_sent = False
+        self._finalized = False
+        self._sha256 = hashlib.sha256()
+        self.plaintext_size = 0
+
+    @property
+    def checksum_sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+    def _seal(self, chunk: bytes, last: bool) -> bytes:
+        nonce = _frame_nonce(self.header.nonce_prefix, self._index, last)
+        self._index += 1
+        return self._aead.encrypt(nonce, chunk, self.header.to_bytes())
+
+    def _take_header(self) -> bytes:
+        if self._header_sent:
+            return b""
+        self._header_sent = True
+        return self.header.to_bytes()
+
+    def update(self, data: bytes) -> bytes:
+        """Encrypt as many whole frames as the buffered plaintext allows."""
+        if self._finalized:
+            raise RuntimeError("StreamEncryptor already finalized")
+
+        self._sha256.update(data)
+        self.plaintext_size += len(data)
+        self._buffer.extend(data)
+
+        chunk_size = self.header.chunk_size
+        out = [self._take_header()]
+        # Keep at least one byte back: the final frame must carry the last-frame flag
+        while len(self._buffer) > chunk_size:
+            out.append(self._seal(bytes(self._buffer[:chunk_size]), last=False))
+            del self._buffer[:chunk_size]
+
+        return b"".join(out)
+
+    def finalize(self) -> bytes:
+        """Encrypt the remaining plaintext as the last frame."""
+        if self._finalized:
+            raise RuntimeError("StreamEncryptor already finalized")
+
+        self._finalized = True
+        out = self._take_header() + self._seal(bytes(self._buffer), last=True)
+        self._buffer.clear()
+        return out
+
+
+class StreamDecryptor:
+    """
+    Incremental decryptor for the framed object format.
+
+    Construct with the header (or call `update()` with data starting at the
+    header) and feed encrypted bytes; each authenticated frame is returned
+    as soon as it is complete. For ranged reads pass the header, the frame
+    window (`first_frame`..`last_frame`) and `total_frames`, and feed bytes
+    starting at `first_frame`.
+    """
+
+    def __init__(
+        self,
+        data_key: bytes,
+        header: Optional[StreamHeader] = None,
+        first_frame: int = 0,
+        last_frame: Optional[int] = None,
+        total_frames: Optional[int] = None
+    ):
+        self._aead = AESGCM(data_key)
+        self.header = header
+        self._header_bytes = header.to_bytes() if header else b""
+        self._buffer = bytearray()
+        self._index = first_frame
+        self._last_frame = last_frame
+        self._total_frames = total_frames
+        self._done = False
+
+    def _open(self, frame: bytes, last: bool) -> bytes:
+        nonce = _frame_nonce(self.header.nonce_prefix, self._index, last)
+        try:
+            plaintext = self._aead.decrypt(nonce, frame, self._header_bytes)
+        except InvalidTag as e:
+            raise EnvelopeDecryptionError(
+                f"Authentication failed for frame {self._index}"
+            ) from e
+        self._index += 1
+        return plaintext
+
+    def _is_last(self, index: int) -> bool:
+        return self._total_frames is not None and index == self._total_frames - 1
+
+    def update(self, data: bytes) -> Iterator[bytes]:
+        """Yield plaintext for every complete frame buffered so far."""
+        if self._done:
+            if data:
+                raise EnvelopeDecryptionError("Data found after the last frame")
+            return
+
+        self._buffer.extend(data)
+
+        if self.header is None:
+            if len(self._buffer) < HEADER_SIZE:
+                return
+            self.header = StreamHeader.from_bytes(bytes(self._buffer[:HEADER_SIZE]))
+            self._header_bytes = self.header.to_bytes()
+            del self._buffer[:HEADER_SIZE]
+
+        frame_size = self.header.frame_size
+        # Without a known frame count, hold back one full frame until more data
+        # (or finalize) shows whether it is the last one
+        while len(self._buffer) > frame_size or (
+            len(self._buffer) == frame_size and self._total_frames is not None
+        ):
+            if self._last_frame is not None and self._index > self._last_frame:
+                raise EnvelopeDecryptionError("Data found after the requested frames")
+            last = self._is_last(self._index)
+            frame = bytes(self._buffer[:frame_size])
+            del self._buffer[:frame_size]
+            yield self._open(frame, last=last)
+            if last:
+                self._done = True
+                if self._buffer:
+                    raise EnvelopeDecryptionError("Data found after the last frame")
+                return
+
+    def finalize(self) -> Iterator[bytes]:
+        """Decrypt any remaining frame; fails if the stream was truncated."""
+        if self._done:
+            return
+        if self.header is None:
+            raise EnvelopeDecryptionError("Encrypted stream header is truncated")
+
+        self._done = True
+        if not self._buffer:
+            # Only a ranged read may legitimately stop on a frame boundary
+            if self._last_frame is None or self._index != self._last_frame + 1:
+                raise EnvelopeDecryptionError("Encrypted stream is truncated")
+            return
+
+        if len(self._buffer) < TAG_SIZE or (
+            self._total_frames is not None and not self._is_last(self._index)
+        ):
+            raise EnvelopeDecryptionError("Encrypted stream is truncated")
+
+        frame = bytes(self._buffer)
+        self._buffer.clear()
+        yield self._open(frame, last=True)
+
+
+async def decrypt_stream(
+    data_key: bytes,
+    chunks: AsyncIterator[bytes],
+    header: Optional[StreamHeader] = None,
+    first_frame: int = 0,
+    last_frame: Optional[int] = None,
+    total_frames: Optional[int] = None
+) -> AsyncIterator[bytes]:
+    """Decrypt an async iterator of encrypted bytes frame by frame."""
+    decryptor = StreamDecryptor(data_key, header, first_frame, last_frame, total_frames)
+    async for chunk in chunks:
+        for plaintext in decryptor.update(chunk):
+            yield plaintext
+    for plaintext in decryptor.finalize():
+        yield plaintext
+
+
+__all__ = [
+    'STREAM_FORMAT',
+    'DEFAULT_CHUNK_SIZE',
+    'EnvelopeDecryptionError',
+    'StreamHeader',
+    'StreamEncryptor',
+    'StreamDecryptor',
+    'generate_data_key',
+    'frame_count',
+    'encrypted_size',
+    'frame_range',
+    'decrypt_stream'
+]
@@ -0,0 +1,115 @@
+"""
+Fast-path JSON responses for GameForge AI Platform.
+
+High-volume list endpoints used to build one Pydantic model per row and
+let FastAPI validate and re-encode every page through response_model.
+The fast path skips both:
+- DefaultJSONResponse renders with orjson when it is installed (it is the
+  application's default_response_class)
+- RowSerializer maps projected rows (SQLAlchemy row mappings or plain
+  dicts) straight to response dicts. Its field mapping is checked against
+  the response model once, when the serializer is built, instead of once
+  per row; None in a non-Optional column falls back to the field's empty
+  value so the output still matches the declared schema
+- json_response() returns the result directly; endpoints keep
+  response_model for the OpenAPI schema
+"""
+import typing
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Type, Union
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSONResponse = None
+    ORJSON_AVAILABLE = False
+
+DefaultJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+# Field source: a row key, or a callable computing the value from the row
+FieldSource = Union[str, Callable[[Mapping[str, Any]], Any]]
+
+_EMPTY_VALUES = {int: 0, float: 0.0, bool: False, str: ""}
+_EMPTY_CONTAINERS = {list: list, List: list, dict: dict, Dict: dict}
+
+
+def _is_optional(annotation: Any) -> bool:
+    return typing.get_origin(annotation) is Union and type(None) in typing.get_args(annotation)
+
+
+def _empty_value(annotation: Any) -> Callable[[], Any]:
+    """Factory for the value used when a non-Optional column is NULL."""
+    origin = typing.get_origin(annotation) or annotation
+    if origin in _EMPTY_CONTAINERS:
+        return _EMPTY_CONTAINERS[origin]
+    for base, empty in _EMPTY_VALUES.items():
+        if isinstance(origin, type) and issubclass(origin, base):
+            return lambda empty=empty: empty
+    return lambda: None
+
+
+class RowSerializer:
+    """
+    Maps rows to response dicts shaped like a Pydantic model.
+
+    Args:
+        model: Response model whose fields define the output keys
+        sources: Response field -> row key or callable(row); fields not listed
+            are read from the row key of the same name
+
+    Raises:
+        ValueError: If sources name fields the model does not have
+    """
+
+    def __init__(self, model: Type[BaseModel], sources: Optional[Dict[str, FieldSource]] = None):
+        sources = dict(sources or {})
+        unknown = set(sources) - set(model.model_fields)
+        if unknown:
+            raise ValueError(f"{model.__name__} has no fields {sorted(unknown)}")
+
+        self.model = model
+        self._fields = []
+        for name, field in model.model_fields.items():
+            source = sources.get(name, name)
+            if field.is_required() and _is_optional(field.annotation):
+                empty = lambda: None
+            elif not field.is_required():
+                empty = lambda field=field: field.get_default(call_default_factory=True)
+            else:
+                empty = _empty_value(field.annotation)
+            self._fields.append((name, source, empty))
+
+    def __call__(self, row: Mapping[str, Any]) -> Dict[str, Any]:
+        result = {}
+        for name, source, empty in self._fields:
+            value = source(row) if callable(source) else row.get(source)
+            result[name] = empty() if value is None else value
+        return result
+
+    def many(self, rows: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        return [self(row) for row in rows]
+
+
+def json_response(
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None
+):
+    """Render content with orjson (or the stdlib encoder as a fallback)."""
+    if ORJSON_AVAILABLE:
+        return ORJSONResponse(content, status_code=status_code, headers=headers)
+    return JSONResponse(jsonable_encoder(content), status_code=status_code, headers=headers)
+
+
+__all__ = [
+    'ORJSON_AVAILABLE',
+    'DefaultJSONResponse',
+    'RowSerializer',
+    'json_response'
+]
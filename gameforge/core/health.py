@@ -1,12 +1,30 @@
 """
 Comprehensive health checking for GameForge application.
+
+Checks run concurrently, each bounded by its own timeout, and the combined
+result is cached for `cache_ttl` seconds. A background refresher keeps the
+cache warm, so load balancer probes read the last result instead of hitting
+the database and Redis on every request. Concurrent callers that find the
+cache stale share a single run.
 """
 import asyncio
 import time
 from typing import Dict, Any, Optional
 
 import redis.asyncio as redis
+from prometheus_client import Histogram
+
 from gameforge.core.database import DatabaseManager
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+HEALTH_CHECK_DURATION = Histogram(
+    'gameforge_health_check_duration_seconds',
+    'Duration of individual health checks',
+    ['check'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
 
 
 class HealthChecker:
@@ -15,11 +33,51 @@ class HealthChecker:
     def __init__(
         self,
         db_manager: Optional[DatabaseManager] = None,
-        redis_client: Optional[redis.Redis] = None
+        redis_client: Optional[redis.Redis] = None,
+        cache_ttl: float = 5.0,
+        check_timeout: float = 2.0,
+        refresh_interval: Optional[float] = None
     ):
+        """
+        Args:
+            db_manager: Database manager to probe
+            redis_client: Redis client to probe
+            cache_ttl: Seconds a completed run is served to callers
+            check_timeout: Seconds before a single check is reported unhealthy
+            refresh_interval: Background refresh period (default: cache_ttl / 2)
+        """
         self.db_manager = db_manager
         self.redis_client = redis_client
         self.start_time = time.time()
+        self.cache_ttl = cache_ttl
+        self.check_timeout = check_timeout
+        self.refresh_interval = refresh_interval or max(cache_ttl / 2, 0.1)
+        
+        self._cached: Optional[Dict[str, Dict[str, Any]]] = None
+        self._cached_at = 0.0
+        self._checked_at: Optional[float] = None
+        self._inflight: Optional[asyncio.Task] = None
+        self._refresher: Optional[asyncio.Task] = None
+        self.stats = {"runs": 0, "cache_hits": 0, "timeouts": 0}
+    
+    async def start(self) -> None:
+        """Run the checks once and keep the cached result fresh in the background."""
+        if self._refresher is None:
+            await self._run_health_checks()
+            self._refresher = asyncio.create_task(self._refresh_loop())
+    
+    async def stop(self) -> None:
+        for task in (self._refresher, self._inflight):
+            if task is not None and not task.done():
+                task.cancel()
+        self._refresher = None
+        self._inflight = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "cache_age": time.monotonic() - self._cached_at if self._cached else None
+        }
     
     async def check_health(self) -> Dict[str, Any]:
         """
@@ -67,7 +125,9 @@ class HealthChecker:
             "uptime": time.time() - self.start_time,
             "version": "1.0.0",
             "environment": "production",
-            "checks": health_checks
+            "checks": health_checks,
+            "checked_at": self._checked_at,
+            "cache": self.get_stats()
         }
     
     async def check_readiness(self) -> Dict[str, Any]:
@@ -96,10 +156,18 @@ class HealthChecker:
         }
     
     async def _run_health_checks(self) -> Dict[str, Dict[str, Any]]:
-        """Run all health checks concurrently."""
-        checks = {}
+        """Cached results of all health checks (runs them when stale)."""
+        if self._cached is not None and time.monotonic() - self._cached_at < self.cache_ttl:
+            self.stats["cache_hits"] += 1
+            return self._cached
         
-        # Run checks concurrently
+        # Single flight: every caller waits on the same run
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._execute_checks())
+        return await asyncio.shield(self._inflight)
+    
+    async def _execute_checks(self) -> Dict[str, Dict[str, Any]]:
+        """Run all health checks concurrently."""
         tasks = []
         
         if self.db_manager:
@@ -115,19 +183,56 @@ class HealthChecker:
             ("memory", self._check_memory())
         ])
         
-        # Execute all checks
-        for name, task in tasks:
-            try:
-                checks[name] = await task
-            except Exception as e:
-                checks[name] = {
-                    "status": "unhealthy",
-                    "error": str(e),
-                    "timestamp": time.time()
-                }
+        results = await asyncio.gather(
+            *(self._timed_check(name, check) for name, check in tasks)
+        )
+        checks = dict(zip((name for name, _ in tasks), results))
         
+        self._cached = checks
+        self._cached_at = time.monotonic()
+        self._checked_at = time.time()
+        self.stats["runs"] += 1
         return checks
     
+    async def _timed_check(self, name: str, check) -> Dict[str, Any]:
+        """Run one check under the timeout and record its latency."""
+        start_time = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(check, self.check_timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            result = {
+                "status": "unhealthy",
+                "error": f"Check timed out after {self.check_timeout}s",
+                "timestamp": time.time()
+            }
+        except Exception as e:
+            result = {
+                "status": "unhealthy",
+                "error": str(e),
+                "timestamp": time.time()
+            }
+        
+        duration = time.perf_counter() - start_time
+        HEALTH_CHECK_DURATION.labels(check=name).observe(duration)
+        result["duration_ms"] = round(duration * 1000, 3)
+        previous = (self._cached or {}).get(name, {}).get("status")
+        if result["status"] != "healthy" and previous != result["status"]:
+            logger.warning("Health check failed", check=name, error=result.get("error"))
+        return result
+    
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                if self._inflight is None or self._inflight.done():
+                    self._inflight = asyncio.create_task(self._execute_checks())
+                await asyncio.shield(self._inflight)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Health check refresh failed", error=str(e))
+    
     async def _check_database(self) -> Dict[str, Any]:
         """Check SQLAlchemy database connectivity."""
         if not self.db_manager:
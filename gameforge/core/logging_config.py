@@ -1,13 +1,28 @@
 """
 Structured logging configuration for GameForge AI Platform.
 Provides ELK-stack compatible JSON logging with proper context.
+
+Request threads only build the log record and put it on a queue; a
+QueueListener thread renders it to JSON (orjson) and writes it. structlog
+event dicts travel on the record as `extra_fields`, so every entry is
+encoded exactly once. Info-level security and API events go through an
+EventSampler first, so per-request events can be sampled and rate-capped
+per event type.
 """
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+import random
 import sys
+import threading
+import time
 import structlog
-from typing import Any, Dict
-import json
-from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from datetime import datetime, timezone
+
+import orjson
 
 
 class ELKFormatter(logging.Formatter):
@@ -16,7 +31,7 @@ class ELKFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON for ELK ingestion."""
         log_data = {
-            "@timestamp": datetime.utcnow().isoformat(),
+            "@timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -24,18 +39,133 @@ class ELKFormatter(logging.Formatter):
             "function": record.funcName,
             "line": record.lineno,
             "service": "gameforge-ai",
-            "environment": "production"
+            "environment": "production",
+            "deployment": "vastai"
         }
         
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            log_data["stack"] = self.formatStack(record.stack_info)
         
         # Add extra fields if present
         if hasattr(record, 'extra_fields'):
             log_data.update(record.extra_fields)
         
-        return json.dumps(log_data, default=str)
+        return orjson.dumps(
+            log_data, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+
+class _LogQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue records without formatting them.
+    
+    The stock QueueHandler formats in the calling thread; here the listener
+    does it. A full queue drops the record instead of blocking the request.
+    """
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve %-args now; they may be mutated after the call returns
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class EventSampler:
+    """
+    Per-event-type sampling and rate caps for info-level events.
+    
+    Args:
+        sample_rates: event_type -> fraction of events kept (default 1.0)
+        rate_limit: Events kept per event type per second (0 = unlimited)
+    
+    Warnings and errors are always kept. The next kept event of a type
+    carries how many were dropped before it, so counts can be re-weighted.
+    """
+    
+    def __init__(self, sample_rates: Optional[Dict[str, float]] = None, rate_limit: int = 0):
+        self.sample_rates = sample_rates or {}
+        self.rate_limit = rate_limit
+        # event_type -> [window_second, kept_in_window, dropped_since_last_kept]
+        self._windows: Dict[str, list] = {}
+    
+    def sample(self, event_type: str, severity: str = "info") -> Tuple[bool, int]:
+        """
+        Returns:
+            (keep, dropped): whether to log the event, and how many events
+            of this type were dropped since the last one kept
+        """
+        if severity not in ("info", "debug"):
+            return True, self._take_dropped(event_type)
+        
+        state = self._windows.get(event_type)
+        if state is None:
+            state = self._windows[event_type] = [0, 0, 0]
+        
+        rate = self.sample_rates.get(event_type, 1.0)
+        if rate < 1.0 and random.random() >= rate:
+            state[2] += 1
+            return False, 0
+        
+        if self.rate_limit:
+            second = int(time.monotonic())
+            if state[0] != second:
+                state[0], state[1] = second, 0
+            if state[1] >= self.rate_limit:
+                state[2] += 1
+                return False, 0
+            state[1] += 1
+        
+        dropped, state[2] = state[2], 0
+        return True, dropped
+    
+    def _take_dropped(self, event_type: str) -> int:
+        state = self._windows.get(event_type)
+        if state is None:
+            return 0
+        dropped, state[2] = state[2], 0
+        return dropped
+    
+    @classmethod
+    def from_env(cls) -> "EventSampler":
+        """LOG_SAMPLE_RATES="api_request_completed=0.1,token_validated=0.05" and LOG_EVENT_RATE_LIMIT."""
+        sample_rates = {}
+        for item in os.getenv("LOG_SAMPLE_RATES", "").split(","):
+            if "=" in item:
+                event_type, rate = item.split("=", 1)
+                sample_rates[event_type.strip()] = float(rate)
+        return cls(sample_rates, int(os.getenv("LOG_EVENT_RATE_LIMIT", "0")))
+
+
+event_sampler = EventSampler.from_env()
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _render_to_record(logger, method_name, event_dict):
+    """Final structlog processor: hand the event dict to stdlib untouched."""
+    exc_info = event_dict.pop("exc_info", None)
+    stack_info = event_dict.pop("stack_info", False)
+    return {
+        "msg": event_dict.pop("event", ""),
+        "exc_info": exc_info,
+        "stack_info": stack_info,
+        "extra": {"extra_fields": event_dict}
+    }
 
 
 def setup_structured_logging():
@@ -43,39 +173,39 @@ def setup_structured_logging():
     Configure structured logging for the entire application.
     Sets up both standard logging and structlog for ELK compatibility.
     """
-    # Configure standard logging with ELK formatter
+    global _listener
+    
+    # Write from a background thread; request threads only enqueue
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(ELKFormatter())
+    log_queue = queue.Queue(maxsize=int(os.getenv("LOG_QUEUE_SIZE", "10000")))
     
-    # Remove default handlers and add our ELK handler
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+        _listener = logging.handlers.QueueListener(
+            log_queue, handler, respect_handler_level=True
+        )
+        _listener.start()
+    
+    # Remove default handlers and add the queue handler
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+    root_logger.addHandler(_LogQueueHandler(log_queue))
     root_logger.setLevel(logging.INFO)
     
-    # Configure structlog for structured logging
+    # Configure structlog for structured logging; level, logger name,
+    # timestamp and service metadata are added by ELKFormatter
     structlog.configure(
         processors=[
             # Filter by log level
             structlog.stdlib.filter_by_level,
-            # Add logger name
-            structlog.stdlib.add_logger_name,
-            # Add log level
-            structlog.stdlib.add_log_level,
             # Process positional arguments
             structlog.stdlib.PositionalArgumentsFormatter(),
-            # Add timestamp
-            structlog.processors.TimeStamper(fmt="iso"),
-            # Add stack info for errors
-            structlog.processors.StackInfoRenderer(),
-            # Format exception info
-            structlog.processors.format_exc_info,
             # Ensure unicode
             structlog.processors.UnicodeDecoder(),
-            # Add service metadata
-            add_service_metadata,
-            # Output as JSON
-            structlog.processors.JSONRenderer()
+            # Pass the event dict to ELKFormatter as extra_fields
+            _render_to_record
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -84,12 +214,16 @@ def setup_structured_logging():
     )
 
 
-def add_service_metadata(logger, method_name, event_dict):
-    """Add consistent service metadata to all log entries."""
-    event_dict["service"] = "gameforge-ai"
-    event_dict["environment"] = "production"
-    event_dict["deployment"] = "vastai"
-    return event_dict
+def shutdown_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+atexit.register(shutdown_logging)
 
 
 def get_structured_logger(name: str):
@@ -97,6 +231,10 @@ def get_structured_logger(name: str):
     return structlog.get_logger(name)
 
 
+_security_logger = get_structured_logger("gameforge.security")
+_api_logger = get_structured_logger("gameforge.api")
+
+
 def log_ai_job_event(
     event_type: str,
     job_id: str,
@@ -157,13 +295,18 @@ def log_security_event(
         severity: Event severity (info, warning, error, critical)
         **kwargs: Additional context fields
     """
-    logger = get_structured_logger("gameforge.security")
+    keep, dropped = event_sampler.sample(event_type, severity)
+    if not keep:
+        return
+    logger = _security_logger
     
     log_data = {
         "event_type": event_type,
         "severity": severity,
         **kwargs
     }
+    if dropped:
+        log_data["sampled_out"] = dropped
     
     if user_id:
         log_data["user_id"] = user_id
@@ -199,7 +342,12 @@ def log_api_request(
         ip_address: Client IP address
         **kwargs: Additional context fields
     """
-    logger = get_structured_logger("gameforge.api")
+    keep, dropped = event_sampler.sample(
+        "api_request", "error" if status_code >= 400 else "info"
+    )
+    if not keep:
+        return
+    logger = _api_logger
     
     log_data = {
         "event_type": "api_request",
@@ -210,6 +358,8 @@ def log_api_request(
         **kwargs
     }
     
+    if dropped:
+        log_data["sampled_out"] = dropped
     if user_id:
         log_data["user_id"] = user_id
     if ip_address:
@@ -0,0 +1,225 @@
+"""
+Request Timing for GameForge AI Platform
+========================================
+
+Per-request latency breakdown:
+- RequestTimingMiddleware (outermost, pure ASGI) puts a RequestTimings in a
+  contextvar for each HTTP request
+- `span("phase")` blocks and `@timed("phase")` coroutines append
+  (phase, start, duration) to it: two perf_counter() calls and a list append
+- When the response starts, the phases finished so far are optionally sent
+  back as a Server-Timing header
+- When the request finishes (body sent), every phase, including those that
+  ended after the response started, is summed and observed once in
+  gameforge_request_phase_duration_seconds{phase}
+- With REQUEST_TIMING_OTEL=true and opentelemetry installed, the phases are
+  also exported as child spans of one request span, after the response, so
+  the request path never touches the tracer
+
+Phases overlap: "handler" covers everything below the security middleware up
+to the start of the response, including the "auth.jwt" and "db.session"
+phases measured inside it.
+"""
+import functools
+import os
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.metrics.gameforge_metrics import metrics
+
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+_perf_counter = time.perf_counter
+
+_current: ContextVar[Optional["RequestTimings"]] = ContextVar(
+    "gameforge_request_timings", default=None
+)
+
+# phase -> bound Histogram.observe, so recording skips the labels() lookup
+_observers: Dict[str, Callable[[float], None]] = {}
+
+
+def _observer(phase: str) -> Callable[[float], None]:
+    observe = _observers.get(phase)
+    if observe is None:
+        observe = _observers[phase] = metrics.request_phase_duration.labels(phase=phase).observe
+    return observe
+
+
+class RequestTimings:
+    """Phases recorded during one request."""
+
+    __slots__ = ("start", "spans")
+
+    def __init__(self):
+        self.start = _perf_counter()
+        self.spans: List[Tuple[str, float, float]] = []
+
+    def totals(self) -> Dict[str, float]:
+        """Seconds per phase (a phase entered twice is summed)."""
+        totals: Dict[str, float] = {}
+        for name, _, duration in self.spans:
+            totals[name] = totals.get(name, 0.0) + duration
+        return totals
+
+    def server_timing(self, totals: Dict[str, float]) -> str:
+        parts = [f"{name};dur={duration * 1000:.2f}" for name, duration in totals.items()]
+        parts.append(f"total;dur={(_perf_counter() - self.start) * 1000:.2f}")
+        return ", ".join(parts)
+
+
+class span:
+    """
+    Time a block as a request phase.
+
+        with span("rate_limit"):
+            ...
+
+    Outside a request the duration goes straight to the histogram.
+    """
+
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._start = None
+
+    def __enter__(self) -> "span":
+        self._start = _perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._start is None:
+            return  # already closed
+        duration = _perf_counter() - self._start
+        self._start, start = None, self._start
+        timings = _current.get()
+        if timings is not None:
+            timings.spans.append((self.name, start, duration))
+        else:
+            _observer(self.name)(duration)
+
+    def close(self) -> None:
+        """End the span early (e.g. when the response starts); the later exit is a no-op."""
+        self.__exit__(None, None, None)
+
+    async def __aenter__(self) -> "span":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.__exit__(exc_type, exc, tb)
+
+
+def timed(name: str):
+    """Decorator recording a coroutine's duration as a request phase."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with span(name):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current.get()
+
+
+# ============================================================================
+# OpenTelemetry export (optional)
+# ============================================================================
+
+def _load_tracer():
+    if os.getenv("REQUEST_TIMING_OTEL", "false").lower() != "true":
+        return None
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        logger.warning("REQUEST_TIMING_OTEL is set but opentelemetry is not installed")
+        return None
+    return trace.get_tracer("gameforge.request_timing")
+
+
+def _export_spans(tracer, scope, timings: RequestTimings, status_code: int) -> None:
+    """Replay the recorded phases as OTel spans with their real timestamps."""
+    from opentelemetry import trace
+
+    # perf_counter -> wall clock in ns
+    offset_ns = time.time_ns() - int(_perf_counter() * 1e9)
+    request_span = tracer.start_span(
+        f"{scope['method']} {scope['path']}",
+        start_time=offset_ns + int(timings.start * 1e9),
+        attributes={"http.method": scope["method"], "http.target": scope["path"], "http.status_code": status_code}
+    )
+    context = trace.set_span_in_context(request_span)
+    for name, start, duration in timings.spans:
+        tracer.start_span(name, context=context, start_time=offset_ns + int(start * 1e9)).end(
+            end_time=offset_ns + int((start + duration) * 1e9)
+        )
+    request_span.end()
+
+
+# ============================================================================
+# Middleware
+# ============================================================================
+
+class RequestTimingMiddleware:
+    """
+    Outermost ASGI middleware collecting the request's phases.
+
+    Args:
+        app: ASGI application
+        server_timing: Add a Server-Timing response header
+    """
+
+    def __init__(self, app, server_timing: bool = False):
+        self.app = app
+        self.server_timing = server_timing
+        self.tracer = _load_tracer()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", timings.server_timing(timings.totals()).encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            self._observe(timings)
+            if self.tracer is not None:
+                try:
+                    _export_spans(self.tracer, scope, timings, status_code)
+                except Exception as e:
+                    logger.warning("Failed to export request spans", error=str(e))
+
+    @staticmethod
+    def _observe(timings: RequestTimings) -> None:
+        for name, duration in timings.totals().items():
+            _observer(name)(duration)
+
+
+__all__ = [
+    'RequestTimings',
+    'RequestTimingMiddleware',
+    'current_timings',
+    'span',
+    'timed'
+]
@@ -0,0 +1,259 @@
+"""
+Secret caching for the Vault client.
+
+Every VaultClient.get_secret used to be a blocking HTTP round trip, even
+for secrets that change a few times a year. This cache keeps secrets in
+process memory so that:
+- each path has a TTL (longest-prefix overrides, capped by the Vault lease
+  when the secret has one)
+- entries past `refresh_ratio` of their TTL are returned immediately and
+  refreshed in the background, so hot secrets never expire on the request path
+- if Vault is unreachable, an expired entry keeps being served for up to
+  `max_stale_seconds` (stale-while-revalidate)
+- concurrent misses for the same path share one Vault read
+- a load that started before an invalidation of its path does not write its
+  result back (per-path generations)
+- the async API runs the blocking loader on a worker thread
+"""
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+# Loader result: (secret data, lease duration in seconds or 0)
+SecretLoad = Tuple[Optional[Dict[str, Any]], float]
+
+
+@dataclass
+class CachedSecret:
+    """A secret plus the monotonic times that govern its reuse."""
+    data: Dict[str, Any]
+    fetched_at: float
+    refresh_at: float
+    expires_at: float
+    stale_until: float
+
+
+class SecretCache:
+    """
+    TTL cache with refresh-ahead and stale-while-revalidate.
+
+    Args:
+        loader: Blocking callable path -> (data, lease_duration); raises when
+            the backend is unreachable and returns (None, 0) when not found
+        default_ttl: Seconds a secret is fresh unless overridden
+        ttl_overrides: Path prefix -> TTL seconds (longest prefix wins)
+        refresh_ratio: Fraction of the TTL after which reads trigger a refresh
+        max_stale_seconds: How long past expiry a secret may be served while
+            the backend is failing
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], SecretLoad],
+        default_ttl: float = 300.0,
+        ttl_overrides: Optional[Dict[str, float]] = None,
+        refresh_ratio: float = 0.75,
+        max_stale_seconds: float = 3600.0
+    ):
+        self.loader = loader
+        self.default_ttl = default_ttl
+        self.ttl_overrides = dict(ttl_overrides or {})
+        self.refresh_ratio = refresh_ratio
+        self.max_stale_seconds = max_stale_seconds
+        self._entries: Dict[str, CachedSecret] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Bumped by invalidate(); _epoch covers invalidating every path
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self._refresher: Optional[asyncio.Task] = None
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "stale_served": 0,
+            "load_failures": 0,
+            "loads": 0,
+            "discarded_loads": 0
+        }
+
+    # ------------------------------------------------------------------
+    # Policy
+    # ------------------------------------------------------------------
+
+    def ttl_for(self, path: str, lease_duration: float = 0) -> float:
+        """TTL for a path: longest matching prefix override, capped by the lease."""
+        ttl = self.default_ttl
+        best = -1
+        for prefix, prefix_ttl in self.ttl_overrides.items():
+            if path.startswith(prefix) and len(prefix) > best:
+                ttl, best = prefix_ttl, len(prefix)
+        if lease_duration and lease_duration > 0:
+            ttl = min(ttl, lease_duration)
+        return ttl
+
+    def put(self, path: str, data: Dict[str, Any], lease_duration: float = 0) -> CachedSecret:
+        return self._store(path, data, lease_duration)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Forget one path (after a write) or every cached secret."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._epoch += 1
+                self._inflight.clear()
+            else:
+                self._entries.pop(path, None)
+                self._generations[path] = self._generations.get(path, 0) + 1
+                # Later readers must not join a load that may return the old value
+                self._inflight.pop(path, None)
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+
+    async def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """Return a secret without blocking the event loop."""
+        now = time.monotonic()
+        entry = self._entries.get(path)
+
+        if entry is not None and now < entry.expires_at:
+            self.stats["hits"] += 1
+            if now >= entry.refresh_at:
+                self._start_load(path)
+            return entry.data
+
+        self.stats["misses"] += 1
+        try:
+            return await asyncio.shield(self._start_load(path))
+        except Exception:
+            return self._serve_stale(path, entry)
+
+    async def start(self, interval: float = 30.0) -> None:
+        """Refresh entries inside their refresh window even when nobody reads them."""
+        if self._refresher is None:
+            self._refresher = asyncio.create_task(self._refresh_loop(interval))
+
+    async def stop(self) -> None:
+        tasks = list(self._inflight.values())
+        if self._refresher is not None:
+            tasks.append(self._refresher)
+            self._refresher = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Sync API (for callers that are not on the event loop)
+    # ------------------------------------------------------------------
+
+    def get_sync(self, path: str) -> Optional[Dict[str, Any]]:
+        """Blocking variant: fresh or refresh-window hits avoid Vault entirely."""
+        now = time.monotonic()
+        entry = self._entries.get(path)
+
+        if entry is not None and now < entry.expires_at:
+            self.stats["hits"] += 1
+            return entry.data
+
+        self.stats["misses"] += 1
+        try:
+            return self._load(path)
+        except Exception:
+            return self._serve_stale(path, entry)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "entries": len(self._entries), "inflight": len(self._inflight)}
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _start_load(self, path: str) -> asyncio.Task:
+        """Single-flight: concurrent callers share one in-flight load per path."""
+        task = self._inflight.get(path)
+        if task is None:
+            task = asyncio.create_task(asyncio.to_thread(self._load, path))
+            self._inflight[path] = task
+            task.add_done_callback(lambda t: self._finish_load(path, t))
+        return task
+
+    def _finish_load(self, path: str, task: asyncio.Task) -> None:
+        if self._inflight.get(path) is task:
+            del self._inflight[path]
+        if not task.cancelled():
+            task.exception()  # mark retrieved; failures are logged in _load
+
+    def _generation(self, path: str) -> Tuple[int, int]:
+        return self._epoch, self._generations.get(path, 0)
+
+    def _store(
+        self,
+        path: str,
+        data: Optional[Dict[str, Any]],
+        lease_duration: float = 0,
+        generation: Optional[Tuple[int, int]] = None
+    ) -> Optional[CachedSecret]:
+        """Write (or, for None, drop) an entry; skipped if `generation` is out of date."""
+        now = time.monotonic()
+        ttl = self.ttl_for(path, lease_duration)
+        entry = None
+        if data is not None:
+            entry = CachedSecret(
+                data=data,
+                fetched_at=now,
+                refresh_at=now + ttl * self.refresh_ratio,
+                expires_at=now + ttl,
+                stale_until=now + ttl + self.max_stale_seconds
+            )
+        with self._lock:
+            if generation is not None and generation != self._generation(path):
+                self.stats["discarded_loads"] += 1
+                return None
+            if entry is None:
+                self._entries.pop(path, None)
+            else:
+                self._entries[path] = entry
+        return entry
+
+    def _load(self, path: str) -> Optional[Dict[str, Any]]:
+        self.stats["loads"] += 1
+        generation = self._generation(path)
+        try:
+            data, lease_duration = self.loader(path)
+        except Exception as e:
+            self.stats["load_failures"] += 1
+            logger.warning("Secret load failed", path=path, error=str(e))
+            raise
+
+        if data is not None and path in self._entries:
+            self.stats["refreshes"] += 1
+        self._store(path, data, lease_duration, generation)
+        return data
+
+    def _serve_stale(self, path: str, entry: Optional[CachedSecret]) -> Optional[Dict[str, Any]]:
+        if entry is not None and time.monotonic() < entry.stale_until:
+            self.stats["stale_served"] += 1
+            logger.warning("Serving stale secret while Vault is unavailable", path=path)
+            return entry.data
+        return None
+
+    async def _refresh_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            for path, entry in list(self._entries.items()):
+                if now >= entry.refresh_at:
+                    self._start_load(path)
+
+
+__all__ = [
+    'CachedSecret',
+    'SecretCache'
+]
@@ -200,19 +200,19 @@ class SecurityIntegrationValidator:
             
             # Test Vault connectivity (without exposing secrets)
             try:
-                jwt_secret = await self.vault_client.get_jwt_secret()
+                jwt_secret = await self.vault_client.aget_jwt_secret()
                 vault_checks["jwt_secret_accessible"] = bool(jwt_secret)
             except Exception:
                 vault_checks["jwt_secret_accessible"] = False
             
             try:
-                model_token = await self.vault_client.get_model_token("test")
+                model_token = await self.vault_client.aget_model_token("test")
                 vault_checks["model_tokens_accessible"] = bool(model_token)
             except Exception:
                 vault_checks["model_tokens_accessible"] = False
             
             try:
-                db_creds = await self.vault_client.get_database_credentials()
+                db_creds = await self.vault_client.aget_database_credentials()
                 vault_checks["database_credentials_accessible"] = bool(db_creds)
             except Exception:
                 vault_checks["database_credentials_accessible"] = False
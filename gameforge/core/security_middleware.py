@@ -3,11 +3,12 @@ Security middleware for GameForge AI Platform.
 Implements global security headers, rate limiting, and exception handling.
 """
 import time
+from typing import Any, Dict, Optional
+
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from gameforge.core.security_config import (
     SECURITY_HEADERS, CORS_SETTINGS, RATE_LIMITS
@@ -16,140 +17,149 @@ from gameforge.core.security import rate_limiter
 from gameforge.core.logging_config import (
     get_structured_logger, log_security_event
 )
+from gameforge.core.request_timing import span
 
 logger = get_structured_logger(__name__)
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add security headers to all responses."""
+# Paths that bypass the global rate limit
+RATE_LIMIT_EXCLUDED_PATHS = frozenset(["/health", "/metrics", "/docs", "/openapi.json"])
+
+_RATE_LIMIT_HEADER_NAMES = (b"x-ratelimit-limit", b"x-ratelimit-remaining", b"x-ratelimit-reset")
+
+
+def _header(headers: list, name: bytes) -> Optional[str]:
+    for key, value in headers:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _forwarded_client(scope, headers: list) -> str:
+    """Client address: first X-Forwarded-For hop, else the peer address."""
+    forwarded_for = _header(headers, b"x-forwarded-for")
+    if forwarded_for:
+        return forwarded_for.split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _rate_limit_client(scope, headers: list) -> str:
+    """Client identifier for rate limiting."""
+    # Try to get user ID from JWT token if available
+    auth_header = _header(headers, b"authorization")
+    if auth_header and auth_header.startswith("Bearer "):
+        # Extract user ID from token (simplified)
+        # In practice, you'd decode the JWT
+        return f"user_{auth_header[-10:]}"  # Use last 10 chars as ID
     
-    async def dispatch(self, request: Request, call_next):
-        """Add security headers to response."""
-        response = await call_next(request)
-        
-        # Add security headers
-        for header_name, header_value in SECURITY_HEADERS.items():
-            response.headers[header_name] = header_value
-        
-        return response
+    # Fall back to IP address
+    return _forwarded_client(scope, headers)
 
 
-class GlobalRateLimitMiddleware(BaseHTTPMiddleware):
-    """Global rate limiting middleware for API protection."""
+class SecurityMiddleware:
+    """
+    Security logging, global rate limiting and security headers as one pure
+    ASGI middleware.
+    
+    Replaces the SecurityLoggingMiddleware -> GlobalRateLimitMiddleware ->
+    SecurityHeadersMiddleware chain of BaseHTTPMiddleware classes, each of
+    which ran the rest of the app in a separate task behind a memory stream.
+    Here the response messages pass straight through; headers are added to
+    http.response.start in place.
+    
+    Phases, in order:
+        1. logging: client id captured, api_request_completed /
+           api_request_failed logged when the app finishes
+        2. rate limit: 429 with Retry-After and X-RateLimit-* headers when the
+           client is over the global limit (excluded paths skip it);
+           X-RateLimit-* headers on allowed responses
+        3. headers: SECURITY_HEADERS set on every response
+    """
     
     def __init__(
-        self, app, max_requests: int = 1000, window_seconds: int = 3600
+        self,
+        app,
+        max_requests: int = 1000,
+        window_seconds: int = 3600,
+        security_headers: Optional[Dict[str, str]] = None,
+        excluded_paths=RATE_LIMIT_EXCLUDED_PATHS
     ):
-        super().__init__(app)
+        self.app = app
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-    
-    async def dispatch(self, request: Request, call_next):
-        """Apply global rate limiting."""
-        # Skip rate limiting for health checks and static files
-        excluded_paths = ["/health", "/metrics", "/docs", "/openapi.json"]
-        if request.url.path in excluded_paths:
-            return await call_next(request)
-        
-        # Get client identifier
-        client_id = self._get_client_id(request)
-        
-        # Check rate limit
-        allowed, info = rate_limiter.is_allowed(
-            client_id, self.max_requests, self.window_seconds
-        )
-        
-        if not allowed:
-            log_security_event(
-                event_type="global_rate_limit_exceeded",
-                severity="warning",
-                client_id=client_id,
-                path=request.url.path,
-                method=request.method,
-                current_count=info["current_count"],
-                max_requests=self.max_requests
-            )
-            
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "error": "Rate limit exceeded",
-                    "message": "Too many requests. Please try again later.",
-                    "retry_after": info.get("reset_time", time.time() + 3600),
-                    "limit": self.max_requests,
-                    "window": self.window_seconds
-                },
-                headers={
-                    "Retry-After": str(self.window_seconds),
-                    "X-RateLimit-Limit": str(self.max_requests),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(
-                        info.get("reset_time", time.time() + 3600)
-                    ))
-                }
-            )
+        self.excluded_paths = frozenset(excluded_paths)
         
-        # Add rate limit headers to successful responses
-        response = await call_next(request)
-        
-        response.headers["X-RateLimit-Limit"] = str(self.max_requests)
-        response.headers["X-RateLimit-Remaining"] = str(
-            info.get("remaining", 0)
-        )
-        response.headers["X-RateLimit-Reset"] = str(
-            int(time.time() + self.window_seconds)
-        )
-        
-        return response
+        # Encode once; SECURITY_HEADERS is final once the app is built
+        headers = SECURITY_HEADERS if security_headers is None else security_headers
+        self._security_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in headers.items()
+        ]
+        self._limit_value = str(max_requests).encode("latin-1")
     
-    def _get_client_id(self, request: Request) -> str:
-        """Get client identifier for rate limiting."""
-        # Try to get user ID from JWT token if available
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            try:
-                # Extract user ID from token (simplified)
-                # In practice, you'd decode the JWT
-                return f"user_{auth_header[-10:]}"  # Use last 10 chars as ID
-            except Exception:
-                pass
-        
-        # Fall back to IP address
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        return request.client.host if request.client else "unknown"
-
-
-class SecurityLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log security-relevant events."""
-    
-    async def dispatch(self, request: Request, call_next):
-        """Log security events and API calls."""
         start_time = time.time()
+        request_headers = scope["headers"]
+        path = scope["path"]
+        method = scope["method"]
+        
+        with span("middleware.security_logging"):
+            client_id = _forwarded_client(scope, request_headers)
+        
+        status_code = 500
+        rate_limit_headers = None
+        # Time to the response start; streaming the body is not part of it
+        handler = span("handler")
         
-        # Log incoming request
-        client_id = self._get_client_id(request)
+        async def send_with_headers(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                handler.close()
+                with span("middleware.security_headers"):
+                    extra = self._security_headers
+                    if rate_limit_headers is not None:
+                        extra = rate_limit_headers() + extra
+                    names = {name for name, _ in extra}
+                    message["headers"] = [
+                        header for header in message.get("headers", [])
+                        if header[0].lower() not in names
+                    ] + extra
+            await send(message)
         
         try:
-            response = await call_next(request)
-            duration = time.time() - start_time
-            
-            # Log API request
-            log_security_event(
-                event_type="api_request_completed",
-                severity="info",
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-                duration=duration,
-                client_id=client_id,
-                user_agent=request.headers.get("User-Agent", "unknown")
-            )
-            
-            return response
-            
+            if path in self.excluded_paths:
+                with handler:
+                    await self.app(scope, receive, send_with_headers)
+            else:
+                with span("middleware.rate_limit"):
+                    limited_client = _rate_limit_client(scope, request_headers)
+                    allowed, info = rate_limiter.is_allowed(
+                        limited_client, self.max_requests, self.window_seconds
+                    )
+                
+                if allowed:
+                    remaining = str(info.get("remaining", 0)).encode("latin-1")
+                    
+                    def rate_limit_headers():
+                        reset = str(int(time.time() + self.window_seconds))
+                        return [
+                            (_RATE_LIMIT_HEADER_NAMES[0], self._limit_value),
+                            (_RATE_LIMIT_HEADER_NAMES[1], remaining),
+                            (_RATE_LIMIT_HEADER_NAMES[2], reset.encode("latin-1"))
+                        ]
+                    
+                    with handler:
+                        await self.app(scope, receive, send_with_headers)
+                else:
+                    response = self._rate_limited_response(limited_client, path, method, info)
+                    await response(scope, receive, send_with_headers)
+        
         except Exception as e:
             duration = time.time() - start_time
             
@@ -157,21 +167,59 @@ class SecurityLoggingMiddleware(BaseHTTPMiddleware):
             log_security_event(
                 event_type="api_request_failed",
                 severity="error",
-                method=request.method,
-                path=request.url.path,
+                method=method,
+                path=path,
                 error=str(e),
                 duration=duration,
                 client_id=client_id
             )
             
             raise
+        
+        duration = time.time() - start_time
+        
+        # Log API request
+        with span("middleware.security_logging"):
+            log_security_event(
+                event_type="api_request_completed",
+                severity="info",
+                method=method,
+                path=path,
+                status_code=status_code,
+                duration=duration,
+                client_id=client_id,
+                user_agent=_header(request_headers, b"user-agent") or "unknown"
+            )
     
-    def _get_client_id(self, request: Request) -> str:
-        """Get client identifier."""
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-        return request.client.host if request.client else "unknown"
+    def _rate_limited_response(self, client_id: str, path: str, method: str, info: Dict[str, Any]) -> JSONResponse:
+        log_security_event(
+            event_type="global_rate_limit_exceeded",
+            severity="warning",
+            client_id=client_id,
+            path=path,
+            method=method,
+            current_count=info["current_count"],
+            max_requests=self.max_requests
+        )
+        
+        return JSONResponse(
+            status_code=429,
+            content={
+                "error": "Rate limit exceeded",
+                "message": "Too many requests. Please try again later.",
+                "retry_after": info.get("reset_time", time.time() + 3600),
+                "limit": self.max_requests,
+                "window": self.window_seconds
+            },
+            headers={
+                "Retry-After": str(self.window_seconds),
+                "X-RateLimit-Limit": str(self.max_requests),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(
+                    info.get("reset_time", time.time() + 3600)
+                ))
+            }
+        )
 
 
 def setup_security_middleware(app: FastAPI, settings) -> None:
@@ -220,20 +268,15 @@ def setup_security_middleware(app: FastAPI, settings) -> None:
         allowed_hosts=trusted_hosts
     )
     
-    # 3. Security Headers Middleware
-    app.add_middleware(SecurityHeadersMiddleware)
-    
-    # 4. Global Rate Limiting Middleware
+    # 3. Security logging, global rate limiting and security headers
+    #    (one pure ASGI middleware, outside CORS and trusted hosts)
     global_limits = RATE_LIMITS["api_general"]
     app.add_middleware(
-        GlobalRateLimitMiddleware,
+        SecurityMiddleware,
         max_requests=global_limits["max_requests"],
         window_seconds=global_limits["window_seconds"]
     )
     
-    # 5. Security Logging Middleware (last, to capture everything)
-    app.add_middleware(SecurityLoggingMiddleware)
-    
     logger.info("✅ Security middleware setup complete")
 
 
@@ -0,0 +1,495 @@
+"""
+Object storage backends for GameForge asset storage.
+
+The SDKs behind S3 and MinIO are blocking, so their calls run on a
+dedicated thread pool sized to the HTTP connection pool instead of on the
+event loop. Transfers are capped per storage tier so a burst of cold or
+frozen restores cannot take every connection from hot-path traffic.
+
+The backend is chosen once when StorageSecurityManager starts:
+STORAGE_BACKEND=s3|minio|local, or inferred from the configured
+credentials (AWS, then MinIO, then the local filesystem).
+"""
+import asyncio
+import functools
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, List, Optional
+
+import aiofiles
+
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+# S3 requires every multipart part except the last to be at least 5 MiB
+MIN_MULTIPART_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_MULTIPART_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_READ_SIZE = 1024 * 1024
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+
+# Concurrent transfers per tier (keyed by StorageTier value)
+DEFAULT_TIER_CONCURRENCY = {
+    "hot": 32,
+    "warm": 16,
+    "cold": 8,
+    "frozen": 4
+}
+
+S3_STORAGE_CLASSES = {
+    "hot": "STANDARD",
+    "warm": "STANDARD_IA",
+    "cold": "GLACIER",
+    "frozen": "DEEP_ARCHIVE"
+}
+
+
+class StorageBackend(ABC):
+    """Base class for object storage backends; tiers are StorageTier values."""
+
+    name = "base"
+
+    def __init__(
+        self,
+        tier_concurrency: Optional[Dict[str, int]] = None,
+        read_size: int = DEFAULT_READ_SIZE
+    ):
+        self.read_size = read_size
+        self._tier_limits = {
+            tier: asyncio.Semaphore(limit)
+            for tier, limit in {**DEFAULT_TIER_CONCURRENCY, **(tier_concurrency or {})}.items()
+        }
+
+    @asynccontextmanager
+    async def _tier_slot(self, tier: str):
+        """
+        Hold one of the tier's transfer slots.
+
+        Uploads hold it for the whole transfer; reads only around each blocking
+        call, so a slow consumer of a stream does not keep a slot while idle.
+        """
+        semaphore = self._tier_limits.get(tier)
+        if semaphore is None:
+            yield
+            return
+        async with semaphore:
+            yield
+
+    async def put_object(self, bucket_name: str, object_key: str, data: bytes, tier: str) -> None:
+        """Store a small object in one request."""
+        async def chunks() -> AsyncIterator[bytes]:
+            yield data
+
+        await self.upload_stream(bucket_name, object_key, chunks(), tier)
+
+    async def get_object(self, bucket_name: str, object_key: str, tier: str) -> bytes:
+        """Read a whole object into memory."""
+        return b"".join([
+            chunk async for chunk in self.stream_object(bucket_name, object_key, tier)
+        ])
+
+    @abstractmethod
+    async def upload_stream(
+        self,
+        bucket_name: str,
+        object_key: str,
+        chunks: AsyncIterable[bytes],
+        tier: str
+    ) -> int:
+        """Store an object from an async iterable of chunks; returns bytes written."""
+
+    @abstractmethod
+    def stream_object(
+        self,
+        bucket_name: str,
+        object_key: str,
+        tier: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Stream an object, or the inclusive byte range start-end, in chunks."""
+
+    async def close(self) -> None:
+        """Release pooled resources."""
+
+
+class _ThreadPoolBackend(StorageBackend):
+    """Runs a blocking SDK client on a private thread pool."""
+
+    def __init__(self, client: Any, max_workers: int, **kwargs):
+        super().__init__(**kwargs)
+        self.client = client
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"storage-{self.name}"
+        )
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _run_in_slot(self, tier: str, func: Callable, *args, **kwargs) -> Any:
+        async with self._tier_slot(tier):
+            return await self._run(func, *args, **kwargs)
+
+    async def _read_body(self, body: Any, tier: str) -> AsyncIterator[bytes]:
+        while True:
+            data = await self._run_in_slot(tier, body.read, self.read_size)
+            if not data:
+                break
+            yield data
+
+    async def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+class S3StorageBackend(_ThreadPoolBackend):
+    """AWS S3 via boto3, multipart uploads with one part in flight while the next fills."""
+
+    name = "s3"
+
+    def __init__(
+        self,
+        client: Any,
+        max_workers: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        part_size: int = DEFAULT_MULTIPART_PART_SIZE,
+        **kwargs
+    ):
+        super().__init__(client, max_workers, **kwargs)
+        self.part_size = max(MIN_MULTIPART_PART_SIZE, part_size)
+
+    def _object_args(self, bucket_name: str, object_key: str, tier: str) -> Dict[str, Any]:
+        return {
+            "Bucket": bucket_name,
+            "Key": object_key,
+            "StorageClass": S3_STORAGE_CLASSES.get(tier, "STANDARD"),
+            "ServerSideEncryption": 'aws:kms' if tier != "hot" else 'AES256'
+        }
+
+    async def upload_stream(
+        self,
+        bucket_name: str,
+        object_key: str,
+        chunks: AsyncIterable[bytes],
+        tier: str
+    ) -> int:
+        """
+        Upload in parts, reading the next part while the previous one uploads.
+
+        Objects smaller than one part go up with a single put_object.
+        """
+        object_args = self._object_args(bucket_name, object_key, tier)
+        upload_id = None
+        parts: List[Dict[str, Any]] = []
+        in_flight: Optional[asyncio.Future] = None
+        part_number = 0
+        buffer = bytearray()
+        total = 0
+
+        async def upload_part(number: int, body: bytes) -> Dict[str, Any]:
+            response = await self._run(
+                self.client.upload_part,
+                Bucket=bucket_name,
+                Key=object_key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=body
+            )
+            return {"ETag": response["ETag"], "PartNumber": number}
+
+        async with self._tier_slot(tier):
+            try:
+                async for chunk in chunks:
+                    buffer.extend(chunk)
+                    total += len(chunk)
+                    if len(buffer) < self.part_size:
+                        continue
+
+                    if upload_id is None:
+                        response = await self._run(self.client.create_multipart_upload, **object_args)
+                        upload_id = response["UploadId"]
+
+                    # At most one part uploads while the next one is being filled
+                    if in_flight is not None:
+                        parts.append(await in_flight)
+                    part_number += 1
+                    in_flight = asyncio.ensure_future(upload_part(part_number, bytes(buffer)))
+                    buffer.clear()
+
+                if upload_id is None:
+                    await self._run(self.client.put_object, Body=bytes(buffer), **object_args)
+                    logger.info(f"Stored to AWS S3: s3://{bucket_name}/{object_key}")
+                    return total
+
+                if in_flight is not None:
+                    parts.append(await in_flight)
+                    in_flight = None
+                if buffer:
+                    parts.append(await upload_part(part_number + 1, bytes(buffer)))
+
+                await self._run(
+                    self.client.complete_multipart_upload,
+                    Bucket=bucket_name,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts}
+                )
+                logger.info(
+                    f"Stored to AWS S3: s3://{bucket_name}/{object_key}",
+                    extra={"parts": len(parts), "size_bytes": total}
+                )
+                return total
+
+            except BaseException:
+                if in_flight is not None:
+                    in_flight.cancel()
+                if upload_id is not None:
+                    try:
+                        await self._run(
+                            self.client.abort_multipart_upload,
+                            Bucket=bucket_name,
+                            Key=object_key,
+                            UploadId=upload_id
+                        )
+                    except Exception as abort_error:
+                        logger.error(f"Failed to abort multipart upload {upload_id}: {abort_error}")
+                raise
+
+    async def stream_object(
+        self,
+        bucket_name: str,
+        object_key: str,
+        tier: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        request = {"Bucket": bucket_name, "Key": object_key}
+        if start is not None:
+            request["Range"] = f"bytes={start}-{'' if end is None else end}"
+
+        response = await self._run_in_slot(tier, self.client.get_object, **request)
+        body = response['Body']
+        try:
+            async for data in self._read_body(body, tier):
+                yield data
+        finally:
+            body.close()
+
+
+class MinioStorageBackend(_ThreadPoolBackend):
+    """MinIO via the minio SDK; uploads are spooled to disk beyond one part."""
+
+    name = "minio"
+
+    def __init__(
+        self,
+        client: Any,
+        max_workers: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        part_size: int = DEFAULT_MULTIPART_PART_SIZE,
+        **kwargs
+    ):
+        super().__init__(client, max_workers, **kwargs)
+        self.part_size = max(MIN_MULTIPART_PART_SIZE, part_size)
+
+    async def upload_stream(
+        self,
+        bucket_name: str,
+        object_key: str,
+        chunks: AsyncIterable[bytes],
+        tier: str
+    ) -> int:
+        async with self._tier_slot(tier):
+            with tempfile.SpooledTemporaryFile(max_size=self.part_size) as spool:
+                total = 0
+                async for chunk in chunks:
+                    spool.write(chunk)
+                    total += len(chunk)
+                spool.seek(0)
+
+                await self._run(
+                    self.client.put_object,
+                    bucket_name,
+                    object_key,
+                    data=spool,
+                    length=total,
+                    part_size=self.part_size
+                )
+
+        logger.info(f"Stored to MinIO: {bucket_name}/{object_key}")
+        return total
+
+    async def stream_object(
+        self,
+        bucket_name: str,
+        object_key: str,
+        tier: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        offset = start or 0
+        length = 0 if end is None else end - offset + 1
+
+        response = await self._run_in_slot(
+            tier,
+            self.client.get_object,
+            bucket_name,
+            object_key,
+            offset=offset,
+            length=length
+        )
+        try:
+            async for data in self._read_body(response, tier):
+                yield data
+        finally:
+            response.close()
+            response.release_conn()
+
+
+class LocalStorageBackend(StorageBackend):
+    """Local filesystem under a root directory, streamed in chunks via aiofiles."""
+
+    name = "local"
+
+    def __init__(self, root: str = "/app/storage", **kwargs):
+        super().__init__(**kwargs)
+        self.root = Path(root)
+
+    def _path(self, bucket_name: str, object_key: str) -> Path:
+        return self.root / bucket_name / object_key
+
+    async def upload_stream(
+        self,
+        bucket_name: str,
+        object_key: str,
+        chunks: AsyncIterable[bytes],
+        tier: str
+    ) -> int:
+        local_path = self._path(bucket_name, object_key)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        # Readers never see a partially written object
+        partial_path = local_path.with_name(local_path.name + ".part")
+
+        total = 0
+        async with self._tier_slot(tier):
+            try:
+                async with aiofiles.open(partial_path, 'wb') as f:
+                    async for chunk in chunks:
+                        await f.write(chunk)
+                        total += len(chunk)
+                os.replace(partial_path, local_path)
+            except BaseException:
+                partial_path.unlink(missing_ok=True)
+                raise
+
+        logger.info(f"Stored locally: {local_path}")
+        return total
+
+    async def stream_object(
+        self,
+        bucket_name: str,
+        object_key: str,
+        tier: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        remaining = None if end is None else end - (start or 0) + 1
+
+        async with aiofiles.open(self._path(bucket_name, object_key), 'rb') as f:
+            if start:
+                await f.seek(start)
+            while remaining is None or remaining > 0:
+                size = self.read_size if remaining is None else min(self.read_size, remaining)
+                async with self._tier_slot(tier):
+                    data = await f.read(size)
+                if not data:
+                    break
+                if remaining is not None:
+                    remaining -= len(data)
+                yield data
+
+
+def _tier_concurrency_from_env() -> Dict[str, int]:
+    return {
+        tier: int(os.getenv(f"STORAGE_CONCURRENCY_{tier.upper()}", str(default)))
+        for tier, default in DEFAULT_TIER_CONCURRENCY.items()
+    }
+
+
+def create_storage_backend(read_size: int = DEFAULT_READ_SIZE) -> StorageBackend:
+    """
+    Build the configured storage backend.
+
+    Environment:
+        STORAGE_BACKEND: s3, minio or local (default: inferred from credentials)
+        STORAGE_MAX_POOL_CONNECTIONS: HTTP connections and worker threads
+        STORAGE_MULTIPART_PART_SIZE: multipart part size in bytes
+        STORAGE_CONCURRENCY_<TIER>: concurrent transfers per tier
+        STORAGE_LOCAL_ROOT: root directory of the local backend
+    """
+    backend = os.getenv("STORAGE_BACKEND")
+    if not backend:
+        if os.getenv("AWS_ACCESS_KEY_ID"):
+            backend = "s3"
+        elif os.getenv("MINIO_ACCESS_KEY"):
+            backend = "minio"
+        else:
+            backend = "local"
+
+    pool_size = int(os.getenv("STORAGE_MAX_POOL_CONNECTIONS", str(DEFAULT_MAX_POOL_CONNECTIONS)))
+    part_size = int(os.getenv("STORAGE_MULTIPART_PART_SIZE", str(DEFAULT_MULTIPART_PART_SIZE)))
+    common = {
+        "tier_concurrency": _tier_concurrency_from_env(),
+        "read_size": read_size
+    }
+
+    if backend == "s3":
+        import boto3
+        from botocore.config import Config
+
+        client = boto3.client(
+            's3',
+            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+            region_name=os.getenv("AWS_REGION", "us-east-1"),
+            config=Config(max_pool_connections=pool_size)
+        )
+        logger.info("AWS S3 storage backend initialized", pool_size=pool_size)
+        return S3StorageBackend(client, max_workers=pool_size, part_size=part_size, **common)
+
+    if backend == "minio":
+        import urllib3
+        from minio import Minio
+
+        client = Minio(
+            os.getenv("MINIO_ENDPOINT", "localhost:9000"),
+            access_key=os.getenv("MINIO_ACCESS_KEY"),
+            secret_key=os.getenv("MINIO_SECRET_KEY"),
+            secure=os.getenv("MINIO_SECURE", "false").lower() == "true",
+            http_client=urllib3.PoolManager(
+                maxsize=pool_size,
+                timeout=urllib3.Timeout(connect=10, read=300),
+                retries=urllib3.Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504])
+            )
+        )
+        logger.info("MinIO storage backend initialized", pool_size=pool_size)
+        return MinioStorageBackend(client, max_workers=pool_size, part_size=part_size, **common)
+
+    if backend == "local":
+        root = os.getenv("STORAGE_LOCAL_ROOT", "/app/storage")
+        logger.info("Local filesystem storage backend initialized", root=root)
+        return LocalStorageBackend(root, **common)
+
+    raise ValueError(f"Unsupported storage backend: {backend}")
+
+
+__all__ = [
+    'StorageBackend',
+    'S3StorageBackend',
+    'MinioStorageBackend',
+    'LocalStorageBackend',
+    'create_storage_backend'
+]
@@ -6,9 +6,8 @@ import os
 import boto3
 import hashlib
 import json
-import aiofiles
 import asyncio
-from typing import Dict, Any, Optional, Union, List, Tuple
+from typing import AsyncIterable, AsyncIterator, Dict, Any, Optional, Union, List, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -18,9 +17,28 @@ from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
+import functools
 
 from gameforge.core.config import get_settings
+from gameforge.core.data_key_cache import DataKey, DataKeyCache, KeyProvider
+from gameforge.core.envelope_encryption import (
+    DEFAULT_CHUNK_SIZE,
+    STREAM_FORMAT,
+    StreamEncryptor,
+    StreamHeader,
+    decrypt_stream,
+    frame_count,
+    frame_range,
+    generate_data_key
+)
 from gameforge.core.logging_config import get_structured_logger
+from gameforge.core.storage_backends import (
+    LocalStorageBackend,
+    MinioStorageBackend,
+    S3StorageBackend,
+    StorageBackend,
+    create_storage_backend
+)
 
 logger = get_structured_logger(__name__)
 
@@ -79,6 +97,22 @@ class StorageSecurityManager:
         # Load storage tier configurations
         self.storage_configs = self._load_storage_configs()
         
+        # Streaming encryption frame size
+        self.stream_chunk_size = int(
+            os.getenv("STORAGE_STREAM_CHUNK_SIZE", str(DEFAULT_CHUNK_SIZE))
+        )
+        
+        # Data keys are reused across assets to save provider round trips
+        self.data_key_cache = DataKeyCache(
+            max_entries=int(os.getenv("DATA_KEY_CACHE_MAX_ENTRIES", "256")),
+            max_age_seconds=float(os.getenv("DATA_KEY_CACHE_MAX_AGE_SECONDS", "300")),
+            max_messages_per_key=int(os.getenv("DATA_KEY_CACHE_MAX_ASSETS_PER_KEY", "1000")),
+            max_bytes_per_key=int(os.getenv("DATA_KEY_CACHE_MAX_BYTES_PER_KEY", str(16 * 1024 ** 3)))
+        )
+        
+        # Overrides the tier providers for data keys (e.g. LocalKeyProvider in tests)
+        self.key_provider: Optional[KeyProvider] = None
+        
         # Initialize encryption providers
         self._init_encryption_providers()
         
@@ -227,28 +261,21 @@ class StorageSecurityManager:
     
     def _init_storage_clients(self):
         """Initialize storage clients for different providers."""
+        # Asset reads and writes go through one backend chosen here
         try:
-            # AWS S3
-            if os.getenv("AWS_ACCESS_KEY_ID"):
-                self._storage_clients["aws_s3"] = boto3.client(
-                    's3',
-                    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-                    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-                    region_name=os.getenv("AWS_REGION", "us-east-1")
-                )
-                logger.info("AWS S3 client initialized")
-            
-            # MinIO (S3-compatible)
-            if os.getenv("MINIO_ACCESS_KEY"):
-                from minio import Minio
-                
-                self._storage_clients["minio"] = Minio(
-                    os.getenv("MINIO_ENDPOINT", "localhost:9000"),
-                    access_key=os.getenv("MINIO_ACCESS_KEY"),
-                    secret_key=os.getenv("MINIO_SECRET_KEY"),
-                    secure=os.getenv("MINIO_SECURE", "false").lower() == "true"
-                )
-                logger.info("MinIO client initialized")
+            self.storage_backend: StorageBackend = create_storage_backend(
+                read_size=self.stream_chunk_size
+            )
+        except Exception as e:
+            logger.error(f"Failed to initialize storage backend, using local filesystem: {e}")
+            self.storage_backend = LocalStorageBackend(read_size=self.stream_chunk_size)
+        
+        try:
+            # Bucket administration shares the backend's pooled client
+            if isinstance(self.storage_backend, S3StorageBackend):
+                self._storage_clients["aws_s3"] = self.storage_backend.client
+            elif isinstance(self.storage_backend, MinioStorageBackend):
+                self._storage_clients["minio"] = self.storage_backend.client
             
             # Azure Blob Storage
             if os.getenv("AZURE_STORAGE_CONNECTION_STRING"):
@@ -438,56 +465,12 @@ class StorageSecurityManager:
         Returns:
             EncryptedAsset object with storage details
         """
-        config = self.storage_configs[tier]
-        
-        # Calculate checksum of original data
-        checksum = self.calculate_checksum(data)
-        
-        # Encrypt the data
-        encrypted_data, encryption_metadata = await self.encrypt_data(
-            data, config.encryption_provider, config.encryption_key_id
-        )
-        
-        # Generate storage path
-        storage_path = f"{tier.value}/{asset_id[:2]}/{asset_id[2:4]}/{asset_id}.enc"
-        
-        # Store encrypted data
-        await self._store_to_bucket(
-            config.bucket_name,
-            storage_path,
-            encrypted_data,
-            tier
+        return await self.store_encrypted_asset_stream(
+            asset_id,
+            _iter_chunks(data, self.stream_chunk_size),
+            tier,
+            metadata
         )
-        
-        # Create asset record
-        encrypted_asset = EncryptedAsset(
-            asset_id=asset_id,
-            original_path=f"/{asset_id}",
-            encrypted_path=f"s3://{config.bucket_name}/{storage_path}",
-            encryption_key_id=config.encryption_key_id or "local",
-            checksum_sha256=checksum,
-            size_bytes=len(data),
-            created_at=datetime.utcnow(),
-            tier=tier,
-            metadata={
-                "encryption_metadata": encryption_metadata,
-                "encryption_provider": config.encryption_provider.value,
-                **(metadata or {})
-            }
-        )
-        
-        logger.info(
-            f"Stored encrypted asset {asset_id} in {tier.value} tier",
-            extra={
-                "asset_id": asset_id,
-                "tier": tier.value,
-                "size_bytes": len(data),
-                "encrypted_size_bytes": len(encrypted_data),
-                "checksum": checksum
-            }
-        )
-        
-        return encrypted_asset
     
     async def retrieve_encrypted_asset(
         self,
@@ -502,15 +485,22 @@ class StorageSecurityManager:
         Returns:
             Decrypted asset data
         """
+        if encrypted_asset.metadata.get("encryption_format") == STREAM_FORMAT:
+            chunks = [
+                chunk async for chunk in self.retrieve_encrypted_asset_stream(encrypted_asset)
+            ]
+            return b"".join(chunks)
+        
         config = self.storage_configs[encrypted_asset.tier]
         
         # Extract storage path from encrypted_path
         storage_path = encrypted_asset.encrypted_path.split('/', 3)[-1]
         
         # Retrieve encrypted data
-        encrypted_data = await self._retrieve_from_bucket(
+        encrypted_data = await self.storage_backend.get_object(
             config.bucket_name,
-            storage_path
+            storage_path,
+            encrypted_asset.tier.value
         )
         
         # Decrypt the data
@@ -545,95 +535,224 @@ class StorageSecurityManager:
         
         return decrypted_data
     
-    async def _store_to_bucket(
+    # ========================================================================
+    # Streaming envelope encryption
+    # ========================================================================
+    
+    async def store_encrypted_asset_stream(
         self,
-        bucket_name: str,
-        object_key: str,
-        data: bytes,
-        tier: StorageTier
-    ):
-        """Store data to the appropriate storage backend."""
-        try:
-            # Try AWS S3 first
-            if "aws_s3" in self._storage_clients:
-                storage_class = self._get_s3_storage_class(tier)
-                
-                self._storage_clients["aws_s3"].put_object(
-                    Bucket=bucket_name,
-                    Key=object_key,
-                    Body=data,
-                    StorageClass=storage_class,
-                    ServerSideEncryption='aws:kms' if tier != StorageTier.HOT else 'AES256'
-                )
-                logger.info(f"Stored to AWS S3: s3://{bucket_name}/{object_key}")
-                return
-            
-            # Fallback to MinIO
-            if "minio" in self._storage_clients:
-                self._storage_clients["minio"].put_object(
-                    bucket_name,
-                    object_key,
-                    data=io.BytesIO(data),
-                    length=len(data)
-                )
-                logger.info(f"Stored to MinIO: {bucket_name}/{object_key}")
-                return
-            
-            # Local filesystem fallback
-            local_path = Path(f"/app/storage/{bucket_name}/{object_key}")
-            local_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            async with aiofiles.open(local_path, 'wb') as f:
-                await f.write(data)
-            
-            logger.info(f"Stored locally: {local_path}")
+        asset_id: str,
+        chunks: AsyncIterable[bytes],
+        tier: StorageTier,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> EncryptedAsset:
+        """
+        Encrypt and upload an asset without holding it in memory.
+        
+        A fresh data key encrypts the asset as AES-GCM frames while it is
+        uploaded part by part; only the data key goes to the tier's
+        encryption provider for wrapping.
+        
+        Args:
+            asset_id: Unique identifier for the asset
+            chunks: Raw asset data as an async iterable of byte chunks
+            tier: Storage tier to use
+            metadata: Additional metadata for the asset
             
-        except Exception as e:
-            logger.error(f"Failed to store to bucket {bucket_name}: {e}")
-            raise
+        Returns:
+            EncryptedAsset object with storage details
+        """
+        config = self.storage_configs[tier]
+        
+        data_key = await self._get_data_key(config)
+        encryptor = StreamEncryptor(data_key.plaintext, self.stream_chunk_size)
+        
+        async def encrypted_frames() -> AsyncIterator[bytes]:
+            async for chunk in chunks:
+                frames = encryptor.update(chunk)
+                if frames:
+                    yield frames
+            yield encryptor.finalize()
+        
+        storage_path = f"{tier.value}/{asset_id[:2]}/{asset_id[2:4]}/{asset_id}.enc"
+        encrypted_size = await self.storage_backend.upload_stream(
+            config.bucket_name,
+            storage_path,
+            encrypted_frames(),
+            tier.value
+        )
+        self.data_key_cache.record_usage(data_key, encryptor.plaintext_size)
+        
+        encrypted_asset = EncryptedAsset(
+            asset_id=asset_id,
+            original_path=f"/{asset_id}",
+            encrypted_path=f"s3://{config.bucket_name}/{storage_path}",
+            encryption_key_id=config.encryption_key_id or "local",
+            checksum_sha256=encryptor.checksum_sha256,
+            size_bytes=encryptor.plaintext_size,
+            created_at=datetime.utcnow(),
+            tier=tier,
+            metadata={
+                "encryption_format": STREAM_FORMAT,
+                "encryption_metadata": data_key.metadata,
+                "encryption_provider": data_key.provider,
+                "wrapped_data_key": base64.b64encode(data_key.wrapped).decode("ascii"),
+                "stream_header": base64.b64encode(encryptor.header.to_bytes()).decode("ascii"),
+                "encrypted_size_bytes": encrypted_size,
+                **(metadata or {})
+            }
+        )
+        
+        logger.info(
+            f"Stored encrypted asset {asset_id} in {tier.value} tier",
+            extra={
+                "asset_id": asset_id,
+                "tier": tier.value,
+                "size_bytes": encryptor.plaintext_size,
+                "encrypted_size_bytes": encrypted_size,
+                "checksum": encryptor.checksum_sha256
+            }
+        )
+        
+        return encrypted_asset
     
-    async def _retrieve_from_bucket(
+    async def retrieve_encrypted_asset_stream(
         self,
-        bucket_name: str,
-        object_key: str
-    ) -> bytes:
-        """Retrieve data from the appropriate storage backend."""
-        try:
-            # Try AWS S3 first
-            if "aws_s3" in self._storage_clients:
-                response = self._storage_clients["aws_s3"].get_object(
-                    Bucket=bucket_name,
-                    Key=object_key
-                )
-                return response['Body'].read()
-            
-            # Fallback to MinIO
-            if "minio" in self._storage_clients:
-                response = self._storage_clients["minio"].get_object(
-                    bucket_name,
-                    object_key
-                )
-                return response.read()
-            
-            # Local filesystem fallback
-            local_path = Path(f"/app/storage/{bucket_name}/{object_key}")
+        encrypted_asset: EncryptedAsset,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Download and decrypt an asset frame by frame.
+        
+        Args:
+            encrypted_asset: EncryptedAsset metadata
+            start: First plaintext byte to return (inclusive)
+            end: Last plaintext byte to return (inclusive), defaults to the end
             
-            async with aiofiles.open(local_path, 'rb') as f:
-                return await f.read()
+        Yields:
+            Decrypted byte chunks; a range only fetches the frames covering it
+        """
+        size = encrypted_asset.size_bytes
+        ranged = start is not None or end is not None
+        start = start or 0
+        end = size - 1 if end is None else min(end, size - 1)
+        
+        if encrypted_asset.metadata.get("encryption_format") != STREAM_FORMAT:
+            # Whole-object Fernet assets written before the streaming format
+            data = await self.retrieve_encrypted_asset(encrypted_asset)
+            yield data[start:end + 1] if ranged else data
+            return
+        
+        if ranged and (start > end or size == 0):
+            return
+        
+        config = self.storage_configs[encrypted_asset.tier]
+        storage_path = encrypted_asset.encrypted_path.split('/', 3)[-1]
+        data_key = await self._unwrap_data_key(encrypted_asset)
+        header = StreamHeader.from_bytes(
+            base64.b64decode(encrypted_asset.metadata["stream_header"])
+        )
+        total_frames = frame_count(size, header.chunk_size)
+        
+        if not ranged:
+            checksum = hashlib.sha256()
+            async for plaintext in decrypt_stream(
+                data_key,
+                self.storage_backend.stream_object(
+                    config.bucket_name, storage_path, encrypted_asset.tier.value
+                ),
+                last_frame=total_frames - 1,
+                total_frames=total_frames
+            ):
+                checksum.update(plaintext)
+                yield plaintext
             
-        except Exception as e:
-            logger.error(f"Failed to retrieve from bucket {bucket_name}: {e}")
-            raise
+            if checksum.hexdigest() != encrypted_asset.checksum_sha256:
+                raise ValueError(
+                    f"Checksum mismatch for asset {encrypted_asset.asset_id}. "
+                    f"Expected: {encrypted_asset.checksum_sha256}, "
+                    f"Got: {checksum.hexdigest()}"
+                )
+            return
+        
+        # Frames are authenticated individually, so a range is verified by GCM alone
+        first, last, enc_start, enc_end = frame_range(size, header.chunk_size, start, end)
+        position = first * header.chunk_size
+        async for plaintext in decrypt_stream(
+            data_key,
+            self.storage_backend.stream_object(
+                config.bucket_name, storage_path, encrypted_asset.tier.value, enc_start, enc_end
+            ),
+            header=header,
+            first_frame=first,
+            last_frame=last,
+            total_frames=total_frames
+        ):
+            frame_start = position
+            position += len(plaintext)
+            yield plaintext[max(start - frame_start, 0):end + 1 - frame_start]
     
-    def _get_s3_storage_class(self, tier: StorageTier) -> str:
-        """Get appropriate S3 storage class for tier."""
-        storage_class_map = {
-            StorageTier.HOT: "STANDARD",
-            StorageTier.WARM: "STANDARD_IA",
-            StorageTier.COLD: "GLACIER",
-            StorageTier.FROZEN: "DEEP_ARCHIVE"
-        }
-        return storage_class_map[tier]
+    async def _wrap_data_key(
+        self,
+        data_key: bytes,
+        config: StorageConfig
+    ) -> Tuple[bytes, EncryptionProvider, str]:
+        """Wrap a data key with the tier's provider; returns the provider actually used."""
+        wrapped_key, key_metadata = await self.encrypt_data(
+            data_key, config.encryption_provider, config.encryption_key_id
+        )
+        
+        # encrypt_data falls back to local Fernet when the configured provider fails
+        provider = config.encryption_provider
+        if json.loads(key_metadata).get("encryption_type") == "fernet":
+            provider = EncryptionProvider.LOCAL_FERNET
+        
+        return wrapped_key, provider, key_metadata
+    
+    async def _get_data_key(self, config: StorageConfig) -> DataKey:
+        """Get a (possibly cached) data key for encrypting one asset in a tier."""
+        if self.key_provider is not None:
+            return await self.data_key_cache.get_encryption_key(
+                self.key_provider.name, self.key_provider.generate_data_key
+            )
+        
+        async def generate() -> DataKey:
+            plaintext = generate_data_key()
+            wrapped_key, provider, key_metadata = await self._wrap_data_key(plaintext, config)
+            return DataKey(
+                plaintext=plaintext,
+                wrapped=wrapped_key,
+                provider=provider.value,
+                metadata=key_metadata
+            )
+        
+        # A key wrapped by the local fallback must not be reused as a KMS-wrapped key
+        partition = f"{config.encryption_provider.value}:{config.encryption_key_id or 'default'}"
+        return await self.data_key_cache.get_encryption_key(
+            partition,
+            generate,
+            reusable=lambda key: key.provider == config.encryption_provider.value
+        )
+    
+    async def _unwrap_data_key(self, encrypted_asset: EncryptedAsset) -> bytes:
+        """Unwrap an asset's data key with the provider that wrapped it (cached)."""
+        wrapped_key = base64.b64decode(encrypted_asset.metadata["wrapped_data_key"])
+        provider = encrypted_asset.metadata["encryption_provider"]
+        key_metadata = encrypted_asset.metadata.get("encryption_metadata", "{}")
+        
+        if self.key_provider is not None and provider == self.key_provider.name:
+            unwrap = functools.partial(self.key_provider.decrypt_data_key, wrapped_key, key_metadata)
+        else:
+            unwrap = functools.partial(
+                self.decrypt_data, wrapped_key, EncryptionProvider(provider), key_metadata
+            )
+        
+        return await self.data_key_cache.get_decryption_key(wrapped_key, unwrap)
+    
+    async def close(self):
+        """Release storage backend connections and worker threads."""
+        await self.storage_backend.close()
     
     async def setup_bucket_policies(self):
         """Setup bucket policies and lifecycle rules for all storage tiers."""
@@ -759,5 +878,12 @@ class StorageSecurityManager:
             logger.error(f"Failed to apply access policy to {config.bucket_name}: {e}")
 
 
+async def _iter_chunks(data: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    """Present in-memory data as an async chunk iterator."""
+    view = memoryview(data)
+    for offset in range(0, len(view), chunk_size):
+        yield bytes(view[offset:offset + chunk_size])
+
+
 # Global storage security manager instance
 storage_security_manager = StorageSecurityManager()
\ No newline at end of file
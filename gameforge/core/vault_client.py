@@ -9,9 +9,17 @@ from datetime import datetime, timedelta
 import json
 import time
 from gameforge.core.logging_config import get_structured_logger, log_security_event
+from gameforge.core.secret_cache import SecretCache
 
 logger = get_structured_logger(__name__)
 
+# Per-path cache TTLs in seconds (longest prefix wins; leases cap them)
+DEFAULT_SECRET_TTLS = {
+    "secrets/jwt": 3600,
+    "secrets/database": 300,
+    "models/": 900
+}
+
 
 class VaultClient:
     """
@@ -24,7 +32,10 @@ class VaultClient:
         self,
         vault_url: Optional[str] = None,
         vault_token: Optional[str] = None,
-        mount_point: str = "gameforge"
+        mount_point: str = "gameforge",
+        secret_ttl: Optional[float] = None,
+        secret_ttls: Optional[Dict[str, float]] = None,
+        max_stale_seconds: Optional[float] = None
     ):
         """
         Initialize Vault client.
@@ -33,6 +44,10 @@ class VaultClient:
             vault_url: Vault server URL (defaults to VAULT_ADDR env var)
             vault_token: Vault authentication token (defaults to VAULT_TOKEN)
             mount_point: Vault mount point for GameForge secrets
+            secret_ttl: Default secret cache TTL (defaults to VAULT_SECRET_TTL or 300s)
+            secret_ttls: Per-path-prefix cache TTLs (defaults to DEFAULT_SECRET_TTLS)
+            max_stale_seconds: How long expired secrets may be served while Vault
+                is unreachable (defaults to VAULT_SECRET_MAX_STALE or 3600s)
         """
         self.vault_url = vault_url or os.getenv(
             "VAULT_ADDR", "http://localhost:8200"
@@ -46,6 +61,17 @@ class VaultClient:
         self.client = hvac.Client(url=self.vault_url, token=self.vault_token)
         self._authenticated = None  # Lazy authentication check
         
+        # Secrets are cached in process; Vault is read on miss or refresh
+        self.secret_cache = SecretCache(
+            loader=self._read_secret,
+            default_ttl=secret_ttl or float(os.getenv("VAULT_SECRET_TTL", "300")),
+            ttl_overrides=DEFAULT_SECRET_TTLS if secret_ttls is None else secret_ttls,
+            max_stale_seconds=(
+                max_stale_seconds if max_stale_seconds is not None
+                else float(os.getenv("VAULT_SECRET_MAX_STALE", "3600"))
+            )
+        )
+        
         logger.info(
             "Vault client initialized",
             vault_url=self.vault_url,
@@ -66,66 +92,91 @@ class VaultClient:
                 self._authenticated = False
         return self._authenticated
     
-    def get_secret(self, path: str, key: str = None) -> Optional[Any]:
+    def _read_secret(self, path: str):
         """
-        Retrieve a secret from Vault.
+        Read a secret from Vault (blocking; used as the secret cache loader).
         
-        Args:
-            path: Secret path (relative to mount point)
-            key: Specific key within the secret (optional)
-            
         Returns:
-            Secret value or None if not found
+            (secret data, lease duration) - data is None if the path is missing
+            
+        Raises:
+            Exception: If Vault could not be reached
         """
         try:
-            full_path = f"{self.mount_point}/data/{path}"
             response = self.client.secrets.kv.v2.read_secret_version(
-                path=path, mount_point=self.mount_point
+                path=path, mount_point=self.mount_point, raise_on_deleted_version=True
             )
-            
-            if not response or 'data' not in response:
-                logger.warning(
-                    "Secret not found",
-                    path=path,
-                    mount_point=self.mount_point
-                )
-                return None
-            
-            secret_data = response['data']['data']
-            
-            if key:
-                result = secret_data.get(key)
-                if result is None:
-                    logger.warning(
-                        "Secret key not found",
-                        path=path,
-                        key=key
-                    )
-                return result
-            
-            log_security_event(
-                event_type="secret_accessed",
-                severity="info",
-                secret_path=path,
-                has_key=bool(key)
-            )
-            
-            return secret_data
-            
+        except hvac.exceptions.InvalidPath:
+            response = None
         except Exception as e:
-            logger.error(
-                "Failed to retrieve secret",
-                path=path,
-                key=key,
-                error=str(e)
-            )
             log_security_event(
                 event_type="secret_access_failed",
                 severity="error",
                 secret_path=path,
                 error=str(e)
             )
-            return None
+            raise
+        
+        if not response or 'data' not in response:
+            logger.warning(
+                "Secret not found",
+                path=path,
+                mount_point=self.mount_point
+            )
+            return None, 0
+        
+        log_security_event(
+            event_type="secret_accessed",
+            severity="info",
+            secret_path=path
+        )
+        
+        return response['data']['data'], response.get('lease_duration') or 0
+    
+    def _select_key(self, path: str, secret_data: Optional[Dict[str, Any]], key: Optional[str]) -> Optional[Any]:
+        if secret_data is None or not key:
+            return secret_data
+        
+        result = secret_data.get(key)
+        if result is None:
+            logger.warning(
+                "Secret key not found",
+                path=path,
+                key=key
+            )
+        return result
+    
+    def get_secret(self, path: str, key: str = None) -> Optional[Any]:
+        """
+        Retrieve a secret from the cache, reading Vault on a miss.
+        
+        Blocks on a miss; code running on the event loop should use
+        aget_secret instead.
+        
+        Args:
+            path: Secret path (relative to mount point)
+            key: Specific key within the secret (optional)
+            
+        Returns:
+            Secret value or None if not found
+        """
+        return self._select_key(path, self.secret_cache.get_sync(path), key)
+    
+    async def aget_secret(self, path: str, key: str = None) -> Optional[Any]:
+        """
+        Retrieve a secret without blocking the event loop.
+        
+        Cached secrets are returned immediately (and refreshed in the
+        background near expiry); concurrent misses share one Vault read.
+        
+        Args:
+            path: Secret path (relative to mount point)
+            key: Specific key within the secret (optional)
+            
+        Returns:
+            Secret value or None if not found
+        """
+        return self._select_key(path, await self.secret_cache.get(path), key)
     
     def set_secret(self, path: str, data: Dict[str, Any]) -> bool:
         """
@@ -150,6 +201,8 @@ class VaultClient:
                 mount_point=self.mount_point
             )
             
+            self.secret_cache.invalidate(path)
+            
             log_security_event(
                 event_type="secret_stored",
                 severity="info",
@@ -194,6 +247,8 @@ class VaultClient:
                 path=path, mount_point=self.mount_point
             )
             
+            self.secret_cache.invalidate(path)
+            
             log_security_event(
                 event_type="secret_deleted",
                 severity="warning",
@@ -221,18 +276,25 @@ class VaultClient:
         Returns:
             API token or None if not found
         """
-        path = f"models/{model_provider}"
-        
+        return self._model_token(model_provider, self.get_secret(f"models/{model_provider}"))
+    
+    async def aget_model_token(self, model_provider: str) -> Optional[str]:
+        """Async variant of get_model_token."""
+        return self._model_token(
+            model_provider, await self.aget_secret(f"models/{model_provider}")
+        )
+    
+    @staticmethod
+    def _model_token(model_provider: str, secret: Optional[Dict[str, Any]]) -> Optional[str]:
+        if not secret:
+            return None
         if model_provider == "huggingface":
-            return self.get_secret(path, "token")
+            return secret.get("token")
         elif model_provider in ["openai", "stability"]:
-            return self.get_secret(path, "api_key")
+            return secret.get("api_key")
         else:
             # Generic token retrieval
-            secret = self.get_secret(path)
-            if secret:
-                return secret.get("token") or secret.get("api_key")
-            return None
+            return secret.get("token") or secret.get("api_key")
     
     def get_database_credentials(self) -> Optional[Dict[str, str]]:
         """
@@ -241,7 +303,14 @@ class VaultClient:
         Returns:
             Dictionary with database credentials or None
         """
-        secret = self.get_secret("secrets/database")
+        return self._database_credentials(self.get_secret("secrets/database"))
+    
+    async def aget_database_credentials(self) -> Optional[Dict[str, str]]:
+        """Async variant of get_database_credentials."""
+        return self._database_credentials(await self.aget_secret("secrets/database"))
+    
+    @staticmethod
+    def _database_credentials(secret: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
         if secret:
             return {
                 "password": secret.get("password"),
@@ -261,6 +330,10 @@ class VaultClient:
         """
         return self.get_secret("secrets/jwt", "secret")
     
+    async def aget_jwt_secret(self) -> Optional[str]:
+        """Async variant of get_jwt_secret."""
+        return await self.aget_secret("secrets/jwt", "secret")
+    
     def rotate_secret(self, path: str, new_data: Dict[str, Any]) -> bool:
         """
         Rotate a secret by updating it with new data.
@@ -0,0 +1,76 @@
+"""
+AI Asset Catalog Models
+=======================
+
+Indexed catalog of AI-generated assets and the per-user projects that
+group them. Column types are portable so the catalog also runs on SQLite
+for tests and local development.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, String, UniqueConstraint, func
+
+from gameforge.core.base import Base
+
+
+class CatalogProject(Base):
+    """A user's asset project (the legacy store only ever had "default")."""
+    
+    __tablename__ = "asset_catalog_projects"
+    
+    id = Column(String(32), primary_key=True)
+    user_id = Column(String(255), nullable=False)
+    slug = Column(String(64), nullable=False, default="default")
+    name = Column(String(255), nullable=False)
+    description = Column(String(1000), nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        UniqueConstraint("user_id", "slug", name="uq_asset_catalog_projects_user_slug"),
+    )
+
+
+class CatalogAsset(Base):
+    """One AI-generated asset."""
+    
+    __tablename__ = "asset_catalog"
+    
+    id = Column(String(32), primary_key=True)
+    user_id = Column(String(255), nullable=False)
+    project_id = Column(
+        String(32),
+        ForeignKey("asset_catalog_projects.id", ondelete="CASCADE"),
+        nullable=True
+    )
+    job_id = Column(String(64), nullable=True)
+    name = Column(String(255), nullable=False)
+    type = Column(String(32), nullable=False, default="art")
+    # Stored as submitted; filtered case-insensitively via lower(category)
+    category = Column(String(64), nullable=False, default="generated")
+    # Copied out of asset_metadata so list filters can use an index
+    style = Column(String(64), nullable=True)
+    file_path = Column(String(1000), nullable=False)
+    thumbnail_path = Column(String(1000), nullable=True)
+    asset_metadata = Column(JSON, nullable=False, default=dict)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    __table_args__ = (
+        # Newest-first listing per user, optionally narrowed by category or style
+        Index("idx_asset_catalog_user_created", "user_id", "created_at", "id"),
+        Index("idx_asset_catalog_user_style", "user_id", "style", "created_at"),
+        Index("idx_asset_catalog_project", "project_id"),
+        Index("idx_asset_catalog_job", "job_id"),
+    )
+
+
+Index(
+    "idx_asset_catalog_user_category_lower",
+    CatalogAsset.user_id,
+    func.lower(CatalogAsset.category),
+    CatalogAsset.created_at
+)
+
+
+__all__ = ['CatalogProject', 'CatalogAsset']
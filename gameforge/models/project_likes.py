@@ -0,0 +1,32 @@
+"""
+Project Like Models
+===================
+
+One row per (project, user) like. The primary key is what deduplicates
+likes; projects.like_count is a denormalized total that the write-behind
+counter flusher keeps in step with this table.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String
+
+from gameforge.core.base import Base
+
+
+class ProjectLike(Base):
+    """A user's like of a project."""
+
+    __tablename__ = "project_likes"
+
+    project_id = Column(String, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(String, primary_key=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        # "Projects I liked", newest first
+        Index("idx_project_likes_user_created", "user_id", "created_at"),
+    )
+
+
+__all__ = ['ProjectLike']
@@ -0,0 +1,42 @@
+"""
+Project Statistics Models
+=========================
+
+Counter table behind the project statistics overview. Rows are maintained
+by the projects_stat_counters trigger (see the add_project_stat_counters
+migration) and only ever count PUBLIC projects, so they are shared by
+every user; each user's own non-public projects are added at read time.
+"""
+
+from sqlalchemy import BigInteger, Column, String
+
+from gameforge.core.base import Base
+
+
+# Facet names stored in ProjectStatCounter.facet
+FACET_TOTAL = "total"
+FACET_TEMPLATE = "template"
+FACET_STATUS = "status"
+FACET_ENGINE = "engine"
+FACET_GENRE = "genre"
+
+
+class ProjectStatCounter(Base):
+    """Number of public projects in one facet bucket (e.g. engine=UNITY)."""
+
+    __tablename__ = "project_stat_counters"
+
+    facet = Column(String(16), primary_key=True)
+    # Enum label of the bucket; "" for total/template and for a NULL status
+    value = Column(String(64), primary_key=True, default="")
+    count = Column(BigInteger, nullable=False, default=0)
+
+
+__all__ = [
+    'ProjectStatCounter',
+    'FACET_TOTAL',
+    'FACET_TEMPLATE',
+    'FACET_STATUS',
+    'FACET_ENGINE',
+    'FACET_GENRE'
+]
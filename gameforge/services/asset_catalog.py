@@ -0,0 +1,477 @@
+"""
+AI Asset Catalog Service for GameForge AI Platform
+==================================================
+
+Database-backed replacement for the JSON-file ProjectStorage:
+- One row per asset, written in a single short transaction; no shared
+  project document is rewritten on every save
+- Listing filters and paginates in SQL on (user_id, created_at, id)
+  indexes instead of globbing and parsing every asset file
+- Runs on the application database via db_manager, or on any SQLAlchemy
+  URL (e.g. sqlite+aiosqlite) for tests and local development
+"""
+import os
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from gameforge.core.base import Base
+from gameforge.core.logging_config import get_structured_logger
+from gameforge.models.asset_catalog import CatalogAsset, CatalogProject
+from gameforge.services.pagination import KeysetPage, paginate_keyset
+
+logger = get_structured_logger(__name__)
+
+DEFAULT_PROJECT_SLUG = "default"
+
+# Job categories mapped to asset types
+ASSET_TYPE_MAPPING = {
+    "character": "art",
+    "environment": "art",
+    "weapon": "art",
+    "prop": "art",
+    "ui": "ui",
+    "icon": "ui",
+    "texture": "art"
+}
+
+# Columns the asset list endpoint renders (see list_asset_rows)
+LIST_COLUMNS = (
+    CatalogAsset.id,
+    CatalogAsset.name,
+    CatalogAsset.category,
+    CatalogAsset.file_path,
+    CatalogAsset.thumbnail_path,
+    CatalogAsset.asset_metadata,
+    CatalogAsset.created_at,
+)
+
+
+class AssetRecord(BaseModel):
+    """Asset record for project storage."""
+    id: str
+    name: str
+    type: str
+    category: str
+    file_path: str
+    thumbnail_path: Optional[str] = None
+    created_at: datetime
+    user_id: str
+    job_id: str
+    metadata: Dict[str, Any] = {}
+
+
+def _normalize(value: Optional[str]) -> Optional[str]:
+    """Styles are matched case-insensitively, so the style column is stored lowercased."""
+    return value.lower() if value else value
+
+
+def _to_record(asset: CatalogAsset) -> AssetRecord:
+    return AssetRecord(
+        id=asset.id,
+        name=asset.name,
+        type=asset.type,
+        category=asset.category,
+        file_path=asset.file_path,
+        thumbnail_path=asset.thumbnail_path,
+        created_at=asset.created_at,
+        user_id=asset.user_id,
+        job_id=asset.job_id or "",
+        metadata=asset.asset_metadata or {}
+    )
+
+
+def _default_session_factory():
+    # Imported lazily: db_manager is PostgreSQL-only and loads every model
+    from gameforge.core.database import db_manager
+    return db_manager.get_async_session()
+
+
+class AssetCatalog:
+    """Indexed catalog of AI-generated assets."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        engine=None,
+        max_cached_projects: int = 10000
+    ):
+        """
+        Args:
+            session_factory: Callable returning an async context manager that
+                yields an AsyncSession; defaults to db_manager sessions
+            engine: Engine owned by this catalog (SQLite mode), disposed on close
+            max_cached_projects: Users whose default project id is kept in
+                memory (least recently used are dropped)
+        """
+        self._session_factory = session_factory or _default_session_factory
+        self._engine = engine
+        self._tables_ready = engine is None
+        self.max_cached_projects = max_cached_projects
+        self._default_projects: "OrderedDict[str, str]" = OrderedDict()
+
+    @classmethod
+    def from_url(cls, database_url: str) -> "AssetCatalog":
+        """Catalog with its own engine, e.g. "sqlite+aiosqlite:///./data/catalog.db"."""
+        engine = create_async_engine(database_url)
+        factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+        return cls(session_factory=factory, engine=engine)
+
+    @classmethod
+    def from_env(cls) -> "AssetCatalog":
+        """Use ASSET_CATALOG_DATABASE_URL when set, otherwise the application database."""
+        database_url = os.getenv("ASSET_CATALOG_DATABASE_URL")
+        return cls.from_url(database_url) if database_url else cls()
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        if not self._tables_ready:
+            await self.create_tables()
+
+        async with self._session_factory() as session:
+            yield session
+
+    async def create_tables(self) -> None:
+        """Create the catalog tables on a catalog-owned engine (SQLite mode)."""
+        if self._engine is None:
+            return
+
+        async with self._engine.begin() as conn:
+            await conn.run_sync(
+                Base.metadata.create_all,
+                tables=[CatalogProject.__table__, CatalogAsset.__table__]
+            )
+        self._tables_ready = True
+
+    async def close(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
+
+    # ========================================================================
+    # Projects
+    # ========================================================================
+
+    async def get_or_create_default_project(
+        self,
+        user_id: str,
+        session: Optional[AsyncSession] = None
+    ) -> str:
+        """Return the id of the user's default project, creating it on first use."""
+        project_id = self._default_projects.get(user_id)
+        if project_id:
+            self._default_projects.move_to_end(user_id)
+            return project_id
+
+        if session is None:
+            async with self._session() as session:
+                return await self.get_or_create_default_project(user_id, session)
+
+        project_id = await session.scalar(
+            select(CatalogProject.id).where(
+                CatalogProject.user_id == user_id,
+                CatalogProject.slug == DEFAULT_PROJECT_SLUG
+            )
+        )
+
+        if project_id is None:
+            project_id = f"proj_{uuid.uuid4().hex[:12]}"
+            session.add(CatalogProject(
+                id=project_id,
+                user_id=user_id,
+                slug=DEFAULT_PROJECT_SLUG,
+                name="My AI Assets",
+                description="Auto-created project for AI-generated assets",
+                created_at=datetime.utcnow()
+            ))
+            try:
+                await session.commit()
+            except IntegrityError:
+                # Another worker created it first
+                await session.rollback()
+                project_id = await session.scalar(
+                    select(CatalogProject.id).where(
+                        CatalogProject.user_id == user_id,
+                        CatalogProject.slug == DEFAULT_PROJECT_SLUG
+                    )
+                )
+
+        self._remember_default_project(user_id, project_id)
+        return project_id
+
+    def _remember_default_project(self, user_id: str, project_id: str) -> None:
+        self._default_projects[user_id] = project_id
+        self._default_projects.move_to_end(user_id)
+        while len(self._default_projects) > self.max_cached_projects:
+            self._default_projects.popitem(last=False)
+
+    # ========================================================================
+    # Assets
+    # ========================================================================
+
+    async def save_asset_to_project(
+        self,
+        user_id: str,
+        asset_url: str,
+        job_data: Dict[str, Any],
+        project_id: Optional[str] = None
+    ) -> AssetRecord:
+        """Save an AI-generated asset to a project."""
+        job_metadata = job_data.get("metadata", {})
+
+        async with self._session() as session:
+            if not project_id:
+                project_id = await self.get_or_create_default_project(user_id, session)
+
+            now = datetime.utcnow()
+            asset = CatalogAsset(
+                id=f"asset_{uuid.uuid4().hex[:12]}",
+                user_id=user_id,
+                project_id=project_id,
+                job_id=job_data["id"],
+                name=self._generate_asset_name(job_data),
+                type=self._determine_asset_type(job_data),
+                category=job_metadata.get("category", "generated"),
+                style=_normalize(job_metadata.get("style")),
+                file_path=asset_url,  # For now, use the CDN URL
+                created_at=now,
+                asset_metadata={
+                    "prompt": job_metadata.get("prompt", ""),
+                    "style": job_metadata.get("style", ""),
+                    "dimensions": job_metadata.get("dimensions", ""),
+                    "quality": job_metadata.get("quality", ""),
+                    "ai_generated": True,
+                    "generation_timestamp": str(job_data.get("created_at", ""))
+                }
+            )
+            session.add(asset)
+            await session.execute(
+                update(CatalogProject)
+                .where(CatalogProject.id == project_id)
+                .values(updated_at=now)
+            )
+            await session.commit()
+
+            return _to_record(asset)
+
+    async def list_assets(
+        self,
+        user_id: str,
+        category: Optional[str] = None,
+        style: Optional[str] = None,
+        project_id: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> KeysetPage:
+        """
+        List a user's assets newest-first.
+
+        Args:
+            user_id: Asset owner
+            category: Case-insensitive category filter
+            style: Case-insensitive style filter
+            project_id: Restrict to one project
+            limit: Page size
+            offset: Rows to skip (ignored when a cursor is given)
+            cursor: Cursor from the previous page for keyset pagination
+
+        Returns:
+            KeysetPage of AssetRecord
+        """
+        query = self._list_query(select(CatalogAsset), user_id, category, style, project_id)
+        if offset and not cursor:
+            query = query.offset(offset)
+
+        async with self._session() as session:
+            page = await paginate_keyset(
+                session, query, CatalogAsset.created_at, CatalogAsset.id, limit, cursor
+            )
+
+        page.items = [_to_record(asset) for asset in page.items]
+        return page
+
+    async def list_asset_rows(
+        self,
+        user_id: str,
+        category: Optional[str] = None,
+        style: Optional[str] = None,
+        project_id: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> KeysetPage:
+        """
+        Same as list_assets, but selects only LIST_COLUMNS and returns row
+        mappings instead of AssetRecord models (the list endpoint fast path).
+        """
+        query = self._list_query(select(*LIST_COLUMNS), user_id, category, style, project_id)
+        if offset and not cursor:
+            query = query.offset(offset)
+
+        async with self._session() as session:
+            return await paginate_keyset(
+                session, query, CatalogAsset.created_at, CatalogAsset.id, limit, cursor,
+                mappings=True
+            )
+
+    @staticmethod
+    def _list_query(query, user_id, category, style, project_id):
+        query = query.where(CatalogAsset.user_id == user_id)
+        if category:
+            query = query.where(func.lower(CatalogAsset.category) == category.lower())
+        if style:
+            query = query.where(CatalogAsset.style == _normalize(style))
+        if project_id:
+            query = query.where(CatalogAsset.project_id == project_id)
+        return query
+
+    async def get_asset(self, user_id: str, asset_id: str) -> Optional[AssetRecord]:
+        """Get one of a user's assets."""
+        async with self._session() as session:
+            asset = await session.scalar(
+                select(CatalogAsset).where(
+                    CatalogAsset.id == asset_id,
+                    CatalogAsset.user_id == user_id
+                )
+            )
+        return _to_record(asset) if asset else None
+
+    async def count_assets(self, user_id: str) -> int:
+        """Number of assets a user owns."""
+        async with self._session() as session:
+            return await session.scalar(
+                select(func.count()).select_from(CatalogAsset).where(CatalogAsset.user_id == user_id)
+            ) or 0
+
+    async def import_records(
+        self,
+        projects: Iterable[Dict[str, Any]],
+        assets: Iterable[AssetRecord],
+        batch_size: int = 500
+    ) -> Dict[str, int]:
+        """
+        Bulk-load projects and assets, skipping ids that already exist.
+
+        Used by scripts/migrate-asset-catalog.py; safe to re-run.
+
+        Args:
+            projects: Legacy project documents (id, user_id, name, ...)
+            assets: Asset records, attached to their user's default project
+        """
+        counts = {"projects": 0, "assets": 0, "skipped": 0}
+
+        async with self._session() as session:
+            for project in projects:
+                exists = await session.scalar(
+                    select(CatalogProject.id).where(
+                        CatalogProject.user_id == project["user_id"],
+                        CatalogProject.slug == project.get("slug", DEFAULT_PROJECT_SLUG)
+                    )
+                )
+                if exists:
+                    self._remember_default_project(project["user_id"], exists)
+                    continue
+                session.add(CatalogProject(
+                    id=project["id"],
+                    user_id=project["user_id"],
+                    slug=project.get("slug", DEFAULT_PROJECT_SLUG),
+                    name=project.get("name", "My AI Assets"),
+                    description=project.get("description"),
+                    created_at=_parse_datetime(project.get("created_at")) or datetime.utcnow(),
+                    updated_at=_parse_datetime(project.get("updated_at"))
+                ))
+                self._remember_default_project(project["user_id"], project["id"])
+                counts["projects"] += 1
+            await session.commit()
+
+            batch: List[AssetRecord] = []
+
+            async def flush() -> None:
+                # Resolve projects first: creating one commits the session
+                project_ids = {
+                    user_id: await self.get_or_create_default_project(user_id, session)
+                    for user_id in {record.user_id for record in batch}
+                }
+
+                existing = set((await session.scalars(
+                    select(CatalogAsset.id).where(CatalogAsset.id.in_([a.id for a in batch]))
+                )).all())
+                for record in batch:
+                    if record.id in existing:
+                        counts["skipped"] += 1
+                        continue
+                    session.add(CatalogAsset(
+                        id=record.id,
+                        user_id=record.user_id,
+                        project_id=project_ids[record.user_id],
+                        job_id=record.job_id,
+                        name=record.name,
+                        type=record.type,
+                        category=record.category,
+                        style=_normalize(record.metadata.get("style")) or None,
+                        file_path=record.file_path,
+                        thumbnail_path=record.thumbnail_path,
+                        asset_metadata=record.metadata,
+                        created_at=record.created_at
+                    ))
+                    counts["assets"] += 1
+                await session.commit()
+                batch.clear()
+
+            for record in assets:
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    await flush()
+            if batch:
+                await flush()
+
+        return counts
+
+    def _generate_asset_name(self, job_data: Dict[str, Any]) -> str:
+        """Generate a user-friendly name for the asset."""
+        metadata = job_data.get("metadata", {})
+        prompt = metadata.get("prompt", "")
+        category = metadata.get("category", "asset")
+
+        # Extract key words from prompt for naming
+        if prompt:
+            words = prompt.split()[:3]  # Take first 3 words
+            base_name = " ".join(words).title()
+        else:
+            base_name = category.title()
+
+        # Add timestamp for uniqueness
+        timestamp = datetime.utcnow().strftime("%m%d_%H%M")
+        return f"{base_name} {timestamp}"
+
+    def _determine_asset_type(self, job_data: Dict[str, Any]) -> str:
+        """Determine asset type from job data."""
+        category = job_data.get("metadata", {}).get("category", "").lower()
+        return ASSET_TYPE_MAPPING.get(category, "art")
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value)) if value else None
+    except ValueError:
+        return None
+
+
+# Global asset catalog (application database unless ASSET_CATALOG_DATABASE_URL is set)
+asset_catalog = AssetCatalog.from_env()
+
+
+__all__ = [
+    'AssetRecord',
+    'AssetCatalog',
+    'asset_catalog'
+]
@@ -13,7 +13,7 @@ import secrets
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, and_, or_, desc, func
+from sqlalchemy import select, update, delete, and_, or_, desc, func, exists
 from sqlalchemy.orm import selectinload, joinedload
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -25,6 +25,10 @@ from gameforge.models.collaboration import (
 )
 from gameforge.models.projects import Project
 from gameforge.core.logging_config import get_structured_logger, log_security_event
+from gameforge.services.notification_delivery import notification_delivery
+from gameforge.services.notification_stats import notification_stats
+from gameforge.services.pagination import KeysetPage, paginate_keyset
+from gameforge.services.project_access import ProjectAccessResolver
 
 logger = get_structured_logger(__name__)
 
@@ -34,6 +38,7 @@ class CollaborationService:
     
     def __init__(self, db_session: AsyncSession):
         self.db = db_session
+        self.access = ProjectAccessResolver(db_session)
     
     # ========================================================================
     # Project Management
@@ -88,6 +93,10 @@ class CollaborationService:
         include_collaborations: bool = False
     ) -> Optional[Project]:
         """Get project if user has access."""
+        # Check access rights (memoized for the session)
+        if not await self.can_user_access_project(project_id, user_id):
+            return None
+        
         query = select(Project).where(
             and_(
                 Project.id == project_id,
@@ -99,16 +108,7 @@ class CollaborationService:
             query = query.options(selectinload(Project.collaborations))
         
         result = await self.db.execute(query)
-        project = result.scalar_one_or_none()
-        
-        if not project:
-            return None
-            
-        # Check access rights
-        if not await self.can_user_access_project(project_id, user_id):
-            return None
-            
-        return project
+        return result.scalar_one_or_none()
     
     async def get_user_projects(
         self,
@@ -152,6 +152,43 @@ class CollaborationService:
         result = await self.db.execute(query)
         return result.scalars().all()
     
+    async def get_user_projects_page(
+        self,
+        user_id: str,
+        include_shared: bool = True,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> KeysetPage:
+        """Get projects accessible to a user, most recently active first (keyset)."""
+        access_filter = Project.owner_id == user_id
+        
+        if include_shared:
+            access_filter = or_(
+                access_filter,
+                exists().where(
+                    and_(
+                        ProjectCollaboration.project_id == Project.id,
+                        ProjectCollaboration.user_id == user_id,
+                        ProjectCollaboration.deleted_at.is_(None)
+                    )
+                )
+            )
+        
+        query = select(Project).where(
+            and_(
+                access_filter,
+                Project.deleted_at.is_(None)
+            )
+        )
+        
+        # Matches idx_projects_owner_activity
+        activity_at = func.coalesce(Project.last_activity_at, Project.created_at)
+        
+        return await paginate_keyset(
+            self.db, query, activity_at, Project.id, limit, cursor,
+            sort_key=lambda project: project.last_activity_at or project.created_at
+        )
+    
     # ========================================================================
     # Collaboration Management
     # ========================================================================
@@ -205,6 +242,7 @@ class CollaborationService:
         )
         
         await self.db.commit()
+        await self.access.invalidate(project_id)
         
         logger.info(
             "Collaborator added to project",
@@ -250,6 +288,7 @@ class CollaborationService:
             )
             
             await self.db.commit()
+            await self.access.invalidate(project_id)
             return True
         
         return False
@@ -287,6 +326,7 @@ class CollaborationService:
             )
             
             await self.db.commit()
+            await self.access.invalidate(project_id)
             return True
         
         return False
@@ -427,6 +467,7 @@ class CollaborationService:
         )
         
         await self.db.commit()
+        await self.access.invalidate(invite.project_id)
         
         return True, None
     
@@ -512,6 +553,23 @@ class CollaborationService:
         
         return result.scalars().all()
     
+    async def get_project_activity_page(
+        self,
+        project_id: str,
+        user_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> KeysetPage:
+        """Get activity feed for a project using keyset pagination."""
+        if not await self.can_user_access_project(project_id, user_id):
+            return KeysetPage()
+        
+        query = select(ActivityLog).where(ActivityLog.project_id == project_id)
+        
+        return await paginate_keyset(
+            self.db, query, ActivityLog.created_at, ActivityLog.id, limit, cursor
+        )
+    
     # ========================================================================
     # Permission Checking
     # ========================================================================
@@ -521,36 +579,9 @@ class CollaborationService:
         project_id: str,
         user_id: str
     ) -> bool:
-        """Check if user can access a project."""
-        # Check if user is owner
-        project = await self.db.execute(
-            select(Project).where(
-                and_(
-                    Project.id == project_id,
-                    Project.deleted_at.is_(None)
-                )
-            )
-        )
-        project = project.scalar_one_or_none()
-        
-        if not project:
-            return False
-            
-        if project.owner_id == user_id:
-            return True
-        
-        # Check if user is a collaborator
-        collaboration = await self.db.execute(
-            select(ProjectCollaboration).where(
-                and_(
-                    ProjectCollaboration.project_id == project_id,
-                    ProjectCollaboration.user_id == user_id,
-                    ProjectCollaboration.deleted_at.is_(None)
-                )
-            )
-        )
-        
-        return collaboration.scalar_one_or_none() is not None
+        """Check if user can access a project (owner or collaborator)."""
+        access = await self.access.resolve(project_id, user_id)
+        return access.can_access
     
     async def can_user_manage_project(
         self,
@@ -558,39 +589,8 @@ class CollaborationService:
         user_id: str
     ) -> bool:
         """Check if user can manage a project (add/remove collaborators)."""
-        # Check if user is owner
-        project = await self.db.execute(
-            select(Project).where(
-                and_(
-                    Project.id == project_id,
-                    Project.deleted_at.is_(None)
-                )
-            )
-        )
-        project = project.scalar_one_or_none()
-        
-        if not project:
-            return False
-            
-        if project.owner_id == user_id:
-            return True
-        
-        # Check if user is admin collaborator
-        collaboration = await self.db.execute(
-            select(ProjectCollaboration).where(
-                and_(
-                    ProjectCollaboration.project_id == project_id,
-                    ProjectCollaboration.user_id == user_id,
-                    ProjectCollaboration.role.in_([
-                        CollaborationRole.ADMIN,
-                        CollaborationRole.OWNER
-                    ]),
-                    ProjectCollaboration.deleted_at.is_(None)
-                )
-            )
-        )
-        
-        return collaboration.scalar_one_or_none() is not None
+        access = await self.access.resolve(project_id, user_id)
+        return access.can_manage
     
     async def get_user_role_in_project(
         self,
@@ -598,33 +598,8 @@ class CollaborationService:
         user_id: str
     ) -> Optional[CollaborationRole]:
         """Get user's role in a project."""
-        # Check if user is owner
-        project = await self.db.execute(
-            select(Project).where(
-                and_(
-                    Project.id == project_id,
-                    Project.owner_id == user_id,
-                    Project.deleted_at.is_(None)
-                )
-            )
-        )
-        
-        if project.scalar_one_or_none():
-            return CollaborationRole.OWNER
-        
-        # Check collaboration
-        collaboration = await self.db.execute(
-            select(ProjectCollaboration).where(
-                and_(
-                    ProjectCollaboration.project_id == project_id,
-                    ProjectCollaboration.user_id == user_id,
-                    ProjectCollaboration.deleted_at.is_(None)
-                )
-            )
-        )
-        collaboration = collaboration.scalar_one_or_none()
-        
-        return collaboration.role if collaboration else None
+        access = await self.access.resolve(project_id, user_id)
+        return access.role
     
     # ========================================================================
     # Helper Methods
@@ -753,10 +728,69 @@ class CommentService:
         
         result = await self.db.execute(query)
         return result.scalars().all()
+    
+    async def get_comments_page(
+        self,
+        project_id: str,
+        user_id: str,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> KeysetPage:
+        """Get comments for a project or specific entity using keyset pagination."""
+        if not await self.collaboration_service.can_user_access_project(project_id, user_id):
+            return KeysetPage()
+        
+        query = select(Comment).where(
+            and_(
+                Comment.project_id == project_id,
+                Comment.deleted_at.is_(None)
+            )
+        )
+        
+        if entity_type and entity_id:
+            query = query.where(
+                and_(
+                    Comment.entity_type == entity_type,
+                    Comment.entity_id == entity_id
+                )
+            )
+        
+        return await paginate_keyset(
+            self.db, query, Comment.created_at, Comment.id, limit, cursor
+        )
+
+
+def notification_payload(notification: Notification) -> Dict[str, Any]:
+    """Socket payload for a notification (same fields as the API response)."""
+    return {
+        "id": notification.id,
+        "user_id": notification.user_id,
+        "type": notification.type,
+        "title": notification.title,
+        "message": notification.message,
+        "entity_type": notification.entity_type,
+        "entity_id": notification.entity_id,
+        "action_url": notification.action_url,
+        "action_text": notification.action_text,
+        "invite_metadata": notification.invite_metadata or {},
+        "read_at": notification.read_at,
+        "archived_at": notification.archived_at,
+        "created_at": notification.created_at,
+        "is_read": notification.read_at is not None,
+        "is_archived": notification.archived_at is not None
+    }
 
 
 class NotificationService:
-    """Service for managing user notifications."""
+    """
+    Service for managing user notifications.
+    
+    Every write goes through here so that, once committed, the cached unread
+    badge (notification_stats) is adjusted and new notifications are pushed
+    to the user's sockets on every worker (notification_delivery).
+    """
     
     def __init__(self, db_session: AsyncSession):
         self.db = db_session
@@ -773,7 +807,7 @@ class NotificationService:
         action_text: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None
     ) -> Notification:
-        """Create a new notification."""
+        """Create a new notification and push it to the user."""
         notification = Notification(
             user_id=user_id,
             type=notification_type,
@@ -783,11 +817,19 @@ class NotificationService:
             entity_id=entity_id,
             action_url=action_url,
             action_text=action_text,
-            metadata=metadata or {}
+            invite_metadata=metadata or {}
         )
         
         self.db.add(notification)
         await self.db.commit()
+        await self.db.refresh(notification)
+        
+        await notification_stats.record_unread_delta(user_id, 1)
+        try:
+            await notification_delivery.publish(user_id, notification_payload(notification))
+        except Exception as e:
+            # Stored either way; the client picks it up on its next fetch
+            logger.warning("Notification push failed", notification_id=notification.id, error=str(e))
         
         return notification
     
@@ -814,6 +856,28 @@ class NotificationService:
         result = await self.db.execute(query)
         return result.scalars().all()
     
+    async def get_user_notifications_page(
+        self,
+        user_id: str,
+        unread_only: bool = False,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> KeysetPage:
+        """Get user notifications using keyset pagination."""
+        query = select(Notification).where(
+            and_(
+                Notification.user_id == user_id,
+                Notification.archived_at.is_(None)
+            )
+        )
+        
+        if unread_only:
+            query = query.where(Notification.read_at.is_(None))
+        
+        return await paginate_keyset(
+            self.db, query, Notification.created_at, Notification.id, limit, cursor
+        )
+    
     async def mark_notification_read(
         self,
         notification_id: str,
@@ -834,14 +898,139 @@ class NotificationService:
         
         if result.rowcount > 0:
             await self.db.commit()
+            await notification_stats.record_unread_delta(user_id, -1)
             return True
         
         return False
+    
+    async def update_notification(
+        self,
+        notification_id: str,
+        user_id: str,
+        is_read: Optional[bool] = None,
+        is_archived: Optional[bool] = None
+    ) -> Notification:
+        """
+        Mark a notification read/unread and/or archive it.
+        
+        Raises:
+            ValueError: If the notification does not exist or belongs to another user
+        """
+        result = await self.db.execute(
+            select(Notification).where(
+                and_(
+                    Notification.id == notification_id,
+                    Notification.user_id == user_id
+                )
+            )
+        )
+        notification = result.scalar_one_or_none()
+        if not notification:
+            raise ValueError("Notification not found")
+        
+        was_unread = notification.read_at is None
+        
+        if is_read is not None:
+            notification.read_at = datetime.utcnow() if is_read else None
+        if is_archived is not None:
+            notification.archived_at = datetime.utcnow() if is_archived else None
+        
+        await self.db.commit()
+        await self.db.refresh(notification)
+        await notification_stats.record_unread_delta(
+            user_id, int(notification.read_at is None) - int(was_unread)
+        )
+        
+        return notification
+    
+    async def delete_notification(self, notification_id: str, user_id: str) -> bool:
+        """Delete a notification; False if it does not exist."""
+        result = await self.db.execute(
+            delete(Notification)
+            .where(
+                and_(
+                    Notification.id == notification_id,
+                    Notification.user_id == user_id
+                )
+            )
+            .returning(Notification.read_at)
+        )
+        deleted = result.all()
+        if not deleted:
+            return False
+        
+        await self.db.commit()
+        if deleted[0].read_at is None:
+            await notification_stats.record_unread_delta(user_id, -1)
+        return True
+    
+    async def mark_all_read(self, user_id: str) -> int:
+        """Mark every unread notification as read; returns the number changed."""
+        result = await self.db.execute(
+            update(Notification)
+            .where(
+                and_(
+                    Notification.user_id == user_id,
+                    Notification.read_at.is_(None)
+                )
+            )
+            .values(read_at=datetime.utcnow())
+        )
+        affected_count = result.rowcount
+        
+        await self.db.commit()
+        await notification_stats.record_unread_delta(user_id, -affected_count)
+        return affected_count
+    
+    async def bulk_update(self, user_id: str, notification_ids: List[str], action: str) -> int:
+        """
+        Apply mark_read, mark_unread, archive, unarchive or delete to several
+        notifications; returns the number of rows affected.
+        """
+        conditions = [
+            Notification.user_id == user_id,
+            Notification.id.in_(notification_ids)
+        ]
+        
+        if action == "delete":
+            result = await self.db.execute(delete(Notification).where(and_(*conditions)))
+        else:
+            # Read state only changes on rows that flip, so rowcount is also
+            # the unread counter delta
+            if action == "mark_read":
+                update_values = {Notification.read_at: datetime.utcnow()}
+                conditions.append(Notification.read_at.is_(None))
+            elif action == "mark_unread":
+                update_values = {Notification.read_at: None}
+                conditions.append(Notification.read_at.is_not(None))
+            elif action == "archive":
+                update_values = {Notification.archived_at: datetime.utcnow()}
+            elif action == "unarchive":
+                update_values = {Notification.archived_at: None}
+            else:
+                raise ValueError(f"Unknown bulk action: {action}")
+            
+            result = await self.db.execute(
+                update(Notification).where(and_(*conditions)).values(update_values)
+            )
+        affected_count = result.rowcount
+        
+        await self.db.commit()
+        
+        if action == "delete":
+            await notification_stats.invalidate(user_id)
+        elif action == "mark_read":
+            await notification_stats.record_unread_delta(user_id, -affected_count)
+        elif action == "mark_unread":
+            await notification_stats.record_unread_delta(user_id, affected_count)
+        
+        return affected_count
 
 
 # Export services
 __all__ = [
     'CollaborationService',
     'CommentService', 
-    'NotificationService'
+    'NotificationService',
+    'notification_payload'
 ]
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""
+Project Membership Cache for GameForge AI Platform
+==================================================
+
+Redis cache of whole project membership sets, used by ProjectAccessResolver:
+- One hash per project holding {user_id: role}, the owner id and the load time
+- A missing project is cached with an empty owner for the negative TTL only
+- Invalidation bumps a per-project generation before dropping the set; a load
+  only writes back if the generation it read before querying is unchanged, so
+  a set read before a membership change cannot overwrite the invalidation
+"""
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+KEY_PREFIX = "gameforge:project_members"
+
+# Redis hash fields holding the owner id and the load time inside a membership set
+OWNER_FIELD = "__owner__"
+CACHED_AT_FIELD = "__cached_at__"
+
+# Generations outlive any load in flight; an expired generation reads as a change
+GENERATION_TTL_SECONDS = 86400
+
+# Replace the set only if the generation still matches (KEYS: set, generation)
+_STORE_IF_GENERATION = """
+local current = redis.call('GET', KEYS[2]) or ''
+if current ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], unpack(ARGV, 3))
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+@dataclass(frozen=True)
+class CachedMembership:
+    """A user's entry in a cached membership set (role as stored, e.g. "editor")."""
+    project_exists: bool
+    is_owner: bool = False
+    role: Optional[str] = None
+
+
+class ProjectMembershipCache:
+    """Redis cache of project membership sets ({user_id: role} plus the owner)."""
+
+    def __init__(self, redis_client=None, ttl_seconds: int = 300, negative_ttl_seconds: int = 10):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+    def configure(
+        self,
+        redis_client,
+        ttl_seconds: Optional[int] = None,
+        negative_ttl_seconds: Optional[int] = None
+    ) -> None:
+        """Attach a Redis client (called once at application startup)."""
+        self.redis = redis_client
+        if ttl_seconds is not None:
+            self.ttl_seconds = ttl_seconds
+        if negative_ttl_seconds is not None:
+            self.negative_ttl_seconds = negative_ttl_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    def _key(self, project_id: str) -> str:
+        return f"{KEY_PREFIX}:{project_id}"
+
+    def _generation_key(self, project_id: str) -> str:
+        return f"{KEY_PREFIX}:{project_id}:generation"
+
+    async def get(self, project_id: str, user_id: str) -> Optional[CachedMembership]:
+        """Return cached membership, or None when the set is not cached."""
+        if not self.enabled:
+            return None
+
+        try:
+            owner_id, cached_at, role = await self.redis.hmget(
+                self._key(project_id), OWNER_FIELD, CACHED_AT_FIELD, str(user_id)
+            )
+        except Exception as e:
+            logger.warning("Membership cache read failed", project_id=project_id, error=str(e))
+            return None
+
+        if owner_id is None:
+            return None
+
+        owner_id = owner_id.decode() if isinstance(owner_id, bytes) else owner_id
+        if owner_id == "":
+            return CachedMembership(project_exists=False)
+
+        role = role.decode() if isinstance(role, bytes) else role
+        is_owner = owner_id == str(user_id)
+        if not is_owner and not role and time.time() - float(cached_at or 0) > self.negative_ttl_seconds:
+            return None  # a denial from an older set: the user may have been added since
+
+        return CachedMembership(project_exists=True, is_owner=is_owner, role=role or None)
+
+    async def generation(self, project_id: str) -> Optional[str]:
+        """
+        Read a project's generation before loading its membership.
+
+        Returns:
+            Value to pass to store(), or None if the cache is unavailable
+            (store() then skips the write)
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            value = await self.redis.get(self._generation_key(project_id))
+        except Exception as e:
+            logger.warning("Membership generation read failed", project_id=project_id, error=str(e))
+            return None
+
+        if value is None:
+            return ""
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    async def store(
+        self,
+        project_id: str,
+        owner_id: Optional[str],
+        members: Dict[str, str],
+        generation: Optional[str]
+    ) -> bool:
+        """
+        Cache a project's full membership set ("" owner marks a missing project).
+
+        Args:
+            members: {user_id: role value}
+            generation: Result of generation() read before the membership query
+
+        Returns:
+            False if the set was invalidated since `generation` was read and
+            was therefore not written
+        """
+        if not self.enabled or generation is None:
+            return False
+
+        mapping = {
+            OWNER_FIELD: str(owner_id) if owner_id is not None else "",
+            CACHED_AT_FIELD: str(time.time())
+        }
+        mapping.update({str(user_id): role for user_id, role in members.items()})
+        fields = [item for pair in mapping.items() for item in pair]
+        ttl = self.ttl_seconds if owner_id is not None else self.negative_ttl_seconds
+
+        try:
+            stored = await self.redis.eval(
+                _STORE_IF_GENERATION,
+                2,
+                self._key(project_id),
+                self._generation_key(project_id),
+                generation,
+                ttl,
+                *fields
+            )
+        except Exception as e:
+            logger.warning("Membership cache write failed", project_id=project_id, error=str(e))
+            return False
+
+        if not stored:
+            logger.debug("Membership changed during load, not caching", project_id=project_id)
+        return bool(stored)
+
+    async def invalidate(self, project_id: str) -> None:
+        """Drop a project's cached membership set and fence out loads in flight."""
+        if not self.enabled:
+            return
+
+        try:
+            generation_key = self._generation_key(project_id)
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.incr(generation_key)
+            pipe.expire(generation_key, GENERATION_TTL_SECONDS)
+            pipe.delete(self._key(project_id))
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Membership cache invalidation failed", project_id=project_id, error=str(e))
+
+
+# Global membership cache (Redis attached during application startup)
+membership_cache = ProjectMembershipCache()
+
+
+__all__ = [
+    'CachedMembership',
+    'ProjectMembershipCache',
+    'membership_cache'
+]
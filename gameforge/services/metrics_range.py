@@ -0,0 +1,357 @@
+"""
+Prometheus Range Queries for GameForge AI Platform
+==================================================
+
+Range-query layer behind /monitoring/metrics/prometheus:
+- start/end are aligned to the step, so every dashboard asking for "the last
+  24h" evaluates at the same timestamps and can share cached samples
+- Samples are cached per (query, step) along with the window they cover.
+  Later requests only fetch what is missing: the new tail since the last
+  fetch, plus one step of overlap because the newest point may still change.
+  A request that starts before the cached window refetches it in full.
+- Series are downsampled to a points-per-series budget with LTTB (keeps the
+  visual shape) or min/max bucketing (keeps spikes)
+- Results are columnar (timestamps[], values[]) rather than one object per
+  point
+"""
+import asyncio
+import bisect
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+# Prometheus rejects range queries above 11,000 points per series
+MAX_POINTS_PER_SERIES = 11000
+
+DOWNSAMPLE_LTTB = "lttb"
+DOWNSAMPLE_MINMAX = "minmax"
+DOWNSAMPLE_NONE = "none"
+
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800, "y": 31536000}
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h|d|w|y)")
+
+SeriesKey = Tuple[Tuple[str, str], ...]
+
+
+class PrometheusQueryError(Exception):
+    """Prometheus rejected a query or could not be reached."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def parse_step(step: str) -> float:
+    """Prometheus duration ("30s", "1m", "1h30m") or plain seconds -> seconds."""
+    try:
+        seconds = float(step)
+    except ValueError:
+        parts = _DURATION_PART.findall(step)
+        if not parts or "".join(n + u for n, u in parts) != step:
+            raise ValueError(f"Invalid step: {step!r}")
+        seconds = sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+    if seconds <= 0:
+        raise ValueError(f"Invalid step: {step!r}")
+    return seconds
+
+
+def align_range(start: float, end: float, step: float) -> Tuple[float, float, float]:
+    """
+    Snap a range to step boundaries, widening the step if the range would
+    exceed MAX_POINTS_PER_SERIES.
+
+    Returns:
+        (aligned_start, aligned_end, step)
+    """
+    step = max(step, math.ceil((end - start) / MAX_POINTS_PER_SERIES))
+    return math.floor(start / step) * step, math.floor(end / step) * step, step
+
+
+# ============================================================================
+# Downsampling
+# ============================================================================
+
+def lttb(
+    timestamps: List[float],
+    values: List[float],
+    threshold: int
+) -> Tuple[List[float], List[float]]:
+    """Largest-Triangle-Three-Buckets: keep `threshold` points that preserve shape."""
+    n = len(timestamps)
+    if threshold >= n or threshold < 3:
+        return timestamps, values
+
+    every = (n - 2) / (threshold - 2)
+    out_t = [timestamps[0]]
+    out_v = [values[0]]
+    a = 0
+
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_len = avg_end - avg_start
+        avg_t = sum(timestamps[avg_start:avg_end]) / avg_len
+        avg_v = sum(values[avg_start:avg_end]) / avg_len
+
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        a_t, a_v = timestamps[a], values[a]
+
+        max_area = -1.0
+        next_a = range_start
+        for j in range(range_start, range_end):
+            area = abs((a_t - avg_t) * (values[j] - a_v) - (a_t - timestamps[j]) * (avg_v - a_v))
+            if area > max_area:
+                max_area = area
+                next_a = j
+
+        out_t.append(timestamps[next_a])
+        out_v.append(values[next_a])
+        a = next_a
+
+    out_t.append(timestamps[-1])
+    out_v.append(values[-1])
+    return out_t, out_v
+
+
+def minmax(
+    timestamps: List[float],
+    values: List[float],
+    threshold: int
+) -> Tuple[List[float], List[float]]:
+    """Min/max bucketing: the lowest and highest point of each bucket, in time order."""
+    n = len(timestamps)
+    buckets = threshold // 2
+    if threshold >= n or buckets < 1:
+        return timestamps, values
+
+    out_t: List[float] = []
+    out_v: List[float] = []
+    size = n / buckets
+    for b in range(buckets):
+        lo, hi = int(b * size), min(int((b + 1) * size), n)
+        if lo >= hi:
+            continue
+        window = range(lo, hi)
+        i_min = min(window, key=values.__getitem__)
+        i_max = max(window, key=values.__getitem__)
+        for i in sorted({i_min, i_max}):
+            out_t.append(timestamps[i])
+            out_v.append(values[i])
+    return out_t, out_v
+
+
+DOWNSAMPLERS = {
+    DOWNSAMPLE_LTTB: lttb,
+    DOWNSAMPLE_MINMAX: minmax
+}
+
+
+# ============================================================================
+# Range cache
+# ============================================================================
+
+@dataclass
+class SeriesData:
+    """Samples of one series, sorted by timestamp (NaN samples dropped)."""
+    metric: Dict[str, str]
+    timestamps: List[float] = field(default_factory=list)
+    values: List[float] = field(default_factory=list)
+
+    def slice(self, start: float, end: float) -> Tuple[List[float], List[float]]:
+        lo = bisect.bisect_left(self.timestamps, start)
+        hi = bisect.bisect_right(self.timestamps, end)
+        return self.timestamps[lo:hi], self.values[lo:hi]
+
+    def replace_from(self, start: float, timestamps: List[float], values: List[float]) -> None:
+        cut = bisect.bisect_left(self.timestamps, start)
+        del self.timestamps[cut:]
+        del self.values[cut:]
+        self.timestamps.extend(timestamps)
+        self.values.extend(values)
+
+
+@dataclass
+class RangeEntry:
+    """Cached samples for one (query, step) and the window they cover."""
+    start: float
+    end: float
+    fetched_at: float
+    series: Dict[SeriesKey, SeriesData] = field(default_factory=dict)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+
+def _series_key(metric: Dict[str, str]) -> SeriesKey:
+    return tuple(sorted(metric.items()))
+
+
+async def fetch_range(
+    session,
+    base_url: str,
+    query: str,
+    start: float,
+    end: float,
+    step: float
+) -> Dict[SeriesKey, SeriesData]:
+    """One query_range call, parsed straight into per-series columns."""
+    params = {"query": query, "start": repr(start), "end": repr(end), "step": repr(step)}
+    try:
+        async with session.get(f"{base_url}/api/v1/query_range", params=params) as response:
+            if response.status != 200:
+                raise PrometheusQueryError(
+                    response.status, f"Prometheus query failed: {await response.text()}"
+                )
+            data = await response.json()
+    except PrometheusQueryError:
+        raise
+    except Exception as e:
+        logger.error("Failed to query Prometheus", error=str(e))
+        raise PrometheusQueryError(503, "Prometheus service unavailable")
+
+    if data["status"] != "success":
+        raise PrometheusQueryError(400, f"Prometheus query error: {data.get('error', 'Unknown error')}")
+
+    series: Dict[SeriesKey, SeriesData] = {}
+    for item in data["data"]["result"]:
+        entry = SeriesData(metric=item["metric"])
+        for timestamp, value in item["values"]:
+            value = float(value)
+            if math.isfinite(value):
+                entry.timestamps.append(float(timestamp))
+                entry.values.append(value)
+        series[_series_key(item["metric"])] = entry
+    return series
+
+
+class RangeQueryCache:
+    """
+    Step-aligned range query cache with incremental tail refresh.
+
+    Args:
+        fetch: Coroutine (query, start, end, step) -> Dict[SeriesKey, SeriesData]
+        max_entries: Cached (query, step) pairs kept (least recently used evicted)
+        max_span_seconds: Oldest data kept per entry, relative to its end
+    """
+
+    def __init__(self, fetch, max_entries: int = 256, max_span_seconds: float = 7 * 86400):
+        self.fetch = fetch
+        self.max_entries = max_entries
+        self.max_span_seconds = max_span_seconds
+        self._entries: "OrderedDict[Tuple[str, float], RangeEntry]" = OrderedDict()
+        self.stats = {
+            "hits": 0,
+            "tail_refreshes": 0,
+            "full_fetches": 0,
+            "points_fetched": 0
+        }
+
+    async def get(self, query: str, start: float, end: float, step: float) -> List[SeriesData]:
+        """Series covering the aligned [start, end] window (sliced copies)."""
+        key = (query, step)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = RangeEntry(start=start, end=start - step, fetched_at=0.0)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self._entries.move_to_end(key)
+
+        async with entry.lock:
+            now = time.time()
+            if start < entry.start or start > entry.end:
+                await self._fetch_full(entry, query, start, end, step, now)
+            elif end > entry.end or self._tail_is_live(entry, step, now):
+                await self._fetch_tail(entry, query, end, step, now)
+            else:
+                self.stats["hits"] += 1
+
+            return [
+                SeriesData(data.metric, *data.slice(start, end))
+                for data in entry.series.values()
+            ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "entries": len(self._entries)}
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _tail_is_live(entry: RangeEntry, step: float, now: float) -> bool:
+        """The last cached point was still being evaluated when fetched, and a step has passed."""
+        return entry.end >= entry.fetched_at - step and now - entry.fetched_at >= step
+
+    async def _fetch_full(self, entry, query, start, end, step, now) -> None:
+        entry.series = await self.fetch(query, start, end, step)
+        entry.start, entry.end, entry.fetched_at = start, end, now
+        self.stats["full_fetches"] += 1
+        self._count(entry.series)
+
+    async def _fetch_tail(self, entry, query, end, step, now) -> None:
+        # Refetch the last cached point too: it may have been partial
+        tail_start = max(entry.start, entry.end)
+        tail = await self.fetch(query, tail_start, max(end, entry.end), step)
+
+        for key, data in tail.items():
+            existing = entry.series.get(key)
+            if existing is None:
+                entry.series[key] = data
+            else:
+                existing.replace_from(tail_start, data.timestamps, data.values)
+        for key in entry.series.keys() - tail.keys():
+            entry.series[key].replace_from(tail_start, [], [])
+
+        entry.end, entry.fetched_at = max(entry.end, end), now
+        self._trim(entry)
+        self.stats["tail_refreshes"] += 1
+        self._count(tail)
+
+    def _trim(self, entry: RangeEntry) -> None:
+        oldest = entry.end - self.max_span_seconds
+        if entry.start >= oldest:
+            return
+        entry.start = oldest
+        for data in entry.series.values():
+            cut = bisect.bisect_left(data.timestamps, oldest)
+            del data.timestamps[:cut]
+            del data.values[:cut]
+
+    def _count(self, series: Dict[SeriesKey, SeriesData]) -> None:
+        self.stats["points_fetched"] += sum(len(data.timestamps) for data in series.values())
+
+
+def downsample(series: SeriesData, max_points: int, method: str = DOWNSAMPLE_LTTB) -> SeriesData:
+    """Reduce a series to at most max_points with the chosen method."""
+    sampler = DOWNSAMPLERS.get(method)
+    if sampler is None or len(series.timestamps) <= max_points:
+        return series
+    return SeriesData(series.metric, *sampler(series.timestamps, series.values, max_points))
+
+
+__all__ = [
+    'MAX_POINTS_PER_SERIES',
+    'DOWNSAMPLE_LTTB',
+    'DOWNSAMPLE_MINMAX',
+    'DOWNSAMPLE_NONE',
+    'PrometheusQueryError',
+    'SeriesData',
+    'RangeQueryCache',
+    'parse_step',
+    'align_range',
+    'lttb',
+    'minmax',
+    'downsample',
+    'fetch_range'
+]
@@ -0,0 +1,349 @@
+"""
+Monitoring Snapshot Poller for GameForge AI Platform
+====================================================
+
+Shared polling for the monitoring dashboard. Each dashboard WebSocket used
+to poll Prometheus/Grafana on its own, so identical queries were repeated
+for every client:
+- A SnapshotPoller owns one query set (instant metrics, active alerts). It
+  refreshes on an interval only while sockets are subscribed, caches the
+  latest snapshot for the HTTP endpoints and fans it out to every
+  subscriber. The payload is encoded once per snapshot, not once per socket.
+- Refreshes are single-flight, and a failed refresh keeps serving the last
+  snapshot
+- With a RedisSnapshotStore one worker per interval wins a short lock and
+  queries upstream; the other workers read its snapshot from Redis
+- Upstream requests share one pooled aiohttp session, and the Prometheus
+  query set runs concurrently
+"""
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+SNAPSHOT_PREFIX = "gameforge:monitoring:snapshot"
+LOCK_PREFIX = "gameforge:monitoring:lock"
+
+
+@dataclass
+class Snapshot:
+    """One poll result plus its pre-encoded WebSocket message."""
+    data: Any
+    fetched_at: float                   # wall-clock time of the upstream fetch
+    message_type: str = "snapshot"
+    _message: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            self._message = json.dumps(
+                {"type": self.message_type, "data": self.data}, default=str
+            )
+        return self._message
+
+
+# ============================================================================
+# Snapshot stores
+# ============================================================================
+
+class SnapshotStore:
+    """Base class for sharing snapshots between workers."""
+
+    async def claim(self, name: str, ttl_seconds: float) -> bool:
+        """Whether this worker should query upstream for the next interval."""
+        return True
+
+    async def load(self, name: str) -> Optional[Snapshot]:
+        """Latest snapshot written by any worker."""
+        return None
+
+    async def save(self, name: str, snapshot: Snapshot, ttl_seconds: float) -> None:
+        """Publish a snapshot to the other workers."""
+
+
+class LocalSnapshotStore(SnapshotStore):
+    """Single-worker store: every process polls upstream itself."""
+
+
+class RedisSnapshotStore(SnapshotStore):
+    """Cluster-wide store: one worker per interval polls, the rest read Redis."""
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+
+    async def claim(self, name: str, ttl_seconds: float) -> bool:
+        ttl_ms = max(int(ttl_seconds * 1000), 1)
+        return bool(await self.redis.set(f"{LOCK_PREFIX}:{name}", "1", nx=True, px=ttl_ms))
+
+    async def load(self, name: str) -> Optional[Snapshot]:
+        raw = await self.redis.get(f"{SNAPSHOT_PREFIX}:{name}")
+        if raw is None:
+            return None
+        payload = json.loads(raw)
+        return Snapshot(data=payload["data"], fetched_at=payload["fetched_at"])
+
+    async def save(self, name: str, snapshot: Snapshot, ttl_seconds: float) -> None:
+        payload = json.dumps(
+            {"data": snapshot.data, "fetched_at": snapshot.fetched_at}, default=str
+        )
+        await self.redis.set(
+            f"{SNAPSHOT_PREFIX}:{name}", payload, px=max(int(ttl_seconds * 1000), 1)
+        )
+
+
+# ============================================================================
+# Shared HTTP session
+# ============================================================================
+
+class SharedHTTPSession:
+    """Lazily created aiohttp session reused by every upstream request."""
+
+    def __init__(self, timeout_seconds: float = 5.0, limit: int = 20):
+        self.timeout_seconds = timeout_seconds
+        self.limit = limit
+        self._session = None
+
+    def get(self):
+        if self._session is None or self._session.closed:
+            import aiohttp
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+                connector=aiohttp.TCPConnector(limit=self.limit, keepalive_timeout=60)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+async def query_prometheus_instant(
+    session,
+    base_url: str,
+    queries: Dict[str, str],
+    default: float = 0.0
+) -> Dict[str, float]:
+    """
+    Run a named set of instant queries concurrently.
+
+    A query that fails or returns no series reports `default`.
+    """
+
+    async def run(name: str, query: str) -> float:
+        try:
+            async with session.get(
+                f"{base_url}/api/v1/query", params={"query": query}
+            ) as response:
+                if response.status != 200:
+                    return default
+                data = await response.json()
+                if data["status"] == "success" and data["data"]["result"]:
+                    return float(data["data"]["result"][0]["value"][1])
+                return default
+        except Exception as e:
+            logger.warning("Prometheus instant query failed", metric=name, error=str(e))
+            return default
+
+    names = list(queries)
+    values = await asyncio.gather(*(run(name, queries[name]) for name in names))
+    return dict(zip(names, values))
+
+
+# ============================================================================
+# Poller
+# ============================================================================
+
+class SnapshotPoller:
+    """
+    Polls one upstream query set for every subscriber in the process.
+
+    Args:
+        name: Store key and log name
+        fetch: Coroutine returning the JSON-serializable snapshot data
+        interval: Seconds between refreshes while sockets are subscribed;
+            also the maximum age served to HTTP callers
+        message_type: "type" of the WebSocket message
+        store: Cross-worker store (LocalSnapshotStore by default)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fetch: Callable[[], Awaitable[Any]],
+        interval: float,
+        message_type: str = "snapshot",
+        store: Optional[SnapshotStore] = None
+    ):
+        self.name = name
+        self.fetch = fetch
+        self.interval = interval
+        self.message_type = message_type
+        self.store = store or LocalSnapshotStore()
+        self._snapshot: Optional[Snapshot] = None
+        self._refreshing: Optional[asyncio.Task] = None
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {
+            "upstream_fetches": 0,
+            "shared_reads": 0,
+            "cache_hits": 0,
+            "fetch_failures": 0,
+            "published": 0
+        }
+
+    async def get(self, max_age: Optional[float] = None) -> Any:
+        """Cached snapshot data, refreshed when older than max_age (default: interval)."""
+        max_age = self.interval if max_age is None else max_age
+        if self._snapshot is not None and self._snapshot.age < max_age:
+            self.stats["cache_hits"] += 1
+            return self._snapshot.data
+        return (await self.refresh()).data
+
+    async def refresh(self) -> Snapshot:
+        """Single-flight refresh; concurrent callers share one upstream round."""
+        if self._refreshing is None:
+            self._refreshing = asyncio.create_task(self._refresh())
+            self._refreshing.add_done_callback(self._refresh_done)
+        return await asyncio.shield(self._refreshing)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Queue receiving every new snapshot (only the latest is kept)."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers.add(queue)
+        if self._snapshot is not None:
+            queue.put_nowait(self._snapshot)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    async def stop(self) -> None:
+        tasks = [task for task in (self._task, self._refreshing) if task is not None]
+        self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "subscribers": len(self._subscribers),
+            "snapshot_age": self._snapshot.age if self._snapshot else None
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _refresh(self) -> Snapshot:
+        snapshot = None
+        try:
+            if await self.store.claim(self.name, self.interval):
+                snapshot = await self._fetch_upstream()
+            else:
+                shared = await self.store.load(self.name)
+                if shared is not None and shared.age < self.interval * 2:
+                    self.stats["shared_reads"] += 1
+                    snapshot = Snapshot(shared.data, shared.fetched_at, self.message_type)
+                else:
+                    # The lock holder has not published yet (or died)
+                    snapshot = await self._fetch_upstream()
+        except Exception as e:
+            self.stats["fetch_failures"] += 1
+            logger.warning("Monitoring snapshot refresh failed", poller=self.name, error=str(e))
+            if self._snapshot is None:
+                raise
+            return self._snapshot
+
+        if self._snapshot is None or snapshot.fetched_at > self._snapshot.fetched_at:
+            self._snapshot = snapshot
+            self._publish(snapshot)
+        return self._snapshot
+
+    async def _fetch_upstream(self) -> Snapshot:
+        self.stats["upstream_fetches"] += 1
+        snapshot = Snapshot(await self.fetch(), time.time(), self.message_type)
+        try:
+            await self.store.save(self.name, snapshot, self.interval * 2)
+        except Exception as e:
+            logger.warning("Failed to share monitoring snapshot", poller=self.name, error=str(e))
+        return snapshot
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        if self._refreshing is task:
+            self._refreshing = None
+        if not task.cancelled():
+            task.exception()  # mark retrieved; failures are logged in _refresh
+
+    def _publish(self, snapshot: Snapshot) -> None:
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(snapshot)
+        self.stats["published"] += 1
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            try:
+                await self.refresh()
+            except Exception:
+                pass  # logged in _refresh(); retried next interval
+            await asyncio.sleep(self.interval)
+        self._task = None
+
+
+class MonitoringPollers:
+    """The process's pollers plus the resources they share."""
+
+    def __init__(self):
+        self.pollers: List[SnapshotPoller] = []
+        self.http = SharedHTTPSession()
+        self.store: Optional[SnapshotStore] = None
+
+    def register(self, poller: SnapshotPoller) -> SnapshotPoller:
+        if self.store is not None:
+            poller.store = self.store
+        self.pollers.append(poller)
+        return poller
+
+    def configure(self, store: SnapshotStore) -> None:
+        """Share snapshots across workers (called once at application startup)."""
+        self.store = store
+        for poller in self.pollers:
+            poller.store = store
+
+    async def stop(self) -> None:
+        await asyncio.gather(*(poller.stop() for poller in self.pollers))
+        await self.http.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {poller.name: poller.get_stats() for poller in self.pollers}
+
+
+# Global registry (pollers are registered by the monitoring API)
+monitoring_pollers = MonitoringPollers()
+
+
+__all__ = [
+    'Snapshot',
+    'SnapshotStore',
+    'LocalSnapshotStore',
+    'RedisSnapshotStore',
+    'SharedHTTPSession',
+    'SnapshotPoller',
+    'MonitoringPollers',
+    'query_prometheus_instant',
+    'monitoring_pollers'
+]
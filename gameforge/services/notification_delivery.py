@@ -0,0 +1,300 @@
+"""
+Notification Delivery for GameForge AI Platform
+===============================================
+
+Push pipeline behind /notifications/ws:
+- Creating a notification publishes it on the realtime bus, on a per-user
+  "notifications" channel. With RedisRealtimeBus every worker subscribes to
+  the users connected to it, so a notification created on worker A reaches
+  sockets on worker B
+- Each socket has its own ConnectionWriter (bounded queue + writer task), so
+  one slow socket never delays the others; overflowing sockets are closed
+- Bursts are coalesced per user: the first notification is pushed at once,
+  anything arriving in the next `batch_window` seconds is sent as one
+  "notification_batch" message ("5 new comments") when the window closes
+- Publish-to-enqueue latency is recorded for every delivered notification
+"""
+import asyncio
+import bisect
+import json
+import os
+import time
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import WebSocket
+
+from gameforge.core.logging_config import get_structured_logger
+from gameforge.services.realtime_broadcast import ConnectionWriter, serialize_message
+from gameforge.services.realtime_bus import (
+    InProcessRealtimeBus, RealtimeBus, RealtimeEnvelope
+)
+
+logger = get_structured_logger(__name__)
+
+NOTIFICATION_SCOPE = "notifications"
+
+# Plural nouns for batch summaries ("5 new comments"), by notification type name
+BATCH_LABELS = {
+    "INVITATION_RECEIVED": "invitations",
+    "INVITATION_ACCEPTED": "accepted invitations",
+    "PROJECT_SHARED": "shared projects",
+    "ASSET_SHARED": "shared assets",
+    "COMMENT_RECEIVED": "comments",
+    "MENTION_RECEIVED": "mentions",
+    "AI_JOB_COMPLETED": "completed AI jobs",
+    "AI_JOB_FAILED": "failed AI jobs"
+}
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class LatencyHistogram:
+    """Cumulative latency buckets plus quantiles over recent samples."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS, window: int = 1024):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self._recent: deque = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        seconds = max(seconds, 0.0)
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self._recent.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self._recent:
+            return None
+        ordered = sorted(self._recent)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative, buckets = 0, {}
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": buckets
+        }
+
+
+@dataclass
+class _BurstWindow:
+    pending: List[Dict[str, Any]] = field(default_factory=list)
+    task: Optional[asyncio.Task] = None
+
+
+def _type_name(notification: Dict[str, Any]) -> str:
+    value = getattr(notification.get("type"), "name", notification.get("type"))
+    return str(value).split(".")[-1].upper()
+
+
+def batch_summary(notifications: List[Dict[str, Any]]) -> str:
+    """"5 new comments" for one type, "5 new notifications" for a mix."""
+    types = {_type_name(notification) for notification in notifications}
+    label = BATCH_LABELS.get(types.pop(), "notifications") if len(types) == 1 else "notifications"
+    return f"{len(notifications)} new {label}"
+
+
+class NotificationDelivery:
+    """
+    Delivers notifications to the WebSockets connected to this worker.
+
+    Args:
+        max_queue_size: Outbound messages buffered per socket before it is closed
+        batch_window: Seconds after a push during which further notifications
+            for the same user are coalesced (0 disables batching)
+        batch_preview: Notifications included in full in a batch message
+    """
+
+    def __init__(self, max_queue_size: int = 100, batch_window: float = 0.5, batch_preview: int = 3):
+        self.max_queue_size = max_queue_size
+        self.batch_window = batch_window
+        self.batch_preview = batch_preview
+        self.bus: RealtimeBus = InProcessRealtimeBus()
+        self.writers: Dict[str, Dict[str, ConnectionWriter]] = {}
+        self._windows: Dict[str, _BurstWindow] = {}
+        self._started = False
+        self.latency = LatencyHistogram()
+        self.stats = {
+            "published": 0,
+            "delivered": 0,
+            "batches": 0,
+            "coalesced": 0,
+            "slow_client_disconnects": 0
+        }
+
+    async def start(self, bus: Optional[RealtimeBus] = None) -> None:
+        """Start consuming notifications from the bus (cross-worker when Redis-backed)."""
+        if self._started:
+            return
+        if bus is not None:
+            self.bus = bus
+        await self.bus.start(self._on_envelope)
+        for user_id in list(self.writers):
+            await self.bus.subscribe(NOTIFICATION_SCOPE, user_id)
+        self._started = True
+
+    async def stop(self) -> None:
+        for window in self._windows.values():
+            if window.task:
+                window.task.cancel()
+        self._windows.clear()
+        await self.bus.stop()
+        self._started = False
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    async def connect(self, websocket: WebSocket, user_id: str) -> str:
+        """Accept a socket and start its writer; returns the connection id."""
+        await websocket.accept()
+        connection_id = uuid.uuid4().hex
+
+        if user_id not in self.writers:
+            self.writers[user_id] = {}
+            await self.bus.subscribe(NOTIFICATION_SCOPE, user_id)
+
+        writer = ConnectionWriter(
+            websocket,
+            connection_id,
+            self.max_queue_size,
+            on_send_error=lambda error: self.disconnect(user_id, connection_id)
+        )
+        self.writers[user_id][connection_id] = writer
+        writer.start()
+        logger.info("Notification socket connected", user_id=user_id, connection_id=connection_id)
+        return connection_id
+
+    async def disconnect(self, user_id: str, connection_id: str) -> None:
+        writer = self.writers.get(user_id, {}).pop(connection_id, None)
+        if writer is not None:
+            writer.close()
+        if user_id in self.writers and not self.writers[user_id]:
+            del self.writers[user_id]
+            await self.bus.unsubscribe(NOTIFICATION_SCOPE, user_id)
+            window = self._windows.pop(user_id, None)
+            if window and window.task:
+                window.task.cancel()
+        logger.info("Notification socket disconnected", user_id=user_id, connection_id=connection_id)
+
+    def reply(self, user_id: str, connection_id: str, text: str) -> None:
+        """Send a control frame (e.g. pong) through the socket's writer."""
+        writer = self.writers.get(user_id, {}).get(connection_id)
+        if writer is not None:
+            writer.enqueue(text)
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    async def publish(self, user_id: str, notification: Dict[str, Any]) -> None:
+        """Route a committed notification to the user's sockets on every worker."""
+        payload = json.dumps({"published_at": time.time(), "notification": notification}, default=str)
+        envelope = RealtimeEnvelope(scope=NOTIFICATION_SCOPE, target_id=user_id, payload=payload)
+        self.stats["published"] += 1
+        if self._started:
+            await self.bus.publish(envelope)
+        else:
+            await self._on_envelope(envelope)
+
+    async def _on_envelope(self, envelope: RealtimeEnvelope) -> None:
+        if envelope.scope != NOTIFICATION_SCOPE or envelope.target_id not in self.writers:
+            return
+
+        data = json.loads(envelope.payload)
+        self.latency.observe(time.time() - data["published_at"])
+        self._accept(envelope.target_id, data["notification"])
+
+    def _accept(self, user_id: str, notification: Dict[str, Any]) -> None:
+        if self.batch_window <= 0:
+            self._push(user_id, notification)
+            return
+
+        window = self._windows.get(user_id)
+        if window is not None:
+            window.pending.append(notification)
+            self.stats["coalesced"] += 1
+            return
+
+        # Leading edge: push now, coalesce whatever follows within the window
+        self._push(user_id, notification)
+        window = _BurstWindow()
+        window.task = asyncio.create_task(self._run_window(user_id, window))
+        self._windows[user_id] = window
+
+    async def _run_window(self, user_id: str, window: _BurstWindow) -> None:
+        while True:
+            await asyncio.sleep(self.batch_window)
+            pending, window.pending = window.pending, []
+            if not pending:
+                if self._windows.get(user_id) is window:
+                    del self._windows[user_id]
+                return
+            if len(pending) == 1:
+                self._push(user_id, pending[0])
+            else:
+                self._push_batch(user_id, pending)
+
+    def _push(self, user_id: str, notification: Dict[str, Any]) -> None:
+        self._send(user_id, {"type": "new_notification", "notification": notification})
+
+    def _push_batch(self, user_id: str, notifications: List[Dict[str, Any]]) -> None:
+        self.stats["batches"] += 1
+        self._send(user_id, {
+            "type": "notification_batch",
+            "count": len(notifications),
+            "summary": batch_summary(notifications),
+            "by_type": dict(Counter(_type_name(n) for n in notifications)),
+            "notifications": notifications[-self.batch_preview:],
+            "timestamp": datetime.utcnow().isoformat()
+        })
+
+    def _send(self, user_id: str, message: Dict[str, Any]) -> None:
+        """Serialize once and enqueue on every local socket of the user."""
+        payload = serialize_message(message)
+        for connection_id, writer in list(self.writers.get(user_id, {}).items()):
+            if writer.enqueue(payload):
+                self.stats["delivered"] += 1
+                continue
+            logger.warning("Closing slow notification socket", user_id=user_id, connection_id=connection_id)
+            self.stats["slow_client_disconnects"] += 1
+            writer.close(close_socket=True)
+            asyncio.create_task(self.disconnect(user_id, connection_id))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "connected_users": len(self.writers),
+            "connections": sum(len(writers) for writers in self.writers.values()),
+            "delivery_latency_seconds": self.latency.snapshot()
+        }
+
+
+# Global delivery pipeline (Redis bus attached during application startup)
+notification_delivery = NotificationDelivery(
+    max_queue_size=int(os.getenv("NOTIFICATION_SOCKET_QUEUE_SIZE", "100")),
+    batch_window=float(os.getenv("NOTIFICATION_BATCH_WINDOW", "0.5"))
+)
+
+
+__all__ = [
+    'NOTIFICATION_SCOPE',
+    'LatencyHistogram',
+    'NotificationDelivery',
+    'batch_summary',
+    'notification_delivery'
+]
@@ -0,0 +1,229 @@
+"""
+Notification Statistics for GameForge AI Platform
+=================================================
+
+Serves /notifications/stats without five COUNT queries per call:
+- The overview is one grouped scan of the user's notifications with
+  COUNT(*) FILTER (...) per facet. idx_notifications_user_stats covers it,
+  so it is answered from the index.
+- The unread badge comes from a per-user counter (in Redis when available).
+  It is primed from the database on a miss. Creates, reads/unreads and
+  deletes adjust it after they commit. Keys expire after a TTL, so any
+  drift from races with priming corrects itself.
+"""
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import DateTime, String, column, func, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+# Only the columns the stats read (see idx_notifications_user_stats)
+notifications_table = table(
+    "notifications",
+    column("user_id", String),
+    column("type", String),
+    column("read_at", DateTime),
+    column("archived_at", DateTime),
+    column("created_at", DateTime)
+)
+
+UNREAD_PREFIX = "gameforge:notifications:unread"
+
+# INCRBY only when the counter is primed; a negative result means it drifted
+_INCR_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+    if value < 0 then
+        redis.call('DEL', KEYS[1])
+        return nil
+    end
+    return value
+end
+return nil
+"""
+
+
+# ============================================================================
+# Unread counters
+# ============================================================================
+
+class UnreadCounter(ABC):
+    """Base class for per-user unread notification counters."""
+
+    @abstractmethod
+    async def get(self, user_id: str) -> Optional[int]:
+        """Cached unread count, or None when not primed."""
+
+    @abstractmethod
+    async def prime(self, user_id: str, count: int) -> None:
+        """Store a count computed from the database."""
+
+    @abstractmethod
+    async def adjust(self, user_id: str, delta: int) -> None:
+        """Apply a committed change; no-op when the counter is not primed."""
+
+    @abstractmethod
+    async def invalidate(self, user_id: str) -> None:
+        pass
+
+
+class InMemoryUnreadCounter(UnreadCounter):
+    """Process-local counters (tests, single worker)."""
+
+    def __init__(self):
+        self._counts: Dict[str, int] = {}
+
+    async def get(self, user_id: str) -> Optional[int]:
+        return self._counts.get(user_id)
+
+    async def prime(self, user_id: str, count: int) -> None:
+        self._counts[user_id] = count
+
+    async def adjust(self, user_id: str, delta: int) -> None:
+        if user_id in self._counts:
+            value = self._counts[user_id] + delta
+            if value < 0:
+                del self._counts[user_id]
+            else:
+                self._counts[user_id] = value
+
+    async def invalidate(self, user_id: str) -> None:
+        self._counts.pop(user_id, None)
+
+
+class RedisUnreadCounter(UnreadCounter):
+    """Counters shared by every worker, one Redis key per user."""
+
+    def __init__(self, redis_client, ttl_seconds: int = 300):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, user_id: str) -> str:
+        return f"{UNREAD_PREFIX}:{user_id}"
+
+    async def get(self, user_id: str) -> Optional[int]:
+        value = await self.redis.get(self._key(user_id))
+        return int(value) if value is not None else None
+
+    async def prime(self, user_id: str, count: int) -> None:
+        await self.redis.set(self._key(user_id), count, ex=self.ttl_seconds)
+
+    async def adjust(self, user_id: str, delta: int) -> None:
+        await self.redis.eval(_INCR_IF_EXISTS, 1, self._key(user_id), delta)
+
+    async def invalidate(self, user_id: str) -> None:
+        await self.redis.delete(self._key(user_id))
+
+
+# ============================================================================
+# Stats service
+# ============================================================================
+
+class NotificationStatsService:
+    """Single-scan notification stats plus the cached unread badge."""
+
+    def __init__(self, counter: Optional[UnreadCounter] = None, recent_hours: int = 24):
+        self.counter = counter or InMemoryUnreadCounter()
+        self.recent_hours = recent_hours
+        self.stats = {"badge_hits": 0, "badge_misses": 0, "overview_scans": 0, "counter_errors": 0}
+
+    def configure(self, counter: UnreadCounter) -> None:
+        """Swap in a shared counter (called once at application startup)."""
+        self.counter = counter
+
+    async def overview(self, db: AsyncSession, user_id: str, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        All facets in one grouped scan.
+
+        Returns:
+            Dict with total_count, unread_count, archived_count, recent_count
+            and by_type (stored type name -> count)
+        """
+        n = notifications_table.c
+        since = (now or datetime.utcnow()) - timedelta(hours=self.recent_hours)
+        result = await db.execute(
+            select(
+                n.type,
+                func.count(),
+                func.count().filter(n.read_at.is_(None)),
+                func.count().filter(n.archived_at.is_not(None)),
+                func.count().filter(n.created_at >= since)
+            )
+            .where(n.user_id == user_id)
+            .group_by(n.type)
+        )
+        self.stats["overview_scans"] += 1
+
+        overview = {"total_count": 0, "unread_count": 0, "archived_count": 0, "recent_count": 0, "by_type": {}}
+        for type_name, total, unread, archived, recent in result.all():
+            overview["by_type"][type_name] = total
+            overview["total_count"] += total
+            overview["unread_count"] += unread
+            overview["archived_count"] += archived
+            overview["recent_count"] += recent
+
+        await self._safe(self.counter.prime(user_id, overview["unread_count"]))
+        return overview
+
+    async def unread_count(self, db: AsyncSession, user_id: str) -> int:
+        """O(1) badge lookup; one indexed COUNT on a miss."""
+        try:
+            cached = await self.counter.get(user_id)
+        except Exception as e:
+            self.stats["counter_errors"] += 1
+            logger.warning("Unread counter unavailable", error=str(e))
+            cached = None
+
+        if cached is not None:
+            self.stats["badge_hits"] += 1
+            return cached
+
+        self.stats["badge_misses"] += 1
+        n = notifications_table.c
+        result = await db.execute(
+            select(func.count()).where(n.user_id == user_id, n.read_at.is_(None))
+        )
+        count = result.scalar() or 0
+        await self._safe(self.counter.prime(user_id, count))
+        return count
+
+    async def record_unread_delta(self, user_id: str, delta: int) -> None:
+        """Apply a committed change to the user's unread count."""
+        if delta:
+            await self._safe(self.counter.adjust(user_id, delta))
+
+    async def invalidate(self, user_id: str) -> None:
+        """Drop the counter when the change cannot be expressed as a delta."""
+        await self._safe(self.counter.invalidate(user_id))
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
+
+    async def _safe(self, operation) -> None:
+        # The counter is an optimization; the database stays authoritative
+        try:
+            await operation
+        except Exception as e:
+            self.stats["counter_errors"] += 1
+            logger.warning("Unread counter update failed", error=str(e))
+
+
+# Global stats service (Redis counter attached during application startup)
+notification_stats = NotificationStatsService(
+    recent_hours=int(os.getenv("NOTIFICATION_RECENT_HOURS", "24"))
+)
+
+
+__all__ = [
+    'UnreadCounter',
+    'InMemoryUnreadCounter',
+    'RedisUnreadCounter',
+    'NotificationStatsService',
+    'notification_stats'
+]
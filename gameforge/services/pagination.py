@@ -0,0 +1,150 @@
+"""
+Keyset (cursor) Pagination for GameForge AI Platform
+====================================================
+
+Feeds are paginated by the last row seen instead of OFFSET, so fetching
+page N costs the same as page 1:
+- Cursors are opaque, URL-safe encodings of (sort value, id)
+- Pages seek with a row-value comparison, (sort, id) < (:sort, :id) for
+  newest-first feeds or > for ascending ones, which PostgreSQL answers from
+  a composite (..., sort, id) index scanned in either direction
+- One extra row is fetched to decide whether a next page exists
+"""
+import base64
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import asc, desc, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """One page of results plus the cursor for the next page."""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(sort_value: Any, row_id: Any) -> str:
+    """Encode the position after a row as an opaque cursor."""
+    if isinstance(sort_value, datetime):
+        sort_value = {"dt": sort_value.isoformat()}
+    data = json.dumps([sort_value, str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Decode a cursor into (sort value, id)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+    if isinstance(sort_value, dict) and "dt" in sort_value:
+        try:
+            sort_value = datetime.fromisoformat(sort_value["dt"])
+        except (TypeError, ValueError) as e:
+            raise InvalidCursorError("Invalid pagination cursor") from e
+
+    # Only shapes encode_cursor produces reach the seek comparison
+    valid_sort = sort_value is None or (
+        isinstance(sort_value, (str, int, float, datetime)) and not isinstance(sort_value, bool)
+    )
+    if not valid_sort or not isinstance(row_id, str):
+        raise InvalidCursorError("Invalid pagination cursor")
+
+    return sort_value, row_id
+
+
+def apply_keyset(
+    query,
+    sort_column,
+    id_column,
+    cursor: Optional[str] = None,
+    ascending: bool = False
+):
+    """Order a query (newest-first unless ascending) and seek past the cursor position."""
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        if getattr(id_column.type, "as_uuid", False):
+            try:
+                row_id = uuid.UUID(row_id)
+            except ValueError as e:
+                raise InvalidCursorError("Invalid pagination cursor") from e
+        position = tuple_(sort_column, id_column)
+        after = tuple_(sort_value, row_id)
+        query = query.where(position > after if ascending else position < after)
+
+    direction = asc if ascending else desc
+    return query.order_by(direction(sort_column), direction(id_column))
+
+
+async def paginate_keyset(
+    db: AsyncSession,
+    query,
+    sort_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    sort_key=None,
+    mappings: bool = False
+) -> KeysetPage:
+    """
+    Execute a keyset-paginated query.
+
+    Args:
+        db: Database session
+        query: Select of ORM entities (or of columns, with mappings=True),
+            already filtered
+        sort_column: Column (or expression) the feed is ordered by
+        id_column: Unique tiebreaker column
+        limit: Page size
+        cursor: Cursor returned with the previous page
+        sort_key: Callable returning a row's sort value when sort_column is an
+            expression rather than a mapped attribute
+        mappings: Return column-projected rows as mappings instead of entities
+
+    Returns:
+        KeysetPage with at most `limit` items
+    """
+    query = apply_keyset(query, sort_column, id_column, cursor).limit(limit + 1)
+    result = await db.execute(query)
+    rows = list(result.mappings().all() if mappings else result.scalars().all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        if mappings:
+            last_sort = sort_key(last) if sort_key else last[sort_column.key]
+            last_id = last[id_column.key]
+        else:
+            last_sort = sort_key(last) if sort_key else getattr(last, sort_column.key)
+            last_id = getattr(last, id_column.key)
+        next_cursor = encode_cursor(last_sort, last_id)
+
+    return KeysetPage(items=rows, next_cursor=next_cursor)
+
+
+__all__ = [
+    'InvalidCursorError',
+    'KeysetPage',
+    'encode_cursor',
+    'decode_cursor',
+    'apply_keyset',
+    'paginate_keyset'
+]
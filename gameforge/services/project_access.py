@@ -0,0 +1,191 @@
+"""
+Project Access Resolution for GameForge AI Platform
+===================================================
+
+Answers "is this user the owner or a collaborator of this project?" for the
+collaboration services:
+- One round trip per (project, user): owner flag and collaborator role are
+  read together instead of loading the full Project and then the collaboration
+- Results are memoized on the database session, so every service sharing a
+  request's session reuses them
+- Optionally caches whole project membership sets in Redis (see
+  membership_cache), invalidated by collaborator changes, ownership changes
+  and project deletion
+- Denials are only trusted for a short negative TTL: a missing project's
+  entry expires quickly, and a user absent from an older membership set is
+  looked up again
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from gameforge.models.collaboration import CollaborationRole, ProjectCollaboration
+from gameforge.models.projects import Project
+from gameforge.core.logging_config import get_structured_logger
+from gameforge.services.membership_cache import ProjectMembershipCache, membership_cache
+
+logger = get_structured_logger(__name__)
+
+# Key under AsyncSession.info holding the request-scoped memo
+SESSION_MEMO_KEY = "project_access_memo"
+
+MANAGER_ROLES = (CollaborationRole.OWNER, CollaborationRole.ADMIN)
+
+
+@dataclass(frozen=True)
+class ProjectAccess:
+    """Resolved relationship between a user and a project."""
+    project_exists: bool
+    is_owner: bool = False
+    collaborator_role: Optional[CollaborationRole] = None
+
+    @property
+    def can_access(self) -> bool:
+        return self.project_exists and (self.is_owner or self.collaborator_role is not None)
+
+    @property
+    def can_manage(self) -> bool:
+        return self.project_exists and (
+            self.is_owner or self.collaborator_role in MANAGER_ROLES
+        )
+
+    @property
+    def role(self) -> Optional[CollaborationRole]:
+        if not self.project_exists:
+            return None
+        return CollaborationRole.OWNER if self.is_owner else self.collaborator_role
+
+
+NO_PROJECT = ProjectAccess(project_exists=False)
+
+
+class ProjectAccessResolver:
+    """Resolves and memoizes project access for one database session."""
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        cache: Optional[ProjectMembershipCache] = None
+    ):
+        self.db = db_session
+        self.cache = cache if cache is not None else membership_cache
+
+    @property
+    def _memo(self) -> Dict[Tuple[str, str], ProjectAccess]:
+        return self.db.info.setdefault(SESSION_MEMO_KEY, {})
+
+    async def resolve(self, project_id: str, user_id: str) -> ProjectAccess:
+        """Resolve a user's access to a project."""
+        memo_key = (str(project_id), str(user_id))
+        access = self._memo.get(memo_key)
+        if access is not None:
+            return access
+
+        cached = await self.cache.get(project_id, user_id)
+        if cached is not None:
+            access = ProjectAccess(
+                project_exists=cached.project_exists,
+                is_owner=cached.is_owner,
+                collaborator_role=CollaborationRole(cached.role) if cached.role else None
+            )
+        elif self.cache.enabled:
+            access = await self._load_membership(project_id, user_id)
+        else:
+            access = await self._query_access(project_id, user_id)
+
+        self._memo[memo_key] = access
+        return access
+
+    async def invalidate(self, project_id: str) -> None:
+        """Forget memoized and cached access for a project after membership changes."""
+        memo = self._memo
+        for memo_key in [k for k in memo if k[0] == str(project_id)]:
+            del memo[memo_key]
+
+        await self.cache.invalidate(project_id)
+
+    async def _query_access(self, project_id: str, user_id: str) -> ProjectAccess:
+        """Owner flag and collaborator role in a single query."""
+        collaborator_role = (
+            select(ProjectCollaboration.role)
+            .where(
+                and_(
+                    ProjectCollaboration.project_id == Project.id,
+                    ProjectCollaboration.user_id == user_id,
+                    ProjectCollaboration.deleted_at.is_(None)
+                )
+            )
+            .limit(1)
+            .scalar_subquery()
+        )
+
+        result = await self.db.execute(
+            select(Project.owner_id == user_id, collaborator_role).where(
+                and_(
+                    Project.id == project_id,
+                    Project.deleted_at.is_(None)
+                )
+            )
+        )
+        row = result.first()
+
+        if row is None:
+            return NO_PROJECT
+
+        is_owner, role = row
+        return ProjectAccess(
+            project_exists=True,
+            is_owner=bool(is_owner),
+            collaborator_role=role
+        )
+
+    async def _load_membership(self, project_id: str, user_id: str) -> ProjectAccess:
+        """Load the full membership set in one query and populate the cache."""
+        # Read first: an invalidation during the query makes the store a no-op
+        generation = await self.cache.generation(project_id)
+        result = await self.db.execute(
+            select(Project.owner_id, ProjectCollaboration.user_id, ProjectCollaboration.role)
+            .select_from(Project)
+            .outerjoin(
+                ProjectCollaboration,
+                and_(
+                    ProjectCollaboration.project_id == Project.id,
+                    ProjectCollaboration.deleted_at.is_(None)
+                )
+            )
+            .where(
+                and_(
+                    Project.id == project_id,
+                    Project.deleted_at.is_(None)
+                )
+            )
+        )
+        rows = result.all()
+
+        if not rows:
+            await self.cache.store(project_id, None, {}, generation)
+            return NO_PROJECT
+
+        owner_id = rows[0][0]
+        members: Dict[str, Any] = {
+            str(member_id): role for _, member_id, role in rows if member_id is not None
+        }
+        await self.cache.store(
+            project_id, owner_id, {member: role.value for member, role in members.items()}, generation
+        )
+
+        return ProjectAccess(
+            project_exists=True,
+            is_owner=str(owner_id) == str(user_id),
+            collaborator_role=members.get(str(user_id))
+        )
+
+
+__all__ = [
+    'ProjectAccess',
+    'ProjectAccessResolver',
+    'ProjectMembershipCache',
+    'membership_cache'
+]
@@ -0,0 +1,449 @@
+"""
+Write-behind Project Counters for GameForge AI Platform
+=======================================================
+
+Views and likes on popular public projects used to update (and lock) the
+project row on every request. Increments are now buffered and written in
+batches:
+- A CounterBuffer collects view increments and new (project, user) likes;
+  InMemoryCounterBuffer serves a single worker, RedisCounterBuffer shares
+  the buffer across workers
+- ProjectCounters drains the buffer periodically, inserts the likes
+  into project_likes (whose primary key deduplicates them) and applies each
+  project's totals with one batched UPDATE ... SET n = n + :n
+- Increments for projects deleted since they were buffered are skipped; if
+  a batch is still rejected by a constraint, it is written project by project
+  and the entries that keep failing are dropped instead of re-buffered
+- Live counts are approximate: the stored total plus the pending increments
+"""
+import asyncio
+import os
+import uuid
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from sqlalchemy import (
+    DateTime, Integer, String, bindparam, column, func, select, table, text, update
+)
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+REDIS_PREFIX = "gameforge:project_counters"
+
+# Arbitrary constant serializing flushes from different workers, so their
+# UPDATEs cannot lock the same project rows in different orders
+FLUSH_LOCK_ID = 0x6766636E74  # "gfcnt"
+
+# Lightweight table clauses: the flusher only touches the counter columns
+# and never loads or locks whole Project rows (see models.project_likes)
+projects_table = table(
+    "projects",
+    column("id", String),
+    column("view_count", Integer),
+    column("like_count", Integer)
+)
+
+likes_table = table(
+    "project_likes",
+    column("project_id", String),
+    column("user_id", String),
+    column("created_at", DateTime)
+)
+
+LikePair = Tuple[str, str]
+
+
+class CounterBatch:
+    """Increments drained from a buffer for one flush."""
+
+    def __init__(self, views: Optional[Dict[str, int]] = None, likes: Optional[Set[LikePair]] = None):
+        self.views = views or {}
+        self.likes = likes or set()
+
+    def __bool__(self) -> bool:
+        return bool(self.views or self.likes)
+
+    def project_ids(self) -> Set[str]:
+        return set(self.views) | {project_id for project_id, _ in self.likes}
+
+    def for_project(self, project_id: str) -> "CounterBatch":
+        return CounterBatch(
+            {project_id: self.views[project_id]} if project_id in self.views else {},
+            {pair for pair in self.likes if pair[0] == project_id}
+        )
+
+
+class CounterBuffer(ABC):
+    """Base class for buffered project counter increments."""
+
+    @abstractmethod
+    async def add_view(self, project_id: str, count: int = 1) -> None:
+        pass
+
+    @abstractmethod
+    async def add_like(self, project_id: str, user_id: str) -> bool:
+        """Buffer a like; returns False if this user's like is already known."""
+
+    @abstractmethod
+    async def pending(self, project_id: str) -> Tuple[int, int]:
+        """(views, likes) buffered for a project but not yet flushed."""
+
+    @abstractmethod
+    async def drain(self) -> CounterBatch:
+        """Atomically take everything buffered so far."""
+
+    @abstractmethod
+    async def restore(self, batch: CounterBatch) -> None:
+        """Put back a batch whose flush failed."""
+
+
+class InMemoryCounterBuffer(CounterBuffer):
+    """Per-process buffer (tests, single worker, or Redis unavailable)."""
+
+    def __init__(self):
+        self._views: Dict[str, int] = defaultdict(int)
+        self._likes: Set[LikePair] = set()
+        self._pending_likes: Dict[str, int] = defaultdict(int)
+
+    async def add_view(self, project_id: str, count: int = 1) -> None:
+        self._views[str(project_id)] += count
+
+    async def add_like(self, project_id: str, user_id: str) -> bool:
+        pair = (str(project_id), str(user_id))
+        if pair in self._likes:
+            return False
+        self._likes.add(pair)
+        self._pending_likes[pair[0]] += 1
+        return True
+
+    async def pending(self, project_id: str) -> Tuple[int, int]:
+        project_id = str(project_id)
+        return self._views.get(project_id, 0), self._pending_likes.get(project_id, 0)
+
+    async def drain(self) -> CounterBatch:
+        batch = CounterBatch(dict(self._views), set(self._likes))
+        self._views.clear()
+        self._likes.clear()
+        self._pending_likes.clear()
+        return batch
+
+    async def restore(self, batch: CounterBatch) -> None:
+        for project_id, count in batch.views.items():
+            await self.add_view(project_id, count)
+        for project_id, user_id in batch.likes:
+            await self.add_like(project_id, user_id)
+
+
+class RedisCounterBuffer(CounterBuffer):
+    """Buffer shared by all workers through Redis hashes and sets."""
+
+    def __init__(self, redis_client, likers_ttl_seconds: int = 86400):
+        self.redis = redis_client
+        self.likers_ttl_seconds = likers_ttl_seconds
+        self.views_key = f"{REDIS_PREFIX}:views"
+        self.like_counts_key = f"{REDIS_PREFIX}:likes"
+        self.like_pairs_key = f"{REDIS_PREFIX}:like_pairs"
+
+    def _likers_key(self, project_id: str) -> str:
+        return f"{REDIS_PREFIX}:likers:{project_id}"
+
+    async def add_view(self, project_id: str, count: int = 1) -> None:
+        await self.redis.hincrby(self.views_key, str(project_id), count)
+
+    async def add_like(self, project_id: str, user_id: str) -> bool:
+        project_id, user_id = str(project_id), str(user_id)
+        likers_key = self._likers_key(project_id)
+
+        # Recent likers dedupe repeat clicks; older likes are caught by the
+        # project_likes primary key when the batch is flushed
+        pipe = self.redis.pipeline()
+        pipe.sadd(likers_key, user_id)
+        pipe.expire(likers_key, self.likers_ttl_seconds)
+        added, _ = await pipe.execute()
+        if not added:
+            return False
+
+        pipe = self.redis.pipeline()
+        pipe.sadd(self.like_pairs_key, f"{project_id}:{user_id}")
+        pipe.hincrby(self.like_counts_key, project_id, 1)
+        await pipe.execute()
+        return True
+
+    async def pending(self, project_id: str) -> Tuple[int, int]:
+        pipe = self.redis.pipeline()
+        pipe.hget(self.views_key, str(project_id))
+        pipe.hget(self.like_counts_key, str(project_id))
+        views, likes = await pipe.execute()
+        return int(views or 0), int(likes or 0)
+
+    async def drain(self) -> CounterBatch:
+        # Rename the live keys away in one MULTI so increments arriving during
+        # the flush start a new batch; a key that is missing (nothing buffered,
+        # or another worker drained it first) just fails its RENAME
+        suffix = uuid.uuid4().hex
+        live_keys = (self.views_key, self.like_pairs_key, self.like_counts_key)
+        drained_keys = [f"{key}:flushing:{suffix}" for key in live_keys]
+
+        pipe = self.redis.pipeline()
+        for live_key, drained_key in zip(live_keys, drained_keys):
+            pipe.rename(live_key, drained_key)
+        renamed = await pipe.execute(raise_on_error=False)
+
+        batch = CounterBatch()
+        views_key, pairs_key, _ = drained_keys
+        if not isinstance(renamed[0], Exception):
+            views = await self.redis.hgetall(views_key)
+            batch.views = {_decode(k): int(v) for k, v in views.items()}
+        if not isinstance(renamed[1], Exception):
+            pairs = await self.redis.smembers(pairs_key)
+            batch.likes = {tuple(_decode(p).split(":", 1)) for p in pairs}
+
+        # Pending like counts are rebuilt from the pairs, so drop the copy
+        await self.redis.delete(*drained_keys)
+        return batch
+
+    async def restore(self, batch: CounterBatch) -> None:
+        pipe = self.redis.pipeline()
+        for project_id, count in batch.views.items():
+            pipe.hincrby(self.views_key, project_id, count)
+        for project_id, user_id in batch.likes:
+            pipe.sadd(self.like_pairs_key, f"{project_id}:{user_id}")
+            pipe.hincrby(self.like_counts_key, project_id, 1)
+        await pipe.execute()
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _insert_ignore(dialect_name: str):
+    """INSERT ... ON CONFLICT DO NOTHING for the session's dialect."""
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+    return insert(likes_table).on_conflict_do_nothing()
+
+
+async def apply_batch(db: AsyncSession, batch: CounterBatch) -> Dict[str, int]:
+    """
+    Write one drained batch in a single transaction.
+
+    Returns:
+        Dict with the number of projects updated and likes inserted
+    """
+    dialect_name = db.bind.dialect.name if db.bind is not None else "postgresql"
+    if dialect_name == "postgresql":
+        await db.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": FLUSH_LOCK_ID})
+
+    # Skip projects deleted since their increments were buffered; KEY SHARE
+    # keeps them from being deleted before this transaction commits
+    requested = sorted(batch.project_ids())
+    result = await db.execute(
+        select(projects_table.c.id)
+        .where(projects_table.c.id.in_(requested))
+        .order_by(projects_table.c.id)
+        .with_for_update(read=True, key_share=True)
+    )
+    existing = {project_id for (project_id,) in result.all()}
+    if len(existing) < len(requested):
+        logger.info("Skipping counters for deleted projects", projects=sorted(set(requested) - existing))
+
+    now = datetime.utcnow()
+
+    # Likes first: only pairs the primary key accepts count towards like_count
+    new_likes: Dict[str, int] = defaultdict(int)
+    likes = sorted(pair for pair in batch.likes if pair[0] in existing)
+    if likes:
+        result = await db.execute(
+            _insert_ignore(dialect_name).returning(likes_table.c.project_id),
+            [{"project_id": p, "user_id": u, "created_at": now} for p, u in likes]
+        )
+        for (project_id,) in result.all():
+            new_likes[project_id] += 1
+
+    # One parameterized UPDATE executed for the whole batch, in id order
+    project_ids = sorted((set(batch.views) & existing) | set(new_likes))
+    if project_ids:
+        await db.execute(
+            update(projects_table)
+            .where(projects_table.c.id == bindparam("project_id"))
+            .values(
+                view_count=func.coalesce(projects_table.c.view_count, 0) + bindparam("views"),
+                like_count=func.coalesce(projects_table.c.like_count, 0) + bindparam("likes")
+            ),
+            [
+                {"project_id": pid, "views": batch.views.get(pid, 0), "likes": new_likes.get(pid, 0)}
+                for pid in project_ids
+            ]
+        )
+
+    await db.commit()
+    return {"projects": len(project_ids), "likes": sum(new_likes.values())}
+
+
+def _default_session_factory():
+    # Imported lazily: db_manager is PostgreSQL-only and loads every model
+    from gameforge.core.database import db_manager
+    return db_manager.get_async_session()
+
+
+class ProjectCounters:
+    """Buffers project views/likes and flushes them to the database in batches."""
+
+    def __init__(
+        self,
+        buffer: Optional[CounterBuffer] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+        flush_interval: float = 5.0
+    ):
+        self.buffer = buffer or InMemoryCounterBuffer()
+        self._session_factory = session_factory or _default_session_factory
+        self.flush_interval = flush_interval
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {
+            "views_buffered": 0,
+            "likes_buffered": 0,
+            "duplicate_likes": 0,
+            "flushes": 0,
+            "flush_failures": 0,
+            "entries_dropped": 0
+        }
+
+    def configure(self, buffer: CounterBuffer, flush_interval: Optional[float] = None) -> None:
+        """Swap in a shared buffer (called once at application startup)."""
+        self.buffer = buffer
+        if flush_interval is not None:
+            self.flush_interval = flush_interval
+
+    async def record_view(self, project_id: str) -> None:
+        await self.buffer.add_view(project_id)
+        self.stats["views_buffered"] += 1
+
+    async def record_like(self, project_id: str, user_id: str) -> bool:
+        """Buffer a like; False when the user has already liked the project."""
+        added = await self.buffer.add_like(project_id, user_id)
+        self.stats["likes_buffered" if added else "duplicate_likes"] += 1
+        return added
+
+    async def has_liked(self, db: AsyncSession, project_id: str, user_id: str) -> bool:
+        """Whether a like is already stored (primary key lookup, no row lock)."""
+        result = await db.execute(
+            select(likes_table.c.user_id).where(
+                likes_table.c.project_id == project_id,
+                likes_table.c.user_id == user_id
+            )
+        )
+        return result.first() is not None
+
+    async def live_counts(self, project_id: str, view_count: Optional[int], like_count: Optional[int]) -> Tuple[int, int]:
+        """Stored totals plus pending increments (approximate)."""
+        views, likes = await self.buffer.pending(project_id)
+        return (view_count or 0) + views, (like_count or 0) + likes
+
+    async def flush(self) -> Dict[str, int]:
+        """
+        Drain the buffer and write it.
+
+        A batch that fails for a transient reason is put back. One rejected
+        by a constraint is retried project by project, so a single bad entry
+        cannot block every later flush.
+        """
+        batch = await self.buffer.drain()
+        if not batch:
+            return {"projects": 0, "likes": 0}
+
+        try:
+            async with self._session_factory() as session:
+                written = await apply_batch(session, batch)
+        except (IntegrityError, DataError) as e:
+            logger.warning("Project counter batch rejected, writing per project", error=str(e))
+            written = await self._flush_per_project(batch)
+        except Exception as e:
+            self.stats["flush_failures"] += 1
+            logger.warning("Project counter flush failed, re-buffering", error=str(e))
+            await self.buffer.restore(batch)
+            raise
+
+        self.stats["flushes"] += 1
+        return written
+
+    async def _flush_per_project(self, batch: CounterBatch) -> Dict[str, int]:
+        written = {"projects": 0, "likes": 0}
+        project_ids = sorted(batch.project_ids())
+        for index, project_id in enumerate(project_ids):
+            part = batch.for_project(project_id)
+            try:
+                async with self._session_factory() as session:
+                    result = await apply_batch(session, part)
+            except (IntegrityError, DataError) as e:
+                dropped = sum(part.views.values()) + len(part.likes)
+                self.stats["entries_dropped"] += dropped
+                logger.error(
+                    "Dropping project counter increments rejected by the database",
+                    project_id=project_id, views=part.views.get(project_id, 0),
+                    likes=len(part.likes), error=str(e)
+                )
+                continue
+            except Exception as e:
+                self.stats["flush_failures"] += 1
+                logger.warning("Project counter flush failed, re-buffering", error=str(e))
+                for remaining in project_ids[index:]:
+                    await self.buffer.restore(batch.for_project(remaining))
+                raise
+            written["projects"] += result["projects"]
+            written["likes"] += result["likes"]
+        return written
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic flusher and write whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        try:
+            await self.flush()
+        except Exception:
+            pass  # already logged and re-buffered (shared buffers survive restarts)
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                pass  # logged in flush(); retried next interval
+
+
+# Global counters (Redis buffer attached during application startup)
+project_counters = ProjectCounters(
+    flush_interval=float(os.getenv("PROJECT_COUNTER_FLUSH_INTERVAL", "5"))
+)
+
+
+__all__ = [
+    'CounterBatch',
+    'CounterBuffer',
+    'InMemoryCounterBuffer',
+    'RedisCounterBuffer',
+    'ProjectCounters',
+    'apply_batch',
+    'project_counters'
+]
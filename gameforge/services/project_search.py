@@ -0,0 +1,156 @@
+"""
+Project Search for GameForge AI Platform
+========================================
+
+Search and keyset pagination for the project catalog:
+- Text matches use the trigger-maintained projects.search_vector (name,
+  summary, tags and description, weighted in that order) through a GIN index
+- Name prefix and typo-tolerant matches use a pg_trgm GIN index
+- Search results can be ordered by relevance: ts_rank_cd over the document
+  plus trigram similarity of the name
+- Every sort option pages by (sort value, id) cursors instead of OFFSET;
+  nullable sort columns are coalesced so the row-value seek stays total
+- Queries are built against the Project model passed in by the caller
+"""
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import func, literal, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from gameforge.services.pagination import KeysetPage, apply_keyset, encode_cursor
+
+# Text search configuration used by the search_vector trigger
+TEXT_SEARCH_CONFIG = "english"
+
+SORT_RELEVANCE = "relevance"
+
+# sort_by value -> expression (for a Project model) matching the keyset indexes
+SORT_COLUMNS = {
+    "created_at": lambda model: model.created_at,
+    "updated_at": lambda model: func.coalesce(model.updated_at, model.created_at),
+    "name": lambda model: model.name,
+    "view_count": lambda model: func.coalesce(model.view_count, 0),
+    "like_count": lambda model: func.coalesce(model.like_count, 0),
+}
+
+DEFAULT_SORT = "created_at"
+
+
+def escape_like(term: str) -> str:
+    """Escape LIKE wildcards so user input only matches literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def build_search(model, term: str) -> Tuple[Any, Any]:
+    """
+    Build the match condition and relevance score for a search term.
+
+    Returns:
+        (condition, rank) - rank is higher for better matches
+    """
+    tsquery = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, term)
+    condition = or_(
+        model.search_vector.op("@@")(tsquery),
+        model.name.ilike(f"{escape_like(term)}%", escape="\\"),
+        model.name.op("%")(term)
+    )
+    rank = (
+        func.coalesce(func.ts_rank_cd(model.search_vector, tsquery), 0)
+        + func.similarity(model.name, term)
+    )
+    return condition, rank
+
+
+def resolve_sort(sort_by: Optional[str], search: Optional[str]) -> str:
+    """Normalize sort_by; relevance is the default (and only valid) when searching."""
+    if sort_by == SORT_RELEVANCE or (sort_by is None and search):
+        return SORT_RELEVANCE if search else DEFAULT_SORT
+    return sort_by if sort_by in SORT_COLUMNS else DEFAULT_SORT
+
+
+async def search_projects(
+    db: AsyncSession,
+    model,
+    filters: list,
+    search: Optional[str] = None,
+    sort_by: Optional[str] = None,
+    sort_order: str = "desc",
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    columns: Optional[Sequence[Any]] = None
+) -> KeysetPage:
+    """
+    Filter, search and keyset-paginate projects.
+
+    Args:
+        db: Database session
+        model: Project model class
+        filters: Additional WHERE conditions (visibility, status, ...)
+        search: Free-text search term
+        sort_by: One of SORT_COLUMNS or "relevance"
+        sort_order: "asc" or "desc" (relevance is always best-first)
+        limit: Page size
+        cursor: Cursor returned with the previous page
+        offset: Legacy OFFSET, applied after the cursor seek
+        columns: Select only these model columns (must include the id)
+            and return row mappings instead of model entities
+
+    Returns:
+        KeysetPage of Project rows (or row mappings when columns are given)
+
+    Raises:
+        InvalidCursorError: If the cursor cannot be decoded
+    """
+    conditions = list(filters)
+    sort_key = resolve_sort(sort_by, search)
+    ascending = sort_order.lower() == "asc"
+
+    if search:
+        condition, rank = build_search(model, search)
+        conditions.append(condition)
+    else:
+        rank = literal(0.0)
+
+    if sort_key == SORT_RELEVANCE:
+        sort_column = rank
+        ascending = False
+    else:
+        sort_column = SORT_COLUMNS[sort_key](model)
+
+    if columns is None:
+        query = select(model, sort_column.label("sort_value"))
+    else:
+        query = select(*columns, sort_column.label("sort_value"))
+    if conditions:
+        query = query.where(*conditions)
+
+    query = apply_keyset(query, sort_column, model.id, cursor, ascending=ascending)
+    if offset:
+        query = query.offset(offset)
+
+    result = await db.execute(query.limit(limit + 1))
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        last_id = last[0].id if columns is None else last.id
+        next_cursor = encode_cursor(last.sort_value, last_id)
+
+    if columns is None:
+        items = [row[0] for row in rows]
+    else:
+        items = [row._mapping for row in rows]
+    return KeysetPage(items=items, next_cursor=next_cursor)
+
+
+__all__ = [
+    'SORT_COLUMNS',
+    'SORT_RELEVANCE',
+    'build_search',
+    'escape_like',
+    'resolve_sort',
+    'search_projects'
+]
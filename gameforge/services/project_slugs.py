@@ -0,0 +1,150 @@
+"""
+Project Slug Allocation for GameForge AI Platform
+=================================================
+
+Allocates unique project slugs ("my-game", "my-game-1", ...) without probing
+candidates one SELECT at a time:
+- One prefix query fetches every taken slug for a base, and the lowest free
+  numeric suffix is picked in memory
+- The unique index on projects.slug is the final arbiter: the row is flushed
+  inside a SAVEPOINT, and on a conflict with a concurrent insert the taken
+  set is refreshed and the next free suffix is tried
+"""
+from typing import Any, Optional, Set
+
+from sqlalchemy import String, column, inspect, or_, select, table
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+# Only the slug column is read (see idx_projects_slug_pattern for the LIKE)
+projects_table = table("projects", column("slug", String))
+
+DEFAULT_SLUG = "project"
+
+
+class SlugAllocationError(RuntimeError):
+    """Raised when no slug could be claimed within the retry budget."""
+
+
+def slugify(name: str) -> str:
+    """Project name -> base slug ("My Game_2" -> "my-game-2")."""
+    base_slug = name.lower().replace(' ', '-').replace('_', '-')
+    base_slug = ''.join(c for c in base_slug if c.isalnum() or c == '-')
+    return base_slug or DEFAULT_SLUG
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def taken_suffixes(db: AsyncSession, base_slug: str) -> Set[int]:
+    """
+    Numeric suffixes already used for a base slug in one query.
+
+    The bare base slug is reported as suffix 0; slugs that merely share the
+    prefix ("my-game-remastered") are ignored.
+    """
+    slug = projects_table.c.slug
+    result = await db.execute(
+        select(slug).where(
+            or_(
+                slug == base_slug,
+                slug.like(f"{_escape_like(base_slug)}-%", escape="\\")
+            )
+        )
+    )
+
+    taken = set()
+    for (existing,) in result.all():
+        suffix = suffix_of(existing, base_slug)
+        if suffix is not None:
+            taken.add(suffix)
+    return taken
+
+
+def suffix_of(slug: str, base_slug: str) -> Optional[int]:
+    """0 for the base slug itself, N for "<base>-N", else None."""
+    if slug == base_slug:
+        return 0
+    tail = slug[len(base_slug) + 1:]
+    if slug.startswith(f"{base_slug}-") and tail.isdigit() and not tail.startswith("0"):
+        return int(tail)
+    return None
+
+
+def first_free(taken: Set[int]) -> int:
+    suffix = 0
+    while suffix in taken:
+        suffix += 1
+    return suffix
+
+
+def _is_slug_conflict(error: IntegrityError) -> bool:
+    return "slug" in str(getattr(error, "orig", error)).lower()
+
+
+async def assign_unique_slug(
+    db: AsyncSession,
+    instance: Any,
+    name: str,
+    max_attempts: int = 5
+) -> str:
+    """
+    Give a new or renamed project a unique slug and flush it.
+
+    Other pending changes in the session are flushed first, so a slug
+    conflict only rolls back the slug attempt itself. The caller commits.
+
+    Args:
+        db: Database session
+        instance: Project (or any mapped object with a slug attribute)
+        name: Name to derive the slug from
+        max_attempts: Conflicting concurrent inserts tolerated before giving up
+
+    Returns:
+        The slug that was claimed
+
+    Raises:
+        SlugAllocationError: If every attempt lost a race
+    """
+    base_slug = slugify(name)
+    is_new = not inspect(instance).persistent
+
+    # A rename that keeps the same base slug keeps the slug it already has
+    if not is_new and instance.slug and suffix_of(instance.slug, base_slug) is not None:
+        return instance.slug
+
+    await db.flush()
+    taken = await taken_suffixes(db, base_slug)
+
+    for attempt in range(max_attempts):
+        suffix = first_free(taken)
+        slug = base_slug if suffix == 0 else f"{base_slug}-{suffix}"
+        instance.slug = slug
+
+        try:
+            async with db.begin_nested():
+                if is_new:
+                    db.add(instance)
+                await db.flush()
+            return slug
+        except IntegrityError as e:
+            if not _is_slug_conflict(e):
+                raise
+            logger.info("Slug taken concurrently, retrying", slug=slug, attempt=attempt + 1)
+            taken.add(suffix)
+            taken |= await taken_suffixes(db, base_slug)
+
+    raise SlugAllocationError(f"Could not allocate a unique slug for '{base_slug}'")
+
+
+__all__ = [
+    'SlugAllocationError',
+    'slugify',
+    'taken_suffixes',
+    'assign_unique_slug'
+]
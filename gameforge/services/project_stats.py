@@ -0,0 +1,266 @@
+"""
+Project Statistics for GameForge AI Platform
+============================================
+
+Builds the /projects/stats/overview response without scanning the projects
+table on every call:
+- Public facets (totals, templates, status/engine/genre breakdowns) come from
+  the trigger-maintained project_stat_counters table and are shared by all users
+- The caller's own non-public projects are added with one grouped query
+- Both the shared facets and each user's merged result are cached in-process
+  with a short TTL; writes through the projects API invalidate them, the TTL
+  bounds staleness for writes made by other workers
+- Breakdowns are keyed by enum label; render_breakdowns() turns them into the
+  response keys with the model enums
+"""
+
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import Boolean, String, column, func, or_, select, table
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from gameforge.models.project_stats import (
+    ProjectStatCounter, FACET_TOTAL, FACET_TEMPLATE, FACET_STATUS, FACET_ENGINE, FACET_GENRE
+)
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+# Only the columns the stats read; enum columns are compared by label, as the
+# projects_stat_counters trigger does
+projects_table = table(
+    "projects",
+    column("id", String),
+    column("owner_id", String),
+    column("visibility"),
+    column("status"),
+    column("engine"),
+    column("genre"),
+    column("is_template", Boolean)
+)
+
+PUBLIC = "PUBLIC"
+PRIVATE = "PRIVATE"
+
+
+@dataclass
+class FacetCounts:
+    """Project counts with per-facet breakdowns, keyed by enum label."""
+    total: int = 0
+    template: int = 0
+    by_status: Dict[Optional[str], int] = field(default_factory=dict)
+    by_engine: Dict[str, int] = field(default_factory=dict)
+    by_genre: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, facet: str, value: Optional[str], count: int) -> None:
+        if facet == FACET_TOTAL:
+            self.total += count
+        elif facet == FACET_TEMPLATE:
+            self.template += count
+        elif facet == FACET_STATUS:
+            self.by_status[value] = self.by_status.get(value, 0) + count
+        elif facet == FACET_ENGINE and value is not None:
+            self.by_engine[value] = self.by_engine.get(value, 0) + count
+        elif facet == FACET_GENRE and value is not None:
+            self.by_genre[value] = self.by_genre.get(value, 0) + count
+
+
+def _label(value: Any) -> Optional[str]:
+    """Enum member (or raw database label) -> enum label."""
+    if value is None or value == "":
+        return None
+    return getattr(value, "name", value)
+
+
+def _render(enum_cls, counts: Dict[Optional[str], int]) -> Dict[str, int]:
+    rendered = {}
+    for label, count in counts.items():
+        if count <= 0:
+            continue
+        try:
+            key = str(enum_cls[label]) if label is not None else str(None)
+        except KeyError:
+            key = label
+        rendered[key] = rendered.get(key, 0) + count
+    return rendered
+
+
+def _facet_rows(status, engine, genre, is_template, count):
+    """Expand one grouped row into (facet, label, count) counter rows."""
+    rows = [(FACET_TOTAL, None, count), (FACET_STATUS, _label(status), count)]
+    if is_template:
+        rows.append((FACET_TEMPLATE, None, count))
+    if engine is not None:
+        rows.append((FACET_ENGINE, _label(engine), count))
+    if genre is not None:
+        rows.append((FACET_GENRE, _label(genre), count))
+    return rows
+
+
+def render_breakdowns(overview: Dict[str, Any], enums: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Render breakdown keys the way the endpoint always has (str of the enum member).
+
+    Args:
+        overview: Result of ProjectStatsService.get_overview
+        enums: Enum class per breakdown, e.g. {"by_status": ProjectStatus}
+    """
+    rendered = dict(overview)
+    for name, enum_cls in enums.items():
+        rendered[name] = _render(enum_cls, overview[name])
+    return rendered
+
+
+def _merge(a: Dict, b: Dict) -> Dict:
+    merged = dict(a)
+    for key, count in b.items():
+        merged[key] = merged.get(key, 0) + count
+    return merged
+
+
+class ProjectStatsService:
+    """Cached project statistics overview."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        public_ttl_seconds: float = 30.0,
+        max_entries: int = 10000
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.public_ttl_seconds = public_ttl_seconds
+        self.max_entries = max_entries
+        self._public: Optional[Tuple[float, FacetCounts]] = None
+        self._by_user: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "public_refreshes": 0,
+            "invalidations": 0
+        }
+
+    async def get_overview(self, db: AsyncSession, user_id: str) -> Dict[str, Any]:
+        """Statistics over public projects plus the user's own projects (breakdowns by label)."""
+        user_id = str(user_id)
+        now = time.monotonic()
+
+        cached = self._by_user.get(user_id)
+        if cached is not None and cached[0] > now:
+            self._by_user.move_to_end(user_id)
+            self.stats["hits"] += 1
+            return cached[1]
+        self.stats["misses"] += 1
+
+        public = await self._get_public_facets(db, now)
+        private_projects, own = await self._load_user_facets(db, user_id)
+
+        overview = {
+            "total_projects": public.total + own.total,
+            "public_projects": public.total,
+            "private_projects": private_projects,
+            "template_projects": public.template + own.template,
+            "by_status": _merge(public.by_status, own.by_status),
+            "by_engine": _merge(public.by_engine, own.by_engine),
+            "by_genre": _merge(public.by_genre, own.by_genre)
+        }
+
+        self._by_user[user_id] = (now + self.ttl_seconds, overview)
+        self._by_user.move_to_end(user_id)
+        while len(self._by_user) > self.max_entries:
+            self._by_user.popitem(last=False)
+
+        return overview
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Drop cached results after a project write.
+
+        The shared public facets are always dropped (a write by one user can
+        change them); the per-user entry is dropped for ``user_id``, or every
+        entry when no user is given.
+        """
+        self._public = None
+        if user_id is None:
+            self._by_user.clear()
+        else:
+            self._by_user.pop(str(user_id), None)
+        self.stats["invalidations"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "cached_users": len(self._by_user)}
+
+    async def _get_public_facets(self, db: AsyncSession, now: float) -> FacetCounts:
+        if self._public is not None and self._public[0] > now:
+            return self._public[1]
+
+        try:
+            result = await db.execute(
+                select(ProjectStatCounter.facet, ProjectStatCounter.value, ProjectStatCounter.count)
+            )
+            rows = [(facet, _label(value), count) for facet, value, count in result.all()]
+        except DBAPIError as e:
+            # Counter table not migrated yet - fall back to one grouped scan
+            logger.warning("Project stat counters unavailable, scanning projects", error=str(e))
+            await db.rollback()
+            rows = await self._scan_public_facets(db)
+
+        public = FacetCounts()
+        for facet, value, count in rows:
+            public.add(facet, value, count)
+
+        self._public = (now + self.public_ttl_seconds, public)
+        self.stats["public_refreshes"] += 1
+        return public
+
+    async def _scan_public_facets(self, db: AsyncSession):
+        p = projects_table.c
+        result = await db.execute(
+            select(p.status, p.engine, p.genre, p.is_template, func.count(p.id))
+            .where(p.visibility == PUBLIC)
+            .group_by(p.status, p.engine, p.genre, p.is_template)
+        )
+        rows = []
+        for status, engine, genre, is_template, count in result.all():
+            rows.extend(_facet_rows(status, engine, genre, is_template, count))
+        return rows
+
+    async def _load_user_facets(self, db: AsyncSession, user_id: str) -> Tuple[int, FacetCounts]:
+        """The user's non-public projects, grouped by every facet in one query."""
+        p = projects_table.c
+        result = await db.execute(
+            select(p.visibility, p.status, p.engine, p.genre, p.is_template, func.count(p.id))
+            .where(
+                p.owner_id == user_id,
+                or_(p.visibility != PUBLIC, p.visibility.is_(None))
+            )
+            .group_by(p.visibility, p.status, p.engine, p.genre, p.is_template)
+        )
+
+        private_projects = 0
+        own = FacetCounts()
+        for visibility, status, engine, genre, is_template, count in result.all():
+            if _label(visibility) == PRIVATE:
+                private_projects += count
+            for facet, value, n in _facet_rows(status, engine, genre, is_template, count):
+                own.add(facet, value, n)
+
+        return private_projects, own
+
+
+# Global statistics service
+project_stats = ProjectStatsService(
+    ttl_seconds=float(os.getenv("PROJECT_STATS_CACHE_TTL", "30")),
+    public_ttl_seconds=float(os.getenv("PROJECT_STATS_PUBLIC_TTL", "30"))
+)
+
+
+__all__ = [
+    'FacetCounts',
+    'ProjectStatsService',
+    'project_stats',
+    'render_breakdowns'
+]
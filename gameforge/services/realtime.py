@@ -10,13 +10,20 @@ WebSocket-based real-time collaboration system providing:
 - Asset synchronization
 """
 import asyncio
-import json
 from datetime import datetime
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, List, Set, Optional, Any, Tuple
 from fastapi import WebSocket, WebSocketDisconnect, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from gameforge.core.config import get_settings
 from gameforge.core.logging_config import get_structured_logger
+from gameforge.services.realtime_broadcast import (
+    ConnectionWriter, OverflowPolicy, coalesce_key, serialize_message
+)
+from gameforge.services.realtime_bus import (
+    RealtimeEnvelope, RealtimeBus, InProcessRealtimeBus, PresenceStore,
+    InMemoryPresenceStore
+)
 from gameforge.services.collaboration import CollaborationService, NotificationService
 from gameforge.models.collaboration import ActivityType, NotificationType
 
@@ -26,19 +33,78 @@ logger = get_structured_logger(__name__)
 class ConnectionManager:
     """Manages WebSocket connections for real-time collaboration."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_queue_size: int = 256,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DISCONNECT,
+        presence_ttl: int = 300
+    ):
         # Active connections: {user_id: {connection_id: websocket}}
         self.active_connections: Dict[str, Dict[str, WebSocket]] = {}
         
+        # Outbound writers: {connection_id: ConnectionWriter}
+        self.writers: Dict[str, ConnectionWriter] = {}
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        
+        # Delivery counters for monitoring
+        self.delivery_stats: Dict[str, int] = {
+            "dropped_messages": 0,
+            "slow_client_disconnects": 0
+        }
+        
         # Project subscriptions: {project_id: {user_id: set of connection_ids}}
         self.project_subscriptions: Dict[str, Dict[str, Set[str]]] = {}
         
-        # User presence: {project_id: {user_id: last_activity}}
-        self.user_presence: Dict[str, Dict[str, datetime]] = {}
+        # Cross-node message bus and shared presence (in-process until start())
+        self.bus: RealtimeBus = InProcessRealtimeBus()
+        self.presence: PresenceStore = InMemoryPresenceStore(presence_ttl)
+        self._started = False
+        self._heartbeat_task: Optional[asyncio.Task] = None
         
         # Connection metadata: {connection_id: metadata}
         self.connection_metadata: Dict[str, Dict[str, Any]] = {}
     
+    async def start(
+        self,
+        bus: Optional[RealtimeBus] = None,
+        presence: Optional[PresenceStore] = None
+    ) -> None:
+        """Start cross-node delivery and presence heartbeats."""
+        if self._started:
+            return
+        
+        if bus is not None:
+            self.bus = bus
+        if presence is not None:
+            self.presence = presence
+        
+        await self.bus.start(self._deliver_envelope)
+        
+        # Re-register interest for anything connected before start()
+        for user_id in list(self.active_connections):
+            await self.bus.subscribe("user", user_id)
+        for project_id in list(self.project_subscriptions):
+            await self.bus.subscribe("project", project_id)
+        
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        self._started = True
+        
+        logger.info(
+            "Real-time collaboration started",
+            bus=type(self.bus).__name__,
+            presence=type(self.presence).__name__
+        )
+    
+    async def stop(self) -> None:
+        """Stop cross-node delivery and presence heartbeats."""
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        
+        await self.bus.stop()
+        self._started = False
+    
     async def connect(
         self,
         websocket: WebSocket,
@@ -52,8 +118,21 @@ class ConnectionManager:
         # Store connection
         if user_id not in self.active_connections:
             self.active_connections[user_id] = {}
+            await self.bus.subscribe("user", user_id)
         self.active_connections[user_id][connection_id] = websocket
         
+        # Start the outbound writer for this connection
+        writer = ConnectionWriter(
+            websocket,
+            connection_id,
+            self.max_queue_size,
+            on_send_error=lambda error: self._handle_send_error(
+                user_id, connection_id, error
+            )
+        )
+        self.writers[connection_id] = writer
+        writer.start()
+        
         # Store metadata
         self.connection_metadata[connection_id] = {
             "user_id": user_id,
@@ -82,11 +161,17 @@ class ConnectionManager:
     
     async def disconnect(self, user_id: str, connection_id: str) -> None:
         """Handle WebSocket disconnection."""
+        # Stop the outbound writer
+        writer = self.writers.pop(connection_id, None)
+        if writer:
+            writer.close()
+        
         # Remove from active connections
         if user_id in self.active_connections:
             self.active_connections[user_id].pop(connection_id, None)
             if not self.active_connections[user_id]:
                 del self.active_connections[user_id]
+                await self.bus.unsubscribe("user", user_id)
         
         # Get metadata before removal
         metadata = self.connection_metadata.get(connection_id, {})
@@ -99,16 +184,14 @@ class ConnectionManager:
                 if not self.project_subscriptions[project_id][user_id]:
                     del self.project_subscriptions[project_id][user_id]
                     
-                    # Update user presence
-                    if project_id in self.user_presence:
-                        self.user_presence[project_id].pop(user_id, None)
-                        
-                        # Broadcast user left
-                        await self.broadcast_to_project(project_id, {
-                            "type": "user_left",
-                            "user_id": user_id,
-                            "timestamp": datetime.utcnow().isoformat()
-                        }, exclude_user=user_id)
+                    # Drop this node's presence entry; the user only left if
+                    # no other node still has them connected
+                    if await self.presence.remove(project_id, user_id):
+                        await self._announce_left(project_id, user_id)
+            
+            if not self.project_subscriptions[project_id]:
+                del self.project_subscriptions[project_id]
+                await self.bus.unsubscribe("project", project_id)
         
         # Clean up metadata
         self.connection_metadata.pop(connection_id, None)
@@ -129,6 +212,7 @@ class ConnectionManager:
         """Subscribe a connection to project updates."""
         if project_id not in self.project_subscriptions:
             self.project_subscriptions[project_id] = {}
+            await self.bus.subscribe("project", project_id)
         
         if user_id not in self.project_subscriptions[project_id]:
             self.project_subscriptions[project_id][user_id] = set()
@@ -136,9 +220,7 @@ class ConnectionManager:
         self.project_subscriptions[project_id][user_id].add(connection_id)
         
         # Update user presence
-        if project_id not in self.user_presence:
-            self.user_presence[project_id] = {}
-        self.user_presence[project_id][user_id] = datetime.utcnow()
+        await self.presence.heartbeat(project_id, user_id)
         
         # Broadcast user joined
         await self.broadcast_to_project(project_id, {
@@ -148,7 +230,7 @@ class ConnectionManager:
         }, exclude_user=user_id)
         
         # Send current online users to the new subscriber
-        online_users = list(self.user_presence[project_id].keys())
+        online_users = await self.get_online_users(project_id)
         await self.send_personal_message(user_id, connection_id, {
             "type": "online_users",
             "users": online_users,
@@ -161,32 +243,23 @@ class ConnectionManager:
         connection_id: str,
         message: Dict[str, Any]
     ) -> None:
-        """Send message to a specific connection."""
-        if (user_id in self.active_connections and 
-            connection_id in self.active_connections[user_id]):
-            
-            websocket = self.active_connections[user_id][connection_id]
-            try:
-                await websocket.send_text(json.dumps(message, default=str))
-            except Exception as e:
-                logger.error(
-                    "Failed to send message to connection",
-                    user_id=user_id,
-                    connection_id=connection_id,
-                    error=str(e)
-                )
-                # Clean up broken connection
-                await self.disconnect(user_id, connection_id)
+        """Send message to a specific local connection."""
+        payload = serialize_message(message)
+        if not self._enqueue(user_id, connection_id, payload, coalesce_key(message)):
+            await self._handle_overflow([(user_id, connection_id)])
     
     async def send_to_user(
         self,
         user_id: str,
         message: Dict[str, Any]
     ) -> None:
-        """Send message to all connections of a user."""
-        if user_id in self.active_connections:
-            for connection_id in list(self.active_connections[user_id].keys()):
-                await self.send_personal_message(user_id, connection_id, message)
+        """Send message to all connections of a user on every node."""
+        await self._publish(RealtimeEnvelope(
+            scope="user",
+            target_id=user_id,
+            payload=serialize_message(message),
+            coalesce_key=coalesce_key(message)
+        ))
     
     async def broadcast_to_project(
         self,
@@ -194,16 +267,129 @@ class ConnectionManager:
         message: Dict[str, Any],
         exclude_user: Optional[str] = None
     ) -> None:
-        """Broadcast message to all users subscribed to a project."""
+        """Broadcast message to all users subscribed to a project on every node."""
+        await self._publish(RealtimeEnvelope(
+            scope="project",
+            target_id=project_id,
+            payload=serialize_message(message),
+            coalesce_key=coalesce_key(message),
+            exclude_user=exclude_user
+        ))
+    
+    async def _publish(self, envelope: RealtimeEnvelope) -> None:
+        """Hand an envelope to the bus, or deliver locally before start()."""
+        if self._started:
+            await self.bus.publish(envelope)
+        else:
+            await self._deliver_envelope(envelope)
+    
+    async def _deliver_envelope(self, envelope: RealtimeEnvelope) -> None:
+        """Deliver an envelope received from the bus to local connections."""
+        if envelope.scope == "project":
+            await self._deliver_to_project(
+                envelope.target_id,
+                envelope.payload,
+                envelope.coalesce_key,
+                envelope.exclude_user
+            )
+        elif envelope.scope == "user":
+            await self._deliver_to_user(
+                envelope.target_id,
+                envelope.payload,
+                envelope.coalesce_key
+            )
+    
+    async def _deliver_to_user(
+        self,
+        user_id: str,
+        payload: str,
+        key: Optional[str]
+    ) -> None:
+        """Queue a serialized message on every local connection of a user."""
+        if user_id not in self.active_connections:
+            return
+        
+        overflowed = [
+            (user_id, connection_id)
+            for connection_id in list(self.active_connections[user_id].keys())
+            if not self._enqueue(user_id, connection_id, payload, key)
+        ]
+        await self._handle_overflow(overflowed)
+    
+    async def _deliver_to_project(
+        self,
+        project_id: str,
+        payload: str,
+        key: Optional[str],
+        exclude_user: Optional[str] = None
+    ) -> None:
+        """Queue a serialized message on every local connection in a project."""
         if project_id not in self.project_subscriptions:
             return
         
-        for user_id, connection_ids in self.project_subscriptions[project_id].items():
+        overflowed: List[Tuple[str, str]] = []
+        
+        for user_id, connection_ids in list(self.project_subscriptions[project_id].items()):
             if exclude_user and user_id == exclude_user:
                 continue
                 
             for connection_id in list(connection_ids):
-                await self.send_personal_message(user_id, connection_id, message)
+                if not self._enqueue(user_id, connection_id, payload, key):
+                    overflowed.append((user_id, connection_id))
+        
+        await self._handle_overflow(overflowed)
+    
+    def _enqueue(
+        self,
+        user_id: str,
+        connection_id: str,
+        payload: str,
+        key: Optional[str]
+    ) -> bool:
+        """Queue a serialized message; returns False if the queue overflowed."""
+        writer = self.writers.get(connection_id)
+        if writer is None:
+            return True
+        
+        return writer.enqueue(payload, key)
+    
+    async def _handle_overflow(self, connections: List[Tuple[str, str]]) -> None:
+        """Apply the overflow policy to connections that could not keep up."""
+        for user_id, connection_id in connections:
+            self.delivery_stats["dropped_messages"] += 1
+            
+            if self.overflow_policy != OverflowPolicy.DISCONNECT:
+                continue
+            
+            writer = self.writers.get(connection_id)
+            if writer is None:
+                continue
+            
+            logger.warning(
+                "Disconnecting slow WebSocket client",
+                user_id=user_id,
+                connection_id=connection_id,
+                queue_depth=writer.queue_depth
+            )
+            self.delivery_stats["slow_client_disconnects"] += 1
+            writer.close(close_socket=True)
+            await self.disconnect(user_id, connection_id)
+    
+    async def _handle_send_error(
+        self,
+        user_id: str,
+        connection_id: str,
+        error: Exception
+    ) -> None:
+        """Clean up a connection whose writer failed to send."""
+        logger.error(
+            "Failed to send message to connection",
+            user_id=user_id,
+            connection_id=connection_id,
+            error=str(error)
+        )
+        # Clean up broken connection
+        await self.disconnect(user_id, connection_id)
     
     async def update_user_presence(
         self,
@@ -211,27 +397,53 @@ class ConnectionManager:
         project_id: str
     ) -> None:
         """Update user's last activity timestamp."""
-        if project_id in self.user_presence:
-            self.user_presence[project_id][user_id] = datetime.utcnow()
+        if user_id in self.project_subscriptions.get(project_id, {}):
+            await self.presence.heartbeat(project_id, user_id)
     
-    def get_online_users(self, project_id: str) -> List[str]:
-        """Get list of users currently online in a project."""
-        if project_id not in self.user_presence:
-            return []
-        
-        # Filter out users who haven't been active recently (5 minutes)
-        cutoff = datetime.utcnow().timestamp() - 300  # 5 minutes
-        active_users = []
-        
-        for user_id, last_activity in self.user_presence[project_id].items():
-            if last_activity.timestamp() > cutoff:
-                active_users.append(user_id)
-        
-        return active_users
+    async def get_online_users(self, project_id: str) -> List[str]:
+        """Get list of users currently online in a project across all nodes."""
+        return await self.presence.online_users(project_id)
+    
+    async def _announce_left(self, project_id: str, user_id: str) -> None:
+        await self.broadcast_to_project(project_id, {
+            "type": "user_left",
+            "user_id": user_id,
+            "timestamp": datetime.utcnow().isoformat()
+        }, exclude_user=user_id)
+    
+    async def _heartbeat_loop(self) -> None:
+        """
+        Refresh presence for locally connected users ahead of the TTL, and
+        announce users whose last entry expired (e.g. their node died).
+        """
+        interval = max(self.presence.ttl_seconds / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            for project_id, users in list(self.project_subscriptions.items()):
+                for user_id in list(users):
+                    try:
+                        await self.presence.heartbeat(project_id, user_id)
+                    except Exception as e:
+                        logger.warning(
+                            "Presence heartbeat failed",
+                            project_id=project_id,
+                            user_id=user_id,
+                            error=str(e)
+                        )
+                
+                try:
+                    for user_id in await self.presence.expire(project_id):
+                        await self._announce_left(project_id, user_id)
+                except Exception as e:
+                    logger.warning("Presence expiry failed", project_id=project_id, error=str(e))
 
 
 # Global connection manager instance
-connection_manager = ConnectionManager()
+connection_manager = ConnectionManager(
+    max_queue_size=get_settings().realtime_send_queue_size,
+    overflow_policy=get_settings().realtime_overflow_policy,
+    presence_ttl=get_settings().realtime_presence_ttl
+)
 
 
 class RealTimeCollaborationService:
@@ -382,7 +594,7 @@ class RealTimeCollaborationService:
         project_id: str,
         job_id: str,
         user_id: str,
-        event_type: str,  # 'started', 'completed', 'failed'
+        event_type: str,  # 'started', 'progress', 'completed', 'failed'
         model: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -0,0 +1,160 @@
+"""
+Broadcast Engine for GameForge Real-time Collaboration
+======================================================
+
+Per-connection outbound delivery used by the ConnectionManager:
+- Messages are serialized once per broadcast and shared by all recipients
+- Every connection drains its own bounded queue from a dedicated writer task,
+  so one slow client never stalls delivery to the rest of a project
+- Connections whose queue overflows are handled by the overflow policy
+- High-frequency events (presence, AI job progress) are coalesced per
+  connection so only the latest pending update is delivered
+"""
+import asyncio
+import json
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import WebSocket
+
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when a connection's outbound queue is full."""
+    DROP = "drop"              # Drop the new message, keep the connection
+    DISCONNECT = "disconnect"  # Disconnect the slow client
+
+
+# Message types where only the most recent pending update matters
+COALESCED_MESSAGE_TYPES = {"online_users", "presence_update"}
+
+
+def coalesce_key(message: Dict[str, Any]) -> Optional[str]:
+    """Return the coalescing key for a message, or None if it must not be merged."""
+    message_type = message.get("type")
+
+    if message_type in COALESCED_MESSAGE_TYPES:
+        return message_type
+
+    if message_type == "ai_job_update" and message.get("event_type") == "progress":
+        job = message.get("job") or {}
+        return f"ai_job_progress:{job.get('id')}"
+
+    return None
+
+
+def serialize_message(message: Dict[str, Any]) -> str:
+    """Serialize a message once for delivery to any number of connections."""
+    return json.dumps(message, default=str)
+
+
+class ConnectionWriter:
+    """Bounded outbound queue and writer task for a single WebSocket connection."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        connection_id: str,
+        max_queue_size: int,
+        on_send_error: Callable[[Exception], Awaitable[None]]
+    ):
+        self.websocket = websocket
+        self.connection_id = connection_id
+        self.max_queue_size = max_queue_size
+        self._on_send_error = on_send_error
+
+        # Queue items are (coalesce_key, payload); coalesced payloads live in
+        # _pending and the queue only holds their key
+        self._queue: asyncio.Queue[Tuple[Optional[str], Optional[str]]] = (
+            asyncio.Queue(maxsize=max_queue_size)
+        )
+        self._pending: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self.sent_count = 0
+        self.coalesced_count = 0
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of messages waiting to be sent."""
+        return self._queue.qsize()
+
+    def enqueue(self, payload: str, key: Optional[str] = None) -> bool:
+        """
+        Queue a serialized message without blocking.
+
+        Returns:
+            False if the queue is full and the message was not accepted
+        """
+        if self._closed:
+            return True
+
+        if key is not None and key in self._pending:
+            # A newer update replaces the one still waiting to be sent
+            self._pending[key] = payload
+            self.coalesced_count += 1
+            return True
+
+        try:
+            if key is not None:
+                self._queue.put_nowait((key, None))
+                self._pending[key] = payload
+            else:
+                self._queue.put_nowait((None, payload))
+        except asyncio.QueueFull:
+            return False
+
+        return True
+
+    def close(self, close_socket: bool = False) -> None:
+        """Stop the writer task and optionally close the underlying socket."""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._task and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+        if close_socket:
+            asyncio.create_task(self._close_socket())
+
+    async def _close_socket(self) -> None:
+        """Close the socket with 'try again later' without raising."""
+        try:
+            await self.websocket.close(code=1013)
+        except Exception:
+            pass
+
+    async def _run(self) -> None:
+        """Drain the queue, sending messages one at a time in order."""
+        while not self._closed:
+            key, payload = await self._queue.get()
+            if key is not None:
+                payload = self._pending.pop(key, None)
+                if payload is None:
+                    continue
+
+            try:
+                await self.websocket.send_text(payload)
+                self.sent_count += 1
+            except Exception as e:
+                self._closed = True
+                await self._on_send_error(e)
+                return
+
+
+__all__ = [
+    'OverflowPolicy',
+    'ConnectionWriter',
+    'coalesce_key',
+    'serialize_message'
+]
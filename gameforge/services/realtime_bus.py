@@ -0,0 +1,340 @@
+"""
+Realtime Bus and Presence Store for GameForge Collaboration
+===========================================================
+
+Cross-node fan-out for the ConnectionManager:
+- RealtimeBus implementations carry project and user messages between
+  workers/pods; every node delivers to its locally connected sockets
+- InProcessRealtimeBus delivers within the current process (tests, single worker)
+- RedisRealtimeBus publishes to one Redis pub/sub channel per project/user and
+  only subscribes to channels that have local listeners
+- PresenceStore implementations track online users with TTL heartbeats so
+  presence is shared across nodes; each node keeps its own entry per user,
+  so a user only leaves when their last node drops them
+"""
+import asyncio
+import json
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from gameforge.core.logging_config import get_structured_logger
+
+logger = get_structured_logger(__name__)
+
+CHANNEL_PREFIX = "gameforge:realtime"
+PRESENCE_PREFIX = "gameforge:presence"
+
+
+@dataclass
+class RealtimeEnvelope:
+    """A serialized message addressed to a project or a user."""
+    scope: str                          # "project" or "user"
+    target_id: str
+    payload: str                        # JSON-encoded message, serialized once
+    coalesce_key: Optional[str] = None
+    exclude_user: Optional[str] = None
+
+    @property
+    def channel(self) -> str:
+        return f"{CHANNEL_PREFIX}:{self.scope}:{self.target_id}"
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "scope": self.scope,
+            "target_id": self.target_id,
+            "payload": self.payload,
+            "coalesce_key": self.coalesce_key,
+            "exclude_user": self.exclude_user
+        })
+
+    @classmethod
+    def from_json(cls, data: str) -> "RealtimeEnvelope":
+        return cls(**json.loads(data))
+
+
+EnvelopeHandler = Callable[[RealtimeEnvelope], Awaitable[None]]
+
+
+class RealtimeBus(ABC):
+    """Base class for realtime message buses."""
+
+    def __init__(self):
+        self._handler: Optional[EnvelopeHandler] = None
+
+    async def start(self, handler: EnvelopeHandler) -> None:
+        """Start delivering envelopes received by this node to handler."""
+        self._handler = handler
+
+    async def stop(self) -> None:
+        """Stop receiving messages."""
+        self._handler = None
+
+    @abstractmethod
+    async def publish(self, envelope: RealtimeEnvelope) -> None:
+        """Publish an envelope to every node with listeners for its target."""
+
+    async def subscribe(self, scope: str, target_id: str) -> None:
+        """Register local interest in a project or user channel."""
+
+    async def unsubscribe(self, scope: str, target_id: str) -> None:
+        """Drop local interest in a project or user channel."""
+
+
+class InProcessRealtimeBus(RealtimeBus):
+    """Bus that delivers only within the current process."""
+
+    async def publish(self, envelope: RealtimeEnvelope) -> None:
+        if self._handler:
+            await self._handler(envelope)
+
+
+class RedisRealtimeBus(RealtimeBus):
+    """Bus backed by Redis pub/sub with one channel per project and user."""
+
+    def __init__(self, redis_client, poll_timeout: float = 1.0):
+        super().__init__()
+        self.redis = redis_client
+        self.poll_timeout = poll_timeout
+        self.node_id = uuid.uuid4().hex
+        self._pubsub = None
+        self._channels: Set[str] = set()
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self, handler: EnvelopeHandler) -> None:
+        await super().start(handler)
+        self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        self._listener = asyncio.create_task(self._listen())
+        logger.info("Realtime Redis bus started", node_id=self.node_id)
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+        if self._pubsub:
+            try:
+                await self._pubsub.close()
+            except Exception:
+                pass
+            self._pubsub = None
+
+        self._channels.clear()
+        await super().stop()
+
+    async def publish(self, envelope: RealtimeEnvelope) -> None:
+        try:
+            await self.redis.publish(envelope.channel, envelope.to_json())
+        except Exception as e:
+            # Keep local clients working while Redis is unavailable
+            logger.warning(
+                "Realtime publish failed, delivering locally",
+                channel=envelope.channel,
+                error=str(e)
+            )
+            if self._handler:
+                await self._handler(envelope)
+
+    async def subscribe(self, scope: str, target_id: str) -> None:
+        channel = f"{CHANNEL_PREFIX}:{scope}:{target_id}"
+        if channel in self._channels or not self._pubsub:
+            return
+        self._channels.add(channel)
+        await self._pubsub.subscribe(channel)
+
+    async def unsubscribe(self, scope: str, target_id: str) -> None:
+        channel = f"{CHANNEL_PREFIX}:{scope}:{target_id}"
+        if channel not in self._channels or not self._pubsub:
+            return
+        self._channels.discard(channel)
+        await self._pubsub.unsubscribe(channel)
+
+    async def _listen(self) -> None:
+        """Receive messages for subscribed channels and hand them to the handler."""
+        while True:
+            if not self._channels:
+                await asyncio.sleep(self.poll_timeout)
+                continue
+
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=self.poll_timeout
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Realtime bus receive failed", error=str(e))
+                await asyncio.sleep(self.poll_timeout)
+                continue
+
+            if not message or message.get("type") != "message":
+                continue
+
+            try:
+                data = message["data"]
+                if isinstance(data, bytes):
+                    data = data.decode("utf-8")
+                envelope = RealtimeEnvelope.from_json(data)
+                if self._handler:
+                    await self._handler(envelope)
+            except Exception as e:
+                logger.error(
+                    "Failed to deliver realtime message",
+                    channel=message.get("channel"),
+                    error=str(e)
+                )
+
+
+class PresenceStore(ABC):
+    """
+    Base class for project presence tracking with TTL heartbeats.
+
+    Entries are kept per node ("user_id:node_id"): a user connected to the
+    same project through two nodes stays present until the last node removes
+    its entry or stops heartbeating.
+    """
+
+    def __init__(self, ttl_seconds: int = 300, node_id: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self.node_id = node_id or uuid.uuid4().hex
+
+    def _member(self, user_id: str) -> str:
+        return f"{user_id}:{self.node_id}"
+
+    @staticmethod
+    def _user(member: str) -> str:
+        return member.rsplit(":", 1)[0]
+
+    @abstractmethod
+    async def heartbeat(self, project_id: str, user_id: str) -> None:
+        """Mark a user as active in a project on this node now."""
+
+    @abstractmethod
+    async def remove(self, project_id: str, user_id: str) -> bool:
+        """
+        Remove this node's entry for a user.
+
+        Returns:
+            True if the user is no longer present on any node
+        """
+
+    @abstractmethod
+    async def online_users(self, project_id: str) -> List[str]:
+        """Users with a heartbeat within the TTL on at least one node."""
+
+    @abstractmethod
+    async def expire(self, project_id: str) -> List[str]:
+        """
+        Drop entries whose heartbeat is older than the TTL.
+
+        Returns:
+            Users left with no entry at all; each is returned to exactly one
+            caller, which announces that they left
+        """
+
+
+class InMemoryPresenceStore(PresenceStore):
+    """Presence tracked in process memory."""
+
+    def __init__(self, ttl_seconds: int = 300, node_id: Optional[str] = None):
+        super().__init__(ttl_seconds, node_id)
+        # {project_id: {"user_id:node_id": last_heartbeat}}
+        self._presence: Dict[str, Dict[str, float]] = {}
+
+    async def heartbeat(self, project_id: str, user_id: str) -> None:
+        self._presence.setdefault(project_id, {})[self._member(user_id)] = time.time()
+
+    async def remove(self, project_id: str, user_id: str) -> bool:
+        members = self._presence.get(project_id)
+        if members is None:
+            return True
+        members.pop(self._member(user_id), None)
+        if not members:
+            del self._presence[project_id]
+        return user_id not in await self.online_users(project_id)
+
+    async def online_users(self, project_id: str) -> List[str]:
+        cutoff = time.time() - self.ttl_seconds
+        users = {
+            self._user(member)
+            for member, last_seen in self._presence.get(project_id, {}).items()
+            if last_seen > cutoff
+        }
+        return list(users)
+
+    async def expire(self, project_id: str) -> List[str]:
+        members = self._presence.get(project_id, {})
+        cutoff = time.time() - self.ttl_seconds
+        expired = [member for member, last_seen in members.items() if last_seen <= cutoff]
+        for member in expired:
+            del members[member]
+        remaining = {self._user(member) for member in members}
+        return sorted({self._user(member) for member in expired} - remaining)
+
+
+class RedisPresenceStore(PresenceStore):
+    """Presence shared across nodes in a Redis sorted set per project."""
+
+    def __init__(self, redis_client, ttl_seconds: int = 300, node_id: Optional[str] = None):
+        super().__init__(ttl_seconds, node_id)
+        self.redis = redis_client
+
+    def _key(self, project_id: str) -> str:
+        return f"{PRESENCE_PREFIX}:{project_id}"
+
+    @staticmethod
+    def _decode(members) -> List[str]:
+        return [m.decode("utf-8") if isinstance(m, bytes) else m for m in members]
+
+    async def heartbeat(self, project_id: str, user_id: str) -> None:
+        key = self._key(project_id)
+        pipe = self.redis.pipeline()
+        pipe.zadd(key, {self._member(user_id): time.time()})
+        pipe.expire(key, self.ttl_seconds * 2)
+        await pipe.execute()
+
+    async def remove(self, project_id: str, user_id: str) -> bool:
+        key = self._key(project_id)
+        pipe = self.redis.pipeline()
+        pipe.zrem(key, self._member(user_id))
+        pipe.zrangebyscore(key, time.time() - self.ttl_seconds, "+inf")
+        _, members = await pipe.execute()
+        return all(self._user(member) != user_id for member in self._decode(members))
+
+    async def online_users(self, project_id: str) -> List[str]:
+        # Expired entries are left for expire(), which announces the leave
+        members = await self.redis.zrangebyscore(
+            self._key(project_id), time.time() - self.ttl_seconds, "+inf"
+        )
+        return list({self._user(member) for member in self._decode(members)})
+
+    async def expire(self, project_id: str) -> List[str]:
+        key = self._key(project_id)
+        cutoff = time.time() - self.ttl_seconds
+        # MULTI: when several nodes expire the same project, only the first
+        # sees (and reports) the expired entries
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zrangebyscore(key, "-inf", cutoff)
+        pipe.zremrangebyscore(key, "-inf", cutoff)
+        pipe.zrange(key, 0, -1)
+        expired, _, remaining = await pipe.execute()
+        remaining_users = {self._user(member) for member in self._decode(remaining)}
+        return sorted({self._user(member) for member in self._decode(expired)} - remaining_users)
+
+
+__all__ = [
+    'RealtimeEnvelope',
+    'RealtimeBus',
+    'InProcessRealtimeBus',
+    'RedisRealtimeBus',
+    'PresenceStore',
+    'InMemoryPresenceStore',
+    'RedisPresenceStore'
+]
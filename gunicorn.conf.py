@@ -3,6 +3,13 @@ Gunicorn configuration for GameForge production deployment.
 """
 import multiprocessing
 import os
+import shutil
+
+# Prometheus multiprocess mode. This must be set before the app (and with it
+# prometheus_client) is imported; preload_app imports it in the master.
+prometheus_multiproc_dir = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", "/tmp/gameforge-prometheus"
+)
 
 # Server socket
 bind = "0.0.0.0:8080"
@@ -53,6 +60,10 @@ raw_env = [
 def on_starting(server):
     """Called just before the master process is initialized."""
     server.log.info("🚀 GameForge application starting up...")
+    
+    # Drop samples left by a previous run
+    shutil.rmtree(prometheus_multiproc_dir, ignore_errors=True)
+    os.makedirs(prometheus_multiproc_dir, exist_ok=True)
 
 def on_reload(server):
     """Called to recycle workers during a reload via SIGHUP."""
@@ -70,10 +81,17 @@ def worker_exit(server, worker):
     """Called just after a worker has been exited."""
     server.log.info(f"👷 Worker {worker.pid} exited")
 
+def child_exit(server, worker):
+    """Called in the master after a worker exits."""
+    # Remove the dead worker's live gauges from the aggregated metrics
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
 # Memory optimization
 def post_fork(server, worker):
     """Called just after a worker has been forked."""
     server.log.info(f"👷 Worker {worker.pid} spawned")
+    # Metrics collection threads start in the app lifespan, inside the worker
     
     # Import torch and clean up if available
     try:
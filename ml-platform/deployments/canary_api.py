@@ -549,6 +549,7 @@ async def startup_event():
         
         # Initialize deployment manager
         deployment_manager = CanaryDeploymentManager(db_pool, redis_client)
+        await deployment_manager.traffic_splitter.start()
         
         logger.info("GameForge Canary Deployment API started successfully")
         
@@ -561,6 +562,9 @@ async def shutdown_event():
     """Clean up connections on shutdown"""
     global db_pool, redis_client
     
+    if deployment_manager:
+        await deployment_manager.traffic_splitter.stop()
+    
     if db_pool:
         await db_pool.close()
     
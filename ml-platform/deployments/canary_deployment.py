@@ -26,6 +26,8 @@ import numpy as np
 from scipy import stats
 import yaml
 
+from traffic_router import TrafficRouter
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -98,47 +100,39 @@ class ComparisonResult:
 class TrafficSplitter:
     """Handles traffic splitting between model versions"""
     
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(self, redis_client: redis.Redis, router: Optional[TrafficRouter] = None):
         self.redis = redis_client
+        self.router = router or TrafficRouter(redis_client)
+        
+    async def start(self) -> None:
+        """Follow split updates published by other processes"""
+        await self.router.start()
+        
+    async def stop(self) -> None:
+        await self.router.stop()
         
     async def set_traffic_split(self, model_name: str, version_weights: Dict[str, int]) -> None:
         """Set traffic split weights for model versions"""
-        key = f"traffic_split:{model_name}"
-        await self.redis.hset(key, mapping=version_weights)
-        await self.redis.expire(key, 3600)  # 1 hour expiry
+        version = await self.router.set_split(model_name, version_weights)
         
         # Update Prometheus metrics
-        for version, weight in version_weights.items():
-            traffic_gauge.labels(model=model_name, version=version).set(weight)
+        for version_name, weight in version_weights.items():
+            traffic_gauge.labels(model=model_name, version=version_name).set(weight)
             
-        logger.info(f"Updated traffic split for {model_name}: {version_weights}")
+        logger.info(f"Updated traffic split for {model_name} (v{version}): {version_weights}")
         
     async def get_traffic_split(self, model_name: str) -> Dict[str, int]:
         """Get current traffic split weights"""
-        key = f"traffic_split:{model_name}"
-        weights = await self.redis.hgetall(key)
-        return {k.decode(): int(v) for k, v in weights.items()}
-        
-    async def route_request(self, model_name: str) -> str:
-        """Route request based on traffic split weights"""
-        weights = await self.get_traffic_split(model_name)
-        if not weights:
-            return "current"  # Default to current version
-            
-        total_weight = sum(weights.values())
-        if total_weight == 0:
-            return "current"
-            
-        # Weighted random selection
-        rand_val = np.random.random() * total_weight
-        cumulative_weight = 0
-        
-        for version, weight in weights.items():
-            cumulative_weight += weight
-            if rand_val <= cumulative_weight:
-                return version
-                
-        return "current"  # Fallback
+        return await self.router.get_split(model_name)
+        
+    async def route_request(self, model_name: str, routing_key: Optional[str] = None) -> str:
+        """
+        Route request based on traffic split weights.
+        
+        Decisions come from the locally cached split; pass a user or session
+        id as routing_key to keep that caller on the same version.
+        """
+        return await self.router.route(model_name, routing_key)
 
 class MetricsCollector:
     """Collects and analyzes model performance metrics"""
@@ -557,6 +551,7 @@ async def main():
     
     # Initialize canary deployment manager
     manager = CanaryDeploymentManager(db_pool, redis_client)
+    await manager.traffic_splitter.start()
     
     logger.info("GameForge Canary Deployment System started")
     
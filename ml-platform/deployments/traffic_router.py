@@ -0,0 +1,287 @@
+"""
+GameForge Traffic Router
+========================
+
+Local, cached routing decisions for canary traffic splits:
+- Each model's split is loaded from Redis once and kept in process as an
+  alias table, so a routing decision is one random draw and two list lookups
+- Every write stamps the split with a new version (from a global counter) and
+  publishes {model, version} on the `traffic_split_updates` channel; routers
+  drop their table as soon as they see a newer version
+- While the subscription is down, tables are revalidated every `ttl` seconds
+  with a single GET of the version key; the hash is only reread when the
+  version changed
+- Sticky routing hashes a user or session key to a fixed point in [0, 1).
+  Versions keep a stable order, so ramping a canary from 5% to 10% only moves
+  the keys in the added band
+"""
+
+import asyncio
+import bisect
+import hashlib
+import json
+import logging
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SPLIT_KEY = "traffic_split:{model}"
+VERSION_KEY = "traffic_split_version:{model}"
+VERSION_SEQUENCE_KEY = "traffic_split_version_seq"
+UPDATES_CHANNEL = "traffic_split_updates"
+SPLIT_EXPIRY_SECONDS = 3600
+DEFAULT_VERSION = "current"
+
+
+def _text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def sticky_point(routing_key: str) -> float:
+    """Map a routing key to a stable point in [0, 1)."""
+    digest = hashlib.blake2b(routing_key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2 ** 64
+
+
+class SplitTable:
+    """
+    Weighted choice over one model's versions.
+
+    `choose` uses Vose's alias method (O(1) per draw); `choose_sticky` walks
+    the cumulative weights with bisect so a key keeps its version for as long
+    as its band does.
+    """
+
+    __slots__ = ("versions", "weights", "version", "checked_at", "_prob", "_alias", "_cumulative")
+
+    def __init__(self, weights: Dict[str, int], version: int = 0):
+        self.versions: List[str] = sorted(v for v, w in weights.items() if w > 0)
+        self.weights = {v: weights[v] for v in self.versions}
+        self.version = version
+        self.checked_at = time.monotonic()
+        self._build()
+
+    def _build(self):
+        count = len(self.versions)
+        total = sum(self.weights.values())
+        self._prob = [1.0] * count
+        self._alias = list(range(count))
+        self._cumulative = []
+
+        running = 0
+        for version in self.versions:
+            running += self.weights[version]
+            self._cumulative.append(running / total)
+
+        scaled = [self.weights[v] * count / total for v in self.versions] if count else []
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self._prob[s] = scaled[s]
+            self._alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Leftovers are 1.0 up to float error
+        for i in small + large:
+            self._prob[i] = 1.0
+
+    def __bool__(self) -> bool:
+        return bool(self.versions)
+
+    def choose(self, u: float) -> str:
+        """Version for a uniform draw u in [0, 1)."""
+        scaled = u * len(self.versions)
+        column = min(int(scaled), len(self.versions) - 1)
+        if scaled - column < self._prob[column]:
+            return self.versions[column]
+        return self.versions[self._alias[column]]
+
+    def choose_sticky(self, point: float) -> str:
+        index = bisect.bisect_right(self._cumulative, point)
+        return self.versions[min(index, len(self.versions) - 1)]
+
+
+class TrafficRouter:
+    """
+    Per-process cache of traffic split tables backed by Redis.
+
+    Args:
+        redis_client: redis.asyncio client (bytes or decoded responses)
+        ttl: Seconds between version checks while pub/sub is unavailable
+        max_age: Seconds between version checks while subscribed, as a
+            safety net for missed messages
+    """
+
+    def __init__(self, redis_client, ttl: float = 2.0, max_age: float = 60.0):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.max_age = max_age
+        self._tables: Dict[str, SplitTable] = {}
+        self._loading: Dict[str, asyncio.Task] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = False
+        self._random = random.random
+        self.stats = {
+            "decisions": 0,
+            "loads": 0,
+            "revalidations": 0,
+            "invalidations": 0,
+            "redis_errors": 0
+        }
+
+    async def start(self):
+        """Subscribe to split updates."""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._subscribed = False
+
+    # ------------------------------------------------------------------
+    # Reads and writes
+    # ------------------------------------------------------------------
+
+    async def route(self, model_name: str, routing_key: Optional[str] = None) -> str:
+        """Pick a version for one request; sticky when a routing key is given."""
+        table = self._tables.get(model_name)
+        if table is None or time.monotonic() - table.checked_at > (self.max_age if self._subscribed else self.ttl):
+            table = await self._refresh(model_name)
+
+        self.stats["decisions"] += 1
+        if not table:
+            return DEFAULT_VERSION
+        if routing_key is not None:
+            return table.choose_sticky(sticky_point(routing_key))
+        return table.choose(self._random())
+
+    async def get_split(self, model_name: str) -> Dict[str, int]:
+        """Current weights as stored in Redis."""
+        weights = await self.redis.hgetall(SPLIT_KEY.format(model=model_name))
+        return {_text(k): int(v) for k, v in weights.items()}
+
+    async def set_split(self, model_name: str, version_weights: Dict[str, int]) -> int:
+        """Replace a model's split, stamp it with a new version and notify every router."""
+        version = await self.redis.incr(VERSION_SEQUENCE_KEY)
+        split_key = SPLIT_KEY.format(model=model_name)
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(split_key)
+        if version_weights:
+            pipe.hset(split_key, mapping=version_weights)
+            pipe.expire(split_key, SPLIT_EXPIRY_SECONDS)
+        pipe.set(VERSION_KEY.format(model=model_name), version, ex=SPLIT_EXPIRY_SECONDS)
+        pipe.publish(UPDATES_CHANNEL, json.dumps({"model": model_name, "version": version}))
+        await pipe.execute()
+
+        self._tables[model_name] = SplitTable(version_weights, version)
+        return version
+
+    def invalidate(self, model_name: str, version: Optional[int] = None):
+        """Drop a cached table (only if older than `version`, when given)."""
+        table = self._tables.get(model_name)
+        if table is not None and (version is None or table.version < version):
+            del self._tables[model_name]
+            self.stats["invalidations"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "subscribed": self._subscribed,
+            "models": {name: table.version for name, table in self._tables.items()}
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _refresh(self, model_name: str) -> SplitTable:
+        """Revalidate or load a table; concurrent callers share one round trip."""
+        task = self._loading.get(model_name)
+        if task is None:
+            task = asyncio.ensure_future(self._revalidate(model_name))
+            self._loading[model_name] = task
+            task.add_done_callback(lambda _: self._loading.pop(model_name, None))
+        return await asyncio.shield(task)
+
+    async def _revalidate(self, model_name: str) -> SplitTable:
+        cached = self._tables.get(model_name)
+        try:
+            if cached is not None:
+                current = await self.redis.get(VERSION_KEY.format(model=model_name))
+                if current is not None and int(current) == cached.version:
+                    cached.checked_at = time.monotonic()
+                    self.stats["revalidations"] += 1
+                    return cached
+            table = await self._load(model_name)
+        except Exception as e:
+            self.stats["redis_errors"] += 1
+            if cached is None:
+                raise
+            # Keep routing on the last known split until Redis is back
+            logger.warning(f"Traffic split refresh failed for {model_name}, serving cached split: {e}")
+            cached.checked_at = time.monotonic()
+            return cached
+
+        newer = self._tables.get(model_name)
+        if newer is not None and newer.version > table.version:
+            return newer
+        self._tables[model_name] = table
+        return table
+
+    async def _load(self, model_name: str) -> SplitTable:
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.get(VERSION_KEY.format(model=model_name))
+        pipe.hgetall(SPLIT_KEY.format(model=model_name))
+        version, weights = await pipe.execute()
+
+        self.stats["loads"] += 1
+        return SplitTable(
+            {_text(k): int(v) for k, v in weights.items()},
+            int(version) if version is not None else 0
+        )
+
+    async def _listen(self):
+        backoff = 1.0
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(UPDATES_CHANNEL)
+                self._subscribed = True
+                backoff = 1.0
+                # Updates may have been missed while disconnected
+                for table in self._tables.values():
+                    table.checked_at = 0.0
+                logger.info(f"Subscribed to {UPDATES_CHANNEL}")
+
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        update = json.loads(_text(message["data"]))
+                        self.invalidate(update["model"], int(update["version"]))
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.warning(f"Ignoring malformed traffic split update: {e}")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Traffic split subscription lost, polling every {self.ttl}s: {e}")
+            finally:
+                self._subscribed = False
+                try:
+                    await pubsub.reset()
+                except Exception:
+                    pass
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
@@ -0,0 +1,299 @@
+"""
+GameForge Alert Dispatcher
+Rate-aware, batched delivery of AlertManager notifications to webhook channels
+
+- One pooled aiohttp session for every channel and message
+- Per-channel token bucket; a 429 pauses the channel for its Retry-After
+- Retries with exponential backoff and full jitter on 5xx and network errors
+- Alerts already delivered (or in flight) with the same (fingerprint,
+  status) within the dedup window are dropped; a failed delivery releases
+  them so AlertManager's re-send goes out
+- Webhook payloads arriving within the digest window are merged into one
+  message per channel, so an alert storm becomes a few digest posts
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# on_result(channel, status, duration_seconds); status is "success" or "error"
+ResultCallback = Callable[[str, str, float], None]
+
+
+class TokenBucket:
+    """Async token bucket: `rate` messages per second with bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float):
+        """Stop issuing tokens for `seconds` (server-side rate limit)."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+    async def acquire(self):
+        async with self._lock:  # waiters are served in FIFO order
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+@dataclass
+class Channel:
+    """A webhook destination and how to talk to it."""
+    name: str
+    url: str
+    format: Callable[[Any], Dict]
+    success_statuses: Tuple[int, ...] = (200, 204)
+    rate: float = 1.0
+    burst: int = 1
+    digest: bool = True
+
+
+def parse_retry_after(value: Optional[str], default: float) -> float:
+    """Retry-After in seconds (delta-seconds or HTTP-date)."""
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
+def merge_payloads(payloads: List[Any]) -> Any:
+    """
+    Merge AlertManager webhook payloads into one digest payload.
+
+    Alerts are keyed by fingerprint (the latest status wins); common labels are
+    the labels shared by every alert.
+    """
+    if len(payloads) == 1:
+        return payloads[0]
+
+    alerts = {}
+    for payload in payloads:
+        for alert in payload.alerts:
+            alerts[alert.fingerprint] = alert
+    merged = list(alerts.values())
+
+    common = dict(merged[0].labels)
+    for alert in merged[1:]:
+        common = {k: v for k, v in common.items() if alert.labels.get(k) == v}
+
+    names = {alert.labels.get('alertname', 'Unknown') for alert in merged}
+    alertname = names.pop() if len(names) == 1 else f"{len(merged)} alerts from {len(names)} rules"
+
+    return payloads[-1].model_copy(update={
+        "alerts": merged,
+        "status": "firing" if any(alert.status == "firing" for alert in merged) else "resolved",
+        "commonLabels": common,
+        "groupLabels": {"alertname": alertname},
+        "groupKey": f"digest:{len(payloads)}:{payloads[-1].groupKey}"
+    })
+
+
+class AlertDispatcher:
+    """Delivers alert payloads to registered channels."""
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        retry_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        dedup_window: float = 300.0,
+        digest_window: float = 5.0,
+        max_connections: int = 20,
+        on_result: Optional[ResultCallback] = None
+    ):
+        self.timeout = timeout
+        self.retry_attempts = retry_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.dedup_window = dedup_window
+        self.digest_window = digest_window
+        self.max_connections = max_connections
+        self.on_result = on_result
+
+        self.channels: Dict[str, Channel] = {}
+        self.buckets: Dict[str, TokenBucket] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._sent: Dict[Tuple[str, str, str], float] = {}
+        self._pending: Dict[str, List[Any]] = {}
+        self._flushers: Dict[str, asyncio.Task] = {}
+        self.stats = {
+            "posts": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "duplicates_dropped": 0,
+            "payloads_digested": 0,
+            "failures": 0
+        }
+
+    def register(self, channel: Channel):
+        self.channels[channel.name] = channel
+        self.buckets[channel.name] = TokenBucket(channel.rate, channel.burst)
+
+    async def start(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_connections)
+            )
+
+    async def close(self):
+        """Send pending digests, then release the HTTP session."""
+        await self.flush()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def dispatch(self, channel_name: str, payload: Any, deduplicate: bool = True):
+        """Queue a webhook payload for a channel (digest channels send after the window)."""
+        channel = self.channels.get(channel_name)
+        if channel is None:
+            logger.warning("Channel not configured", channel=channel_name)
+            return
+
+        if deduplicate:
+            payload = self._drop_duplicates(channel_name, payload)
+            if payload is None:
+                return
+
+        if not channel.digest or self.digest_window <= 0:
+            await self._deliver(channel, payload)
+            return
+
+        self._pending.setdefault(channel_name, []).append(payload)
+        if channel_name not in self._flushers:
+            self._flushers[channel_name] = asyncio.create_task(self._flush_later(channel_name))
+
+    async def flush(self, channel_name: Optional[str] = None):
+        """Send pending digests now."""
+        names = [channel_name] if channel_name else list(self._pending)
+        for name in names:
+            task = self._flushers.pop(name, None)
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+            payloads = self._pending.pop(name, [])
+            if payloads:
+                self.stats["payloads_digested"] += len(payloads) - 1
+                await self._deliver(self.channels[name], merge_payloads(payloads))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "pending": {name: len(payloads) for name, payloads in self._pending.items()}
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _drop_duplicates(self, channel_name: str, payload: Any) -> Optional[Any]:
+        now = time.monotonic()
+        if len(self._sent) > 10000:
+            self._sent = {k: t for k, t in self._sent.items() if now - t < self.dedup_window}
+
+        fresh = []
+        for alert in payload.alerts:
+            key = (channel_name, alert.fingerprint, alert.status)
+            if now - self._sent.get(key, float("-inf")) < self.dedup_window:
+                self.stats["duplicates_dropped"] += 1
+                continue
+            self._sent[key] = now
+            fresh.append(alert)
+
+        if not fresh:
+            return None
+        if len(fresh) == len(payload.alerts):
+            return payload
+        return payload.model_copy(update={"alerts": fresh})
+
+    def _release(self, channel_name: str, payload: Any):
+        """Forget a failed payload's alerts so a re-send is not dropped as a duplicate."""
+        for alert in payload.alerts:
+            self._sent.pop((channel_name, alert.fingerprint, alert.status), None)
+
+    async def _flush_later(self, channel_name: str):
+        await asyncio.sleep(self.digest_window)
+        self._flushers.pop(channel_name, None)
+        await self.flush(channel_name)
+
+    async def _deliver(self, channel: Channel, payload: Any):
+        started = time.monotonic()
+        status = "success" if await self._post(channel, channel.format(payload)) else "error"
+        if status == "error":
+            self.stats["failures"] += 1
+            self._release(channel.name, payload)
+        if self.on_result:
+            self.on_result(channel.name, status, time.monotonic() - started)
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter: uniform(0, min(max, base * 2^attempt))."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def _post(self, channel: Channel, body: Dict) -> bool:
+        await self.start()
+        bucket = self.buckets[channel.name]
+
+        for attempt in range(self.retry_attempts + 1):
+            await bucket.acquire()
+            try:
+                async with self._session.post(channel.url, json=body) as response:
+                    self.stats["posts"] += 1
+                    if response.status in channel.success_statuses:
+                        logger.info("Notification sent", channel=channel.name, attempt=attempt + 1)
+                        return True
+
+                    if response.status == 429:
+                        delay = parse_retry_after(response.headers.get("Retry-After"), self._backoff(attempt))
+                        bucket.pause(delay)
+                        self.stats["rate_limited"] += 1
+                        logger.warning("Channel rate limited", channel=channel.name, retry_after=delay)
+                        delay = 0.0  # the bucket already waits
+                    elif response.status >= 500:
+                        delay = self._backoff(attempt)
+                        logger.warning("Channel server error", channel=channel.name, status=response.status)
+                    else:
+                        logger.error("Notification rejected", channel=channel.name, status=response.status)
+                        return False
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                delay = self._backoff(attempt)
+                logger.warning("Notification send failed", channel=channel.name, error=str(e))
+
+            if attempt < self.retry_attempts:
+                self.stats["retries"] += 1
+                await asyncio.sleep(delay)
+
+        logger.error("Notification dropped after retries", channel=channel.name, attempts=self.retry_attempts + 1)
+        return False
@@ -9,12 +9,12 @@ import os
 import json
 import smtplib
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
 from typing import Dict, List, Optional
 
-import aiohttp
 import structlog
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.responses import JSONResponse
@@ -22,6 +22,8 @@ from pydantic import BaseModel, Field
 from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
 import uvicorn
 
+from alert_dispatcher import AlertDispatcher, Channel
+
 # Configure structured logging
 logging.basicConfig(level=logging.INFO)
 logger = structlog.get_logger(__name__)
@@ -57,7 +59,11 @@ class NotificationService:
     """Main notification service class"""
     
     def __init__(self):
-        self.app = FastAPI(title="GameForge Notification Service", version="1.0.0")
+        self.app = FastAPI(
+            title="GameForge Notification Service",
+            version="1.0.0",
+            lifespan=self.lifespan
+        )
         self.setup_routes()
         
         # Configuration
@@ -77,15 +83,75 @@ class NotificationService:
         self.notification_timeout = int(os.getenv('NOTIFICATION_TIMEOUT', '30'))
         self.retry_attempts = int(os.getenv('RETRY_ATTEMPTS', '3'))
         
+        # Webhook delivery: shared session, rate limits, retries, dedup, digests
+        self.dispatcher = AlertDispatcher(
+            timeout=self.notification_timeout,
+            retry_attempts=self.retry_attempts,
+            backoff_base=float(os.getenv('RETRY_BACKOFF_SECONDS', '0.5')),
+            dedup_window=float(os.getenv('DEDUP_WINDOW_SECONDS', '300')),
+            digest_window=float(os.getenv('DIGEST_WINDOW_SECONDS', '5')),
+            on_result=self.record_result
+        )
+        self.register_channels()
+        
         logger.info("GameForge Notification Service initialized")
 
+    @asynccontextmanager
+    async def lifespan(self, app: FastAPI):
+        """Open the shared HTTP session; send pending digests on shutdown"""
+        await self.dispatcher.start()
+        try:
+            yield
+        finally:
+            await self.dispatcher.close()
+
+    def register_channels(self):
+        """Register configured webhook channels with their rate limits"""
+        # Slack incoming webhooks allow ~1 message/s; Discord 30/min per webhook
+        if self.slack_webhook:
+            self.dispatcher.register(Channel(
+                "slack", self.slack_webhook, self.format_slack_message,
+                success_statuses=(200,),
+                rate=float(os.getenv('SLACK_RATE_PER_SECOND', '1')), burst=3
+            ))
+        if self.discord_webhook:
+            self.dispatcher.register(Channel(
+                "discord", self.discord_webhook, self.format_discord_message,
+                success_statuses=(200, 204),
+                rate=float(os.getenv('DISCORD_RATE_PER_SECOND', '0.5')), burst=5
+            ))
+        if self.teams_webhook:
+            self.dispatcher.register(Channel(
+                "teams", self.teams_webhook, self.format_teams_message,
+                success_statuses=(200,),
+                rate=float(os.getenv('TEAMS_RATE_PER_SECOND', '1')), burst=4
+            ))
+        if self.pagerduty_key:
+            # Every PagerDuty event keeps its own dedup_key, so no digests
+            self.dispatcher.register(Channel(
+                "pagerduty", "https://events.pagerduty.com/v2/enqueue",
+                self.format_pagerduty_event,
+                success_statuses=(202,),
+                rate=float(os.getenv('PAGERDUTY_RATE_PER_SECOND', '2')), burst=10,
+                digest=False
+            ))
+
+    def record_result(self, channel: str, status: str, duration: float):
+        """Record a delivery outcome from the dispatcher"""
+        notification_counter.labels(channel=channel, status=status).inc()
+        notification_duration.labels(channel=channel).observe(duration)
+
     def setup_routes(self):
         """Setup FastAPI routes"""
         
         @self.app.get("/health")
         async def health_check():
             """Health check endpoint"""
-            return {"status": "healthy", "service": "gameforge-notification-service"}
+            return {
+                "status": "healthy",
+                "service": "gameforge-notification-service",
+                "dispatcher": self.dispatcher.get_stats()
+            }
         
         @self.app.get("/metrics")
         async def metrics():
@@ -131,11 +197,11 @@ class NotificationService:
             )
             
             if channel == "slack":
-                background_tasks.add_task(self.send_slack_notification, test_payload)
+                background_tasks.add_task(self.send_slack_notification, test_payload, deduplicate=False)
             elif channel == "email":
                 background_tasks.add_task(self.send_email_notification, test_payload)
             elif channel == "pagerduty":
-                background_tasks.add_task(self.send_pagerduty_notification, test_payload)
+                background_tasks.add_task(self.send_pagerduty_notification, test_payload, deduplicate=False)
             else:
                 raise HTTPException(status_code=400, detail=f"Unknown channel: {channel}")
             
@@ -197,33 +263,13 @@ class NotificationService:
         
         return channels
 
-    async def send_slack_notification(self, payload: AlertManagerWebhook):
+    async def send_slack_notification(self, payload: AlertManagerWebhook, deduplicate: bool = True):
         """Send notification to Slack"""
         if not self.slack_webhook:
             logger.warning("Slack webhook not configured")
             return
         
-        with notification_duration.labels(channel="slack").time():
-            try:
-                # Format Slack message
-                message = self.format_slack_message(payload)
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        self.slack_webhook,
-                        json=message,
-                        timeout=aiohttp.ClientTimeout(total=self.notification_timeout)
-                    ) as response:
-                        if response.status == 200:
-                            notification_counter.labels(channel="slack", status="success").inc()
-                            logger.info("Slack notification sent successfully")
-                        else:
-                            notification_counter.labels(channel="slack", status="error").inc()
-                            logger.error("Failed to send Slack notification", status=response.status)
-            
-            except Exception as e:
-                notification_counter.labels(channel="slack", status="error").inc()
-                logger.error("Error sending Slack notification", error=str(e))
+        await self.dispatcher.dispatch("slack", payload, deduplicate=deduplicate)
 
     async def send_email_notification(self, payload: AlertManagerWebhook):
         """Send notification via email"""
@@ -240,11 +286,11 @@ class NotificationService:
                 recipients = self.get_email_recipients(payload)
                 
                 # Send email
-                msg = MimeMultipart()
+                msg = MIMEMultipart()
                 msg['From'] = self.email_from
                 msg['To'] = ", ".join(recipients)
                 msg['Subject'] = subject
-                msg.attach(MimeText(body, 'plain'))
+                msg.attach(MIMEText(body, 'plain'))
                 
                 with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
                     server.starttls()
@@ -258,89 +304,29 @@ class NotificationService:
                 notification_counter.labels(channel="email", status="error").inc()
                 logger.error("Error sending email notification", error=str(e))
 
-    async def send_pagerduty_notification(self, payload: AlertManagerWebhook):
+    async def send_pagerduty_notification(self, payload: AlertManagerWebhook, deduplicate: bool = True):
         """Send notification to PagerDuty"""
         if not self.pagerduty_key:
             logger.warning("PagerDuty routing key not configured")
             return
         
-        with notification_duration.labels(channel="pagerduty").time():
-            try:
-                # Format PagerDuty event
-                event = self.format_pagerduty_event(payload)
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        "https://events.pagerduty.com/v2/enqueue",
-                        json=event,
-                        timeout=aiohttp.ClientTimeout(total=self.notification_timeout)
-                    ) as response:
-                        if response.status == 202:
-                            notification_counter.labels(channel="pagerduty", status="success").inc()
-                            logger.info("PagerDuty notification sent successfully")
-                        else:
-                            notification_counter.labels(channel="pagerduty", status="error").inc()
-                            logger.error("Failed to send PagerDuty notification", status=response.status)
-            
-            except Exception as e:
-                notification_counter.labels(channel="pagerduty", status="error").inc()
-                logger.error("Error sending PagerDuty notification", error=str(e))
+        await self.dispatcher.dispatch("pagerduty", payload, deduplicate=deduplicate)
 
-    async def send_discord_notification(self, payload: AlertManagerWebhook):
+    async def send_discord_notification(self, payload: AlertManagerWebhook, deduplicate: bool = True):
         """Send notification to Discord"""
         if not self.discord_webhook:
             logger.warning("Discord webhook not configured")
             return
         
-        with notification_duration.labels(channel="discord").time():
-            try:
-                # Format Discord message
-                message = self.format_discord_message(payload)
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        self.discord_webhook,
-                        json=message,
-                        timeout=aiohttp.ClientTimeout(total=self.notification_timeout)
-                    ) as response:
-                        if response.status in [200, 204]:
-                            notification_counter.labels(channel="discord", status="success").inc()
-                            logger.info("Discord notification sent successfully")
-                        else:
-                            notification_counter.labels(channel="discord", status="error").inc()
-                            logger.error("Failed to send Discord notification", status=response.status)
-            
-            except Exception as e:
-                notification_counter.labels(channel="discord", status="error").inc()
-                logger.error("Error sending Discord notification", error=str(e))
+        await self.dispatcher.dispatch("discord", payload, deduplicate=deduplicate)
 
-    async def send_teams_notification(self, payload: AlertManagerWebhook):
+    async def send_teams_notification(self, payload: AlertManagerWebhook, deduplicate: bool = True):
         """Send notification to Microsoft Teams"""
         if not self.teams_webhook:
             logger.warning("Teams webhook not configured")
             return
         
-        with notification_duration.labels(channel="teams").time():
-            try:
-                # Format Teams message
-                message = self.format_teams_message(payload)
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        self.teams_webhook,
-                        json=message,
-                        timeout=aiohttp.ClientTimeout(total=self.notification_timeout)
-                    ) as response:
-                        if response.status == 200:
-                            notification_counter.labels(channel="teams", status="success").inc()
-                            logger.info("Teams notification sent successfully")
-                        else:
-                            notification_counter.labels(channel="teams", status="error").inc()
-                            logger.error("Failed to send Teams notification", status=response.status)
-            
-            except Exception as e:
-                notification_counter.labels(channel="teams", status="error").inc()
-                logger.error("Error sending Teams notification", error=str(e))
+        await self.dispatcher.dispatch("teams", payload, deduplicate=deduplicate)
 
     def format_slack_message(self, payload: AlertManagerWebhook) -> Dict:
         """Format message for Slack"""
@@ -356,6 +342,8 @@ class NotificationService:
                         f"*Severity:* {alert.labels.get('severity', 'N/A')}",
                 "short": False
             })
+        if len(payload.alerts) > 5:
+            fields.append({"title": f"+{len(payload.alerts) - 5} more alerts", "value": "", "short": False})
         
         return {
             "attachments": [{
@@ -460,8 +448,12 @@ AlertManager: http://alertmanager.gameforge.local:9093
                 "timestamp": alert.startsAt
             })
         
+        content = f"**GameForge Alert**: {payload.status.upper()}"
+        if len(payload.alerts) > 10:
+            content += f" (+{len(payload.alerts) - 10} more alerts)"
+        
         return {
-            "content": f"**GameForge Alert**: {payload.status.upper()}",
+            "content": content,
             "embeds": embeds
         }
 
@@ -477,6 +469,8 @@ AlertManager: http://alertmanager.gameforge.local:9093
                 {"name": "Severity", "value": alert.labels.get('severity', 'N/A')},
                 {"name": "Summary", "value": alert.annotations.get('summary', 'N/A')}
             ])
+        if len(payload.alerts) > 5:
+            facts.append({"name": "More", "value": f"+{len(payload.alerts) - 5} more alerts"})
         
         return {
             "@type": "MessageCard",
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+========================================================================
+GameForge AI - Keyset vs OFFSET Pagination Benchmark
+Measures page-N latency for the project activity feed query shape
+========================================================================
+
+Builds an in-memory SQLite activity_logs table with the same composite
+(project_id, created_at DESC, id DESC) index as migration c4e8f1a92b57 and
+walks a project's feed with both strategies:
+
+    OFFSET:  ORDER BY created_at DESC, id DESC LIMIT :n OFFSET :k
+    Keyset:  WHERE (created_at, id) < (:cursor_at, :cursor_id)
+             ORDER BY created_at DESC, id DESC LIMIT :n
+
+OFFSET latency grows with the page number; keyset latency stays flat.
+
+Usage:
+    python scripts/benchmark-keyset-pagination.py [--rows 200000] [--page-size 50]
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+
+def build_database(total_rows: int, projects: int):
+    """Create and populate the activity_logs table; returns (conn, busiest project)."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("""
+        CREATE TABLE activity_logs (
+            id TEXT PRIMARY KEY,
+            project_id TEXT NOT NULL,
+            description TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE INDEX idx_activity_logs_project_feed
+        ON activity_logs (project_id, created_at DESC, id DESC)
+    """)
+
+    start = datetime(2025, 1, 1)
+    project_ids = [str(uuid.uuid4()) for _ in range(projects)]
+    rows = [
+        (
+            str(uuid.uuid4()),
+            project_ids[0] if i % 2 == 0 else random.choice(project_ids),
+            f"Activity {i}",
+            (start + timedelta(seconds=i)).isoformat()
+        )
+        for i in range(total_rows)
+    ]
+    conn.executemany("INSERT INTO activity_logs VALUES (?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.execute("ANALYZE")
+    return conn, project_ids[0]
+
+
+def time_query(conn: sqlite3.Connection, sql: str, params: tuple, repeats: int) -> float:
+    """Median latency in milliseconds."""
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def run(total_rows: int, page_size: int, projects: int, repeats: int) -> None:
+    conn, project_id = build_database(total_rows, projects)
+
+    offset_sql = """
+        SELECT id, description, created_at FROM activity_logs
+        WHERE project_id = ?
+        ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?
+    """
+    keyset_sql = """
+        SELECT id, description, created_at FROM activity_logs
+        WHERE project_id = ? AND (created_at, id) < (?, ?)
+        ORDER BY created_at DESC, id DESC LIMIT ?
+    """
+
+    # Record the cursor at the start of every page by walking the feed once
+    cursors = {}
+    cursor = None
+    page = 1
+    while True:
+        if cursor is None:
+            rows = conn.execute(
+                offset_sql, (project_id, page_size, 0)
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                keyset_sql, (project_id, cursor[1], cursor[0], page_size)
+            ).fetchall()
+        if len(rows) < page_size:
+            break
+        cursor = (rows[-1][0], rows[-1][2])
+        page += 1
+        cursors[page] = cursor
+
+    last_page = page
+    sample_pages = sorted({
+        p for p in (2, 10, 100, 500, 1000, 2000, last_page // 2, last_page - 1)
+        if 2 <= p < last_page
+    })
+
+    print(f"activity_logs rows: {total_rows:,}  feed pages: {last_page:,}  "
+          f"page size: {page_size}")
+    print(f"{'page':>8} {'offset ms':>12} {'keyset ms':>12} {'speedup':>10}")
+    for page in sample_pages:
+        offset_ms = time_query(
+            conn, offset_sql,
+            (project_id, page_size, (page - 1) * page_size), repeats
+        )
+        cursor_id, cursor_at = cursors[page]
+        keyset_ms = time_query(
+            conn, keyset_sql,
+            (project_id, cursor_at, cursor_id, page_size), repeats
+        )
+        print(f"{page:>8} {offset_ms:>12.3f} {keyset_ms:>12.3f} "
+              f"{offset_ms / keyset_ms:>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyset pagination benchmark")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.rows, args.page_size, args.projects, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
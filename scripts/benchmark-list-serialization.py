@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+========================================================================
+GameForge AI - List Serialization Benchmark
+Compares per-row Pydantic responses with the RowSerializer/orjson fast path
+========================================================================
+
+Serves the same page of --rows project-shaped rows from an in-process
+FastAPI app through both paths and reports rows/sec end to end:
+
+    model:  one Pydantic model per row (from_attributes), revalidated by
+            response_model and rendered with the stdlib JSONResponse
+    fast:   projected row mappings -> RowSerializer dicts -> orjson
+            (gameforge.core.fast_json), response_model kept for OpenAPI only
+
+Usage:
+    python scripts/benchmark-list-serialization.py [--rows 100] [--requests 500]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gameforge.core.fast_json import ORJSON_AVAILABLE, RowSerializer, json_response  # noqa: E402
+
+
+class ProjectListItem(BaseModel):
+    """Same shape as api.v1.projects.ProjectListResponse."""
+    id: str
+    name: str
+    slug: str
+    summary: Optional[str]
+    engine: Optional[str]
+    genre: Optional[str]
+    status: str
+    visibility: str
+    is_featured: bool
+    is_template: bool
+    owner_id: str
+    tags: List[str]
+    thumbnail_url: Optional[str]
+    view_count: int
+    like_count: int
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+
+class Row:
+    """Attribute access, like an ORM entity."""
+
+    def __init__(self, mapping):
+        self.__dict__.update(mapping)
+
+
+def make_rows(count: int) -> List[dict]:
+    now = datetime(2024, 1, 1)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"Project {i}",
+            "slug": f"project-{i}",
+            "summary": "A small platformer" if i % 3 else None,
+            "engine": "godot",
+            "genre": "platformer",
+            "status": "active",
+            "visibility": "public",
+            "is_featured": i % 10 == 0,
+            "is_template": False,
+            "owner_id": str(uuid.uuid4()),
+            "tags": ["2d", "pixel-art", "retro"],
+            "thumbnail_url": None,
+            "view_count": i * 7,
+            "like_count": i,
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now if i % 2 else None
+        }
+        for i in range(count)
+    ]
+
+
+def build_app(rows: List[dict]) -> FastAPI:
+    app = FastAPI()
+    entities = [Row(row) for row in rows]
+    serializer = RowSerializer(ProjectListItem)
+
+    @app.get("/model", response_model=List[ProjectListItem], response_class=JSONResponse)
+    async def model_path():
+        return [ProjectListItem.from_orm(entity) for entity in entities]
+
+    @app.get("/fast", response_model=List[ProjectListItem])
+    async def fast_path():
+        return json_response(serializer.many(rows))
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str, requests: int, rows: int) -> float:
+    for _ in range(10):
+        (await client.get(path)).raise_for_status()
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        (await client.get(path)).raise_for_status()
+    elapsed = time.perf_counter() - started
+
+    rate = requests * rows / elapsed
+    print(f"{path.strip('/'):>8} {elapsed * 1000 / requests:>12.2f} {rate:>12.0f}")
+    return rate
+
+
+async def run(rows: int, requests: int) -> None:
+    app = build_app(make_rows(rows))
+    transport = httpx.ASGITransport(app=app)
+
+    print(f"rows/page: {rows}  requests: {requests}  orjson: {ORJSON_AVAILABLE}")
+    print(f"{'path':>8} {'ms/request':>12} {'rows/s':>12}")
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        model_rate = await measure(client, "/model", requests, rows)
+        fast_rate = await measure(client, "/fast", requests, rows)
+    print(f"speedup: {fast_rate / model_rate:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List serialization benchmark")
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+========================================================================
+GameForge AI - Security Middleware Benchmark
+Compares the old BaseHTTPMiddleware chain with the fused ASGI middleware
+========================================================================
+
+Serves a trivial endpoint from an in-process FastAPI app behind each stack
+and reports requests/sec end to end:
+
+    chain:  SecurityLoggingMiddleware -> GlobalRateLimitMiddleware ->
+            SecurityHeadersMiddleware, three BaseHTTPMiddleware classes
+            (reproduced below as they were before the fused middleware)
+    fused:  gameforge.core.security_middleware.SecurityMiddleware
+
+Both stacks run the same rate limiter, logging call and headers. Info-level
+logging is disabled so the numbers measure the middleware, not stdout.
+Each request uses its own client address, so the in-memory rate limiter
+does not grow a long per-client window.
+
+Usage:
+    python scripts/benchmark-security-middleware.py [--requests 5000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gameforge.core.logging_config import log_security_event, setup_structured_logging  # noqa: E402
+from gameforge.core.security import rate_limiter  # noqa: E402
+from gameforge.core.security_config import SECURITY_HEADERS  # noqa: E402
+from gameforge.core.security_middleware import SecurityMiddleware  # noqa: E402
+
+MAX_REQUESTS = 1000
+WINDOW_SECONDS = 3600
+
+
+# ------------------------------------------------------------------
+# Previous BaseHTTPMiddleware chain
+# ------------------------------------------------------------------
+
+class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        for header_name, header_value in SECURITY_HEADERS.items():
+            response.headers[header_name] = header_value
+        return response
+
+
+class GlobalRateLimitMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        client_id = request.headers.get("X-Forwarded-For", "unknown").split(",")[0].strip()
+        allowed, info = rate_limiter.is_allowed(client_id, MAX_REQUESTS, WINDOW_SECONDS)
+        if not allowed:
+            return JSONResponse(status_code=429, content={"error": "Rate limit exceeded"})
+
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = str(MAX_REQUESTS)
+        response.headers["X-RateLimit-Remaining"] = str(info.get("remaining", 0))
+        response.headers["X-RateLimit-Reset"] = str(int(time.time() + WINDOW_SECONDS))
+        return response
+
+
+class SecurityLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        client_id = request.headers.get("X-Forwarded-For", "unknown").split(",")[0].strip()
+        response = await call_next(request)
+        log_security_event(
+            event_type="api_request_completed",
+            severity="info",
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            duration=time.time() - start_time,
+            client_id=client_id,
+            user_agent=request.headers.get("User-Agent", "unknown")
+        )
+        return response
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping", response_class=PlainTextResponse)
+    async def ping():
+        return "pong"
+
+    if stack == "chain":
+        app.add_middleware(SecurityHeadersMiddleware)
+        app.add_middleware(GlobalRateLimitMiddleware)
+        app.add_middleware(SecurityLoggingMiddleware)
+    else:
+        app.add_middleware(SecurityMiddleware, max_requests=MAX_REQUESTS, window_seconds=WINDOW_SECONDS)
+    return app
+
+
+async def measure(stack: str, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=build_app(stack))
+    addresses = (f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in itertools.count())
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker(count: int):
+            for _ in range(count):
+                response = await client.get("/ping", headers={"X-Forwarded-For": next(addresses)})
+                response.raise_for_status()
+
+        await asyncio.gather(*(worker(10) for _ in range(concurrency)))  # warm up
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    rate = (requests // concurrency) * concurrency / elapsed
+    print(f"{stack:>6} {elapsed * 1e6 / requests:>14.1f} {rate:>12.0f}")
+    return rate
+
+
+async def run(requests: int, concurrency: int) -> None:
+    setup_structured_logging()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"requests: {requests}  concurrency: {concurrency}")
+    print(f"{'stack':>6} {'us/request':>14} {'req/s':>12}")
+    chain_rate = await measure("chain", requests, concurrency)
+    fused_rate = await measure("fused", requests, concurrency)
+    print(f"speedup: {fused_rate / chain_rate:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Security middleware benchmark")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+========================================================================
+GameForge AI - Slug Allocation Fork-Storm Benchmark
+Compares per-candidate slug probing with the set-based allocator
+========================================================================
+
+Seeds a SQLite projects table with --existing forks of one template
+("my-game-fork", "my-game-fork-1", ...) and then forks it --forks more
+times, --concurrency at a time, with both strategies:
+
+    probe:      SELECT ... WHERE slug = :candidate for name, name-1, name-2, ...
+                until one is free, then INSERT
+    allocator:  one prefix query for every taken suffix, INSERT inside a
+                SAVEPOINT, refresh and retry on a unique conflict
+
+Reports statements per fork, wall time and forks that failed with a unique
+violation (the probe strategy has no retry, so it loses races).
+
+Usage:
+    python scripts/benchmark-slug-allocation.py [--existing 200] [--forks 200] [--concurrency 10]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from sqlalchemy import Column, String, event, select
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gameforge.services.project_slugs import assign_unique_slug, slugify  # noqa: E402
+
+BenchBase = declarative_base()
+
+FORK_NAME = "My Game (Fork)"
+
+
+class BenchProject(BenchBase):
+    __tablename__ = "projects"
+
+    id = Column(String, primary_key=True)
+    name = Column(String, nullable=False)
+    slug = Column(String, nullable=False, unique=True)
+
+
+async def probe_fork(db) -> None:
+    """The previous generate_unique_slug loop: one SELECT per candidate."""
+    base_slug = slugify(FORK_NAME)
+    counter = 0
+    slug = base_slug
+    while True:
+        result = await db.execute(select(BenchProject).where(BenchProject.slug == slug))
+        if not result.scalar_one_or_none():
+            break
+        counter += 1
+        slug = f"{base_slug}-{counter}"
+
+    db.add(BenchProject(id=str(uuid.uuid4()), name=FORK_NAME, slug=slug))
+    await db.commit()
+
+
+async def allocator_fork(db) -> None:
+    project = BenchProject(id=str(uuid.uuid4()), name=FORK_NAME)
+    await assign_unique_slug(db, project, FORK_NAME)
+    await db.commit()
+
+
+async def run_strategy(name, fork, existing: int, forks: int, concurrency: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), f"{name}.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", connect_args={"timeout": 30})
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count_statement(*args):
+        nonlocal statements
+        statements += 1
+
+    async with engine.begin() as conn:
+        await conn.run_sync(BenchBase.metadata.create_all)
+
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    base_slug = slugify(FORK_NAME)
+    async with sessions() as db:
+        db.add_all(
+            BenchProject(
+                id=str(uuid.uuid4()),
+                name=FORK_NAME,
+                slug=base_slug if i == 0 else f"{base_slug}-{i}"
+            )
+            for i in range(existing)
+        )
+        await db.commit()
+
+    statements = 0
+    failures = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_fork():
+        nonlocal failures
+        async with semaphore:
+            async with sessions() as db:
+                try:
+                    await fork(db)
+                except (IntegrityError, OperationalError):
+                    failures += 1
+                    await db.rollback()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_fork() for _ in range(forks)))
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+
+    print(f"{name:>10} {statements / forks:>14.1f} {elapsed * 1000:>10.0f} "
+          f"{(forks - failures) / elapsed:>10.0f} {failures:>9}")
+
+
+async def run(existing: int, forks: int, concurrency: int) -> None:
+    print(f"existing forks: {existing}  new forks: {forks}  concurrency: {concurrency}")
+    print(f"{'strategy':>10} {'stmts/fork':>14} {'total ms':>10} {'forks/s':>10} {'failed':>9}")
+    await run_strategy("probe", probe_fork, existing, forks, concurrency)
+    await run_strategy("allocator", allocator_fork, existing, forks, concurrency)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Slug allocation fork-storm benchmark")
+    parser.add_argument("--existing", type=int, default=200)
+    parser.add_argument("--forks", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.existing, args.forks, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+========================================================================
+GameForge AI - Canary Traffic Routing Benchmark
+Routing decisions per second: per-request Redis walk vs cached alias table
+========================================================================
+
+Runs TrafficRouter against an in-process stand-in for Redis that charges a
+fixed round-trip delay per command, and compares:
+
+    walk:    the previous route_request, HGETALL on every request followed by
+             a cumulative-weight walk (reproduced below)
+    alias:   TrafficRouter.route, local alias table, random draw
+    sticky:  TrafficRouter.route with a routing key (blake2b + bisect)
+
+The cached paths revalidate once per `--ttl` seconds, so their Redis cost is
+amortised over every decision in between.
+
+Usage:
+    python scripts/benchmark-traffic-routing.py [--decisions 200000] [--rtt-ms 0.3] [--versions 4]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "ml-platform" / "deployments"))
+
+from traffic_router import SPLIT_KEY, VERSION_KEY, TrafficRouter  # noqa: E402
+
+
+class DelayedRedis:
+    """Dict-backed GET/HGETALL/pipeline with a simulated network round trip."""
+
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.strings = {}
+        self.hashes = {}
+        self.round_trips = 0
+
+    async def _round_trip(self):
+        self.round_trips += 1
+        await asyncio.sleep(self.rtt)
+
+    async def get(self, key):
+        await self._round_trip()
+        return self.strings.get(key)
+
+    async def hgetall(self, key):
+        await self._round_trip()
+        return dict(self.hashes.get(key, {}))
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipeline:
+            def __init__(self):
+                self.keys = []
+
+            def get(self, key):
+                self.keys.append(("get", key))
+
+            def hgetall(self, key):
+                self.keys.append(("hgetall", key))
+
+            async def execute(self):
+                await redis._round_trip()
+                return [redis.strings.get(k) if op == "get" else dict(redis.hashes.get(k, {})) for op, k in self.keys]
+
+        return Pipeline()
+
+
+async def route_walk(redis, model_name: str) -> str:
+    """route_request before the local cache."""
+    weights = {k.decode(): int(v) for k, v in (await redis.hgetall(SPLIT_KEY.format(model=model_name))).items()}
+    total_weight = sum(weights.values())
+    if total_weight == 0:
+        return "current"
+    rand_val = random.random() * total_weight
+    cumulative_weight = 0
+    for version, weight in weights.items():
+        cumulative_weight += weight
+        if rand_val <= cumulative_weight:
+            return version
+    return "current"
+
+
+async def measure(name: str, route, decisions: int, redis: DelayedRedis) -> float:
+    redis.round_trips = 0
+    started = time.perf_counter()
+    for i in range(decisions):
+        await route(i)
+    elapsed = time.perf_counter() - started
+
+    rate = decisions / elapsed
+    print(f"{name:>7} {elapsed * 1e6 / decisions:>12.2f} {rate:>14.0f} {redis.round_trips:>12}")
+    return rate
+
+
+async def run(decisions: int, rtt_ms: float, versions: int, ttl: float) -> None:
+    redis = DelayedRedis(rtt_ms / 1000)
+    weights = {f"v{i}": random.randint(1, 100) for i in range(versions)}
+    redis.hashes[SPLIT_KEY.format(model="bench")] = {k.encode(): str(v).encode() for k, v in weights.items()}
+    redis.strings[VERSION_KEY.format(model="bench")] = b"1"
+    router = TrafficRouter(redis, ttl=ttl)
+    keys = [f"user-{i}" for i in range(10000)]
+
+    print(f"decisions: {decisions}  rtt: {rtt_ms}ms  versions: {versions}  ttl: {ttl}s")
+    print(f"{'path':>7} {'us/decision':>12} {'decisions/s':>14} {'round trips':>12}")
+    # The per-request walk is bounded by the round trip; a slice is enough to measure it
+    walk_rate = await measure("walk", lambda i: route_walk(redis, "bench"), max(decisions // 100, 100), redis)
+    alias_rate = await measure("alias", lambda i: router.route("bench"), decisions, redis)
+    sticky_rate = await measure("sticky", lambda i: router.route("bench", keys[i % len(keys)]), decisions, redis)
+    print(f"speedup: alias {alias_rate / walk_rate:.0f}x  sticky {sticky_rate / walk_rate:.0f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Canary traffic routing benchmark")
+    parser.add_argument("--decisions", type=int, default=200000)
+    parser.add_argument("--rtt-ms", type=float, default=0.3)
+    parser.add_argument("--versions", type=int, default=4)
+    parser.add_argument("--ttl", type=float, default=2.0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.decisions, args.rtt_ms, args.versions, args.ttl))
+
+
+if __name__ == "__main__":
+    main()
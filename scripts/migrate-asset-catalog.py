@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+========================================================================
+GameForge AI - Asset Catalog Migration
+Imports the legacy JSON project storage into the asset catalog tables
+========================================================================
+
+Reads the layout written by ProjectStorage:
+
+    <data-dir>/projects/<user_id>/default.json   one project document per user
+    <data-dir>/assets/<user_id>/<asset_id>.json  one AssetRecord per asset
+
+and bulk-loads it into asset_catalog_projects / asset_catalog. Asset files
+are streamed in batches, and ids that already exist are skipped, so the
+script can be re-run after a partial import or while the old store is
+still receiving writes.
+
+Usage:
+    python scripts/migrate-asset-catalog.py --data-dir ./data
+    python scripts/migrate-asset-catalog.py --data-dir ./data \\
+        --database-url sqlite+aiosqlite:///./data/asset_catalog.db
+    python scripts/migrate-asset-catalog.py --data-dir ./data --dry-run
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gameforge.services.asset_catalog import AssetCatalog, AssetRecord  # noqa: E402
+
+
+def iter_projects(data_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Yield legacy project documents (without their embedded asset lists)."""
+    for project_file in sorted((data_dir / "projects").glob("*/*.json")):
+        try:
+            project = json.loads(project_file.read_text())
+        except (OSError, ValueError) as e:
+            print(f"Skipping unreadable project {project_file}: {e}")
+            continue
+        project.pop("assets", None)
+        project.setdefault("user_id", project_file.parent.name)
+        project["slug"] = project_file.stem
+        yield project
+
+
+def iter_assets(data_dir: Path, stats: Dict[str, int]) -> Iterator[AssetRecord]:
+    """Yield legacy asset records one file at a time."""
+    for asset_file in (data_dir / "assets").glob("*/*.json"):
+        try:
+            yield AssetRecord(**json.loads(asset_file.read_text()))
+        except Exception as e:
+            stats["unreadable"] += 1
+            print(f"Skipping unreadable asset {asset_file}: {e}")
+
+
+async def migrate(data_dir: Path, database_url: str, batch_size: int, dry_run: bool) -> None:
+    stats = {"unreadable": 0}
+
+    if dry_run:
+        projects = sum(1 for _ in iter_projects(data_dir))
+        assets = sum(1 for _ in iter_assets(data_dir, stats))
+        print(f"Would import {projects} projects and {assets} assets "
+              f"({stats['unreadable']} unreadable files)")
+        return
+
+    catalog = AssetCatalog.from_url(database_url) if database_url else AssetCatalog()
+    try:
+        counts = await catalog.import_records(
+            iter_projects(data_dir),
+            iter_assets(data_dir, stats),
+            batch_size=batch_size
+        )
+    finally:
+        await catalog.close()
+
+    print(f"Imported {counts['projects']} projects and {counts['assets']} assets; "
+          f"{counts['skipped']} already present, {stats['unreadable']} unreadable")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate JSON project storage to the asset catalog")
+    parser.add_argument("--data-dir", default="./data", type=Path)
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("ASSET_CATALOG_DATABASE_URL"),
+        help="Target database (default: ASSET_CATALOG_DATABASE_URL, else the application database)"
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(migrate(args.data_dir, args.database_url, args.batch_size, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
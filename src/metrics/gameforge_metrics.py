@@ -1,11 +1,22 @@
 # ========================================================================
 # GameForge Application Metrics Implementation
 # Prometheus metrics endpoints for custom services
+#
+# Under gunicorn, gunicorn.conf.py sets PROMETHEUS_MULTIPROC_DIR before the
+# app is imported, so every worker writes its samples to mmap files there
+# and a scrape of any worker aggregates all of them. The collection thread
+# is started per worker after fork (start_collection), and host-level
+# GPU/system gauges are sampled by one worker per host at a time, elected
+# with a flock on a file in the multiprocess directory.
 # ========================================================================
 
+import fcntl
+import os
 import time
 import psutil
-from prometheus_client import Counter, Histogram, Gauge, Info, generate_latest
+from prometheus_client import (
+    CollectorRegistry, Counter, Histogram, Gauge, generate_latest, multiprocess
+)
 import threading
 from functools import wraps
 
@@ -21,18 +32,13 @@ class GameForgeMetrics:
     """Production metrics collection for GameForge AI platform"""
     
     def __init__(self):
-        # Initialize NVIDIA ML
-        if NVIDIA_AVAILABLE:
-            try:
-                nvml.nvmlInit()
-                self.gpu_available = True
-                self.gpu_count = nvml.nvmlDeviceGetCount()
-            except Exception:
-                self.gpu_available = False
-                self.gpu_count = 0
-        else:
-            self.gpu_available = False
-            self.gpu_count = 0
+        # NVML is initialized lazily in the process that samples GPUs;
+        # handles created before a fork are not usable in the children
+        self.gpu_available = False
+        self.gpu_count = 0
+        self._nvml_pid = None
+        self._collector_pid = None
+        self._host_lock = None
         
         # Application Metrics
         self.http_requests_total = Counter(
@@ -61,29 +67,41 @@ class GameForgeMetrics:
             buckets=[1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0]
         )
         
+        # Per-request latency breakdown (see gameforge.core.request_timing)
+        self.request_phase_duration = Histogram(
+            'gameforge_request_phase_duration_seconds',
+            'Time spent in each phase of an HTTP request',
+            ['phase'],
+            buckets=[0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0]
+        )
+        
         # GPU Metrics
         self.gpu_utilization = Gauge(
             'gameforge_gpu_utilization_percent',
             'GPU utilization percentage',
-            ['gpu_id', 'gpu_name']
+            ['gpu_id', 'gpu_name'],
+            multiprocess_mode='livemostrecent'
         )
         
         self.gpu_memory_used = Gauge(
             'gameforge_gpu_memory_used_bytes',
             'GPU memory used in bytes',
-            ['gpu_id', 'gpu_name']
+            ['gpu_id', 'gpu_name'],
+            multiprocess_mode='livemostrecent'
         )
         
         self.gpu_memory_total = Gauge(
             'gameforge_gpu_memory_total_bytes',
             'GPU memory total in bytes',
-            ['gpu_id', 'gpu_name']
+            ['gpu_id', 'gpu_name'],
+            multiprocess_mode='livemostrecent'
         )
         
         self.gpu_temperature = Gauge(
             'gameforge_gpu_temperature_celsius',
             'GPU temperature in Celsius',
-            ['gpu_id', 'gpu_name']
+            ['gpu_id', 'gpu_name'],
+            multiprocess_mode='livemostrecent'
         )
         
         # Model Storage Metrics
@@ -106,7 +124,8 @@ class GameForgeMetrics:
         self.model_storage_size = Gauge(
             'gameforge_model_storage_bytes',
             'Model storage size in bytes',
-            ['model']
+            ['model'],
+            multiprocess_mode='mostrecent'
         )
         
         # Security Metrics
@@ -126,40 +145,76 @@ class GameForgeMetrics:
         self.worker_queue_size = Gauge(
             'gameforge_worker_queue_size',
             'Worker queue size',
-            ['queue_name']
+            ['queue_name'],
+            multiprocess_mode='mostrecent'
         )
         
         self.active_connections = Gauge(
             'gameforge_active_connections',
-            'Active connections'
+            'Active connections',
+            multiprocess_mode='livesum'
         )
         
-        # Application Info
-        self.app_info = Info(
+        # Application Info (a gauge set to 1: Info is not multiprocess-safe)
+        self.app_info = Gauge(
             'gameforge_app_info',
-            'Application information'
+            'Application information',
+            ['version', 'environment', 'deployment', 'cpu_cores', 'memory_total', 'gpu_count'],
+            multiprocess_mode='livemax'
         )
-        
-        # Start background metrics collection
-        self._start_background_collection()
     
-    def _start_background_collection(self):
-        """Start background thread for continuous metrics collection"""
+    def start_collection(self):
+        """
+        Start the background collection thread in this process.
+        
+        Call it after fork (worker startup), never in a preloading master:
+        a thread does not survive fork and the lock state it leaves behind
+        is undefined in the children. Calling it again in the same process
+        is a no-op.
+        """
+        if self._collector_pid == os.getpid():
+            return
+        self._collector_pid = os.getpid()
+        self._host_lock = None
+        
         def collect_metrics():
             while True:
                 try:
-                    self._collect_gpu_metrics()
-                    self._collect_system_metrics()
+                    if self._is_host_collector():
+                        self._collect_gpu_metrics()
+                        self._collect_system_metrics()
                     time.sleep(5)  # Collect every 5 seconds
                 except Exception as e:
                     print(f"Error in metrics collection: {e}")
                     time.sleep(10)
         
-        thread = threading.Thread(target=collect_metrics, daemon=True)
+        thread = threading.Thread(target=collect_metrics, name="gameforge-metrics", daemon=True)
         thread.start()
     
+    def _is_host_collector(self):
+        """Whether this process samples host gauges (one process per host)"""
+        if self._host_lock is None:
+            self._host_lock = acquire_host_lock(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+        return self._host_lock is not None
+    
+    def _init_nvml(self):
+        """Initialize NVML once in the current process"""
+        if self._nvml_pid == os.getpid():
+            return
+        self._nvml_pid = os.getpid()
+        self.gpu_available = False
+        self.gpu_count = 0
+        if NVIDIA_AVAILABLE:
+            try:
+                nvml.nvmlInit()
+                self.gpu_available = True
+                self.gpu_count = nvml.nvmlDeviceGetCount()
+            except Exception:
+                pass
+    
     def _collect_gpu_metrics(self):
         """Collect GPU metrics using nvidia-ml-py"""
+        self._init_nvml()
         if not self.gpu_available:
             return
         
@@ -197,14 +252,14 @@ class GameForgeMetrics:
             memory = psutil.virtual_memory()
             
             # Update application info
-            self.app_info.info({
-                'version': '1.0.0',
-                'environment': 'production',
-                'deployment': 'vastai',
-                'cpu_cores': str(psutil.cpu_count()),
-                'memory_total': str(memory.total),
-                'gpu_count': str(self.gpu_count)
-            })
+            self.app_info.labels(
+                version='1.0.0',
+                environment='production',
+                deployment='vastai',
+                cpu_cores=str(psutil.cpu_count()),
+                memory_total=str(memory.total),
+                gpu_count=str(self.gpu_count)
+            ).set(1)
             
         except Exception as e:
             print(f"Error collecting system metrics: {e}")
@@ -271,7 +326,37 @@ class GameForgeMetrics:
         """Record model cache miss"""
         self.model_cache_misses.inc()
 
-# Global metrics instance
+def acquire_host_lock(lock_dir):
+    """
+    Try to become this host's collector for host-level gauges.
+    
+    Returns the locked file (keep it open to hold the lock), True without a
+    multiprocess directory (single process), or None when another process
+    holds it. The kernel releases the lock when its holder exits, and
+    another worker takes over on its next pass.
+    """
+    if not lock_dir:
+        return True
+    lock_file = open(os.path.join(lock_dir, 'host-collector.lock'), 'a')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+def metrics_registry():
+    """Registry to expose: every worker's samples in multiprocess mode"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    from prometheus_client import REGISTRY
+    return REGISTRY
+
+
+# Global metrics instance (collection starts in start_collection)
 metrics = GameForgeMetrics()
 
 # Flask app for metrics endpoint (only create if running standalone)
@@ -283,7 +368,7 @@ def create_metrics_app():
     @app.route('/metrics')
     def prometheus_metrics():
         """Prometheus metrics endpoint"""
-        return Response(generate_latest(), mimetype='text/plain')
+        return Response(generate_latest(metrics_registry()), mimetype='text/plain')
 
     @app.route('/health')
     def health_check():
@@ -293,6 +378,7 @@ def create_metrics_app():
     @app.route('/metrics/gpu')
     def gpu_metrics():
         """GPU-specific metrics endpoint"""
+        metrics._init_nvml()
         gpu_data = {}
         if metrics.gpu_available:
             for i in range(metrics.gpu_count):
@@ -318,8 +404,8 @@ def create_metrics_app():
 
 # Metrics endpoint functions for FastAPI integration
 def get_prometheus_metrics():
-    """Get Prometheus metrics as string"""
-    return generate_latest()
+    """Get Prometheus metrics as string (aggregated across workers)"""
+    return generate_latest(metrics_registry())
 
 def get_health_status():
     """Get health check status"""
@@ -327,6 +413,7 @@ def get_health_status():
 
 def get_gpu_metrics():
     """Get GPU metrics data"""
+    metrics._init_nvml()
     gpu_data = {}
     if metrics.gpu_available:
         for i in range(metrics.gpu_count):
@@ -350,5 +437,6 @@ def get_gpu_metrics():
 
 if __name__ == '__main__':
     # Run standalone metrics server
+    metrics.start_collection()
     app = create_metrics_app()
     app.run(host='0.0.0.0', port=8080, debug=False)
\ No newline at end of file
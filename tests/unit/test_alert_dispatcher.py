@@ -0,0 +1,135 @@
+"""
+Unit tests for the AlertManager webhook dispatcher
+"""
+
+import os
+import sys
+from typing import Dict, List
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from pydantic import BaseModel
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "monitoring", "notifications"))
+
+from alert_dispatcher import AlertDispatcher, Channel  # noqa: E402
+
+
+class Alert(BaseModel):
+    status: str
+    labels: Dict[str, str]
+    fingerprint: str
+
+
+class Webhook(BaseModel):
+    status: str
+    alerts: List[Alert]
+    groupLabels: Dict[str, str]
+    commonLabels: Dict[str, str]
+    groupKey: str
+
+
+def webhook(*fingerprints: str, alertname: str = "HighCPU") -> Webhook:
+    return Webhook(
+        status="firing",
+        alerts=[
+            Alert(status="firing", labels={"alertname": alertname, "env": "prod"}, fingerprint=f)
+            for f in fingerprints
+        ],
+        groupLabels={"alertname": alertname},
+        commonLabels={"alertname": alertname, "env": "prod"},
+        groupKey=alertname
+    )
+
+
+def to_body(payload: Webhook) -> Dict:
+    return {
+        "title": payload.groupLabels["alertname"],
+        "fingerprints": [alert.fingerprint for alert in payload.alerts]
+    }
+
+
+@pytest_asyncio.fixture
+async def stub():
+    """Local webhook receiver; `responses` are served in order, then 200."""
+    received, responses = [], []
+
+    async def handler(request):
+        received.append(await request.json())
+        status, headers = responses.pop(0) if responses else (200, {})
+        return web.Response(status=status, headers=headers)
+
+    app = web.Application()
+    app.router.add_post("/hook", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    yield f"http://127.0.0.1:{port}/hook", received, responses
+    await runner.cleanup()
+
+
+class TestAlertDispatcher:
+    """Test suite for AlertDispatcher"""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_post_is_retried_after_retry_after(self, stub):
+        """Test that a 429 pauses the channel for Retry-After and then succeeds"""
+        url, received, responses = stub
+        responses.append((429, {"Retry-After": "0.2"}))
+        results = []
+        dispatcher = AlertDispatcher(
+            digest_window=0, backoff_base=0.01,
+            on_result=lambda channel, status, duration: results.append((status, duration))
+        )
+        dispatcher.register(Channel("slack", url, to_body, success_statuses=(200,), rate=100, burst=5))
+
+        await dispatcher.dispatch("slack", webhook("a1"))
+        await dispatcher.close()
+
+        assert len(received) == 2
+        assert results[0][0] == "success" and results[0][1] >= 0.2
+        assert dispatcher.stats["rate_limited"] == 1
+        assert dispatcher.stats["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_storm_is_deduplicated_and_digested(self, stub):
+        """Test that repeated fingerprints are dropped and payloads merge into one post"""
+        url, received, _ = stub
+        dispatcher = AlertDispatcher(digest_window=60)
+        dispatcher.register(Channel("slack", url, to_body, rate=100, burst=5))
+
+        await dispatcher.dispatch("slack", webhook("a1", "a2"))
+        await dispatcher.dispatch("slack", webhook("a2", "a3"))
+        await dispatcher.dispatch("slack", webhook("b1", alertname="DiskFull"))
+        await dispatcher.dispatch("slack", webhook("a1"))
+        assert received == []
+
+        await dispatcher.close()
+
+        assert len(received) == 1
+        assert received[0]["fingerprints"] == ["a1", "a2", "a3", "b1"]
+        assert received[0]["title"] == "4 alerts from 2 rules"
+        assert dispatcher.stats["duplicates_dropped"] == 2
+        assert dispatcher.stats["payloads_digested"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_does_not_block_resend(self, stub):
+        """Test that an alert whose delivery failed is sent again when re-sent"""
+        url, received, responses = stub
+        responses.extend([(500, {})] * 2)
+        dispatcher = AlertDispatcher(digest_window=0, retry_attempts=1, backoff_base=0.01)
+        dispatcher.register(Channel("slack", url, to_body, success_statuses=(200,), rate=100, burst=5))
+
+        await dispatcher.dispatch("slack", webhook("a1"))
+        assert dispatcher.stats["failures"] == 1
+
+        await dispatcher.dispatch("slack", webhook("a1"))
+        await dispatcher.close()
+
+        assert len(received) == 3
+        assert dispatcher.stats["duplicates_dropped"] == 0
+        assert dispatcher.stats["failures"] == 1
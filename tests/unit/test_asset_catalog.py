@@ -0,0 +1,97 @@
+"""
+Unit tests for the asset catalog
+
+Runs the catalog in SQLite mode to test saving, filtered
+keyset listing and idempotent imports of legacy records.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+from gameforge.services.asset_catalog import AssetCatalog, AssetRecord
+
+
+@pytest_asyncio.fixture
+async def catalog(tmp_path):
+    catalog = AssetCatalog.from_url(f"sqlite+aiosqlite:///{tmp_path / 'catalog.db'}")
+    yield catalog
+    await catalog.close()
+
+
+def job(job_id: str, category: str, style: str) -> dict:
+    return {
+        "id": job_id,
+        "metadata": {"prompt": "ancient elven sword", "category": category, "style": style}
+    }
+
+
+class TestAssetCatalog:
+    """Test suite for the database-backed asset catalog"""
+
+    @pytest.mark.asyncio
+    async def test_save_and_filter_case_insensitive(self, catalog):
+        """Test that assets land in one default project and filter by category/style"""
+        first = await catalog.save_asset_to_project("user_1", "https://cdn/a.png", job("j1", "Weapon", "Fantasy"))
+        second = await catalog.save_asset_to_project("user_1", "https://cdn/b.png", job("j2", "ui", "pixel"))
+        await catalog.save_asset_to_project("user_2", "https://cdn/c.png", job("j3", "weapon", "fantasy"))
+
+        weapons = await catalog.list_assets("user_1", category="WEAPON")
+        pixel = await catalog.list_assets("user_1", style="Pixel")
+
+        assert [a.id for a in weapons.items] == [first.id]
+        assert first.category == "Weapon"
+        assert weapons.items[0].category == "Weapon"
+        assert [a.id for a in pixel.items] == [second.id]
+        assert first.type == "art" and second.type == "ui"
+        assert await catalog.get_asset("user_2", first.id) is None
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages_and_idempotent_import(self, catalog):
+        """Test cursor pagination over imported records and re-import skipping"""
+        start = datetime(2025, 1, 1)
+        records = [
+            AssetRecord(
+                id=f"asset_{i:04d}",
+                name=f"Asset {i}",
+                type="art",
+                category="texture",
+                file_path=f"https://cdn/{i}.png",
+                created_at=start + timedelta(minutes=i),
+                user_id="user_1",
+                job_id=f"job_{i}",
+                metadata={"style": "realistic"}
+            )
+            for i in range(25)
+        ]
+        projects = [{"id": "proj_legacy", "user_id": "user_1", "name": "My AI Assets"}]
+
+        counts = await catalog.import_records(projects, records, batch_size=10)
+        again = await catalog.import_records(projects, records, batch_size=10)
+
+        seen = []
+        cursor = None
+        while True:
+            page = await catalog.list_assets("user_1", style="realistic", limit=10, cursor=cursor)
+            seen.extend(a.id for a in page.items)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+
+        assert counts == {"projects": 1, "assets": 25, "skipped": 0}
+        assert again == {"projects": 0, "assets": 0, "skipped": 25}
+        assert seen == [r.id for r in reversed(records)]
+        assert await catalog.get_or_create_default_project("user_1") == "proj_legacy"
+
+    @pytest.mark.asyncio
+    async def test_default_project_cache_is_bounded(self, catalog):
+        """Test that evicted users get their existing default project back"""
+        catalog.max_cached_projects = 2
+        first = await catalog.get_or_create_default_project("user_1")
+        await catalog.get_or_create_default_project("user_2")
+        await catalog.get_or_create_default_project("user_3")
+
+        assert list(catalog._default_projects) == ["user_2", "user_3"]
+        assert await catalog.get_or_create_default_project("user_1") == first
+        assert len(catalog._default_projects) == 2
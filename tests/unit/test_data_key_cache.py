@@ -0,0 +1,102 @@
+"""
+Unit tests for the data-key cache
+
+Tests key reuse limits, decryption caching and single-flight
+provider calls using the local stand-in key provider.
+"""
+
+import asyncio
+import functools
+import json
+from unittest.mock import patch
+
+import pytest
+
+from gameforge.core.data_key_cache import DataKeyCache, LocalKeyProvider
+from gameforge.core.storage_security import (
+    EncryptionProvider,
+    StorageSecurityManager,
+    StorageTier
+)
+
+
+class TestDataKeyCache:
+    """Test suite for data-key caching"""
+
+    @pytest.mark.asyncio
+    async def test_encryption_key_reused_until_asset_limit(self):
+        """Test that a key is reused for max_messages_per_key assets, then replaced"""
+        provider = LocalKeyProvider()
+        cache = DataKeyCache(max_messages_per_key=3)
+
+        keys = [
+            await cache.get_encryption_key("kms:hot", provider.generate_data_key)
+            for _ in range(4)
+        ]
+
+        assert keys[0] is keys[1] is keys[2]
+        assert keys[3] is not keys[0]
+        assert provider.generate_calls == 2
+        assert cache.stats["provider_calls_saved"] == 2
+
+    @pytest.mark.asyncio
+    async def test_encryption_key_retired_by_age_and_bytes(self):
+        """Test that keys past max age or max bytes are not handed out again"""
+        provider = LocalKeyProvider()
+        cache = DataKeyCache(max_age_seconds=60, max_bytes_per_key=100)
+
+        with patch("gameforge.core.data_key_cache.time.monotonic", return_value=1000.0):
+            first = await cache.get_encryption_key("kms:hot", provider.generate_data_key)
+        cache.record_usage(first, 100)
+        with patch("gameforge.core.data_key_cache.time.monotonic", return_value=1001.0):
+            second = await cache.get_encryption_key("kms:hot", provider.generate_data_key)
+        with patch("gameforge.core.data_key_cache.time.monotonic", return_value=1061.0):
+            third = await cache.get_encryption_key("kms:hot", provider.generate_data_key)
+
+        assert len({id(first), id(second), id(third)}) == 3
+        assert cache.stats["retired_keys"] == 2
+
+    @pytest.mark.asyncio
+    async def test_decryption_unwraps_once_per_wrapped_key(self):
+        """Test that concurrent and repeated reads share one unwrap call"""
+        writer = LocalKeyProvider(master_key=b"k" * 32)
+        reader = LocalKeyProvider(master_key=b"k" * 32, latency_seconds=0.01)
+        cache = DataKeyCache()
+        key = await writer.generate_data_key()
+
+        unwrap = functools.partial(reader.decrypt_data_key, key.wrapped, key.metadata)
+        results = await asyncio.gather(
+            *(cache.get_decryption_key(key.wrapped, unwrap) for _ in range(10))
+        )
+        results.append(await cache.get_decryption_key(key.wrapped, unwrap))
+
+        assert all(result == key.plaintext for result in results)
+        assert reader.decrypt_calls == 1
+        assert cache.stats["provider_calls_saved"] == 10
+
+    @pytest.mark.asyncio
+    async def test_fallback_wrapped_key_not_cached_for_kms_partition(self, monkeypatch, tmp_path):
+        """Test that a key wrapped by the local fallback is used once, not cached as a KMS key"""
+        monkeypatch.setenv("LOCAL_ENCRYPTION_KEY_PATH", str(tmp_path / "encryption.key"))
+        manager = StorageSecurityManager()
+        config = manager.storage_configs[StorageTier.HOT]
+        config.encryption_provider = EncryptionProvider.AWS_KMS
+        kms_calls = []
+
+        async def encrypt_aws_kms(data, key_id):
+            kms_calls.append(key_id)
+            if len(kms_calls) == 1:
+                raise ConnectionError("KMS unavailable")
+            return b"kms:" + data, json.dumps({"encryption_type": "aws_kms"})
+
+        monkeypatch.setattr(manager, "_encrypt_aws_kms", encrypt_aws_kms)
+
+        fallback = await manager._get_data_key(config)
+        first = await manager._get_data_key(config)
+        second = await manager._get_data_key(config)
+
+        assert fallback.provider == EncryptionProvider.LOCAL_FERNET.value
+        assert first.provider == EncryptionProvider.AWS_KMS.value
+        assert first is second is not fallback
+        assert len(kms_calls) == 2
+        assert manager.data_key_cache.stats["uncached_keys"] == 1
@@ -0,0 +1,79 @@
+"""
+Unit tests for streaming envelope encryption
+
+Tests frame round-trips, ranged decryption of individual
+frames and rejection of tampered or truncated streams.
+"""
+
+import os
+
+import pytest
+
+from gameforge.core.envelope_encryption import (
+    EnvelopeDecryptionError, StreamDecryptor, StreamEncryptor,
+    encrypted_size, frame_count, frame_range, generate_data_key
+)
+
+
+def encrypt(data: bytes, key: bytes, chunk_size: int, feed: int = 7):
+    """Encrypt data fed in small, unaligned pieces."""
+    encryptor = StreamEncryptor(key, chunk_size)
+    out = b"".join(encryptor.update(data[i:i + feed]) for i in range(0, len(data), feed))
+    return out + encryptor.finalize(), encryptor
+
+
+def decrypt(blob: bytes, key: bytes, **kwargs) -> bytes:
+    decryptor = StreamDecryptor(key, **kwargs)
+    out = b"".join(b"".join(decryptor.update(blob[i:i + 5])) for i in range(0, len(blob), 5))
+    return out + b"".join(decryptor.finalize())
+
+
+class TestEnvelopeEncryption:
+    """Test suite for the framed AES-GCM stream format"""
+
+    @pytest.mark.parametrize("size", [0, 1, 63, 64, 65, 640])
+    def test_round_trip(self, size):
+        """Test that any plaintext size survives encryption and decryption"""
+        key = generate_data_key()
+        data = os.urandom(size)
+        blob, encryptor = encrypt(data, key, chunk_size=64)
+
+        assert len(blob) == encrypted_size(size, 64)
+        assert encryptor.plaintext_size == size
+        assert decrypt(blob, key) == data
+
+    def test_ranged_read_decrypts_only_covering_frames(self):
+        """Test that a byte range maps to whole frames and decrypts alone"""
+        key = generate_data_key()
+        data = os.urandom(1000)
+        blob, encryptor = encrypt(data, key, chunk_size=64)
+
+        first, last, enc_start, enc_end = frame_range(len(data), 64, 100, 700)
+        plaintext = decrypt(
+            blob[enc_start:enc_end + 1], key,
+            header=encryptor.header,
+            first_frame=first,
+            last_frame=last,
+            total_frames=frame_count(len(data), 64)
+        )
+
+        assert plaintext == data[first * 64:(last + 1) * 64]
+
+    def test_tampered_frame_is_rejected(self):
+        """Test that flipping a ciphertext bit fails authentication"""
+        key = generate_data_key()
+        blob, _ = encrypt(os.urandom(200), key, chunk_size=64)
+        tampered = bytearray(blob)
+        tampered[40] ^= 0x01
+
+        with pytest.raises(EnvelopeDecryptionError):
+            decrypt(bytes(tampered), key)
+
+    def test_truncated_stream_is_rejected(self):
+        """Test that dropping the final frame is detected"""
+        key = generate_data_key()
+        blob, encryptor = encrypt(os.urandom(200), key, chunk_size=64)
+        truncated = blob[:len(blob) - (200 - 3 * 64) - 16]
+
+        with pytest.raises(EnvelopeDecryptionError):
+            decrypt(truncated, key)
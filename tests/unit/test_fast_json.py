@@ -0,0 +1,56 @@
+"""
+Unit tests for the fast-path list serializer
+"""
+
+import pytest
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from gameforge.core.fast_json import RowSerializer
+
+
+class Item(BaseModel):
+    id: str
+    title: str
+    summary: Optional[str]
+    tags: List[str]
+    count: int
+    source: str = "catalog"
+    created_at: datetime
+
+
+class TestRowSerializer:
+    """Test suite for RowSerializer"""
+
+    def test_output_matches_model_schema(self):
+        """Test that NULL columns still produce schema-valid dicts"""
+        serializer = RowSerializer(Item, {"title": "name"})
+        row = {
+            "id": "a1",
+            "name": "Sprite",
+            "summary": None,
+            "tags": None,
+            "count": None,
+            "source": None,
+            "created_at": datetime(2025, 1, 1)
+        }
+
+        result = serializer(row)
+
+        assert result == {
+            "id": "a1",
+            "title": "Sprite",
+            "summary": None,
+            "tags": [],
+            "count": 0,
+            "source": "catalog",
+            "created_at": datetime(2025, 1, 1)
+        }
+        assert Item.model_validate(result).model_dump() == result
+
+    def test_unknown_source_field_rejected(self):
+        """Test that the mapping is checked when the serializer is built"""
+        with pytest.raises(ValueError):
+            RowSerializer(Item, {"missing": "id"})
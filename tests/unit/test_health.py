@@ -0,0 +1,82 @@
+"""
+Unit tests for concurrent, cached health checks
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from gameforge.core.health import HealthChecker
+
+
+class SlowDatabase:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    async def health_check(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return True
+
+
+class SlowRedis:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def ping(self):
+        await asyncio.sleep(self.delay)
+        return True
+
+
+class TestHealthChecker:
+    """Test suite for HealthChecker"""
+
+    @pytest.mark.asyncio
+    async def test_checks_run_concurrently(self):
+        """Test that a run takes as long as the slowest check, not the sum"""
+        checker = HealthChecker(SlowDatabase(0.2), SlowRedis(0.2))
+
+        started = time.perf_counter()
+        result = await checker.detailed_health_check()
+
+        assert time.perf_counter() - started < 0.35
+        assert result["checks"]["database"]["status"] == "healthy"
+        assert result["checks"]["redis"]["duration_ms"] >= 200
+
+    @pytest.mark.asyncio
+    async def test_slow_check_times_out(self):
+        """Test that a hung dependency is reported unhealthy after the timeout"""
+        checker = HealthChecker(SlowDatabase(5), SlowRedis(0), check_timeout=0.05)
+
+        result = await checker.check_readiness()
+
+        assert result["ready"] is False
+        assert result["critical_services"] == {"database": "unhealthy", "redis": "healthy"}
+        assert checker.stats["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_probes_are_served_from_cache(self):
+        """Test that concurrent and repeated probes share one run"""
+        database = SlowDatabase(0.05)
+        checker = HealthChecker(database, SlowRedis(0), cache_ttl=60)
+
+        await asyncio.gather(*(checker.check_health() for _ in range(20)))
+        await checker.check_readiness()
+
+        assert database.calls == 1
+        assert checker.stats["runs"] == 1
+        assert checker.stats["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_background_refresh(self):
+        """Test that the refresher re-runs the checks without any probe"""
+        database = SlowDatabase(0)
+        checker = HealthChecker(database, SlowRedis(0), cache_ttl=0.1, refresh_interval=0.02)
+
+        await checker.start()
+        await asyncio.sleep(0.1)
+        await checker.stop()
+
+        assert database.calls >= 3
@@ -0,0 +1,53 @@
+"""
+Unit tests for the queued logging pipeline and event sampling
+"""
+
+import json
+import logging
+import queue
+
+from gameforge.core.logging_config import ELKFormatter, EventSampler, _LogQueueHandler
+
+
+class TestEventSampler:
+    """Test suite for EventSampler"""
+
+    def test_rate_cap_reports_dropped_events(self):
+        """Test that info events over the cap are dropped and counted on the next kept one"""
+        sampler = EventSampler(rate_limit=2)
+
+        kept = [sampler.sample("api_request_completed")[0] for _ in range(5)]
+
+        assert kept == [True, True, False, False, False]
+        assert sampler.sample("api_request_completed", "warning") == (True, 3)
+
+    def test_sample_rate_zero_drops_info_only(self):
+        """Test that sampled-out event types still log warnings and errors"""
+        sampler = EventSampler(sample_rates={"token_validated": 0.0})
+
+        assert sampler.sample("token_validated") == (False, 0)
+        assert sampler.sample("token_validated", "error") == (True, 1)
+        assert sampler.sample("login_success") == (True, 0)
+
+
+class TestQueuedLogging:
+    """Test suite for the queue handler and ELK formatter"""
+
+    def test_records_are_enqueued_unformatted_and_rendered_once(self):
+        """Test that structured fields reach the JSON line as top-level keys"""
+        log_queue = queue.Queue(maxsize=1)
+        handler = _LogQueueHandler(log_queue)
+        logger = logging.getLogger("gameforge.tests.queue")
+        record = logger.makeRecord(
+            logger.name, logging.INFO, __file__, 1, "user %s", ("u1",), None,
+            extra={"extra_fields": {"event_type": "login", "attempt": 2}}
+        )
+
+        handler.handle(record)
+        handler.handle(record)
+
+        queued = log_queue.get_nowait()
+        line = json.loads(ELKFormatter().format(queued))
+        assert handler.dropped == 1
+        assert line["message"] == "user u1"
+        assert line["event_type"] == "login" and line["attempt"] == 2
@@ -0,0 +1,135 @@
+"""
+Unit tests for the project membership cache
+
+Tests grants, revocations, owner transfer, missing projects, the negative
+TTL and the generation fence against a small in-memory Redis stand-in.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from gameforge.services import membership_cache as membership_module
+from gameforge.services.membership_cache import CachedMembership, ProjectMembershipCache
+
+
+class FakeRedis:
+    """Strings, hashes and the store script, on plain dicts (bytes responses)."""
+
+    def __init__(self):
+        self.strings, self.hashes, self.ttls = {}, {}, {}
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def hmget(self, key, *fields):
+        values = self.hashes.get(key, {})
+        return [values.get(field) for field in fields]
+
+    async def eval(self, script, numkeys, *args):
+        assert script == membership_module._STORE_IF_GENERATION
+        (members_key, generation_key), (expected, ttl, *fields) = args[:numkeys], args[numkeys:]
+        if (self.strings.get(generation_key) or b"").decode() != expected:
+            return 0
+        self.hashes[members_key] = {
+            fields[i]: str(fields[i + 1]).encode() for i in range(0, len(fields), 2)
+        }
+        self.ttls[members_key] = ttl
+        return 1
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+
+    async def execute(self):
+        for name, args in self.calls:
+            if name == "incr":
+                value = int(self.redis.strings.get(args[0], b"0")) + 1
+                self.redis.strings[args[0]] = str(value).encode()
+            elif name == "delete":
+                self.redis.hashes.pop(args[0], None)
+
+
+async def load(cache, project_id, owner_id, members):
+    """Mimic ProjectAccessResolver._load_membership around a membership query."""
+    generation = await cache.generation(project_id)
+    return await cache.store(project_id, owner_id, members, generation)
+
+
+class TestProjectMembershipCache:
+    """Test suite for ProjectMembershipCache"""
+
+    @pytest.mark.asyncio
+    async def test_cached_set_answers_owner_member_and_denial(self):
+        """Test that one cached set resolves owners, collaborators and outsiders"""
+        cache = ProjectMembershipCache(FakeRedis())
+        assert await load(cache, "p1", "owner", {"u1": "editor"})
+
+        assert await cache.get("p1", "owner") == CachedMembership(True, is_owner=True)
+        assert await cache.get("p1", "u1") == CachedMembership(True, role="editor")
+        assert await cache.get("p1", "u2") == CachedMembership(True)
+        assert await cache.get("p2", "u1") is None
+
+    @pytest.mark.asyncio
+    async def test_denial_only_trusted_for_negative_ttl(self):
+        """Test that an outsider is looked up again once the set is older than the negative TTL"""
+        redis = FakeRedis()
+        cache = ProjectMembershipCache(redis, ttl_seconds=300, negative_ttl_seconds=10)
+        with patch.object(membership_module.time, "time", return_value=1000.0):
+            await load(cache, "p1", "owner", {"u1": "viewer"})
+            await load(cache, "missing", None, {})
+
+        with patch.object(membership_module.time, "time", return_value=1011.0):
+            assert await cache.get("p1", "u2") is None
+            assert await cache.get("p1", "u1") == CachedMembership(True, role="viewer")
+            assert await cache.get("missing", "u1") == CachedMembership(False)
+
+        assert redis.ttls[cache._key("p1")] == 300
+        assert redis.ttls[cache._key("missing")] == 10
+
+    @pytest.mark.asyncio
+    async def test_grant_revoke_and_owner_transfer_after_invalidate(self):
+        """Test that a reload after invalidation reflects membership and ownership changes"""
+        cache = ProjectMembershipCache(FakeRedis())
+        await load(cache, "p1", "owner", {"u1": "editor"})
+
+        await cache.invalidate("p1")
+        assert await cache.get("p1", "u1") is None
+        assert await load(cache, "p1", "u1", {"u2": "viewer"})
+
+        assert await cache.get("p1", "owner") == CachedMembership(True)
+        assert await cache.get("p1", "u1") == CachedMembership(True, is_owner=True)
+        assert await cache.get("p1", "u2") == CachedMembership(True, role="viewer")
+
+    @pytest.mark.asyncio
+    async def test_load_racing_invalidation_is_not_stored(self):
+        """Test that a set read before an invalidation cannot overwrite it"""
+        cache = ProjectMembershipCache(FakeRedis())
+        await load(cache, "p1", "owner", {"u1": "editor"})
+
+        generation = await cache.generation("p1")
+        # u1 is removed and the project deleted while the stale query runs
+        await cache.invalidate("p1")
+        assert not await cache.store("p1", "owner", {"u1": "editor"}, generation)
+        assert await cache.get("p1", "u1") is None
+
+        assert await load(cache, "p1", None, {})
+        assert await cache.get("p1", "u1") == CachedMembership(False)
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_redis(self):
+        """Test that an unconfigured cache never answers or writes"""
+        cache = ProjectMembershipCache()
+
+        assert await cache.generation("p1") is None
+        assert not await cache.store("p1", "owner", {}, None)
+        assert await cache.get("p1", "owner") is None
+        await cache.invalidate("p1")
@@ -0,0 +1,71 @@
+"""
+Unit tests for Prometheus range caching and downsampling
+"""
+
+import math
+
+import pytest
+
+from gameforge.services.metrics_range import (
+    RangeQueryCache, SeriesData, align_range, lttb, minmax, parse_step
+)
+
+
+class TestDownsampling:
+    """Test suite for LTTB and min/max bucketing"""
+
+    def test_lttb_keeps_endpoints_and_peak(self):
+        """Test that LTTB respects the budget and keeps the spike"""
+        timestamps = [float(i) for i in range(1000)]
+        values = [math.sin(i / 50) for i in range(1000)]
+        values[500] = 10.0
+
+        out_t, out_v = lttb(timestamps, values, 100)
+
+        assert len(out_t) == len(out_v) == 100
+        assert out_t[0] == 0.0 and out_t[-1] == 999.0
+        assert out_t == sorted(out_t)
+        assert 10.0 in out_v
+
+    def test_minmax_keeps_extremes(self):
+        """Test that min/max bucketing keeps both extremes of each bucket"""
+        timestamps = [float(i) for i in range(100)]
+        values = [float(i % 10) for i in range(100)]
+        values[37] = -5.0
+
+        out_t, out_v = minmax(timestamps, values, 20)
+
+        assert len(out_t) <= 20
+        assert min(out_v) == -5.0 and max(out_v) == 9.0
+
+    def test_step_parsing_and_alignment(self):
+        """Test Prometheus durations and step-aligned windows"""
+        assert parse_step("1m") == 60
+        assert parse_step("1h30m") == 5400
+        with pytest.raises(ValueError):
+            parse_step("5 minutes")
+
+        assert align_range(125.0, 3599.0, 60) == (120, 3540, 60)
+
+
+class TestRangeQueryCache:
+    """Test suite for RangeQueryCache"""
+
+    @pytest.mark.asyncio
+    async def test_later_request_fetches_only_the_tail(self):
+        """Test step-aligned incremental refresh"""
+        calls = []
+
+        async def fetch(query, start, end, step):
+            calls.append((start, end))
+            timestamps = [float(t) for t in range(int(start), int(end) + 1, int(step))]
+            return {(("job", "api"),): SeriesData({"job": "api"}, timestamps, [t * 2 for t in timestamps])}
+
+        cache = RangeQueryCache(fetch)
+        first = await cache.get("up", 0, 600, 60)
+        second = await cache.get("up", 120, 900, 60)
+
+        assert calls == [(0, 600), (600, 900)]
+        assert first[0].timestamps == [float(t) for t in range(0, 601, 60)]
+        assert second[0].timestamps == [float(t) for t in range(120, 901, 60)]
+        assert second[0].values == [t * 2 for t in second[0].timestamps]
@@ -0,0 +1,88 @@
+"""
+Unit tests for the shared monitoring snapshot poller
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from gameforge.services.monitoring_poller import Snapshot, SnapshotPoller, SnapshotStore
+
+
+class FollowerStore(SnapshotStore):
+    """Another worker holds the lock and has published a snapshot."""
+
+    async def claim(self, name, ttl_seconds):
+        return False
+
+    async def load(self, name):
+        return Snapshot(data={"source": "leader"}, fetched_at=time.time())
+
+
+class TestSnapshotPoller:
+    """Test suite for SnapshotPoller"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_fetch(self):
+        """Test that concurrent and repeated reads hit upstream once per interval"""
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": calls}
+
+        poller = SnapshotPoller("test", fetch, interval=60)
+        results = await asyncio.gather(*(poller.get() for _ in range(20)))
+        results.append(await poller.get())
+
+        assert calls == 1
+        assert all(result == {"value": 1} for result in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_keeps_previous_snapshot(self):
+        """Test that an upstream error serves the last snapshot instead of replacing it"""
+        responses = [["HighCPU"], RuntimeError("Grafana returned 502")]
+
+        async def fetch():
+            result = responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        poller = SnapshotPoller("alerts", fetch, interval=60)
+        assert await poller.get() == ["HighCPU"]
+        assert await poller.get(max_age=0) == ["HighCPU"]
+        assert poller.stats["fetch_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_encoded_snapshot(self):
+        """Test that every subscriber gets the same pre-encoded message"""
+        async def fetch():
+            return {"cpu_usage": 12.5}
+
+        poller = SnapshotPoller("test", fetch, interval=60, message_type="metrics_update")
+        queues = [poller.subscribe() for _ in range(3)]
+        snapshots = await asyncio.wait_for(
+            asyncio.gather(*(queue.get() for queue in queues)), timeout=1
+        )
+        await poller.stop()
+
+        assert len({id(snapshot) for snapshot in snapshots}) == 1
+        assert json.loads(snapshots[0].message) == {
+            "type": "metrics_update", "data": {"cpu_usage": 12.5}
+        }
+
+    @pytest.mark.asyncio
+    async def test_follower_reads_shared_snapshot(self):
+        """Test that workers without the lock do not query upstream"""
+        async def fetch():
+            raise AssertionError("follower must not query upstream")
+
+        poller = SnapshotPoller("test", fetch, interval=60, store=FollowerStore())
+
+        assert await poller.get() == {"source": "leader"}
+        assert poller.get_stats()["shared_reads"] == 1
@@ -0,0 +1,61 @@
+"""
+Unit tests for the notification delivery pipeline
+
+Uses the in-process bus to check burst coalescing and latency tracking.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from gameforge.services.notification_delivery import NotificationDelivery, batch_summary
+
+
+class RecordingWebSocket:
+    """WebSocket stand-in that records sent frames"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload):
+        self.sent.append(json.loads(payload))
+
+    async def close(self, code=1000):
+        pass
+
+
+class TestNotificationDelivery:
+    """Test suite for NotificationDelivery"""
+
+    def test_batch_summary(self):
+        """Test summaries for single-type and mixed bursts"""
+        comments = [{"type": "COMMENT_RECEIVED"}] * 5
+        assert batch_summary(comments) == "5 new comments"
+        assert batch_summary(comments + [{"type": "AI_JOB_FAILED"}]) == "6 new notifications"
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced(self):
+        """Test that the first notification is immediate and the rest are batched"""
+        delivery = NotificationDelivery(batch_window=0.05)
+        await delivery.start()
+        websocket = RecordingWebSocket()
+        await delivery.connect(websocket, "u1")
+
+        for i in range(6):
+            await delivery.publish("u1", {"id": f"n{i}", "type": "COMMENT_RECEIVED"})
+        await asyncio.sleep(0.01)
+        assert [message["type"] for message in websocket.sent] == ["new_notification"]
+
+        await asyncio.sleep(0.1)
+        await delivery.stop()
+
+        batch = websocket.sent[1]
+        assert batch["type"] == "notification_batch"
+        assert batch["count"] == 5
+        assert batch["summary"] == "5 new comments"
+        assert [n["id"] for n in batch["notifications"]] == ["n3", "n4", "n5"]
+        assert delivery.get_stats()["delivery_latency_seconds"]["count"] == 6
@@ -0,0 +1,68 @@
+"""
+Unit tests for single-scan notification stats and unread counters
+"""
+
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from gameforge.services.notification_stats import NotificationStatsService
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE notifications (id VARCHAR PRIMARY KEY, user_id VARCHAR, type VARCHAR, "
+            "read_at DATETIME, archived_at DATETIME, created_at DATETIME)"
+        ))
+        await conn.execute(text(
+            "INSERT INTO notifications VALUES "
+            "('n1', 'u1', 'COMMENT_RECEIVED', NULL, NULL, '2025-01-10 12:00:00'), "
+            "('n2', 'u1', 'COMMENT_RECEIVED', '2025-01-09', NULL, '2025-01-01 00:00:00'), "
+            "('n3', 'u1', 'AI_JOB_COMPLETED', NULL, '2025-01-09', '2025-01-05 00:00:00'), "
+            "('n4', 'u2', 'AI_JOB_COMPLETED', NULL, NULL, '2025-01-10 12:00:00')"
+        ))
+    yield engine
+    await engine.dispose()
+
+
+class TestNotificationStats:
+    """Test suite for NotificationStatsService"""
+
+    @pytest.mark.asyncio
+    async def test_overview_in_one_statement(self, engine):
+        """Test that every facet comes from a single grouped scan"""
+        statements = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        service = NotificationStatsService()
+
+        async with AsyncSession(engine) as db:
+            overview = await service.overview(db, "u1", now=datetime(2025, 1, 11))
+
+        assert len(statements) == 1
+        assert overview == {
+            "total_count": 3,
+            "unread_count": 2,
+            "archived_count": 1,
+            "recent_count": 1,
+            "by_type": {"COMMENT_RECEIVED": 2, "AI_JOB_COMPLETED": 1}
+        }
+
+    @pytest.mark.asyncio
+    async def test_unread_badge_primed_then_adjusted(self, engine):
+        """Test the O(1) badge after the first lookup and committed deltas"""
+        service = NotificationStatsService()
+
+        async with AsyncSession(engine) as db:
+            assert await service.unread_count(db, "u1") == 2
+            await service.record_unread_delta("u1", 1)
+            await service.record_unread_delta("u1", -3)
+            assert await service.unread_count(db, "u1") == 0
+
+        assert service.get_stats()["badge_misses"] == 1
+        assert service.get_stats()["badge_hits"] == 1
@@ -0,0 +1,68 @@
+"""
+Unit tests for keyset pagination cursors
+"""
+
+import base64
+import json
+
+import pytest
+from datetime import datetime
+
+from sqlalchemy import column, select, table
+
+from gameforge.services.pagination import (
+    InvalidCursorError, apply_keyset, decode_cursor, encode_cursor
+)
+
+
+class TestKeysetCursors:
+    """Test suite for cursor encoding"""
+
+    def test_datetime_cursor_round_trip(self):
+        """Test that datetime sort values survive encoding"""
+        created_at = datetime(2025, 9, 13, 12, 0, 0, 123456)
+        cursor = encode_cursor(created_at, "a1b2c3")
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (created_at, "a1b2c3")
+
+    def test_invalid_cursor_rejected(self):
+        """Test that tampered cursors raise a client error"""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor")
+
+    @pytest.mark.parametrize("payload", [
+        [{"nested": 1}, "a1b2c3"],
+        [[1, 2], "a1b2c3"],
+        [True, "a1b2c3"],
+        ["2025-09-13", 42],
+        ["2025-09-13", None],
+        [1.5, ["a1b2c3"]]
+    ])
+    def test_cursor_with_unexpected_types_rejected(self, payload):
+        """Test that well-formed JSON of the wrong shape is rejected too"""
+        data = json.dumps(payload).encode("utf-8")
+        cursor = base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+    def test_scalar_and_null_sort_values_round_trip(self):
+        """Test that the sort value types encode_cursor emits decode unchanged"""
+        for sort_value in ("title", 7, 0.25, None):
+            assert decode_cursor(encode_cursor(sort_value, "a1b2c3")) == (sort_value, "a1b2c3")
+
+    def test_ascending_keyset_seeks_forward(self):
+        """Test that ascending pages seek past the cursor with (sort, id) > ..."""
+        projects = table("projects", column("name"), column("id"))
+        query = apply_keyset(
+            select(projects.c.id),
+            projects.c.name,
+            projects.c.id,
+            encode_cursor("Dungeon", "p42"),
+            ascending=True
+        )
+        sql = str(query.compile(compile_kwargs={"literal_binds": True}))
+
+        assert "(projects.name, projects.id) > ('Dungeon', 'p42')" in sql
+        assert "ORDER BY projects.name ASC, projects.id ASC" in sql
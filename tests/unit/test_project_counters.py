@@ -0,0 +1,109 @@
+"""
+Unit tests for write-behind project counters
+
+Flushes buffered views and likes into a SQLite database to check
+batched increments and per-user like deduplication.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from gameforge.services.project_counters import ProjectCounters
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE projects (id VARCHAR PRIMARY KEY, view_count INTEGER, like_count INTEGER)"
+        ))
+        await conn.execute(text(
+            "CREATE TABLE project_likes (project_id VARCHAR, user_id VARCHAR, "
+            "created_at DATETIME NOT NULL, PRIMARY KEY (project_id, user_id))"
+        ))
+        await conn.execute(text("INSERT INTO projects VALUES ('p1', NULL, 1), ('p2', 5, 0)"))
+        await conn.execute(text("INSERT INTO project_likes VALUES ('p1', 'u1', '2025-01-01')"))
+    yield engine
+    await engine.dispose()
+
+
+class TestProjectCounters:
+    """Test suite for buffered project view/like counters"""
+
+    @pytest.mark.asyncio
+    async def test_flush_applies_batched_increments(self, engine):
+        """Test live counts before a flush and stored totals after it"""
+        counters = ProjectCounters(session_factory=async_sessionmaker(engine))
+
+        for _ in range(3):
+            await counters.record_view("p1")
+        await counters.record_like("p2", "u1")
+
+        assert await counters.live_counts("p1", None, 1) == (3, 1)
+        assert await counters.live_counts("p2", 5, 0) == (5, 1)
+
+        assert await counters.flush() == {"projects": 2, "likes": 1}
+        assert await counters.live_counts("p1", 3, 1) == (3, 1)
+
+        async with engine.connect() as conn:
+            rows = (await conn.execute(text("SELECT * FROM projects ORDER BY id"))).all()
+        assert rows == [("p1", 3, 1), ("p2", 5, 1)]
+
+    @pytest.mark.asyncio
+    async def test_likes_deduplicated_per_user(self, engine):
+        """Test repeat likes in the buffer and likes already stored"""
+        counters = ProjectCounters(session_factory=async_sessionmaker(engine))
+
+        assert await counters.record_like("p1", "u2") is True
+        assert await counters.record_like("p1", "u2") is False
+        # Already stored - only the project_likes primary key can tell
+        assert await counters.record_like("p1", "u1") is True
+
+        assert await counters.flush() == {"projects": 1, "likes": 1}
+
+        async with engine.connect() as conn:
+            like_count = (await conn.execute(
+                text("SELECT like_count FROM projects WHERE id = 'p1'")
+            )).scalar()
+        assert like_count == 2
+
+    @pytest.mark.asyncio
+    async def test_deleted_project_does_not_block_flush(self, engine):
+        """Test that increments for a project deleted after buffering are skipped"""
+        counters = ProjectCounters(session_factory=async_sessionmaker(engine))
+
+        await counters.record_view("p1")
+        await counters.record_view("gone")
+        await counters.record_like("gone", "u2")
+        await counters.record_like("p2", "u2")
+
+        assert await counters.flush() == {"projects": 2, "likes": 1}
+        assert await counters.live_counts("gone", 0, 0) == (0, 0)
+
+        async with engine.connect() as conn:
+            rows = (await conn.execute(text("SELECT * FROM projects ORDER BY id"))).all()
+            likes = (await conn.execute(text("SELECT project_id FROM project_likes ORDER BY project_id"))).all()
+        assert rows == [("p1", 1, 1), ("p2", 5, 1)]
+        assert likes == [("p1",), ("p2",)]
+
+    @pytest.mark.asyncio
+    async def test_rejected_entries_are_dropped_not_rebuffered(self, engine):
+        """Test that a constraint failure only drops the offending project's increments"""
+        async with engine.begin() as conn:
+            await conn.execute(text("INSERT INTO projects VALUES ('p3', 0, 0)"))
+            await conn.execute(text(
+                "CREATE TRIGGER reject_p3 BEFORE INSERT ON project_likes WHEN NEW.project_id = 'p3' "
+                "BEGIN SELECT RAISE(ABORT, 'constraint failed'); END"
+            ))
+        counters = ProjectCounters(session_factory=async_sessionmaker(engine))
+
+        await counters.record_like("p3", "u2")
+        await counters.record_like("p2", "u2")
+
+        assert await counters.flush() == {"projects": 1, "likes": 1}
+        assert counters.stats["entries_dropped"] == 1
+        assert await counters.live_counts("p3", 0, 0) == (0, 0)
+        assert await counters.flush() == {"projects": 0, "likes": 0}
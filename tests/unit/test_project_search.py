@@ -0,0 +1,167 @@
+"""
+Unit tests for project search and keyset-paginated listings
+
+Pages a SQLite projects table through every sort option. Full-text and
+trigram matching are PostgreSQL-only, so those expressions are checked as
+compiled SQL.
+"""
+
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, DateTime, Integer, String, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+from gameforge.services.pagination import apply_keyset, decode_cursor, encode_cursor
+from gameforge.services.project_search import (
+    SORT_COLUMNS, SORT_RELEVANCE, build_search, escape_like, resolve_sort, search_projects
+)
+
+Base = declarative_base()
+
+
+class SearchProject(Base):
+    """The projects columns search reads."""
+    __tablename__ = "projects"
+
+    id = Column(String, primary_key=True)
+    name = Column(String)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    view_count = Column(Integer)
+    like_count = Column(Integer)
+    search_vector = Column(TSVECTOR)
+
+
+# id, name, created_at day, updated_at day, view_count, like_count
+PROJECTS = [
+    ("p1", "Dungeon", 1, None, None, 3),
+    ("p2", "50% Off Racer", 2, 5, 10, None),
+    ("p3", "500 Club", 3, None, 10, 3),
+    ("p4", "Astro_Miner", 4, 4, 0, 0),
+    ("p5", "Dungeon", 5, 1, None, None)
+]
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE projects (id VARCHAR PRIMARY KEY, name VARCHAR, created_at DATETIME, "
+            "updated_at DATETIME, view_count INTEGER, like_count INTEGER, search_vector TEXT)"
+        ))
+    async with async_sessionmaker(engine)() as db:
+        db.add_all([
+            SearchProject(
+                id=pid,
+                name=name,
+                created_at=datetime(2025, 1, created),
+                updated_at=datetime(2025, 1, updated) if updated else None,
+                view_count=views,
+                like_count=likes
+            )
+            for pid, name, created, updated, views, likes in PROJECTS
+        ])
+        await db.commit()
+        yield db
+    await engine.dispose()
+
+
+def expected_order(sort_by: str, ascending: bool):
+    """Ids ordered the way the coalesced (sort, id) keyset should page them."""
+    def key(row):
+        pid, name, created, updated, views, likes = row
+        value = {
+            "created_at": created,
+            "updated_at": updated or created,
+            "name": name,
+            "view_count": views or 0,
+            "like_count": likes or 0
+        }[sort_by]
+        return value, pid
+
+    return [row[0] for row in sorted(PROJECTS, key=key, reverse=not ascending)]
+
+
+async def page_through(db, **kwargs):
+    ids, cursor = [], None
+    while True:
+        page = await search_projects(db, SearchProject, [], limit=2, cursor=cursor, **kwargs)
+        ids.extend(item.id for item in page.items)
+        if not page.has_more:
+            return ids
+        cursor = page.next_cursor
+
+
+class TestProjectSearch:
+    """Test suite for project search and keyset listings"""
+
+    def test_escape_like_matches_wildcards_literally(self):
+        """Test that %, _ and backslashes are escaped for LIKE"""
+        assert escape_like("50%_off\\") == "50\\%\\_off\\\\"
+        assert escape_like("plain") == "plain"
+
+    def test_resolve_sort(self):
+        """Test that relevance is the search default and unknown sorts fall back"""
+        assert resolve_sort(None, "dungeon") == SORT_RELEVANCE
+        assert resolve_sort(None, None) == "created_at"
+        assert resolve_sort(SORT_RELEVANCE, None) == "created_at"
+        assert resolve_sort("view_count", "dungeon") == "view_count"
+        assert resolve_sort("owner_id; drop", None) == "created_at"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort_by", sorted(SORT_COLUMNS))
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    async def test_pages_cover_every_row_once(self, session, sort_by, sort_order):
+        """Test that cursors over nullable, tied sort columns neither skip nor repeat rows"""
+        ids = await page_through(session, sort_by=sort_by, sort_order=sort_order)
+
+        assert ids == expected_order(sort_by, sort_order == "asc")
+
+    @pytest.mark.asyncio
+    async def test_filters_and_projected_columns(self, session):
+        """Test extra filters, and row mappings when columns are requested"""
+        page = await search_projects(
+            session,
+            SearchProject,
+            [SearchProject.name.like(f"{escape_like('50%')}%", escape="\\")],
+            columns=(SearchProject.id, SearchProject.name)
+        )
+
+        # Unescaped, "50%" would also match "500 Club"
+        assert [(item["id"], item["name"]) for item in page.items] == [("p2", "50% Off Racer")]
+        assert page.next_cursor is None
+
+    def test_search_condition_and_rank(self):
+        """Test the full-text, prefix and trigram parts of a search"""
+        condition, rank = build_search(SearchProject, "astro_")
+        sql = str((select(SearchProject.id).where(condition).order_by(rank.desc())).compile(
+            dialect=postgresql.dialect()
+        ))
+
+        assert "projects.search_vector @@ websearch_to_tsquery(" in sql
+        assert "projects.name ILIKE" in sql and "ESCAPE" in sql
+        assert "projects.name %% " in sql
+        assert "ts_rank_cd(projects.search_vector, websearch_to_tsquery(" in sql
+        assert "similarity(projects.name, " in sql
+
+    def test_relevance_cursor_round_trip(self):
+        """Test that a float rank survives the cursor and seeks best-first"""
+        _, rank = build_search(SearchProject, "dungeon")
+        cursor = encode_cursor(0.7071067811865476, "p3")
+        assert decode_cursor(cursor) == (0.7071067811865476, "p3")
+
+        compiled = apply_keyset(select(SearchProject.id), rank, SearchProject.id, cursor).compile(
+            dialect=postgresql.dialect()
+        )
+        sql = str(compiled)
+
+        assert ", projects.id) < (" in sql
+        assert "DESC, projects.id DESC" in sql
+        assert 0.7071067811865476 in compiled.params.values()
+        assert "p3" in compiled.params.values()
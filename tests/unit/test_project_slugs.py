@@ -0,0 +1,79 @@
+"""
+Unit tests for project slug allocation
+
+Uses a minimal projects table on SQLite with the same unique slug
+constraint to test suffix selection and retry after a lost race.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, String
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+from gameforge.services.project_slugs import assign_unique_slug, slugify, taken_suffixes
+
+SlugBase = declarative_base()
+
+
+class SlugProject(SlugBase):
+    __tablename__ = "projects"
+
+    id = Column(String, primary_key=True)
+    name = Column(String, nullable=False)
+    slug = Column(String, nullable=False, unique=True)
+
+
+@pytest_asyncio.fixture
+async def sessions():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(SlugBase.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def seed(sessions, *slugs):
+    async with sessions() as db:
+        db.add_all(SlugProject(id=slug, name=slug, slug=slug) for slug in slugs)
+        await db.commit()
+
+
+class TestSlugAllocation:
+    """Test suite for set-based slug allocation"""
+
+    @pytest.mark.asyncio
+    async def test_picks_lowest_free_suffix(self, sessions):
+        """Test that one prefix query finds gaps and ignores look-alike slugs"""
+        await seed(sessions, "my-game-fork", "my-game-fork-1", "my-game-fork-3", "my-game-fork-ultimate")
+
+        async with sessions() as db:
+            project = SlugProject(id="new", name="My Game (Fork)")
+            slug = await assign_unique_slug(db, project, project.name)
+            await db.commit()
+
+        assert slugify("My Game (Fork)") == "my-game-fork"
+        assert slug == "my-game-fork-2"
+
+    @pytest.mark.asyncio
+    async def test_retries_after_concurrent_insert(self, sessions, monkeypatch):
+        """Test that a unique conflict refreshes the taken set and retries"""
+        await seed(sessions, "arena")
+        stale_reads = []
+
+        async def stale_taken(db, base_slug):
+            # First read misses a slug a concurrent request just committed
+            if not stale_reads:
+                stale_reads.append(base_slug)
+                await seed(sessions, "arena-1")
+                return {0}
+            return await taken_suffixes(db, base_slug)
+
+        monkeypatch.setattr("gameforge.services.project_slugs.taken_suffixes", stale_taken)
+
+        async with sessions() as db:
+            project = SlugProject(id="new", name="Arena")
+            slug = await assign_unique_slug(db, project, project.name)
+            await db.commit()
+
+        assert slug == "arena-2"
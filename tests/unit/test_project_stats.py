@@ -0,0 +1,140 @@
+"""
+Unit tests for the project statistics overview
+
+Reads counters and projects from a SQLite database to check the per-user
+cache, invalidation and the scan used before the counter table exists.
+"""
+
+from enum import Enum
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from gameforge.services import project_stats as project_stats_module
+from gameforge.services.project_stats import ProjectStatsService
+
+PROJECTS = [
+    ("p1", "u0", "PUBLIC", "DRAFT", "UNITY", "RPG", 1),
+    ("p2", "u0", "PUBLIC", "PUBLISHED", None, "RPG", 0),
+    ("p3", "u1", "PRIVATE", "DRAFT", "GODOT", None, 0),
+    ("p4", "u2", "PRIVATE", "DRAFT", "UNITY", None, 0)
+]
+
+# What the projects_stat_counters trigger keeps for the public rows above
+COUNTERS = [
+    ("total", "", 2), ("template", "", 1),
+    ("status", "DRAFT", 1), ("status", "PUBLISHED", 1),
+    ("engine", "UNITY", 1), ("genre", "RPG", 2)
+]
+
+
+async def create_projects(conn):
+    await conn.execute(text(
+        "CREATE TABLE projects (id VARCHAR PRIMARY KEY, owner_id VARCHAR, visibility VARCHAR, "
+        "status VARCHAR, engine VARCHAR, genre VARCHAR, is_template BOOLEAN)"
+    ))
+    await conn.execute(
+        text("INSERT INTO projects VALUES (:id, :owner, :visibility, :status, :engine, :genre, :template)"),
+        [
+            dict(zip(("id", "owner", "visibility", "status", "engine", "genre", "template"), row))
+            for row in PROJECTS
+        ]
+    )
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await create_projects(conn)
+        await conn.execute(text(
+            "CREATE TABLE project_stat_counters (facet VARCHAR, value VARCHAR, count INTEGER, "
+            "PRIMARY KEY (facet, value))"
+        ))
+        for facet, value, count in COUNTERS:
+            await conn.execute(
+                text("INSERT INTO project_stat_counters VALUES (:f, :v, :c)"),
+                {"f": facet, "v": value, "c": count}
+            )
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def unmigrated_engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await create_projects(conn)
+    yield engine
+    await engine.dispose()
+
+
+EXPECTED_U1 = {
+    "total_projects": 3,
+    "public_projects": 2,
+    "private_projects": 1,
+    "template_projects": 1,
+    "by_status": {"DRAFT": 2, "PUBLISHED": 1},
+    "by_engine": {"UNITY": 1, "GODOT": 1},
+    "by_genre": {"RPG": 2}
+}
+
+
+class TestProjectStats:
+    """Test suite for the cached project statistics overview"""
+
+    @pytest.mark.asyncio
+    async def test_overview_merges_public_counters_and_own_projects(self, engine):
+        """Test that public counters and the caller's private projects are combined"""
+        service = ProjectStatsService()
+        async with async_sessionmaker(engine)() as db:
+            assert await service.get_overview(db, "u1") == EXPECTED_U1
+            overview = await service.get_overview(db, "u2")
+
+        assert overview["private_projects"] == 1
+        assert overview["by_engine"] == {"UNITY": 2}
+        assert service.stats["public_refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_until_invalidated_or_expired(self, engine):
+        """Test that the per-user entry is reused until invalidate() or its TTL"""
+        service = ProjectStatsService(ttl_seconds=30, public_ttl_seconds=30)
+        async with async_sessionmaker(engine)() as db:
+            with patch.object(project_stats_module.time, "monotonic", return_value=100.0):
+                await service.get_overview(db, "u1")
+                await db.execute(text(
+                    "INSERT INTO projects VALUES ('p5', 'u1', 'PRIVATE', 'DRAFT', NULL, NULL, 0)"
+                ))
+                assert (await service.get_overview(db, "u1"))["private_projects"] == 1
+                assert service.stats["hits"] == 1
+
+                service.invalidate("u1")
+                assert (await service.get_overview(db, "u1"))["private_projects"] == 2
+
+                await db.execute(text("DELETE FROM projects WHERE id = 'p5'"))
+            with patch.object(project_stats_module.time, "monotonic", return_value=131.0):
+                assert (await service.get_overview(db, "u1"))["private_projects"] == 1
+
+        assert service.stats["misses"] == 3
+        assert service.get_stats()["cached_users"] == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_scan_without_counter_table(self, unmigrated_engine):
+        """Test that a missing counter table is answered by one grouped scan"""
+        service = ProjectStatsService()
+        async with async_sessionmaker(unmigrated_engine)() as db:
+            assert await service.get_overview(db, "u1") == EXPECTED_U1
+
+    def test_render_breakdowns_uses_enum_members(self):
+        """Test that labels render as str() of the enum member, unknown labels as-is"""
+        class Engine(Enum):
+            UNITY = "unity"
+
+        rendered = project_stats_module.render_breakdowns(
+            {"total_projects": 3, "by_engine": {"UNITY": 2, "CUSTOM": 1, "GONE": 0}},
+            {"by_engine": Engine}
+        )
+        assert rendered == {"total_projects": 3, "by_engine": {"Engine.UNITY": 2, "CUSTOM": 1}}
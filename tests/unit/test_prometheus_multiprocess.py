@@ -0,0 +1,47 @@
+"""
+Unit tests for multiprocess-safe Prometheus metrics
+"""
+
+import os
+import subprocess
+import sys
+
+from prometheus_client import CollectorRegistry, multiprocess
+
+from src.metrics.gameforge_metrics import acquire_host_lock
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+WORKER = (
+    "from src.metrics.gameforge_metrics import metrics; "
+    "metrics.record_http_request('GET', '/api/v1/projects', 200)"
+)
+
+
+class TestMultiprocessMetrics:
+    """Test suite for metrics aggregated across worker processes"""
+
+    def test_scrape_aggregates_all_workers(self, tmp_path):
+        """Test that counters from separate worker processes are summed"""
+        env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+        for _ in range(3):
+            subprocess.run([sys.executable, "-c", WORKER], cwd=REPO_ROOT, env=env, check=True)
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry, path=str(tmp_path))
+
+        assert registry.get_sample_value(
+            "gameforge_http_requests_total",
+            {"method": "GET", "endpoint": "/api/v1/projects", "status": "200"}
+        ) == 3
+
+    def test_one_host_collector_at_a_time(self, tmp_path):
+        """Test that only one holder samples host gauges until it releases"""
+        leader = acquire_host_lock(str(tmp_path))
+        assert leader is not None
+        assert acquire_host_lock(str(tmp_path)) is None
+
+        leader.close()
+        successor = acquire_host_lock(str(tmp_path))
+        assert successor is not None
+        successor.close()
@@ -0,0 +1,100 @@
+"""
+Unit tests for the real-time collaboration broadcast engine
+
+Tests per-connection outbound queues, overflow handling and
+coalescing of high-frequency events.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+
+from gameforge.services.realtime_broadcast import (
+    ConnectionWriter, coalesce_key, serialize_message
+)
+
+
+class SlowWebSocket:
+    """WebSocket stand-in that blocks sends until released"""
+
+    def __init__(self):
+        self.sent = []
+        self.release = asyncio.Event()
+
+    async def send_text(self, payload):
+        await self.release.wait()
+        self.sent.append(payload)
+
+    async def close(self, code=1000):
+        pass
+
+
+class TestBroadcastEngine:
+    """Test suite for ConnectionWriter"""
+
+    def test_coalesce_keys(self):
+        """Test which message types are coalesced"""
+        assert coalesce_key({"type": "online_users"}) == "online_users"
+        assert coalesce_key({
+            "type": "ai_job_update",
+            "event_type": "progress",
+            "job": {"id": "job_1"}
+        }) == "ai_job_progress:job_1"
+        assert coalesce_key({"type": "ai_job_update", "event_type": "completed"}) is None
+        assert coalesce_key({"type": "new_comment"}) is None
+
+    @pytest.mark.asyncio
+    async def test_overflow_reports_full_queue(self):
+        """Test that a slow client's queue overflows instead of blocking"""
+        websocket = SlowWebSocket()
+        writer = ConnectionWriter(websocket, "conn_1", 2, on_send_error=AsyncMock())
+        writer.start()
+        await asyncio.sleep(0)
+
+        # First message is picked up by the writer and blocks in send_text
+        assert writer.enqueue(serialize_message({"n": 0}))
+        await asyncio.sleep(0)
+        assert writer.enqueue(serialize_message({"n": 1}))
+        assert writer.enqueue(serialize_message({"n": 2}))
+        assert not writer.enqueue(serialize_message({"n": 3}))
+
+        writer.close()
+
+    @pytest.mark.asyncio
+    async def test_coalesced_updates_deliver_latest(self):
+        """Test that pending progress updates are replaced, not queued"""
+        websocket = SlowWebSocket()
+        writer = ConnectionWriter(websocket, "conn_1", 4, on_send_error=AsyncMock())
+
+        for progress in range(10):
+            message = {
+                "type": "ai_job_update",
+                "event_type": "progress",
+                "job": {"id": "job_1", "progress": progress}
+            }
+            assert writer.enqueue(serialize_message(message), coalesce_key(message))
+
+        assert writer.queue_depth == 1
+        assert writer.coalesced_count == 9
+
+        websocket.release.set()
+        writer.start()
+        await asyncio.sleep(0.01)
+
+        assert len(websocket.sent) == 1
+        assert '"progress": 9' in websocket.sent[0]
+        writer.close()
+
+    @pytest.mark.asyncio
+    async def test_send_error_invokes_callback(self):
+        """Test that a failed send hands the connection back for cleanup"""
+        websocket = AsyncMock()
+        websocket.send_text.side_effect = RuntimeError("socket closed")
+        on_error = AsyncMock()
+
+        writer = ConnectionWriter(websocket, "conn_1", 4, on_send_error=on_error)
+        writer.start()
+        writer.enqueue(serialize_message({"type": "pong"}))
+        await asyncio.sleep(0.01)
+
+        on_error.assert_awaited_once()
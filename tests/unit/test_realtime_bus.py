@@ -0,0 +1,99 @@
+"""
+Unit tests for the realtime bus and presence store
+
+Tests envelope round-trips, in-process delivery and
+TTL-based presence tracking.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from gameforge.services.realtime_bus import (
+    RealtimeEnvelope, InProcessRealtimeBus, InMemoryPresenceStore
+)
+
+
+class TestRealtimeBus:
+    """Test suite for realtime bus implementations"""
+
+    def test_envelope_round_trip(self):
+        """Test envelope serialization for Redis channels"""
+        envelope = RealtimeEnvelope(
+            scope="project",
+            target_id="project_1",
+            payload='{"type": "user_joined"}',
+            exclude_user="user_1"
+        )
+
+        assert envelope.channel == "gameforge:realtime:project:project_1"
+        assert RealtimeEnvelope.from_json(envelope.to_json()) == envelope
+
+    @pytest.mark.asyncio
+    async def test_in_process_bus_delivers_to_handler(self):
+        """Test that the in-process bus hands envelopes to the local handler"""
+        handler = AsyncMock()
+        bus = InProcessRealtimeBus()
+        await bus.start(handler)
+
+        envelope = RealtimeEnvelope(scope="user", target_id="user_1", payload="{}")
+        await bus.publish(envelope)
+
+        handler.assert_awaited_once_with(envelope)
+
+
+class TestPresenceStore:
+    """Test suite for presence tracking"""
+
+    @pytest.mark.asyncio
+    async def test_presence_expires_after_ttl(self):
+        """Test that users drop out once their heartbeat is older than the TTL"""
+        store = InMemoryPresenceStore(ttl_seconds=60)
+
+        with patch("gameforge.services.realtime_bus.time.time", return_value=1000.0):
+            await store.heartbeat("project_1", "user_1")
+        with patch("gameforge.services.realtime_bus.time.time", return_value=1050.0):
+            await store.heartbeat("project_1", "user_2")
+            assert sorted(await store.online_users("project_1")) == ["user_1", "user_2"]
+        with patch("gameforge.services.realtime_bus.time.time", return_value=1070.0):
+            assert await store.online_users("project_1") == ["user_2"]
+
+    @pytest.mark.asyncio
+    async def test_remove_user(self):
+        """Test explicit removal on disconnect"""
+        store = InMemoryPresenceStore()
+        await store.heartbeat("project_1", "user_1")
+        await store.remove("project_1", "user_1")
+
+        assert await store.online_users("project_1") == []
+
+    @pytest.mark.asyncio
+    async def test_user_stays_present_while_another_node_has_them(self):
+        """Test that presence entries are per node and the last one decides the leave"""
+        node_a = InMemoryPresenceStore(node_id="node-a")
+        node_b = InMemoryPresenceStore(node_id="node-b")
+        node_b._presence = node_a._presence  # one shared presence map
+
+        await node_a.heartbeat("project_1", "user_1")
+        await node_b.heartbeat("project_1", "user_1")
+        assert await node_a.online_users("project_1") == ["user_1"]
+
+        assert await node_a.remove("project_1", "user_1") is False
+        assert await node_b.online_users("project_1") == ["user_1"]
+        assert await node_b.remove("project_1", "user_1") is True
+
+    @pytest.mark.asyncio
+    async def test_expired_last_entry_is_reported_once(self):
+        """Test that a dead node's users are reported as left by exactly one expiry"""
+        node_a = InMemoryPresenceStore(ttl_seconds=60, node_id="node-a")
+        node_b = InMemoryPresenceStore(ttl_seconds=60, node_id="node-b")
+        node_b._presence = node_a._presence
+
+        with patch("gameforge.services.realtime_bus.time.time", return_value=1000.0):
+            await node_a.heartbeat("project_1", "user_1")
+            await node_a.heartbeat("project_1", "user_2")
+        with patch("gameforge.services.realtime_bus.time.time", return_value=1050.0):
+            await node_b.heartbeat("project_1", "user_2")
+        with patch("gameforge.services.realtime_bus.time.time", return_value=1070.0):
+            assert await node_b.expire("project_1") == ["user_1"]
+            assert await node_a.expire("project_1") == []
+            assert await node_b.online_users("project_1") == ["user_2"]
@@ -0,0 +1,104 @@
+"""
+Unit tests for per-request span timing
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from gameforge.core.request_timing import RequestTimingMiddleware, span, timed
+from gameforge.core.security_middleware import SecurityMiddleware
+
+
+def phase_count(phase: str) -> float:
+    return REGISTRY.get_sample_value(
+        "gameforge_request_phase_duration_seconds_count", {"phase": phase}
+    ) or 0.0
+
+
+@timed("test.auth")
+async def authenticate():
+    await asyncio.sleep(0.01)
+
+
+def build_app(server_timing: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/work")
+    async def work():
+        await authenticate()
+        with span("test.db"):
+            pass
+        with span("test.db"):
+            pass
+        return {"ok": True}
+
+    app.add_middleware(RequestTimingMiddleware, server_timing=server_timing)
+    return app
+
+
+def build_secured_app() -> FastAPI:
+    """The production order: timing outermost, then the fused security middleware."""
+    app = FastAPI()
+
+    @app.get("/work")
+    async def work():
+        await authenticate()
+        return {"ok": True}
+
+    app.add_middleware(SecurityMiddleware, max_requests=100, window_seconds=60)
+    app.add_middleware(RequestTimingMiddleware, server_timing=True)
+    return app
+
+
+class TestRequestTiming:
+    """Test suite for RequestTimingMiddleware and spans"""
+
+    def test_server_timing_header_lists_phases(self):
+        """Test that phases are summed per name and returned as Server-Timing"""
+        response = TestClient(build_app(server_timing=True)).get("/work")
+
+        entries = dict(
+            part.strip().split(";dur=") for part in response.headers["server-timing"].split(",")
+        )
+        assert set(entries) == {"test.auth", "test.db", "total"}
+        assert float(entries["test.auth"]) >= 10
+
+    def test_phases_observed_once_per_request(self):
+        """Test that each phase is observed once per request, header or not"""
+        before = phase_count("test.db")
+
+        response = TestClient(build_app(server_timing=False)).get("/work")
+
+        assert "server-timing" not in response.headers
+        assert phase_count("test.db") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_span_outside_request_observes_directly(self):
+        """Test that spans outside a request still reach the histogram"""
+        before = phase_count("test.background")
+
+        async with span("test.background"):
+            pass
+
+        assert phase_count("test.background") == before + 1
+
+    def test_security_stack_records_handler_and_trailing_phases(self):
+        """Test handler in Server-Timing and phases ending after response start in the histogram"""
+        handler_before = phase_count("handler")
+        logging_before = phase_count("middleware.security_logging")
+
+        response = TestClient(build_secured_app()).get("/work", headers={"X-Forwarded-For": uuid.uuid4().hex})
+
+        entries = dict(
+            part.strip().split(";dur=") for part in response.headers["server-timing"].split(",")
+        )
+        assert {"handler", "test.auth", "middleware.rate_limit"} <= set(entries)
+        assert float(entries["handler"]) >= float(entries["test.auth"])
+        assert phase_count("handler") == handler_before + 1
+        # The completion log is written after the body is sent
+        assert phase_count("middleware.security_logging") == logging_before + 1
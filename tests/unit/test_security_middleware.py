@@ -0,0 +1,73 @@
+"""
+Unit tests for the fused pure-ASGI security middleware
+"""
+
+import uuid
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from gameforge.core.security_config import SECURITY_HEADERS
+from gameforge.core.security_middleware import SecurityMiddleware
+
+
+def build_client(max_requests: int = 100) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"pong": True}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(SecurityMiddleware, max_requests=max_requests, window_seconds=60)
+    return TestClient(app, headers={"X-Forwarded-For": uuid.uuid4().hex})
+
+
+class TestSecurityMiddleware:
+    """Test suite for SecurityMiddleware"""
+
+    def test_security_and_rate_limit_headers(self):
+        """Test that allowed responses carry security and X-RateLimit-* headers"""
+        response = build_client(max_requests=5).get("/ping")
+
+        assert response.status_code == 200
+        for name, value in SECURITY_HEADERS.items():
+            assert response.headers[name] == value
+        assert response.headers["X-RateLimit-Limit"] == "5"
+        assert response.headers["X-RateLimit-Remaining"] == "4"
+
+    def test_over_limit_returns_429(self):
+        """Test that the global limit answers 429 without reaching the endpoint"""
+        client = build_client(max_requests=2)
+        client.get("/ping")
+        client.get("/ping")
+
+        response = client.get("/ping")
+
+        assert response.status_code == 429
+        assert response.json()["limit"] == 2
+        assert response.headers["Retry-After"] == "60"
+        assert response.headers["X-RateLimit-Remaining"] == "0"
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+
+    def test_excluded_paths_and_streaming(self):
+        """Test that health skips the limit and streamed bodies pass through intact"""
+        client = build_client(max_requests=1)
+
+        health = [client.get("/health") for _ in range(3)]
+        stream = client.get("/stream")
+
+        assert all(r.status_code == 200 and "X-RateLimit-Limit" not in r.headers for r in health)
+        assert stream.text == "chunk-0\nchunk-1\nchunk-2\n"
+        assert stream.headers["X-Frame-Options"] == "DENY"
@@ -0,0 +1,109 @@
+"""
+Unit tests for object storage backends
+
+Tests chunked local-filesystem transfers, S3 multipart
+part handling and per-tier concurrency limits.
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from gameforge.core.storage_backends import (
+    LocalStorageBackend, S3StorageBackend, MIN_MULTIPART_PART_SIZE
+)
+
+
+async def chunks_of(data: bytes, size: int):
+    for offset in range(0, len(data), size):
+        yield data[offset:offset + size]
+
+
+class TestLocalStorageBackend:
+    """Test suite for the local filesystem backend"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_and_range(self, tmp_path):
+        """Test chunked upload, whole reads and inclusive byte ranges"""
+        backend = LocalStorageBackend(str(tmp_path), read_size=7)
+        data = bytes(range(256)) * 4
+
+        written = await backend.upload_stream("bucket", "a/b.enc", chunks_of(data, 100), "hot")
+        ranged = b"".join([
+            chunk async for chunk in backend.stream_object("bucket", "a/b.enc", "hot", 10, 500)
+        ])
+
+        assert written == len(data)
+        assert await backend.get_object("bucket", "a/b.enc", "hot") == data
+        assert ranged == data[10:501]
+        assert not (tmp_path / "bucket" / "a" / "b.enc.part").exists()
+
+    @pytest.mark.asyncio
+    async def test_tier_concurrency_limit(self, tmp_path):
+        """Test that transfers beyond a tier's limit wait for a free slot"""
+        backend = LocalStorageBackend(str(tmp_path), tier_concurrency={"cold": 1})
+        active = 0
+        peak = 0
+
+        async def slow_chunks():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            yield b"data"
+            active -= 1
+
+        await asyncio.gather(*(
+            backend.upload_stream("bucket", f"obj{i}", slow_chunks(), "cold") for i in range(3)
+        ))
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_paused_stream_does_not_hold_tier_slot(self, tmp_path):
+        """Test that a reader waiting on its consumer leaves the slot to other reads"""
+        backend = LocalStorageBackend(str(tmp_path), tier_concurrency={"cold": 1}, read_size=4)
+        await backend.put_object("bucket", "a", b"a" * 16, "cold")
+        await backend.put_object("bucket", "b", b"b" * 16, "cold")
+
+        paused = backend.stream_object("bucket", "a", "cold")
+        assert await paused.__anext__() == b"aaaa"
+
+        other = await asyncio.wait_for(backend.get_object("bucket", "b", "cold"), timeout=1)
+        rest = b"".join([chunk async for chunk in paused])
+
+        assert other == b"b" * 16
+        assert rest == b"a" * 12
+
+
+class TestS3StorageBackend:
+    """Test suite for the S3 backend with a stubbed boto3 client"""
+
+    @pytest.mark.asyncio
+    async def test_multipart_upload_off_event_loop(self):
+        """Test part numbering and that SDK calls run on the backend's threads"""
+        client = MagicMock()
+        client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+        loop_thread = threading.get_ident()
+        call_threads = []
+
+        def upload_part(**kwargs):
+            call_threads.append(threading.get_ident())
+            return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+        client.upload_part.side_effect = upload_part
+        backend = S3StorageBackend(client, max_workers=2, part_size=MIN_MULTIPART_PART_SIZE)
+        data = b"x" * (MIN_MULTIPART_PART_SIZE * 2 + 10)
+
+        written = await backend.upload_stream(
+            "bucket", "big.enc", chunks_of(data, 1024 * 1024), "warm"
+        )
+        await backend.close()
+
+        parts = client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+        assert written == len(data)
+        assert [part["PartNumber"] for part in parts] == [1, 2, 3]
+        assert loop_thread not in call_threads
+        client.put_object.assert_not_called()
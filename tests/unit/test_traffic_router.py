@@ -0,0 +1,125 @@
+"""
+Unit tests for the canary traffic router
+"""
+
+import os
+import sys
+from collections import Counter
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ml-platform", "deployments"))
+
+from traffic_router import SplitTable, TrafficRouter, sticky_point  # noqa: E402
+
+
+class FakeRedis:
+    """The handful of commands the router uses, on plain dicts (bytes responses)."""
+
+    def __init__(self):
+        self.strings, self.hashes, self.published = {}, {}, []
+        self.commands = Counter()
+
+    async def get(self, key):
+        self.commands["get"] += 1
+        return self.strings.get(key)
+
+    async def incr(self, key):
+        value = int(self.strings.get(key, b"0")) + 1
+        self.strings[key] = str(value).encode()
+        return value
+
+    async def hgetall(self, key):
+        self.commands["hgetall"] += 1
+        return dict(self.hashes.get(key, {}))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    async def execute(self):
+        results = []
+        for name, args, kwargs in self.calls:
+            if name == "get":
+                results.append(await self.redis.get(args[0]))
+            elif name == "hgetall":
+                results.append(await self.redis.hgetall(args[0]))
+            elif name == "delete":
+                self.redis.hashes.pop(args[0], None)
+            elif name == "hset":
+                self.redis.hashes[args[0]] = {
+                    k.encode(): str(v).encode() for k, v in kwargs["mapping"].items()
+                }
+            elif name == "set":
+                self.redis.strings[args[0]] = str(args[1]).encode()
+            elif name == "publish":
+                self.redis.published.append(args)
+        return results
+
+
+class TestTrafficRouter:
+    """Test suite for SplitTable and TrafficRouter"""
+
+    def test_alias_table_matches_weights(self):
+        """Test that alias draws follow the configured weights"""
+        table = SplitTable({"v1": 70, "v2": 25, "v3": 5, "v4": 0})
+        draws = 100000
+        counts = Counter(table.choose(i / draws) for i in range(draws))
+
+        assert set(counts) == {"v1", "v2", "v3"}
+        assert counts["v1"] / draws == pytest.approx(0.70, abs=0.001)
+        assert counts["v2"] / draws == pytest.approx(0.25, abs=0.001)
+        assert counts["v3"] / draws == pytest.approx(0.05, abs=0.001)
+
+    def test_ramping_canary_only_moves_keys_in_new_band(self):
+        """Test that sticky keys stay put except those entering the canary"""
+        keys = [f"user-{i}" for i in range(5000)]
+        before = SplitTable({"stable": 95, "canary": 5})
+        after = SplitTable({"stable": 90, "canary": 10})
+
+        first = {k: before.choose_sticky(sticky_point(k)) for k in keys}
+        second = {k: after.choose_sticky(sticky_point(k)) for k in keys}
+
+        assert all(second[k] == "canary" for k in keys if first[k] == "canary")
+        moved = sum(first[k] != second[k] for k in keys)
+        assert moved / len(keys) == pytest.approx(0.05, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_routes_from_cache_and_reloads_on_version_change(self):
+        """Test that decisions are local until the version key changes"""
+        redis = FakeRedis()
+        writer = TrafficRouter(redis)
+        reader = TrafficRouter(redis, ttl=0)
+
+        await writer.set_split("npc", {"current": 100})
+        assert redis.published[-1][0] == "traffic_split_updates"
+        for _ in range(50):
+            assert await reader.route("npc") == "current"
+        assert redis.commands["hgetall"] == 1
+
+        await writer.set_split("npc", {"canary": 100})
+        assert await reader.route("npc") == "canary"
+        assert redis.commands["hgetall"] == 2
+        assert await reader.route("npc", routing_key="session-1") == "canary"
+
+    @pytest.mark.asyncio
+    async def test_published_update_invalidates_older_table(self):
+        """Test that only a newer version drops the cached table"""
+        router = TrafficRouter(FakeRedis())
+        await router.set_split("npc", {"current": 50, "canary": 50})
+        version = router.get_stats()["models"]["npc"]
+
+        router.invalidate("npc", version)
+        assert "npc" in router.get_stats()["models"]
+
+        router.invalidate("npc", version + 1)
+        assert "npc" not in router.get_stats()["models"]
+        assert await router.route("npc") in {"current", "canary"}
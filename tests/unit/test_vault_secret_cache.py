@@ -0,0 +1,136 @@
+"""
+Unit tests for the Vault secret cache
+
+Runs VaultClient against a local fake Vault KV v2 HTTP server to test
+single-flight misses, refresh-ahead, stale-while-revalidate and
+loads racing an invalidation.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from gameforge.core.secret_cache import SecretCache
+from gameforge.core.vault_client import VaultClient
+
+
+class FakeVault:
+    """Minimal KV v2 server: GET /v1/<mount>/data/<path>."""
+
+    def __init__(self, secrets):
+        self.secrets = secrets
+        self.reads = []
+        self.available = True
+        self.delay = 0.0
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fake.reads.append(self.path)
+                if fake.delay:
+                    threading.Event().wait(fake.delay)
+                if not fake.available:
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+                path = self.path.split("/data/", 1)[1]
+                if path not in fake.secrets:
+                    self.send_response(404)
+                    self.send_header("Content-Type", "application/json")
+                    self.end_headers()
+                    self.wfile.write(b'{"errors": []}')
+                    return
+                body = json.dumps({
+                    "data": {"data": fake.secrets[path], "metadata": {"version": 1}},
+                    "lease_duration": 0
+                }).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def vault():
+    fake = FakeVault({"secrets/jwt": {"secret": "s3cret"}})
+    yield fake
+    fake.close()
+
+
+class TestVaultSecretCache:
+    """Test suite for cached Vault secret reads"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_read(self, vault):
+        """Test single-flight misses and that later reads are served from cache"""
+        vault.delay = 0.05
+        client = VaultClient(vault_url=vault.url, vault_token="test")
+
+        results = await asyncio.gather(*(client.aget_jwt_secret() for _ in range(20)))
+
+        assert results == ["s3cret"] * 20
+        assert client.get_jwt_secret() == "s3cret"
+        assert len(vault.reads) == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_and_stale_while_revalidate(self, vault):
+        """Test background refresh near expiry and stale reads while Vault is down"""
+        client = VaultClient(vault_url=vault.url, vault_token="test", secret_ttls={"secrets/": 0.2})
+
+        assert await client.aget_jwt_secret() == "s3cret"
+
+        # Inside the refresh window: served from cache, refreshed in the background
+        vault.secrets["secrets/jwt"] = {"secret": "rotated"}
+        await asyncio.sleep(0.16)
+        assert await client.aget_jwt_secret() == "s3cret"
+        await asyncio.sleep(0.05)
+        assert len(vault.reads) == 2
+        assert await client.aget_jwt_secret() == "rotated"
+
+        # Expired while Vault is down: the last value is still served
+        vault.available = False
+        await asyncio.sleep(0.25)
+        assert await client.aget_jwt_secret() == "rotated"
+        assert client.secret_cache.get_stats()["stale_served"] == 1
+
+    @pytest.mark.asyncio
+    async def test_load_racing_invalidation_is_discarded(self):
+        """Test that a read started before a write cannot cache the old value"""
+        vault_value = {"secret": "old"}
+        release = threading.Event()
+        reads = []
+
+        def loader(path):
+            value = dict(vault_value)
+            reads.append(value)
+            if len(reads) == 1:
+                release.wait(1)
+            return value, 0
+
+        cache = SecretCache(loader)
+        first = asyncio.create_task(cache.get("secrets/jwt"))
+        await asyncio.sleep(0.05)
+
+        vault_value["secret"] = "new"
+        cache.invalidate("secrets/jwt")
+        second = await cache.get("secrets/jwt")
+        release.set()
+
+        assert await first == {"secret": "old"}
+        assert second == {"secret": "new"}
+        assert await cache.get("secrets/jwt") == {"secret": "new"}
+        assert cache.get_stats()["discarded_loads"] == 1